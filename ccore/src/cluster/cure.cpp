@@ -25,6 +25,8 @@
 
 #include "cluster/cure.hpp"
 
+#include "container/balanced_kdtree.hpp"
+
 #include "utils/metric.hpp"
 
 
@@ -112,17 +114,25 @@ void cure_queue::create_queue(const std::vector< std::vector<double> > * data) {
         queue->push_back(cluster);
     }
 
-    for (auto & first_cluster : *queue) {
+    /* the nearest neighbor of each point is found by balanced KD-tree, neighbors with the same distance are ordered
+       by index, therefore the first cluster in the queue is chosen as the closest one as well as by full search */
+    const std::vector<cure_cluster *> clusters(queue->begin(), queue->end());
+    const std::size_t amount_neighbors = std::min(std::size_t(2), clusters.size());
+
+    std::vector<std::size_t> nearest_indexes;
+    std::vector<double> nearest_distances;
+    balanced_kdtree(*data).find_nearest(*data, amount_neighbors, nearest_indexes, nearest_distances);
+
+    for (std::size_t index_cluster = 0; index_cluster < clusters.size(); index_cluster++) {
         double minimal_distance = std::numeric_limits<double>::max();
         cure_cluster * closest_cluster = nullptr;
 
-        for (auto & second_cluster : *queue) {
-            if (first_cluster != second_cluster) {
-                double dist = get_distance(first_cluster, second_cluster);
-                if (dist < minimal_distance) {
-                    minimal_distance = dist;
-                    closest_cluster = second_cluster;
-                }
+        for (std::size_t index_neighbor = 0; index_neighbor < amount_neighbors; index_neighbor++) {
+            const std::size_t index_candidate = nearest_indexes[index_cluster * amount_neighbors + index_neighbor];
+            if (index_candidate != index_cluster) {
+                closest_cluster = clusters[index_candidate];
+                minimal_distance = get_distance(clusters[index_cluster], closest_cluster);
+                break;
             }
         }
 
@@ -130,8 +140,8 @@ void cure_queue::create_queue(const std::vector< std::vector<double> > * data) {
           std::cout << "bad" << std::endl;
         }
 
-        first_cluster->closest = closest_cluster;
-        first_cluster->distance_closest = minimal_distance;
+        clusters[index_cluster]->closest = closest_cluster;
+        clusters[index_cluster]->distance_closest = minimal_distance;
     }
 
     auto distance_comparison = [](cure_cluster * cluster1, cure_cluster * cluster2) { return cluster1->distance_closest < cluster2->distance_closest; };
@@ -21,8 +21,13 @@
 
 #include "cluster/dbscan.hpp"
 
+#include <numeric>
 #include <string>
-#include <unordered_set>
+
+#include "parallel/parallel.hpp"
+
+
+using namespace ccore::parallel;
 
 
 namespace ccore {
@@ -50,9 +55,7 @@ void dbscan::process(const dataset & p_data, const dbscan_data_t p_type, cluster
     m_data_ptr  = &p_data;
     m_type      = p_type;
 
-    if (m_type == dbscan_data_t::POINTS) {
-        create_kdtree(*m_data_ptr);
-    }
+    create_neighbors_graph();
 
     m_visited = std::vector<bool>(m_data_ptr->size(), false);
     m_belong = std::vector<bool>(m_data_ptr->size(), false);
@@ -83,59 +86,57 @@ void dbscan::process(const dataset & p_data, const dbscan_data_t p_type, cluster
 
     m_data_ptr = nullptr;
     m_result_ptr = nullptr;
+    m_neighbors_graph = container::radius_neighbors();
 }
 
 
 void dbscan::expand_cluster(const std::size_t p_index, cluster & allocated_cluster) {
-    std::vector<size_t> index_matrix_neighbors;
-    get_neighbors(p_index, index_matrix_neighbors);
-
-    if (index_matrix_neighbors.size() >= m_neighbors) {
-        allocated_cluster.push_back(p_index);
-        m_belong[p_index] = true;
-
-        for (std::size_t k = 0; k < index_matrix_neighbors.size(); k++) {
-            std::size_t index_neighbor = index_matrix_neighbors[k];
-
-            if (m_visited[index_neighbor] != true) {
-                m_visited[index_neighbor] = true;
-
-                /* check for neighbors of the current neighbor - maybe it's noise */
-                std::vector<size_t> neighbor_neighbor_indexes;
-                get_neighbors(index_neighbor, neighbor_neighbor_indexes);
-                if (neighbor_neighbor_indexes.size() >= m_neighbors) {
-
-                    /* Add neighbors of the neighbor for checking */
-                    for (auto neighbor_index : neighbor_neighbor_indexes) {
-                        /* Check if some of neighbors already in check list */
-                        std::vector<std::size_t>::const_iterator position = std::find(index_matrix_neighbors.begin(), index_matrix_neighbors.end(), neighbor_index);
-                        if (position == index_matrix_neighbors.end()) {
-                            /* Add neighbor if it does not exist in the list */
-                            index_matrix_neighbors.push_back(neighbor_index);
-                        }
-                    }
-                }
+    if (m_neighbors_graph.size(p_index) < m_neighbors) {
+        return;
+    }
+
+    allocated_cluster.push_back(p_index);
+    m_belong[p_index] = true;
+
+    /* Objects are captured by the cluster when they are reached at the first time, therefore each object is
+       checked only once, neighbors of captured core objects are checked in order of capturing. */
+    for (std::size_t k = 0; k < allocated_cluster.size(); k++) {
+        const std::size_t index_object = allocated_cluster[k];
+
+        if (k > 0) {
+            if (m_visited[index_object]) {
+                continue;
             }
 
-            if (m_belong[index_neighbor] != true) {
-                allocated_cluster.push_back(index_neighbor);
-                m_belong[index_neighbor] = true;
+            m_visited[index_object] = true;
+
+            /* check for neighbors of the current neighbor - maybe it's noise */
+            if (m_neighbors_graph.size(index_object) < m_neighbors) {
+                continue;
             }
         }
 
-        index_matrix_neighbors.clear();
+        const std::size_t * neighbor_begin = m_neighbors_graph.indexes.data() + m_neighbors_graph.offsets[index_object];
+        const std::size_t * neighbor_end = m_neighbors_graph.indexes.data() + m_neighbors_graph.offsets[index_object + 1];
+
+        for (const std::size_t * neighbor = neighbor_begin; neighbor != neighbor_end; ++neighbor) {
+            if (!m_belong[*neighbor]) {
+                allocated_cluster.push_back(*neighbor);
+                m_belong[*neighbor] = true;
+            }
+        }
     }
 }
 
 
-void dbscan::get_neighbors(const size_t p_index, std::vector<size_t> & p_neighbors) {
+void dbscan::create_neighbors_graph(void) {
     switch(m_type) {
     case dbscan_data_t::POINTS:
-        get_neighbors_from_points(p_index, p_neighbors);
+        create_neighbors_graph_from_points();
         break;
 
     case dbscan_data_t::DISTANCE_MATRIX:
-        get_neighbors_from_distance_matrix(p_index, p_neighbors);
+        create_neighbors_graph_from_distance_matrix();
         break;
 
     default:
@@ -144,31 +145,41 @@ void dbscan::get_neighbors(const size_t p_index, std::vector<size_t> & p_neighbo
 }
 
 
-void dbscan::get_neighbors_from_points(const size_t p_index, std::vector<size_t> & p_neighbors) {
-    container::kdtree_searcher searcher((*m_data_ptr)[p_index], m_kdtree.get_root(), m_initial_radius);
-    searcher.find_nearest([&p_index, &p_neighbors](const container::kdnode::ptr & node, const double distance) {
-            if (p_index != (std::size_t) node->get_payload()) {
-                p_neighbors.push_back((std::size_t) node->get_payload());
-            }
-        });
+void dbscan::create_neighbors_graph_from_points(void) {
+    container::balanced_kdtree(*m_data_ptr).find_radius(m_initial_radius, m_neighbors_graph);
 }
 
 
-void dbscan::get_neighbors_from_distance_matrix(const size_t p_index, std::vector<size_t> & p_neighbors) {
-    const auto & distances = m_data_ptr->at(p_index);
-    for (std::size_t index_neighbor = 0; index_neighbor < distances.size(); index_neighbor++) {
-        const double candidate_distance = distances[index_neighbor];
-        if ( (candidate_distance <= m_initial_radius) && (index_neighbor != p_index) ) {
-            p_neighbors.push_back(index_neighbor);
-        }
-    }
-}
+void dbscan::create_neighbors_graph_from_distance_matrix(void) {
+    const dataset & matrix = *m_data_ptr;
 
+    m_neighbors_graph = container::radius_neighbors();
+    m_neighbors_graph.offsets.assign(matrix.size() + 1, 0);
 
-void dbscan::create_kdtree(const dataset & p_data) {
-    for (std::size_t index = 0; index < p_data.size(); index++) {
-        m_kdtree.insert(p_data[index], (void *) index);
-    }
+    parallel_for(std::size_t(0), matrix.size(), [this, &matrix](const std::size_t p_index) {
+        const auto & distances = matrix[p_index];
+        m_neighbors_graph.offsets[p_index + 1] = std::count_if(distances.begin(), distances.end(),
+            [this](const double p_distance) { return p_distance <= m_initial_radius; }) - ((distances[p_index] <= m_initial_radius) ? 1 : 0);
+    });
+
+    std::partial_sum(m_neighbors_graph.offsets.begin(), m_neighbors_graph.offsets.end(), m_neighbors_graph.offsets.begin());
+
+    m_neighbors_graph.indexes.resize(m_neighbors_graph.offsets.back());
+    m_neighbors_graph.distances.resize(m_neighbors_graph.offsets.back());
+
+    parallel_for(std::size_t(0), matrix.size(), [this, &matrix](const std::size_t p_index) {
+        const auto & distances = matrix[p_index];
+
+        std::size_t position = m_neighbors_graph.offsets[p_index];
+        for (std::size_t index_neighbor = 0; index_neighbor < distances.size(); index_neighbor++) {
+            const double candidate_distance = distances[index_neighbor];
+            if ( (candidate_distance <= m_initial_radius) && (index_neighbor != p_index) ) {
+                m_neighbors_graph.indexes[position] = index_neighbor;
+                m_neighbors_graph.distances[position] = candidate_distance;
+                position++;
+            }
+        }
+    });
 }
 
 
@@ -24,7 +24,7 @@
 #include <cmath>
 #include <algorithm>
 
-#include "container/kdtree.hpp"
+#include "container/balanced_kdtree.hpp"
 
 #include "cluster/cluster_algorithm.hpp"
 #include "cluster/dbscan_data.hpp"
@@ -65,7 +65,7 @@ private:
 
     dbscan_data_t       m_type            = dbscan_data_t::POINTS;
 
-    container::kdtree   m_kdtree          = container::kdtree();
+    container::radius_neighbors m_neighbors_graph = container::radius_neighbors();     /* neighbors of each object */
 
 public:
     /**
@@ -119,19 +119,14 @@ public:
 private:
     /**
     *
-    * @brief    Obtains neighbors of the specified node (data object).
-    *
-    * @param[in]  p_index: index of the node (data object).
-    * @param[out] p_neighbors: neighbor indexes of the specified node (data object).
+    * @brief    Finds neighbors of all nodes (data objects) at once in line with type of input data.
     *
     */
-    void get_neighbors(const size_t p_index, std::vector<size_t> & p_neighbors);
-
-    void get_neighbors_from_points(const size_t p_index, std::vector<size_t> & p_neighbors);
+    void create_neighbors_graph(void);
 
-    void get_neighbors_from_distance_matrix(const size_t p_index, std::vector<size_t> & p_neighbors);
+    void create_neighbors_graph_from_points(void);
 
-    void create_kdtree(const dataset & p_data);
+    void create_neighbors_graph_from_distance_matrix(void);
 
     void expand_cluster(const std::size_t p_index, cluster & allocated_cluster);
 };
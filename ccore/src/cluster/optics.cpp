@@ -74,6 +74,10 @@ void optics::process(const dataset & p_data, const optics_data_t p_type, cluster
     m_result_ptr  = (optics_data *) &p_result;
     m_type        = p_type;
 
+    if (m_type == optics_data_t::POINTS) {
+        create_kdtree();
+    }
+
     calculate_cluster_result();
 
     if ( (m_amount_clusters > 0) && (m_amount_clusters != m_result_ptr->clusters().size()) ) {
@@ -89,6 +93,9 @@ void optics::process(const dataset & p_data, const optics_data_t p_type, cluster
 
     m_data_ptr    = nullptr;
     m_result_ptr  = nullptr;
+
+    m_kdtree          = container::balanced_kdtree();
+    m_neighbors_graph = container::radius_neighbors();
 }
 
 
@@ -101,7 +108,7 @@ void optics::calculate_cluster_result(void) {
 
 void optics::initialize(void) {
     if (m_type == optics_data_t::POINTS) {
-        create_kdtree();
+        create_neighbors_graph();
     }
 
     if (m_optics_objects.empty()) {
@@ -252,15 +259,9 @@ void optics::get_neighbors(const size_t p_index, neighbors_collection & p_neighb
 void optics::get_neighbors_from_points(const std::size_t p_index, neighbors_collection & p_neighbors) {
     p_neighbors.clear();
 
-    container::kdtree_searcher searcher((*m_data_ptr)[p_index], m_kdtree.get_root(), m_radius);
-
-    container::kdtree_searcher::rule_store rule = [&p_index, &p_neighbors](const container::kdnode::ptr & p_node, const double p_distance) {
-            if (p_index != (std::size_t) p_node->get_payload()) {
-                p_neighbors.push_back(std::make_tuple((std::size_t) p_node->get_payload(), std::sqrt(p_distance)));
-            }
-        };
-
-    searcher.find_nearest(rule);
+    for (std::size_t position = m_neighbors_graph.offsets[p_index]; position < m_neighbors_graph.offsets[p_index + 1]; position++) {
+        p_neighbors.push_back(std::make_tuple(m_neighbors_graph.indexes[position], m_neighbors_graph.distances[position]));
+    }
 }
 
 
@@ -295,11 +296,12 @@ void optics::calculate_ordering(void) {
 
 
 void optics::create_kdtree(void) {
-    m_kdtree = container::kdtree();
+    m_kdtree = container::balanced_kdtree(*m_data_ptr);
+}
 
-    for (std::size_t index = 0; index < m_data_ptr->size(); index++) {
-        m_kdtree.insert((*m_data_ptr)[index], (void *) index);
-    }
+
+void optics::create_neighbors_graph(void) {
+    m_kdtree.find_radius(m_radius, m_neighbors_graph);
 }
 
 
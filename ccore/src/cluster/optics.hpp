@@ -25,7 +25,7 @@
 #include <list>
 #include <tuple>
 
-#include "container/kdtree.hpp"
+#include "container/balanced_kdtree.hpp"
 
 #include "cluster/cluster_algorithm.hpp"
 #include "cluster/optics_data.hpp"
@@ -139,7 +139,9 @@ private:
 
     optics_data_t       m_type              = optics_data_t::POINTS;
 
-    container::kdtree   m_kdtree            = container::kdtree();
+    container::balanced_kdtree      m_kdtree            = container::balanced_kdtree();
+
+    container::radius_neighbors     m_neighbors_graph   = container::radius_neighbors();     /* neighbors of each object in current radius */
 
     std::vector<optics_descriptor>      m_optics_objects    = { };
 
@@ -244,6 +246,8 @@ private:
     void calculate_cluster_result(void);
 
     void create_kdtree(void);
+
+    void create_neighbors_graph(void);
 };
 
 
@@ -0,0 +1,413 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#include "container/balanced_kdtree.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <numeric>
+#include <stdexcept>
+#include <string>
+
+#include "parallel/parallel.hpp"
+
+
+using namespace ccore::parallel;
+
+
+namespace ccore {
+
+namespace container {
+
+
+const std::size_t balanced_kdtree::DEFAULT_LEAF_SIZE = 16;
+
+const std::size_t balanced_kdtree::INVALID_NODE = std::numeric_limits<std::size_t>::max();
+
+
+/* Amount of points whose neighbors are collected to the same buffer by batch radius query. */
+static const std::size_t RADIUS_QUERY_BLOCK_SIZE = 256;
+
+
+balanced_kdtree::balanced_kdtree(const dataset & p_data, const std::size_t p_leaf_size) :
+    m_leaf_size(p_leaf_size)
+{
+    if (m_leaf_size == 0) {
+        throw std::invalid_argument("Leaf size of balanced KD-tree should be greater than 0.");
+    }
+
+    build(p_data);
+}
+
+
+void balanced_kdtree::find_radius(const point & p_point, const double p_radius, std::vector<std::size_t> & p_indexes, std::vector<double> & p_distances) const {
+    p_indexes.clear();
+    p_distances.clear();
+
+    if (m_nodes.empty()) {
+        return;
+    }
+
+    if (p_point.size() != m_dimension) {
+        throw std::invalid_argument("Dimension of point '" + std::to_string(p_point.size()) +
+            "' is not equal to dimension of the tree '" + std::to_string(m_dimension) + "'.");
+    }
+
+    std::vector<std::pair<std::size_t, double>> candidates;
+    find_radius(p_point.data(), p_radius * p_radius, candidates);
+
+    p_indexes.reserve(candidates.size());
+    p_distances.reserve(candidates.size());
+
+    for (const auto & candidate : candidates) {
+        p_indexes.push_back(candidate.first);
+        p_distances.push_back(std::sqrt(candidate.second));
+    }
+}
+
+
+void balanced_kdtree::find_radius(const dataset & p_points, const double p_radius, radius_neighbors & p_neighbors) const {
+    for (const auto & query_point : p_points) {
+        if (!m_nodes.empty() && (query_point.size() != m_dimension)) {
+            throw std::invalid_argument("Dimension of point '" + std::to_string(query_point.size()) +
+                "' is not equal to dimension of the tree '" + std::to_string(m_dimension) + "'.");
+        }
+    }
+
+    find_radius(p_points.size(), p_radius, false, [&p_points](const std::size_t p_index) { return p_points[p_index].data(); }, p_neighbors);
+}
+
+
+void balanced_kdtree::find_radius(const double p_radius, radius_neighbors & p_neighbors) const {
+    std::vector<std::size_t> positions(size());
+    for (std::size_t position = 0; position < m_permutation.size(); position++) {
+        positions[m_permutation[position]] = position;
+    }
+
+    find_radius(size(), p_radius, true, [this, &positions](const std::size_t p_index) { return &m_points[positions[p_index] * m_dimension]; }, p_neighbors);
+}
+
+
+void balanced_kdtree::find_nearest(const dataset & p_points, const std::size_t p_amount, std::vector<std::size_t> & p_indexes, std::vector<double> & p_distances) const {
+    const std::size_t amount = std::min(p_amount, size());
+
+    for (const auto & query_point : p_points) {
+        if ((amount > 0) && (query_point.size() != m_dimension)) {
+            throw std::invalid_argument("Dimension of point '" + std::to_string(query_point.size()) +
+                "' is not equal to dimension of the tree '" + std::to_string(m_dimension) + "'.");
+        }
+    }
+
+    p_indexes.assign(p_points.size() * amount, 0);
+    p_distances.assign(p_points.size() * amount, 0.0);
+
+    if (amount == 0) {
+        return;
+    }
+
+    parallel_for(std::size_t(0), p_points.size(), [this, &p_points, amount, &p_indexes, &p_distances](const std::size_t p_index) {
+        std::vector<std::pair<double, std::size_t>> candidates;
+        find_nearest(p_points[p_index].data(), amount, candidates);
+
+        for (std::size_t index_neighbor = 0; index_neighbor < amount; index_neighbor++) {
+            p_indexes[p_index * amount + index_neighbor] = candidates[index_neighbor].second;
+            p_distances[p_index * amount + index_neighbor] = std::sqrt(candidates[index_neighbor].first);
+        }
+    });
+}
+
+
+std::size_t balanced_kdtree::size(void) const {
+    return m_permutation.size();
+}
+
+
+const std::vector<std::size_t> & balanced_kdtree::get_permutation(void) const {
+    return m_permutation;
+}
+
+
+void balanced_kdtree::build(const dataset & p_data) {
+    if (p_data.empty()) {
+        return;
+    }
+
+    m_dimension = p_data.front().size();
+    for (const auto & data_point : p_data) {
+        if (data_point.size() != m_dimension) {
+            throw std::invalid_argument("Points of balanced KD-tree should have the same dimension.");
+        }
+    }
+
+    m_permutation.resize(p_data.size());
+    std::iota(m_permutation.begin(), m_permutation.end(), 0);
+
+    std::vector<std::size_t> stack = { create_node(p_data, 0, p_data.size()) };
+    while(!stack.empty()) {
+        const std::size_t index_node = stack.back();
+        stack.pop_back();
+
+        const std::size_t index_begin = m_nodes[index_node].m_begin;
+        const std::size_t index_end = m_nodes[index_node].m_end;
+
+        std::size_t dimension = 0;
+        double maximum_spread = 0.0;
+        for (std::size_t index_dimension = 0; index_dimension < m_dimension; index_dimension++) {
+            const double spread = m_upper[index_node * m_dimension + index_dimension] - m_lower[index_node * m_dimension + index_dimension];
+            if (spread > maximum_spread) {
+                maximum_spread = spread;
+                dimension = index_dimension;
+            }
+        }
+
+        if ((index_end - index_begin <= m_leaf_size) || (maximum_spread == 0.0)) {
+            continue;   /* leaf - too small or all points are the same */
+        }
+
+        const std::size_t index_median = index_begin + (index_end - index_begin) / 2;
+        std::nth_element(m_permutation.begin() + index_begin, m_permutation.begin() + index_median, m_permutation.begin() + index_end,
+            [&p_data, dimension](const std::size_t p_index1, const std::size_t p_index2) { return p_data[p_index1][dimension] < p_data[p_index2][dimension]; });
+
+        const std::size_t index_left = create_node(p_data, index_begin, index_median);
+        const std::size_t index_right = create_node(p_data, index_median, index_end);
+
+        m_nodes[index_node].m_left = index_left;
+        m_nodes[index_node].m_right = index_right;
+
+        stack.push_back(index_left);
+        stack.push_back(index_right);
+    }
+
+    m_points.resize(p_data.size() * m_dimension);
+    for (std::size_t position = 0; position < m_permutation.size(); position++) {
+        std::copy(p_data[m_permutation[position]].begin(), p_data[m_permutation[position]].end(), m_points.begin() + position * m_dimension);
+    }
+}
+
+
+std::size_t balanced_kdtree::create_node(const dataset & p_data, const std::size_t p_begin, const std::size_t p_end) {
+    node tree_node;
+    tree_node.m_begin = p_begin;
+    tree_node.m_end = p_end;
+
+    m_nodes.push_back(tree_node);
+
+    const point & first_point = p_data[m_permutation[p_begin]];
+    m_lower.insert(m_lower.end(), first_point.begin(), first_point.end());
+    m_upper.insert(m_upper.end(), first_point.begin(), first_point.end());
+
+    double * lower = &m_lower[m_lower.size() - m_dimension];
+    double * upper = &m_upper[m_upper.size() - m_dimension];
+
+    for (std::size_t position = p_begin + 1; position < p_end; position++) {
+        const point & node_point = p_data[m_permutation[position]];
+        for (std::size_t dimension = 0; dimension < m_dimension; dimension++) {
+            lower[dimension] = std::min(lower[dimension], node_point[dimension]);
+            upper[dimension] = std::max(upper[dimension], node_point[dimension]);
+        }
+    }
+
+    return m_nodes.size() - 1;
+}
+
+
+double balanced_kdtree::calculate_box_distance(const std::size_t p_index_node, const double * p_point) const {
+    const double * lower = &m_lower[p_index_node * m_dimension];
+    const double * upper = &m_upper[p_index_node * m_dimension];
+
+    double distance = 0.0;
+    for (std::size_t dimension = 0; dimension < m_dimension; dimension++) {
+        double gap = 0.0;
+        if (p_point[dimension] < lower[dimension]) {
+            gap = lower[dimension] - p_point[dimension];
+        }
+        else if (p_point[dimension] > upper[dimension]) {
+            gap = p_point[dimension] - upper[dimension];
+        }
+
+        distance += gap * gap;
+    }
+
+    return distance;
+}
+
+
+double balanced_kdtree::calculate_distance(const std::size_t p_position, const double * p_point) const {
+    const double * tree_point = &m_points[p_position * m_dimension];
+
+    double distance = 0.0;
+    for (std::size_t dimension = 0; dimension < m_dimension; dimension++) {
+        const double difference = tree_point[dimension] - p_point[dimension];
+        distance += difference * difference;
+    }
+
+    return distance;
+}
+
+
+void balanced_kdtree::find_radius(const double * p_point, const double p_square_radius, std::vector<std::pair<std::size_t, double>> & p_result) const {
+    p_result.clear();
+
+    if (m_nodes.empty()) {
+        return;
+    }
+
+    std::vector<std::size_t> stack = { 0 };
+    while(!stack.empty()) {
+        const std::size_t index_node = stack.back();
+        stack.pop_back();
+
+        if (calculate_box_distance(index_node, p_point) > p_square_radius) {
+            continue;
+        }
+
+        const node & tree_node = m_nodes[index_node];
+        if (tree_node.m_left != INVALID_NODE) {
+            stack.push_back(tree_node.m_right);
+            stack.push_back(tree_node.m_left);
+            continue;
+        }
+
+        for (std::size_t position = tree_node.m_begin; position < tree_node.m_end; position++) {
+            const double distance = calculate_distance(position, p_point);
+            if (distance <= p_square_radius) {
+                p_result.emplace_back(m_permutation[position], distance);
+            }
+        }
+    }
+
+    std::sort(p_result.begin(), p_result.end());
+}
+
+
+void balanced_kdtree::find_nearest(const double * p_point, const std::size_t p_amount, std::vector<std::pair<double, std::size_t>> & p_result) const {
+    p_result.clear();   /* heap of candidates where the worst candidate is located on the top */
+
+    std::vector<std::pair<std::size_t, double>> stack = { { 0, calculate_box_distance(0, p_point) } };
+    while(!stack.empty()) {
+        const std::size_t index_node = stack.back().first;
+        const double box_distance = stack.back().second;
+
+        stack.pop_back();
+
+        if ((p_result.size() == p_amount) && (box_distance > p_result.front().first)) {
+            continue;
+        }
+
+        const node & tree_node = m_nodes[index_node];
+        if (tree_node.m_left != INVALID_NODE) {
+            const double left_distance = calculate_box_distance(tree_node.m_left, p_point);
+            const double right_distance = calculate_box_distance(tree_node.m_right, p_point);
+
+            /* the nearest successor is processed first */
+            if (left_distance <= right_distance) {
+                stack.emplace_back(tree_node.m_right, right_distance);
+                stack.emplace_back(tree_node.m_left, left_distance);
+            }
+            else {
+                stack.emplace_back(tree_node.m_left, left_distance);
+                stack.emplace_back(tree_node.m_right, right_distance);
+            }
+
+            continue;
+        }
+
+        for (std::size_t position = tree_node.m_begin; position < tree_node.m_end; position++) {
+            const std::pair<double, std::size_t> candidate = { calculate_distance(position, p_point), m_permutation[position] };
+
+            if (p_result.size() < p_amount) {
+                p_result.push_back(candidate);
+                std::push_heap(p_result.begin(), p_result.end());
+            }
+            else if (candidate < p_result.front()) {
+                std::pop_heap(p_result.begin(), p_result.end());
+                p_result.back() = candidate;
+                std::push_heap(p_result.begin(), p_result.end());
+            }
+        }
+    }
+
+    std::sort_heap(p_result.begin(), p_result.end());
+}
+
+
+void balanced_kdtree::find_radius(const std::size_t p_amount_points, const double p_radius, const bool p_exclude_itself,
+    const std::function<const double *(const std::size_t)> & p_point_getter, radius_neighbors & p_neighbors) const
+{
+    p_neighbors.offsets.assign(p_amount_points + 1, 0);
+    p_neighbors.indexes.clear();
+    p_neighbors.distances.clear();
+
+    if (m_nodes.empty()) {
+        return;
+    }
+
+    const double square_radius = p_radius * p_radius;
+    const std::size_t amount_blocks = (p_amount_points + RADIUS_QUERY_BLOCK_SIZE - 1) / RADIUS_QUERY_BLOCK_SIZE;
+
+    /* neighbors are collected by blocks of points in parallel and then they are copied to the common storage */
+    std::vector<radius_neighbors> blocks(amount_blocks);
+
+    parallel_for(std::size_t(0), amount_blocks, [this, p_amount_points, square_radius, p_exclude_itself, &p_point_getter, &blocks, &p_neighbors](const std::size_t p_index_block) {
+        const std::size_t index_begin = p_index_block * RADIUS_QUERY_BLOCK_SIZE;
+        const std::size_t index_end = std::min(index_begin + RADIUS_QUERY_BLOCK_SIZE, p_amount_points);
+
+        radius_neighbors & block = blocks[p_index_block];
+        std::vector<std::pair<std::size_t, double>> candidates;
+
+        for (std::size_t index_point = index_begin; index_point < index_end; index_point++) {
+            find_radius(p_point_getter(index_point), square_radius, candidates);
+
+            std::size_t amount_neighbors = 0;
+            for (const auto & candidate : candidates) {
+                if (p_exclude_itself && (candidate.first == index_point)) {
+                    continue;
+                }
+
+                block.indexes.push_back(candidate.first);
+                block.distances.push_back(std::sqrt(candidate.second));
+                amount_neighbors++;
+            }
+
+            p_neighbors.offsets[index_point + 1] = amount_neighbors;
+        }
+    });
+
+    std::partial_sum(p_neighbors.offsets.begin(), p_neighbors.offsets.end(), p_neighbors.offsets.begin());
+
+    p_neighbors.indexes.resize(p_neighbors.offsets.back());
+    p_neighbors.distances.resize(p_neighbors.offsets.back());
+
+    parallel_for(std::size_t(0), amount_blocks, [&blocks, &p_neighbors](const std::size_t p_index_block) {
+        radius_neighbors & block = blocks[p_index_block];
+        const std::size_t offset = p_neighbors.offsets[p_index_block * RADIUS_QUERY_BLOCK_SIZE];
+
+        std::copy(block.indexes.begin(), block.indexes.end(), p_neighbors.indexes.begin() + offset);
+        std::copy(block.distances.begin(), block.distances.end(), p_neighbors.distances.begin() + offset);
+
+        block = radius_neighbors();
+    });
+}
+
+
+}
+
+}
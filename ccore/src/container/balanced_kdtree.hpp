@@ -0,0 +1,204 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#pragma once
+
+
+#include <cstddef>
+#include <functional>
+#include <utility>
+#include <vector>
+
+#include "definitions.hpp"
+
+
+namespace ccore {
+
+namespace container {
+
+
+/**
+ *
+ * @brief   Neighbors of points in compressed sparse row format: neighbors of point 'i' are located in range
+ *           [offsets[i], offsets[i + 1]) of 'indexes' and 'distances'.
+ *
+ */
+struct radius_neighbors {
+public:
+    std::vector<std::size_t>    offsets     = { };
+    std::vector<std::size_t>    indexes     = { };
+    std::vector<double>         distances   = { };
+
+public:
+    /**
+     *
+     * @brief   Returns amount of neighbors of specified point.
+     *
+     */
+    inline std::size_t size(const std::size_t p_index) const {
+        return offsets[p_index + 1] - offsets[p_index];
+    }
+};
+
+
+/**
+ *
+ * @brief   Static KD-tree that is built at once by median partitioning and stored in contiguous arrays.
+ * @details Each node keeps range of points in permutation and bounding box of its points, coordinates of points are
+ *           copied in order of the permutation, therefore points of each leaf (bucket) are located sequentially in
+ *           memory. Nodes are split by median of dimension with the largest spread until they fit to leaf. Points
+ *           cannot be inserted or removed after creation, use 'kdtree' for this purpose. Euclidean distance is used
+ *           for queries, batch queries are processed in parallel.
+ *
+ */
+class balanced_kdtree {
+public:
+    static const std::size_t DEFAULT_LEAF_SIZE;
+
+private:
+    static const std::size_t INVALID_NODE;
+
+    struct node {
+        std::size_t     m_begin     = 0;
+        std::size_t     m_end       = 0;
+        std::size_t     m_left      = INVALID_NODE;
+        std::size_t     m_right     = INVALID_NODE;
+    };
+
+private:
+    std::size_t                 m_dimension     = 0;
+    std::size_t                 m_leaf_size     = DEFAULT_LEAF_SIZE;
+
+    std::vector<std::size_t>    m_permutation   = { };
+    std::vector<double>         m_points        = { };      /* coordinates of points in order of the permutation */
+
+    std::vector<node>           m_nodes         = { };
+    std::vector<double>         m_lower         = { };      /* lower corner of bounding box of each node */
+    std::vector<double>         m_upper         = { };      /* upper corner of bounding box of each node */
+
+public:
+    balanced_kdtree(void) = default;
+
+    /**
+     *
+     * @brief   Builds tree from points.
+     *
+     * @param[in] p_data: points that are stored in the tree, they should have the same dimension.
+     * @param[in] p_leaf_size: maximum amount of points in leaf.
+     *
+     */
+    explicit balanced_kdtree(const dataset & p_data, const std::size_t p_leaf_size = DEFAULT_LEAF_SIZE);
+
+    balanced_kdtree(const balanced_kdtree & p_other) = default;
+
+    balanced_kdtree(balanced_kdtree && p_other) = default;
+
+    ~balanced_kdtree(void) = default;
+
+public:
+    balanced_kdtree & operator=(const balanced_kdtree & p_other) = default;
+
+    balanced_kdtree & operator=(balanced_kdtree && p_other) = default;
+
+public:
+    /**
+     *
+     * @brief   Finds neighbors of the point in area that is covered by the radius (neighbors on the border are included).
+     *
+     * @param[in]  p_point: point whose neighbors should be found.
+     * @param[in]  p_radius: distance from the point where neighbors are searched.
+     * @param[out] p_indexes: indexes of neighbors in ascending order.
+     * @param[out] p_distances: Euclidean distances to neighbors.
+     *
+     */
+    void find_radius(const point & p_point, const double p_radius, std::vector<std::size_t> & p_indexes, std::vector<double> & p_distances) const;
+
+    /**
+     *
+     * @brief   Finds neighbors of each point in area that is covered by the radius, points are processed in parallel.
+     * @details Neighbors of each point are ordered by index, point from the tree is a neighbor of itself if it is queried.
+     *
+     * @param[in]  p_points: points whose neighbors should be found.
+     * @param[in]  p_radius: distance from points where neighbors are searched.
+     * @param[out] p_neighbors: neighbors of each point.
+     *
+     */
+    void find_radius(const dataset & p_points, const double p_radius, radius_neighbors & p_neighbors) const;
+
+    /**
+     *
+     * @brief   Finds neighbors of each point of the tree in area that is covered by the radius, point is not
+     *           a neighbor of itself. Points are processed in parallel.
+     *
+     * @param[in]  p_radius: distance from points where neighbors are searched.
+     * @param[out] p_neighbors: neighbors of each point ordered by index.
+     *
+     */
+    void find_radius(const double p_radius, radius_neighbors & p_neighbors) const;
+
+    /**
+     *
+     * @brief   Finds specified amount of the nearest neighbors of each point, points are processed in parallel.
+     * @details Neighbors are ordered by distance, neighbors with the same distance are ordered by index. Point
+     *           from the tree is a neighbor of itself if it is queried.
+     *
+     * @param[in]  p_points: points whose neighbors should be found.
+     * @param[in]  p_amount: amount of neighbors that should be found for each point (it is reduced to size of the tree).
+     * @param[out] p_indexes: indexes of neighbors, neighbors of point 'i' are located in range [i * amount, (i + 1) * amount).
+     * @param[out] p_distances: Euclidean distances to neighbors.
+     *
+     */
+    void find_nearest(const dataset & p_points, const std::size_t p_amount, std::vector<std::size_t> & p_indexes, std::vector<double> & p_distances) const;
+
+    /**
+     *
+     * @brief   Returns amount of points in the tree.
+     *
+     */
+    std::size_t size(void) const;
+
+    /**
+     *
+     * @brief   Returns permutation of point indexes where points of each node are located sequentially.
+     *
+     */
+    const std::vector<std::size_t> & get_permutation(void) const;
+
+private:
+    void build(const dataset & p_data);
+
+    std::size_t create_node(const dataset & p_data, const std::size_t p_begin, const std::size_t p_end);
+
+    double calculate_box_distance(const std::size_t p_index_node, const double * p_point) const;
+
+    double calculate_distance(const std::size_t p_position, const double * p_point) const;
+
+    void find_radius(const double * p_point, const double p_square_radius, std::vector<std::pair<std::size_t, double>> & p_result) const;
+
+    void find_nearest(const double * p_point, const std::size_t p_amount, std::vector<std::pair<double, std::size_t>> & p_result) const;
+
+    void find_radius(const std::size_t p_amount_points, const double p_radius, const bool p_exclude_itself,
+        const std::function<const double *(const std::size_t)> & p_point_getter, radius_neighbors & p_neighbors) const;
+};
+
+
+}
+
+}
@@ -21,6 +21,8 @@
 #pragma once
 
 
+#include <algorithm>
+#include <stdexcept>
 #include <vector>
 
 
@@ -83,7 +85,81 @@ public:
         return m_oscillators;
     }
 
+    /**
+     *
+     * @brief   Copies values of the specified oscillators on iterations [p_start, p_stop) with step p_step
+     *          to the buffer, values are placed row by row: one row per iteration.
+     * @details Caller is responsible for valid range of iterations and indexes, and for size of the
+     *          buffer that should be not less than amount of iterations multiplied by amount of indexes.
+     *
+     * @param[in] p_values: member of network state where values of oscillators are stored.
+     * @param[in] p_start: the first iteration of the window.
+     * @param[in] p_stop: iteration where the window is ended (it is not included).
+     * @param[in] p_step: step between iterations of the window.
+     * @param[in] p_indexes: indexes of oscillators whose values should be copied, if it is 'nullptr'
+     *             then values of all oscillators are copied.
+     * @param[in] p_amount_indexes: amount of indexes of oscillators.
+     * @param[out] p_output: buffer where values of the window are stored.
+     *
+     */
+    void copy_window(const std::vector<double> DynamicType::* p_values,
+                     const std::size_t p_start,
+                     const std::size_t p_stop,
+                     const std::size_t p_step,
+                     const std::size_t * const p_indexes,
+                     const std::size_t p_amount_indexes,
+                     double * const p_output) const
+    {
+        check_step(p_step);
+
+        double * cursor = p_output;
+        for (std::size_t iteration = p_start; iteration < p_stop; iteration += p_step) {
+            const std::vector<double> & values = (*this)[iteration].*p_values;
+
+            if (p_indexes == nullptr) {
+                cursor = std::copy(values.cbegin(), values.cend(), cursor);
+            }
+            else {
+                for (std::size_t i = 0; i < p_amount_indexes; i++) {
+                    *(cursor++) = values[p_indexes[i]];
+                }
+            }
+        }
+    }
+
+    /**
+     *
+     * @brief   Copies value that is stored once per network state (for example, time) on iterations
+     *          [p_start, p_stop) with step p_step to the buffer.
+     *
+     * @param[in] p_value: member of network state where the value is stored.
+     * @param[in] p_start: the first iteration of the window.
+     * @param[in] p_stop: iteration where the window is ended (it is not included).
+     * @param[in] p_step: step between iterations of the window.
+     * @param[out] p_output: buffer where values of the window are stored.
+     *
+     */
+    void copy_window(const double DynamicType::* p_value,
+                     const std::size_t p_start,
+                     const std::size_t p_stop,
+                     const std::size_t p_step,
+                     double * const p_output) const
+    {
+        check_step(p_step);
+
+        double * cursor = p_output;
+        for (std::size_t iteration = p_start; iteration < p_stop; iteration += p_step) {
+            *(cursor++) = (*this)[iteration].*p_value;
+        }
+    }
+
 private:
+    static void check_step(const std::size_t p_step) {
+        if (p_step == 0) {
+            throw std::invalid_argument("Step between iterations of the window should be greater than zero");
+        }
+    }
+
     void check_set_oscillators(const DynamicType & p_value) {
         if (std::vector<DynamicType>::empty()) {
             m_oscillators = p_value.size();
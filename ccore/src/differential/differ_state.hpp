@@ -23,6 +23,7 @@
 
 #include <vector>
 #include <memory>
+#include <stdexcept>
 
 #include "solve_type.hpp"
 
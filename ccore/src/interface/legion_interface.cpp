@@ -112,3 +112,22 @@ pyclustering_package * legion_dynamic_get_time(const void * pointer) {
 std::size_t legion_dynamic_get_size(const void * pointer) {
     return ((legion_dynamic *) pointer)->size();
 }
+
+std::size_t legion_dynamic_get_oscillators(const void * p_pointer) {
+    return ((legion_dynamic *) p_pointer)->oscillators();
+}
+
+
+void legion_dynamic_get_output_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, const std::size_t * const p_indexes, const std::size_t p_amount_indexes, double * const p_output) {
+    ((legion_dynamic *) p_pointer)->copy_window(&legion_network_state::m_output, p_start, p_stop, p_step, p_indexes, p_amount_indexes, p_output);
+}
+
+
+void legion_dynamic_get_inhibitory_output_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, double * const p_output) {
+    ((legion_dynamic *) p_pointer)->copy_window(&legion_network_state::m_inhibitor, p_start, p_stop, p_step, p_output);
+}
+
+
+void legion_dynamic_get_time_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, double * const p_output) {
+    ((legion_dynamic *) p_pointer)->copy_window(&legion_network_state::m_time, p_start, p_stop, p_step, p_output);
+}
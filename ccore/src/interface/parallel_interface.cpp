@@ -0,0 +1,47 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+
+#include "interface/parallel_interface.h"
+
+#include "parallel/work_stealing_pool.hpp"
+
+
+using namespace ccore::parallel;
+
+
+void parallel_set_amount_threads(const std::size_t p_amount_threads) {
+    work_stealing_pool::get_instance().set_amount_threads(p_amount_threads);
+}
+
+
+std::size_t parallel_get_amount_threads(void) {
+    return work_stealing_pool::get_instance().get_amount_threads();
+}
+
+
+void parallel_set_grain_size(const std::size_t p_grain_size) {
+    work_stealing_pool::get_instance().set_grain_size(p_grain_size);
+}
+
+
+std::size_t parallel_get_grain_size(void) {
+    return work_stealing_pool::get_instance().get_grain_size();
+}
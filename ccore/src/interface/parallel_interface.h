@@ -0,0 +1,67 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+
+#pragma once
+
+
+#include <cstddef>
+
+#include "definitions.hpp"
+
+
+/**
+ *
+ * @brief   Sets amount of threads that are used by parallel loops of the library (including calling thread).
+ * @details Value 1 means that parallel loops are executed sequentially. If value is 0 then default amount is used:
+ *           value of environment variable 'PYCLUSTERING_CCORE_THREADS' or amount of hardware threads.
+ *
+ * @param[in] p_amount_threads: amount of threads.
+ *
+ */
+extern "C" DECLARATION void parallel_set_amount_threads(const std::size_t p_amount_threads);
+
+
+/**
+ *
+ * @brief   Returns amount of threads that are used by parallel loops of the library (including calling thread).
+ *
+ */
+extern "C" DECLARATION std::size_t parallel_get_amount_threads(void);
+
+
+/**
+ *
+ * @brief   Sets amount of iterations of parallel loop that is taken by thread at once.
+ * @details If value is 0 then grain size is chosen for each loop in line with its length and amount of threads.
+ *           Initial value is defined by environment variable 'PYCLUSTERING_CCORE_GRAIN_SIZE' (0 if it is not specified).
+ *
+ * @param[in] p_grain_size: amount of iterations.
+ *
+ */
+extern "C" DECLARATION void parallel_set_grain_size(const std::size_t p_grain_size);
+
+
+/**
+ *
+ * @brief   Returns amount of iterations of parallel loop that is taken by thread at once (0 - it is chosen automatically).
+ *
+ */
+extern "C" DECLARATION std::size_t parallel_get_grain_size(void);
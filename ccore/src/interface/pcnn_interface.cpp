@@ -117,3 +117,16 @@ size_t pcnn_dynamic_get_size(const void * pointer) {
     return ((pcnn_dynamic *) pointer)->size();
 }
 
+std::size_t pcnn_dynamic_get_oscillators(const void * p_pointer) {
+    return ((pcnn_dynamic *) p_pointer)->oscillators();
+}
+
+
+void pcnn_dynamic_get_output_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, const std::size_t * const p_indexes, const std::size_t p_amount_indexes, double * const p_output) {
+    ((pcnn_dynamic *) p_pointer)->copy_window(&pcnn_network_state::m_output, p_start, p_stop, p_step, p_indexes, p_amount_indexes, p_output);
+}
+
+
+void pcnn_dynamic_get_time_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, double * const p_output) {
+    ((pcnn_dynamic *) p_pointer)->copy_window(&pcnn_network_state::m_time, p_start, p_stop, p_step, p_output);
+}
@@ -31,6 +31,11 @@ pyclustering_package::pyclustering_package(const pyclustering_data_t package_typ
 
 
 pyclustering_package::~pyclustering_package(void) {
+    if (type == (unsigned int) pyclustering_data_t::PYCLUSTERING_TYPE_DOUBLE_MATRIX) {
+        /* Matrix is a view over external buffer that is owned by caller */
+        return;
+    }
+
     if (type != (unsigned int) pyclustering_data_t::PYCLUSTERING_TYPE_LIST) {
         switch(type) {
             case pyclustering_data_t::PYCLUSTERING_TYPE_INT:
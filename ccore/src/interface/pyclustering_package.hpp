@@ -41,6 +41,22 @@ enum pyclustering_data_t {
     PYCLUSTERING_TYPE_LIST              = 6,
     PYCLUSTERING_TYPE_SIZE_T            = 7,
     PYCLUSTERING_TYPE_UNDEFINED         = 8,
+    PYCLUSTERING_TYPE_DOUBLE_MATRIX     = 9,
+};
+
+
+/*
+ * @brief   Row-major matrix of doubles that is described by pointer to the first element and its shape.
+ * @details Matrix does not own its buffer, it is a view over memory that belongs to the caller (for example,
+ *           C-contiguous numpy array), therefore package with type 'PYCLUSTERING_TYPE_DOUBLE_MATRIX' should
+ *           not be deallocated by the library.
+ *
+ */
+struct pyclustering_matrix {
+public:
+    std::size_t     rows      = 0;
+    std::size_t     columns   = 0;
+    double          * data    = nullptr;
 };
 
 
@@ -73,6 +89,11 @@ public:
             throw std::out_of_range("pyclustering_package::at() [" + std::to_string(__LINE__) + "]: index '" + std::to_string(index_row) + "' out of range (size: '" + std::to_string(size) + "').");
         }
 
+        if (type == PYCLUSTERING_TYPE_DOUBLE_MATRIX) {
+            const pyclustering_matrix * matrix = (pyclustering_matrix *) data;
+            return ((TypeValue *) matrix->data)[index_row * matrix->columns + index_column];
+        }
+
         pyclustering_package * package = at<pyclustering_package *>(index_row);
         return ((TypeValue *) package->data)[index_column];
     }
@@ -86,10 +107,16 @@ public:
 
     template <class TypeValue>
     void extract(std::vector<std::vector<TypeValue>> & container) const {
+        if (type == PYCLUSTERING_TYPE_DOUBLE_MATRIX) {
+            extract_matrix(container);
+            return;
+        }
+
         if (type != PYCLUSTERING_TYPE_LIST) {
             throw std::invalid_argument("pyclustering_package::extract() [" + std::to_string(__LINE__) + "]: argument is not 'PYCLUSTERING_TYPE_LIST').");
         }
 
+        container.reserve(container.size() + size);
         for (std::size_t i = 0; i < size; i++) {
             std::vector<TypeValue> subcontainer = { };
             extract(subcontainer, at<pyclustering_package *>(i));
@@ -100,10 +127,23 @@ public:
 private:
     template <class TypeValue>
     void extract(std::vector<TypeValue> & container, const pyclustering_package * const package) const {
+        container.reserve(container.size() + package->size);
         for (std::size_t i = 0; i < package->size; i++) {
             container.push_back(package->at<TypeValue>(i));
         }
     }
+
+
+    template <class TypeValue>
+    void extract_matrix(std::vector<std::vector<TypeValue>> & container) const {
+        const pyclustering_matrix * matrix = (pyclustering_matrix *) data;
+
+        container.reserve(container.size() + matrix->rows);
+        for (std::size_t i = 0; i < matrix->rows; i++) {
+            const double * row_begin = matrix->data + i * matrix->columns;
+            container.emplace_back(row_begin, row_begin + matrix->columns);
+        }
+    }
 };
 
 
@@ -176,4 +176,18 @@ pyclustering_package * sync_dynamic_calculate_local_order(const void * p_dynamic
 
     pyclustering_package * package = create_package(&local_order_evolution);
     return package;
+}
+
+std::size_t sync_dynamic_get_oscillators(const void * p_pointer) {
+    return ((sync_dynamic *) p_pointer)->oscillators();
+}
+
+
+void sync_dynamic_get_output_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, const std::size_t * const p_indexes, const std::size_t p_amount_indexes, double * const p_output) {
+    ((sync_dynamic *) p_pointer)->copy_window(&sync_network_state::m_phase, p_start, p_stop, p_step, p_indexes, p_amount_indexes, p_output);
+}
+
+
+void sync_dynamic_get_time_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, double * const p_output) {
+    ((sync_dynamic *) p_pointer)->copy_window(&sync_network_state::m_time, p_start, p_stop, p_step, p_output);
 }
\ No newline at end of file
@@ -220,4 +220,43 @@ extern "C" DECLARATION pyclustering_package * sync_dynamic_calculate_order(const
  * @return Package where evolution local order parameter (estimation of partial synchronization) is stored.
  *
  */
-extern "C" DECLARATION pyclustering_package * sync_dynamic_calculate_local_order(const void * p_dynamic_pointer, const void * p_network_pointer, const std::size_t p_start, const std::size_t p_stop);
\ No newline at end of file
+extern "C" DECLARATION pyclustering_package * sync_dynamic_calculate_local_order(const void * p_dynamic_pointer, const void * p_network_pointer, const std::size_t p_start, const std::size_t p_stop);
+
+/**
+ *
+ * @brief   Returns amount of oscillators whose states are stored in the output dynamic.
+ *
+ * @param[in] p_pointer: pointer to the output dynamic.
+ *
+ */
+extern "C" DECLARATION std::size_t sync_dynamic_get_oscillators(const void * p_pointer);
+
+/**
+ *
+ * @brief   Copies window of phases of oscillators to the buffer that is allocated by caller.
+ * @details Values are stored row by row: one row per iteration where each row consists of values of the specified
+ *           oscillators. Caller is responsible for valid range of iterations, valid indexes and size of the buffer.
+ *
+ * @param[in] p_pointer: pointer to the output dynamic.
+ * @param[in] p_start: the first iteration of the window.
+ * @param[in] p_stop: iteration where the window is ended (it is not included).
+ * @param[in] p_step: step between iterations of the window.
+ * @param[in] p_indexes: indexes of oscillators that should be copied, if it is 'nullptr' then all oscillators are copied.
+ * @param[in] p_amount_indexes: amount of indexes of oscillators.
+ * @param[out] p_output: buffer where the window is stored.
+ *
+ */
+extern "C" DECLARATION void sync_dynamic_get_output_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, const std::size_t * const p_indexes, const std::size_t p_amount_indexes, double * const p_output);
+
+/**
+ *
+ * @brief   Copies window of time points of simulation process to the buffer that is allocated by caller.
+ *
+ * @param[in] p_pointer: pointer to the output dynamic.
+ * @param[in] p_start: the first iteration of the window.
+ * @param[in] p_stop: iteration where the window is ended (it is not included).
+ * @param[in] p_step: step between iterations of the window.
+ * @param[out] p_output: buffer where the window is stored.
+ *
+ */
+extern "C" DECLARATION void sync_dynamic_get_time_window(const void * p_pointer, const std::size_t p_start, const std::size_t p_stop, const std::size_t p_step, double * const p_output);
\ No newline at end of file
@@ -23,24 +23,18 @@
 
 
 #include <cstddef>
-#include <functional>
-#include <future>
-#include <vector>
+#include <iterator>
 
-#include "spinlock.hpp"
+#include "work_stealing_pool.hpp"
 
 
 /* Available options: 
-    1. PARALLEL_IMPLEMENTATION_ASYNC_POOL - own parallel implementation based on std::async pool
-    2. PARALLEL_IMPLEMENTATION_NONE       - parallel implementation is not used
-    3. PARALLEL_IMPLEMENTATION_PPL        - parallel PPL implementation (windows system only)         */
+    1. PARALLEL_IMPLEMENTATION_WORK_STEALING_POOL - own parallel implementation based on persistent work-stealing pool
+    2. PARALLEL_IMPLEMENTATION_NONE               - parallel implementation is not used
+    3. PARALLEL_IMPLEMENTATION_PPL                - parallel PPL implementation (windows system only)             */
 
 
-#if defined(WIN32) || (_WIN32) || (_WIN64)
-#define PARALLEL_IMPLEMENTATION_PPL
-#else
-#define PARALLEL_IMPLEMENTATION_ASYNC_POOL
-#endif
+#define PARALLEL_IMPLEMENTATION_WORK_STEALING_POOL
 
 
 #if defined(PARALLEL_IMPLEMENTATION_PPL)
@@ -53,57 +47,23 @@ namespace ccore {
 namespace parallel {
 
 
-/* Pool of threads is used to prevent overhead in case of nested loop */
-static const std::size_t AMOUNT_HARDWARE_THREADS = std::thread::hardware_concurrency();
-static const std::size_t AMOUNT_THREADS = (AMOUNT_HARDWARE_THREADS > 1) ? (AMOUNT_HARDWARE_THREADS - 1) : 0;
-static std::vector<std::future<void>> FUTURE_STORAGE(AMOUNT_THREADS);
-static std::vector<spinlock> FUTURE_LOCKS(AMOUNT_THREADS);
-
-
+/*
+ * Loops are executed by the pool of threads that is created once per process. Range of loop is divided dynamically
+ * between threads, amount of threads and grain size are controlled by 'work_stealing_pool'.
+ */
 template <typename TypeIndex, typename TypeAction>
 void parallel_for(const TypeIndex p_start, const TypeIndex p_end, const TypeAction & p_task) {
-#if defined(PARALLEL_IMPLEMENTATION_ASYNC_POOL)
-    const TypeIndex step = (p_end - p_start) / (AMOUNT_THREADS + 1);
-    TypeIndex current_start = p_start;
-    TypeIndex current_end = p_start + step;
-
-    std::vector<std::size_t> captured_feature;
-
-    for (std::size_t i = 0; i < AMOUNT_THREADS; ++i) {
-        const auto async_task = [&p_task, current_start, current_end](){
-            for (TypeIndex i = current_start; i < current_end; ++i) {
-                p_task(i);
-            }
-        };
-
-        std::size_t free_index = (std::size_t) -1;
-        for (std::size_t i = 0; i < AMOUNT_THREADS; i++) {
-            if (FUTURE_LOCKS[i].try_lock()) {
-                free_index = i;
-                break;
-            }
-        }
-
-        if (free_index != (std::size_t) -1) {
-            FUTURE_STORAGE[free_index] = std::async(std::launch::async, async_task);
-            captured_feature.push_back(free_index);
-        }
-        else {
-            async_task();
-        }
-
-        current_start = current_end;
-        current_end += step;
-    }
-
-    for (TypeIndex i = current_start; i < p_end; ++i) {
-        p_task(i);
+#if defined(PARALLEL_IMPLEMENTATION_WORK_STEALING_POOL)
+    if (p_end <= p_start) {
+        return;
     }
 
-    for (auto index_feature : captured_feature) {
-        FUTURE_STORAGE[index_feature].get();
-        FUTURE_LOCKS[index_feature].unlock();
-    }
+    work_stealing_pool::get_instance().execute(std::size_t(0), std::size_t(p_end - p_start),
+        [p_start, &p_task](const std::size_t p_begin, const std::size_t p_finish) {
+            for (std::size_t i = p_begin; i < p_finish; ++i) {
+                p_task(static_cast<TypeIndex>(p_start + i));
+            }
+        });
 #elif defined(PARALLEL_IMPLEMENTATION_PPL)
     concurrency::parallel_for(p_start, p_end, p_task);
 #else
@@ -116,49 +76,19 @@ void parallel_for(const TypeIndex p_start, const TypeIndex p_end, const TypeActi
 
 template <typename TypeIter, typename TypeAction>
 void parallel_for_each(const TypeIter p_begin, const TypeIter p_end, const TypeAction & p_task) {
-#if defined(PARALLEL_IMPLEMENTATION_ASYNC_POOL)
-    const std::size_t step = std::distance(p_begin, p_end) / (AMOUNT_THREADS + 1);
-
-    auto current_start = p_begin;
-    auto current_end = p_begin + step;
-
-    std::vector<std::size_t> captured_feature;
+#if defined(PARALLEL_IMPLEMENTATION_WORK_STEALING_POOL)
+    const auto length = std::distance(p_begin, p_end);
+    if (length <= 0) {
+        return;
+    }
 
-    for (std::size_t i = 0; i < AMOUNT_THREADS; ++i) {
-        auto async_task = [&p_task, current_start, current_end](){
-            for (auto iter = current_start; iter != current_end; ++iter) {
+    work_stealing_pool::get_instance().execute(std::size_t(0), std::size_t(length),
+        [&p_begin, &p_task](const std::size_t p_first, const std::size_t p_last) {
+            auto iter = std::next(p_begin, p_first);
+            for (std::size_t i = p_first; i < p_last; ++i, ++iter) {
                 p_task(*iter);
             }
-        };
-
-        std::size_t free_index = (std::size_t) -1;
-        for (std::size_t i = 0; i < AMOUNT_THREADS; i++) {
-            if (FUTURE_LOCKS[i].try_lock()) {
-                free_index = i;
-                break;
-            }
-        }
-
-        if (free_index != (std::size_t) -1) {
-            FUTURE_STORAGE[free_index] = std::async(std::launch::async, async_task);
-            captured_feature.push_back(free_index);
-        }
-        else {
-            async_task();
-        }
-
-        current_start = current_end;
-        current_end += step;
-    }
-
-    for (auto iter = current_start; iter != p_end; ++iter) {
-        p_task(*iter);
-    }
-
-    for (auto index_feature : captured_feature) {
-        FUTURE_STORAGE[index_feature].get();
-        FUTURE_LOCKS[index_feature].unlock();
-    }
+        });
 #elif defined(PARALLEL_IMPLEMENTATION_PPL)
     concurrency::parallel_for_each(p_begin, p_end, p_task);
 #else
@@ -0,0 +1,392 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+
+#include "work_stealing_pool.hpp"
+
+#include <algorithm>
+#include <cstdlib>
+
+#if defined(__unix__)
+#include <unistd.h>
+#endif
+
+
+namespace ccore {
+
+namespace parallel {
+
+
+const char * const work_stealing_pool::ENVIRONMENT_THREADS      = "PYCLUSTERING_CCORE_THREADS";
+const char * const work_stealing_pool::ENVIRONMENT_GRAIN_SIZE   = "PYCLUSTERING_CCORE_GRAIN_SIZE";
+
+
+/* Average amount of chunks per participant when grain size is chosen automatically. */
+static const std::size_t CHUNKS_PER_PARTICIPANT = 8;
+
+
+/* Marks threads that execute iterations of loop, nested loops are executed by them sequentially. */
+static thread_local bool INSIDE_LOOP = false;
+
+
+static std::size_t read_environment_value(const char * const p_name, const std::size_t p_default) {
+    const char * value = std::getenv(p_name);
+    if (value == nullptr) {
+        return p_default;
+    }
+
+    char * value_end = nullptr;
+    const long long result = std::strtoll(value, &value_end, 10);
+    if ((value_end == value) || (*value_end != '\0') || (result < 0)) {
+        return p_default;
+    }
+
+    return static_cast<std::size_t>(result);
+}
+
+
+static long get_process_id(void) {
+#if defined(__unix__)
+    return static_cast<long>(getpid());
+#else
+    return 0;
+#endif
+}
+
+
+work_stealing_pool::work_stealing_pool(const std::size_t p_amount_threads, const std::size_t p_grain_size) :
+    m_sync(new synchronization()),
+    m_grain_size(p_grain_size)
+{
+    start(p_amount_threads);
+}
+
+
+work_stealing_pool::~work_stealing_pool(void) {
+    if (is_forked()) {
+        release_after_fork();
+    }
+    else {
+        stop();
+    }
+}
+
+
+work_stealing_pool & work_stealing_pool::get_instance(void) {
+    static work_stealing_pool instance(get_default_amount_threads(), read_environment_value(ENVIRONMENT_GRAIN_SIZE, 0));
+    return instance;
+}
+
+
+std::size_t work_stealing_pool::get_default_amount_threads(void) {
+    const std::size_t amount_hardware_threads = std::max(std::thread::hardware_concurrency(), 1u);
+    const std::size_t amount_threads = read_environment_value(ENVIRONMENT_THREADS, amount_hardware_threads);
+
+    return (amount_threads > 0) ? amount_threads : amount_hardware_threads;
+}
+
+
+void work_stealing_pool::execute(const std::size_t p_begin, const std::size_t p_end, const range_task & p_task) {
+    if (p_begin >= p_end) {
+        return;
+    }
+
+    if (INSIDE_LOOP) {
+        p_task(p_begin, p_end);     /* nested loop */
+        return;
+    }
+
+    if (is_forked()) {
+        release_after_fork();
+        start(m_amount_threads);
+    }
+
+    std::unique_lock<std::mutex> job_lock(m_sync->m_job_mutex, std::defer_lock);
+    if (!job_lock.try_lock()) {
+        p_task(p_begin, p_end);     /* the pool is busy by another thread */
+        return;
+    }
+
+    const std::size_t length = p_end - p_begin;
+    const std::size_t grain = calculate_grain_size(length);
+    const std::size_t amount_participants = std::min(m_threads.size() + 1, (length + grain - 1) / grain);
+
+    if (amount_participants < 2) {
+        job_lock.unlock();
+
+        p_task(p_begin, p_end);
+        return;
+    }
+
+    job loop_job;
+    loop_job.m_task  = &p_task;
+    loop_job.m_grain = grain;
+    loop_job.m_ranges = std::vector<range>(amount_participants);
+
+    const std::size_t step = length / amount_participants;
+    const std::size_t rest = length % amount_participants;
+
+    std::size_t current_begin = p_begin;
+    for (std::size_t index = 0; index < amount_participants; index++) {
+        const std::size_t current_end = current_begin + step + ((index < rest) ? 1 : 0);
+
+        loop_job.m_ranges[index].m_begin = current_begin;
+        loop_job.m_ranges[index].m_end   = current_end;
+
+        current_begin = current_end;
+    }
+
+    {
+        std::lock_guard<std::mutex> state_lock(m_sync->m_state_mutex);
+
+        m_job = &loop_job;
+        m_finished = 0;
+        m_generation++;
+    }
+
+    m_sync->m_job_cond.notify_all();
+
+    INSIDE_LOOP = true;
+    process(loop_job, 0);
+    INSIDE_LOOP = false;
+
+    {
+        std::unique_lock<std::mutex> state_lock(m_sync->m_state_mutex);
+        m_sync->m_done_cond.wait(state_lock, [this, amount_participants]() { return m_finished == amount_participants - 1; });
+
+        m_job = nullptr;
+    }
+
+    job_lock.unlock();
+
+    if (loop_job.m_error) {
+        std::rethrow_exception(loop_job.m_error);
+    }
+}
+
+
+void work_stealing_pool::set_amount_threads(const std::size_t p_amount_threads) {
+    if (is_forked()) {
+        release_after_fork();
+    }
+
+    std::lock_guard<std::mutex> job_lock(m_sync->m_job_mutex);
+
+    stop();
+
+    start((p_amount_threads > 0) ? p_amount_threads : get_default_amount_threads());
+}
+
+
+std::size_t work_stealing_pool::get_amount_threads(void) {
+    return m_amount_threads;
+}
+
+
+void work_stealing_pool::set_grain_size(const std::size_t p_grain_size) {
+    m_grain_size = p_grain_size;
+}
+
+
+std::size_t work_stealing_pool::get_grain_size(void) {
+    return m_grain_size;
+}
+
+
+void work_stealing_pool::start(const std::size_t p_amount_threads) {
+    m_stop = false;
+    m_job = nullptr;
+    m_owner_process = get_process_id();
+    m_amount_threads = p_amount_threads;
+
+    for (std::size_t index = 1; index < p_amount_threads; index++) {
+        m_threads.emplace_back(&work_stealing_pool::run, this, index);
+    }
+}
+
+
+void work_stealing_pool::stop(void) {
+    {
+        std::lock_guard<std::mutex> state_lock(m_sync->m_state_mutex);
+        m_stop = true;
+    }
+
+    m_sync->m_job_cond.notify_all();
+
+    for (auto & executor : m_threads) {
+        executor.join();
+    }
+
+    m_threads.clear();
+}
+
+
+bool work_stealing_pool::is_forked(void) const {
+    return m_owner_process != get_process_id();
+}
+
+
+void work_stealing_pool::release_after_fork(void) {
+    /* Threads are not copied to child process, therefore their handles are left without joining, state of
+       mutexes and condition variables is copied from parent process, therefore they are replaced by new ones. */
+    new std::vector<std::thread>(std::move(m_threads));
+    m_threads.clear();
+
+    static_cast<void>(m_sync.release());
+    m_sync.reset(new synchronization());
+
+    m_owner_process = get_process_id();
+}
+
+
+std::size_t work_stealing_pool::calculate_grain_size(const std::size_t p_length) const {
+    const std::size_t grain_size = m_grain_size;
+    if (grain_size > 0) {
+        return grain_size;
+    }
+
+    return std::max(p_length / ((m_threads.size() + 1) * CHUNKS_PER_PARTICIPANT), std::size_t(1));
+}
+
+
+void work_stealing_pool::run(const std::size_t p_index_participant) {
+    INSIDE_LOOP = true;
+
+    std::size_t generation = 0;
+
+    while(true) {
+        job * current_job = nullptr;
+
+        {
+            std::unique_lock<std::mutex> state_lock(m_sync->m_state_mutex);
+            m_sync->m_job_cond.wait(state_lock, [this, generation]() { return m_stop || (m_generation != generation); });
+
+            if (m_stop) {
+                return;
+            }
+
+            generation = m_generation;
+            if ((m_job == nullptr) || (p_index_participant >= m_job->m_ranges.size())) {
+                continue;   /* thread is not required for current loop */
+            }
+
+            current_job = m_job;
+        }
+
+        process(*current_job, p_index_participant);
+
+        {
+            std::lock_guard<std::mutex> state_lock(m_sync->m_state_mutex);
+            m_finished++;
+        }
+
+        m_sync->m_done_cond.notify_one();
+    }
+}
+
+
+void work_stealing_pool::process(job & p_job, const std::size_t p_index_participant) {
+    std::size_t chunk_begin = 0, chunk_end = 0;
+
+    while(take_chunk(p_job, p_index_participant, chunk_begin, chunk_end) || steal_range(p_job, p_index_participant)) {
+        if (chunk_begin == chunk_end) {
+            continue;   /* range has been stolen, chunk is taken on the next iteration */
+        }
+
+        try {
+            (*p_job.m_task)(chunk_begin, chunk_end);
+        }
+        catch(...) {
+            std::lock_guard<spinlock> error_lock(p_job.m_error_lock);
+            if (!p_job.m_failed) {
+                p_job.m_error  = std::current_exception();
+                p_job.m_failed = true;
+            }
+        }
+
+        chunk_begin = chunk_end = 0;
+    }
+}
+
+
+bool work_stealing_pool::take_chunk(job & p_job, const std::size_t p_index_participant, std::size_t & p_begin, std::size_t & p_end) {
+    range & own_range = p_job.m_ranges[p_index_participant];
+    std::lock_guard<spinlock> range_lock(own_range.m_lock);
+
+    if (p_job.m_failed) {
+        own_range.m_begin = own_range.m_end;    /* the rest iterations are canceled */
+        return false;
+    }
+
+    if (own_range.m_begin >= own_range.m_end) {
+        return false;
+    }
+
+    p_begin = own_range.m_begin;
+    p_end   = std::min(own_range.m_begin + p_job.m_grain, own_range.m_end);
+
+    own_range.m_begin = p_end;
+    return true;
+}
+
+
+bool work_stealing_pool::steal_range(job & p_job, const std::size_t p_index_participant) {
+    const std::size_t amount_participants = p_job.m_ranges.size();
+
+    for (std::size_t offset = 1; offset < amount_participants; offset++) {
+        range & victim_range = p_job.m_ranges[(p_index_participant + offset) % amount_participants];
+
+        std::size_t stolen_begin = 0, stolen_end = 0;
+
+        {
+            std::lock_guard<spinlock> victim_lock(victim_range.m_lock);
+
+            if (victim_range.m_begin >= victim_range.m_end) {
+                continue;
+            }
+
+            /* victim processes small rest itself */
+            const std::size_t remaining = victim_range.m_end - victim_range.m_begin;
+            if (remaining <= p_job.m_grain / 2) {
+                continue;
+            }
+
+            stolen_end   = victim_range.m_end;
+            stolen_begin = victim_range.m_begin + remaining / 2;
+
+            victim_range.m_end = stolen_begin;
+        }
+
+        range & own_range = p_job.m_ranges[p_index_participant];
+        std::lock_guard<spinlock> own_lock(own_range.m_lock);
+
+        own_range.m_begin = stolen_begin;
+        own_range.m_end   = stolen_end;
+
+        return true;
+    }
+
+    return false;
+}
+
+
+}
+
+}
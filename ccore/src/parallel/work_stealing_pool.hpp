@@ -0,0 +1,192 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+
+#pragma once
+
+
+#include <atomic>
+#include <cstddef>
+#include <condition_variable>
+#include <exception>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include "spinlock.hpp"
+
+
+namespace ccore {
+
+namespace parallel {
+
+
+/**
+ *
+ * @brief   Persistent pool of threads that executes iterations of parallel loops.
+ * @details Range of loop is divided between participants (calling thread and threads of the pool), each participant
+ *           takes chunks of iterations (grain) from the beginning of its own range and when its own range is over it
+ *           steals half of the remaining range of another participant, therefore uneven work is balanced dynamically.
+ *           Threads are created once and wait for the next loop. Loop that is started inside another loop or while
+ *           the pool is busy by another thread is executed by the calling thread.
+ *
+ *           Amount of threads and grain size are defined by environment variables 'PYCLUSTERING_CCORE_THREADS' and
+ *           'PYCLUSTERING_CCORE_GRAIN_SIZE' when the pool is created, they can be changed later.
+ *
+ */
+class work_stealing_pool {
+public:
+    using range_task = std::function<void(const std::size_t, const std::size_t)>;
+
+public:
+    static const char * const ENVIRONMENT_THREADS;
+    static const char * const ENVIRONMENT_GRAIN_SIZE;
+
+private:
+    struct range {
+        spinlock            m_lock;
+        std::size_t         m_begin = 0;
+        std::size_t         m_end   = 0;
+    };
+
+    struct job {
+        const range_task *  m_task  = nullptr;
+        std::size_t         m_grain = 1;
+        std::vector<range>  m_ranges;
+
+        spinlock            m_error_lock;
+        std::exception_ptr  m_error = nullptr;
+        std::atomic<bool>   m_failed { false };
+    };
+
+    struct synchronization {
+        std::mutex                  m_job_mutex;
+        std::mutex                  m_state_mutex;
+        std::condition_variable     m_job_cond;
+        std::condition_variable     m_done_cond;
+    };
+
+private:
+    std::vector<std::thread>            m_threads;
+    std::unique_ptr<synchronization>    m_sync;
+
+    job *                       m_job = nullptr;
+    std::size_t                 m_generation = 0;
+    std::size_t                 m_finished = 0;
+    bool                        m_stop = false;
+
+    std::atomic<std::size_t>    m_amount_threads { 1 };
+    std::atomic<std::size_t>    m_grain_size { 0 };
+    long                        m_owner_process = 0;
+
+public:
+    work_stealing_pool(const std::size_t p_amount_threads, const std::size_t p_grain_size);
+
+    work_stealing_pool(const work_stealing_pool & p_other) = delete;
+
+    work_stealing_pool(work_stealing_pool && p_other) = delete;
+
+    ~work_stealing_pool(void);
+
+public:
+    /**
+     *
+     * @brief   Returns pool that is used by 'parallel_for' and 'parallel_for_each'.
+     *
+     */
+    static work_stealing_pool & get_instance(void);
+
+    /**
+     *
+     * @brief   Returns default amount of threads: value of environment variable 'PYCLUSTERING_CCORE_THREADS' or
+     *           amount of hardware threads if the variable is not specified.
+     *
+     */
+    static std::size_t get_default_amount_threads(void);
+
+public:
+    /**
+     *
+     * @brief   Executes task for each chunk of range [p_begin, p_end) and returns when the whole range is processed.
+     * @details The first exception that is thrown by the task is rethrown by the method.
+     *
+     * @param[in] p_begin: the first index of the range.
+     * @param[in] p_end: index after the last index of the range.
+     * @param[in] p_task: task that processes chunk [begin, end) of the range.
+     *
+     */
+    void execute(const std::size_t p_begin, const std::size_t p_end, const range_task & p_task);
+
+    /**
+     *
+     * @brief   Sets amount of threads that execute loop including calling thread, if it is 0 then default amount is used.
+     * @details The method waits for loop that is being executed by the pool, it should not be called inside loop.
+     *
+     */
+    void set_amount_threads(const std::size_t p_amount_threads);
+
+    /**
+     *
+     * @brief   Returns amount of threads that execute loop including calling thread.
+     *
+     */
+    std::size_t get_amount_threads(void);
+
+    /**
+     *
+     * @brief   Sets amount of iterations that is taken by participant at once, if it is 0 then grain size is chosen
+     *           for each loop in line with its length.
+     *
+     */
+    void set_grain_size(const std::size_t p_grain_size);
+
+    /**
+     *
+     * @brief   Returns grain size, 0 means that grain size is chosen for each loop in line with its length.
+     *
+     */
+    std::size_t get_grain_size(void);
+
+private:
+    void start(const std::size_t p_amount_threads);
+
+    void stop(void);
+
+    bool is_forked(void) const;
+
+    void release_after_fork(void);
+
+    std::size_t calculate_grain_size(const std::size_t p_length) const;
+
+    void run(const std::size_t p_index_participant);
+
+    void process(job & p_job, const std::size_t p_index_participant);
+
+    bool take_chunk(job & p_job, const std::size_t p_index_participant, std::size_t & p_begin, std::size_t & p_end);
+
+    bool steal_range(job & p_job, const std::size_t p_index_participant);
+};
+
+
+}
+
+}
@@ -0,0 +1,295 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+
+#include "gtest/gtest.h"
+
+#include "samples.hpp"
+
+#include "container/balanced_kdtree.hpp"
+
+#include "utils/metric.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <random>
+#include <stdexcept>
+
+
+using namespace ccore::container;
+using namespace ccore::utils::metric;
+
+
+static void template_find_radius(const dataset & p_data, const double p_radius, const std::size_t p_leaf_size = balanced_kdtree::DEFAULT_LEAF_SIZE) {
+    balanced_kdtree tree(p_data, p_leaf_size);
+    ASSERT_EQ(p_data.size(), tree.size());
+
+    radius_neighbors neighbors;
+    tree.find_radius(p_data, p_radius, neighbors);
+
+    radius_neighbors neighbors_without_itself;
+    tree.find_radius(p_radius, neighbors_without_itself);
+
+    ASSERT_EQ(p_data.size() + 1, neighbors.offsets.size());
+    ASSERT_EQ(p_data.size() + 1, neighbors_without_itself.offsets.size());
+
+    for (std::size_t index_point = 0; index_point < p_data.size(); index_point++) {
+        std::vector<std::size_t> expected_indexes;
+        for (std::size_t index_candidate = 0; index_candidate < p_data.size(); index_candidate++) {
+            if (euclidean_distance(p_data[index_point], p_data[index_candidate]) <= p_radius) {
+                expected_indexes.push_back(index_candidate);
+            }
+        }
+
+        const std::vector<std::size_t> actual_indexes(neighbors.indexes.begin() + neighbors.offsets[index_point], neighbors.indexes.begin() + neighbors.offsets[index_point + 1]);
+        ASSERT_EQ(expected_indexes, actual_indexes);
+
+        for (std::size_t position = neighbors.offsets[index_point]; position < neighbors.offsets[index_point + 1]; position++) {
+            ASSERT_NEAR(euclidean_distance(p_data[index_point], p_data[neighbors.indexes[position]]), neighbors.distances[position], 1e-10);
+        }
+
+        expected_indexes.erase(std::find(expected_indexes.begin(), expected_indexes.end(), index_point));
+
+        const std::vector<std::size_t> actual_indexes_without_itself(neighbors_without_itself.indexes.begin() + neighbors_without_itself.offsets[index_point],
+            neighbors_without_itself.indexes.begin() + neighbors_without_itself.offsets[index_point + 1]);
+        ASSERT_EQ(expected_indexes, actual_indexes_without_itself);
+
+        std::vector<std::size_t> single_indexes;
+        std::vector<double> single_distances;
+        tree.find_radius(p_data[index_point], p_radius, single_indexes, single_distances);
+
+        ASSERT_EQ(actual_indexes, single_indexes);
+        ASSERT_EQ(single_indexes.size(), single_distances.size());
+    }
+}
+
+
+static void template_find_nearest(const dataset & p_data, const std::size_t p_amount, const std::size_t p_leaf_size = balanced_kdtree::DEFAULT_LEAF_SIZE) {
+    balanced_kdtree tree(p_data, p_leaf_size);
+
+    std::vector<std::size_t> indexes;
+    std::vector<double> distances;
+    tree.find_nearest(p_data, p_amount, indexes, distances);
+
+    const std::size_t amount = std::min(p_amount, p_data.size());
+    ASSERT_EQ(p_data.size() * amount, indexes.size());
+    ASSERT_EQ(p_data.size() * amount, distances.size());
+
+    for (std::size_t index_point = 0; index_point < p_data.size(); index_point++) {
+        std::vector<std::pair<double, std::size_t>> expected;
+        for (std::size_t index_candidate = 0; index_candidate < p_data.size(); index_candidate++) {
+            expected.emplace_back(euclidean_distance_square(p_data[index_point], p_data[index_candidate]), index_candidate);
+        }
+
+        std::sort(expected.begin(), expected.end());
+
+        for (std::size_t index_neighbor = 0; index_neighbor < amount; index_neighbor++) {
+            ASSERT_EQ(expected[index_neighbor].second, indexes[index_point * amount + index_neighbor]);
+            ASSERT_NEAR(std::sqrt(expected[index_neighbor].first), distances[index_point * amount + index_neighbor], 1e-10);
+        }
+    }
+}
+
+
+static dataset create_uniform_sample(const std::size_t p_size, const std::size_t p_dimension, const unsigned int p_seed) {
+    std::mt19937 generator(p_seed);
+    std::uniform_real_distribution<double> distribution(0.0, 1.0);
+
+    dataset points(p_size, point(p_dimension));
+    for (auto & data_point : points) {
+        for (auto & coordinate : data_point) {
+            coordinate = distribution(generator);
+        }
+    }
+
+    return points;
+}
+
+
+TEST(utest_balanced_kdtree, empty_tree) {
+    const dataset empty_data;
+    balanced_kdtree tree(empty_data);
+    ASSERT_EQ(0U, tree.size());
+
+    radius_neighbors neighbors;
+    tree.find_radius({ { 1.0, 2.0 } }, 1.0, neighbors);
+
+    ASSERT_EQ(std::vector<std::size_t>({ 0, 0 }), neighbors.offsets);
+    ASSERT_TRUE(neighbors.indexes.empty());
+
+    std::vector<std::size_t> indexes;
+    std::vector<double> distances;
+    tree.find_nearest({ { 1.0, 2.0 } }, 3, indexes, distances);
+
+    ASSERT_TRUE(indexes.empty());
+    ASSERT_TRUE(distances.empty());
+}
+
+
+TEST(utest_balanced_kdtree, radius_sample_simple_01) {
+    template_find_radius(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_01), 0.5);
+}
+
+
+TEST(utest_balanced_kdtree, radius_sample_simple_03_small_leaf) {
+    template_find_radius(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_03), 0.7, 1);
+}
+
+
+TEST(utest_balanced_kdtree, radius_one_dimension_sample_simple_07) {
+    template_find_radius(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_07), 2.0, 2);
+}
+
+
+TEST(utest_balanced_kdtree, radius_identical_points_sample_simple_09) {
+    template_find_radius(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_09), 1.0, 3);
+}
+
+
+TEST(utest_balanced_kdtree, radius_identical_points_sample_simple_12) {
+    template_find_radius(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_12), 1.0, 2);
+}
+
+
+TEST(utest_balanced_kdtree, radius_uniform_three_dimensions) {
+    template_find_radius(create_uniform_sample(1500, 3, 1000), 0.1, 8);
+}
+
+
+TEST(utest_balanced_kdtree, nearest_sample_simple_02) {
+    template_find_nearest(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_02), 3);
+}
+
+
+TEST(utest_balanced_kdtree, nearest_identical_points_sample_simple_12) {
+    template_find_nearest(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_12), 4, 1);
+}
+
+
+TEST(utest_balanced_kdtree, nearest_amount_greater_than_size) {
+    template_find_nearest(*simple_sample_factory::create_sample(SAMPLE_SIMPLE::SAMPLE_SIMPLE_01), 20, 2);
+}
+
+
+TEST(utest_balanced_kdtree, nearest_uniform_four_dimensions) {
+    template_find_nearest(create_uniform_sample(1000, 4, 2000), 5, 4);
+}
+
+
+TEST(utest_balanced_kdtree, incorrect_arguments) {
+    const dataset points = { { 1.0, 2.0 }, { 2.0, 3.0 } };
+
+    ASSERT_THROW(balanced_kdtree(points, 0), std::invalid_argument);
+    ASSERT_THROW(balanced_kdtree(dataset({ { 1.0, 2.0 }, { 1.0 } })), std::invalid_argument);
+
+    balanced_kdtree tree(points);
+
+    radius_neighbors neighbors;
+    ASSERT_THROW(tree.find_radius({ { 1.0 } }, 1.0, neighbors), std::invalid_argument);
+
+    std::vector<std::size_t> indexes;
+    std::vector<double> distances;
+    ASSERT_THROW(tree.find_radius(point({ 1.0, 2.0, 3.0 }), 1.0, indexes, distances), std::invalid_argument);
+    ASSERT_THROW(tree.find_nearest({ { 1.0 } }, 1, indexes, distances), std::invalid_argument);
+}
+
+
+//#define UT_PERFORMANCE_SESSION
+#ifdef UT_PERFORMANCE_SESSION
+
+#include <chrono>
+
+#include "container/kdtree.hpp"
+
+
+TEST(performance_balanced_kdtree, radius_query_big_data) {
+    const dataset points = create_uniform_sample(1000000, 2, 3000);
+    const double radius = 0.002;
+
+    auto start = std::chrono::system_clock::now();
+
+    balanced_kdtree tree(points);
+
+    auto built = std::chrono::system_clock::now();
+
+    radius_neighbors neighbors;
+    tree.find_radius(radius, neighbors);
+
+    auto end = std::chrono::system_clock::now();
+
+    std::chrono::duration<double> build_time = built - start;
+    std::chrono::duration<double> query_time = end - built;
+
+    std::cout << "Balanced KD-tree: build time '" << build_time.count() << "' sec, radius query time '" << query_time.count()
+              << "' sec, throughput '" << points.size() / query_time.count() << "' queries/sec, neighbors '" << neighbors.indexes.size() << "'." << std::endl;
+}
+
+
+TEST(performance_balanced_kdtree, radius_query_big_data_dynamic_kdtree) {
+    const dataset points = create_uniform_sample(1000000, 2, 3000);
+    const double radius = 0.002;
+
+    auto start = std::chrono::system_clock::now();
+
+    kdtree tree;
+    for (std::size_t index = 0; index < points.size(); index++) {
+        tree.insert(points[index], (void *) index);
+    }
+
+    auto built = std::chrono::system_clock::now();
+
+    std::size_t amount_neighbors = 0;
+    for (std::size_t index = 0; index < points.size(); index++) {
+        kdtree_searcher searcher(points[index], tree.get_root(), radius);
+        searcher.find_nearest([&amount_neighbors, index](const kdnode::ptr & p_node, const double p_distance) {
+            if (index != (std::size_t) p_node->get_payload()) {
+                amount_neighbors++;
+            }
+        });
+    }
+
+    auto end = std::chrono::system_clock::now();
+
+    std::chrono::duration<double> build_time = built - start;
+    std::chrono::duration<double> query_time = end - built;
+
+    std::cout << "KD-tree: build time '" << build_time.count() << "' sec, radius query time '" << query_time.count()
+              << "' sec, throughput '" << points.size() / query_time.count() << "' queries/sec, neighbors '" << amount_neighbors << "'." << std::endl;
+}
+
+
+TEST(performance_balanced_kdtree, nearest_query_big_data) {
+    const dataset points = create_uniform_sample(1000000, 2, 3000);
+
+    balanced_kdtree tree(points);
+
+    auto start = std::chrono::system_clock::now();
+
+    std::vector<std::size_t> indexes;
+    std::vector<double> distances;
+    tree.find_nearest(points, 2, indexes, distances);
+
+    auto end = std::chrono::system_clock::now();
+
+    std::chrono::duration<double> query_time = end - start;
+    std::cout << "Balanced KD-tree: nearest query time '" << query_time.count() << "' sec, throughput '"
+              << points.size() / query_time.count() << "' queries/sec." << std::endl;
+}
+#endif
@@ -65,6 +65,13 @@ TEST(utest_interface_legion, legion_api) {
     std::size_t size_dynamic = legion_dynamic_get_size(dynamic);
     ASSERT_GT(size_dynamic, 0U);
 
+    ASSERT_EQ(10U, legion_dynamic_get_oscillators(dynamic));
+
+    std::vector<double> window(size_dynamic * 10);
+    legion_dynamic_get_output_window(dynamic, 0, size_dynamic, 1, nullptr, 0, window.data());
+    legion_dynamic_get_inhibitory_output_window(dynamic, 0, size_dynamic, 1, window.data());
+    legion_dynamic_get_time_window(dynamic, 0, size_dynamic, 1, window.data());
+
     legion_dynamic_destroy(dynamic);
     legion_destroy(legion_network);
 }
\ No newline at end of file
@@ -0,0 +1,67 @@
+/**
+*
+* Copyright (C) 2014-2018    Andrei Novikov (pyclustering@yandex.ru)
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+
+#include "gtest/gtest.h"
+
+#include "interface/parallel_interface.h"
+
+#include "parallel/parallel.hpp"
+
+#include <vector>
+
+
+using namespace ccore::parallel;
+
+
+TEST(utest_interface_parallel, amount_threads) {
+    const std::size_t default_amount_threads = parallel_get_amount_threads();
+    ASSERT_GE(default_amount_threads, 1U);
+
+    parallel_set_amount_threads(3);
+    ASSERT_EQ(3U, parallel_get_amount_threads());
+
+    std::vector<std::size_t> results(100, 0);
+    parallel_for(std::size_t(0), results.size(), [&results](const std::size_t p_index) {
+        results[p_index] = p_index;
+    });
+
+    for (std::size_t i = 0; i < results.size(); i++) {
+        ASSERT_EQ(i, results[i]);
+    }
+
+    parallel_set_amount_threads(0);
+    ASSERT_EQ(work_stealing_pool::get_default_amount_threads(), parallel_get_amount_threads());
+
+    parallel_set_amount_threads(default_amount_threads);
+}
+
+
+TEST(utest_interface_parallel, grain_size) {
+    const std::size_t default_grain_size = parallel_get_grain_size();
+
+    parallel_set_grain_size(16);
+    ASSERT_EQ(16U, parallel_get_grain_size());
+
+    parallel_set_grain_size(0);
+    ASSERT_EQ(0U, parallel_get_grain_size());
+
+    parallel_set_grain_size(default_grain_size);
+}
@@ -70,6 +70,12 @@ TEST(utest_interface_pcnn, pcnn_api) {
     std::size_t size_dynamic = pcnn_dynamic_get_size(dynamic);
     ASSERT_GT(size_dynamic, 0U);
 
+    ASSERT_EQ(10U, pcnn_dynamic_get_oscillators(dynamic));
+
+    std::vector<double> window(size_dynamic * 10);
+    pcnn_dynamic_get_output_window(dynamic, 0, size_dynamic, 1, nullptr, 0, window.data());
+    pcnn_dynamic_get_time_window(dynamic, 0, size_dynamic, 1, window.data());
+
     pcnn_dynamic_destroy(dynamic);
     pcnn_destroy(pcnn_network);
 }
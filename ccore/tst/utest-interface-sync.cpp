@@ -88,6 +88,37 @@ TEST(utest_interface_sync, sync_api) {
     package = sync_dynamic_calculate_local_order(dynamic_pointer, network_pointer, 0, dynamic_size);
     CHECK_FREE_PACKAGE(package, dynamic_size);
 
+    sync_dynamic_destroy(dynamic_pointer);
+    sync_destroy_network(network_pointer);
+}
+
+
+TEST(utest_interface_sync, sync_dynamic_window) {
+    void * network_pointer = sync_create_network(10, 1, 0, (unsigned int) connection_t::CONNECTION_ALL_TO_ALL, (unsigned int) initial_type::RANDOM_GAUSSIAN);
+    void * dynamic_pointer = sync_simulate_static(network_pointer, 20, 10, (unsigned int) solve_type::FORWARD_EULER, true);
+
+    const sync_dynamic & dynamic = *((sync_dynamic *) dynamic_pointer);
+    ASSERT_EQ(10U, sync_dynamic_get_oscillators(dynamic_pointer));
+
+    const std::vector<std::size_t> indexes = { 9, 0, 4 };
+    std::vector<double> output(4 * indexes.size());
+    sync_dynamic_get_output_window(dynamic_pointer, 2, 14, 3, indexes.data(), indexes.size(), output.data());
+
+    for (std::size_t i = 0; i < 4; i++) {
+        for (std::size_t j = 0; j < indexes.size(); j++) {
+            ASSERT_EQ(dynamic[2 + i * 3].m_phase[indexes[j]], output[i * indexes.size() + j]);
+        }
+    }
+
+    std::vector<double> full_output(10);
+    sync_dynamic_get_output_window(dynamic_pointer, 20, 21, 1, nullptr, 0, full_output.data());
+    ASSERT_EQ(dynamic[20].m_phase, full_output);
+
+    std::vector<double> time(2);
+    sync_dynamic_get_time_window(dynamic_pointer, 0, 21, 20, time.data());
+    ASSERT_EQ(dynamic[0].m_time, time[0]);
+    ASSERT_EQ(dynamic[20].m_time, time[1]);
+
     sync_dynamic_destroy(dynamic_pointer);
     sync_destroy_network(network_pointer);
 }
\ No newline at end of file
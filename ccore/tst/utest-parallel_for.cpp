@@ -23,7 +23,10 @@
 
 #include "parallel/parallel.hpp"
 
+#include <atomic>
+#include <list>
 #include <numeric>
+#include <stdexcept>
 
 
 using namespace ccore::parallel;
@@ -56,4 +59,153 @@ TEST(utest_parallel_for, square_10_elements) {
 
 TEST(utest_parallel_for, square_10000_elements) {
     template_parallel_square(10000);
+}
+
+
+TEST(utest_parallel_for, empty_range) {
+    std::size_t counter = 0;
+    parallel_for(std::size_t(10), std::size_t(10), [&counter](const std::size_t) { counter++; });
+    parallel_for(std::size_t(10), std::size_t(5), [&counter](const std::size_t) { counter++; });
+
+    ASSERT_EQ(0U, counter);
+}
+
+
+TEST(utest_parallel_for, shifted_range) {
+    std::vector<std::size_t> visits(100, 0);
+    parallel_for(std::size_t(30), std::size_t(70), [&visits](const std::size_t p_index) {
+        visits[p_index]++;
+    });
+
+    for (std::size_t i = 0; i < visits.size(); i++) {
+        ASSERT_EQ(((i >= 30) && (i < 70)) ? 1U : 0U, visits[i]);
+    }
+}
+
+
+static void template_uneven_work(const std::size_t p_amount_threads, const std::size_t p_grain_size) {
+    const std::size_t default_amount_threads = work_stealing_pool::get_instance().get_amount_threads();
+    const std::size_t default_grain_size = work_stealing_pool::get_instance().get_grain_size();
+
+    work_stealing_pool::get_instance().set_amount_threads(p_amount_threads);
+    work_stealing_pool::get_instance().set_grain_size(p_grain_size);
+
+    ASSERT_EQ(p_amount_threads, work_stealing_pool::get_instance().get_amount_threads());
+    ASSERT_EQ(p_grain_size, work_stealing_pool::get_instance().get_grain_size());
+
+    const std::size_t length = 2000;
+    std::vector<std::atomic<std::size_t>> visits(length);
+    for (auto & counter : visits) { counter = 0; }
+
+    /* work of the last iterations is much bigger than work of the first iterations */
+    std::vector<double> results(length, 0.0);
+    parallel_for(std::size_t(0), length, [&visits, &results](const std::size_t p_index) {
+        double value = 0.0;
+        for (std::size_t i = 0; i < p_index * 10; i++) {
+            value += 1.0 / (1.0 + i);
+        }
+
+        results[p_index] = value;
+        visits[p_index]++;
+    });
+
+    for (std::size_t i = 0; i < length; i++) {
+        ASSERT_EQ(1U, visits[i].load());
+    }
+
+    work_stealing_pool::get_instance().set_amount_threads(default_amount_threads);
+    work_stealing_pool::get_instance().set_grain_size(default_grain_size);
+}
+
+
+TEST(utest_parallel_for, uneven_work_1_thread) {
+    template_uneven_work(1, 0);
+}
+
+
+TEST(utest_parallel_for, uneven_work_2_threads) {
+    template_uneven_work(2, 0);
+}
+
+
+TEST(utest_parallel_for, uneven_work_4_threads_grain_1) {
+    template_uneven_work(4, 1);
+}
+
+
+TEST(utest_parallel_for, uneven_work_8_threads_grain_7) {
+    template_uneven_work(8, 7);
+}
+
+
+TEST(utest_parallel_for, uneven_work_3_threads_big_grain) {
+    template_uneven_work(3, 5000);
+}
+
+
+TEST(utest_parallel_for, nested_loops) {
+    const std::size_t length = 50;
+
+    std::vector<std::vector<std::size_t>> results(length, std::vector<std::size_t>(length, 0));
+    parallel_for(std::size_t(0), length, [&results, length](const std::size_t p_row) {
+        parallel_for(std::size_t(0), length, [&results, p_row](const std::size_t p_column) {
+            results[p_row][p_column] = p_row * p_column;
+        });
+    });
+
+    for (std::size_t i = 0; i < length; i++) {
+        for (std::size_t j = 0; j < length; j++) {
+            ASSERT_EQ(i * j, results[i][j]);
+        }
+    }
+}
+
+
+TEST(utest_parallel_for, exception_in_task) {
+    std::atomic<std::size_t> counter(0);
+
+    ASSERT_THROW(parallel_for(std::size_t(0), std::size_t(1000), [&counter](const std::size_t p_index) {
+        counter++;
+        if (p_index == 500) {
+            throw std::runtime_error("failure");
+        }
+    }), std::runtime_error);
+
+    /* pool is workable after failure */
+    template_parallel_square(1000);
+}
+
+
+TEST(utest_parallel_for, for_each_vector) {
+    std::vector<std::size_t> values(1000);
+    std::iota(values.begin(), values.end(), 0);
+
+    std::vector<std::size_t> results(values.size(), 0);
+    parallel_for_each(values, [&results](const std::size_t p_value) {
+        results[p_value] = p_value + 1;
+    });
+
+    for (std::size_t i = 0; i < values.size(); i++) {
+        ASSERT_EQ(i + 1, results[i]);
+    }
+}
+
+
+TEST(utest_parallel_for, for_each_list) {
+    std::list<std::size_t> values(100);
+    std::iota(values.begin(), values.end(), 0);
+
+    std::vector<std::size_t> results(values.size(), 0);
+    parallel_for_each(values.begin(), values.end(), [&results](const std::size_t p_value) {
+        results[p_value] = p_value * 2;
+    });
+
+    for (std::size_t i = 0; i < results.size(); i++) {
+        ASSERT_EQ(i * 2, results[i]);
+    }
+}
+
+
+TEST(utest_parallel_for, default_amount_threads) {
+    ASSERT_GE(work_stealing_pool::get_default_amount_threads(), 1U);
 }
\ No newline at end of file
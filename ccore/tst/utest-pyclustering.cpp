@@ -163,4 +163,28 @@ TEST(utest_pyclustering, package_unpack_empty) {
 
 TEST(utest_pyclustering, package_unpack_two_dimension) {
     template_pack_unpack(std::vector<std::vector<double>>({ { 1.2, 2.4 }, { 3.6, 4.8, 5.0 }, { 6.0 } }));
+}
+
+
+TEST(utest_pyclustering, package_double_matrix) {
+    std::vector<double> buffer = { 1.0, 2.0, 3.0, 4.0, 5.0, 6.0 };
+
+    pyclustering_matrix matrix;
+    matrix.rows = 3;
+    matrix.columns = 2;
+    matrix.data = buffer.data();
+
+    pyclustering_package * package = new pyclustering_package(pyclustering_data_t::PYCLUSTERING_TYPE_DOUBLE_MATRIX);
+    package->size = matrix.rows;
+    package->data = (void *) &matrix;
+
+    std::vector<std::vector<double>> unpack_container;
+    package->extract(unpack_container);
+
+    std::vector<std::vector<double>> expected_container = { { 1.0, 2.0 }, { 3.0, 4.0 }, { 5.0, 6.0 } };
+    ASSERT_EQ(expected_container, unpack_container);
+    ASSERT_EQ(4.0, package->at<double>(1, 1));
+
+    delete package;     /* buffer is not owned by the package */
+    ASSERT_EQ(6.0, buffer.back());
 }
\ No newline at end of file
@@ -25,12 +25,12 @@
 """
 
 
+import numpy;
+
 from enum import IntEnum;
 
 from pyclustering.cluster.encoder import type_encoding;
 
-from pyclustering.utils import euclidean_distance_square;
-
 from pyclustering.core.wrapper import ccore_library
 
 import pyclustering.core.agglomerative_wrapper as wrapper;
@@ -98,6 +98,19 @@ class agglomerative:
         visualizer.show();
     @endcode
     
+    Python implementation builds the whole dendrogram at once, therefore clusters for different amount of clusters
+    can be extracted without re-running the algorithm:
+    @code
+        agglomerative_instance = agglomerative(sample, 2, type_link.AVERAGE_LINK, False);
+        agglomerative_instance.process();
+        
+        # merge history, each row is [index cluster 1, index cluster 2, link distance, size of merged cluster]
+        linkage = agglomerative_instance.get_linkage();
+        
+        three_clusters = agglomerative_instance.extract_clusters(3);
+        four_clusters = agglomerative_instance.extract_clusters(4);
+    @endcode
+    
     Example of agglomerative clustering using different links:
     @image html agglomerative_lsun_clustering_single_link.png
     
@@ -123,12 +136,10 @@ class agglomerative:
             self.__similarity = type_link.CENTROID_LINK;
         
         self.__clusters = [];
+        self.__linkage = None;
         self.__ccore = ccore;
         if (self.__ccore):
             self.__ccore = ccore_library.workable();
-        
-        if (self.__similarity == type_link.CENTROID_LINK):
-            self.__centers = self.__pointer_data.copy();    # used in case of usage of centroid links
     
     
     def process(self):
@@ -143,13 +154,8 @@ class agglomerative:
             self.__clusters = wrapper.agglomerative_algorithm(self.__pointer_data, self.__number_clusters, self.__similarity);
 
         else:
-            self.__clusters = [[index] for index in range(0, len(self.__pointer_data))];
-            
-            current_number_clusters = len(self.__clusters);
-                
-            while (current_number_clusters > self.__number_clusters):
-                self.__merge_similar_clusters();
-                current_number_clusters = len(self.__clusters);
+            self.__linkage = self.__build_linkage();
+            self.__clusters = self.extract_clusters(self.__number_clusters);
     
     
     def get_clusters(self):
@@ -167,6 +173,62 @@ class agglomerative:
         return self.__clusters;
     
     
+    def get_linkage(self):
+        """!
+        @brief Returns history of merges of clusters that is built by Python implementation of the algorithm.
+        @details Each row of the array describes merge as [index cluster 1, index cluster 2, link distance, size of merged cluster],
+                  where clusters with indexes less than amount of objects are objects themselves and cluster that is
+                  created by row 'i' has index 'amount of objects + i'. Link distance is based on square Euclidean distance.
+        
+        @return (numpy.array) Merge history as array of size [(amount of objects - 1) x 4], None if CCORE is used.
+        
+        @see extract_clusters()
+        
+        """
+        
+        return self.__linkage;
+    
+    
+    def extract_clusters(self, number_clusters):
+        """!
+        @brief Extracts clusters from merge history for specified amount of clusters without re-running the algorithm.
+        
+        @param[in] number_clusters (uint): Number of clusters that should be allocated.
+        
+        @return (list) List of allocated clusters, each cluster contains indexes of objects in list of data.
+        
+        @see get_linkage()
+        
+        """
+        
+        if (self.__linkage is None):
+            raise ValueError("Merge history is not available: Python implementation of the algorithm should be processed.");
+        
+        amount_objects = len(self.__linkage) + 1 if (len(self.__pointer_data) > 0) else 0;
+        amount_merges = min(max(amount_objects - number_clusters, 0), len(self.__linkage));
+        
+        # cluster that is created by merge is a parent of merged clusters, roots are found by pointer jumping
+        parents = numpy.arange(amount_objects + amount_merges);
+        merged_clusters = self.__linkage[:amount_merges, :2].astype(numpy.intp);
+        parents[merged_clusters[:, 0]] = numpy.arange(amount_objects, amount_objects + amount_merges);
+        parents[merged_clusters[:, 1]] = numpy.arange(amount_objects, amount_objects + amount_merges);
+        
+        while True:
+            grandparents = parents[parents];
+            if (numpy.array_equal(grandparents, parents)):
+                break;
+            
+            parents = grandparents;
+        
+        roots = parents[:amount_objects];
+        order = numpy.argsort(roots, kind='stable');
+        borders = numpy.nonzero(numpy.diff(roots[order]))[0] + 1;
+        
+        clusters = [cluster.tolist() for cluster in numpy.split(order, borders)] if (amount_objects > 0) else [];
+        clusters.sort(key = lambda cluster: cluster[0]);
+        return clusters;
+    
+    
     def get_cluster_encoding(self):
         """!
         @brief Returns clustering result representation type that indicate how clusters are encoded.
@@ -180,177 +242,293 @@ class agglomerative:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION;
     
     
-    def __merge_similar_clusters(self):
+    def __build_linkage(self):
         """!
-        @brief Merges the most similar clusters in line with link type.
+        @brief Builds the whole merge history in line with link type.
+        @details Links between clusters are stored in condensed matrix and updated by Lance-Williams formula after
+                  each merge. Nearest-neighbor chain is used for single, complete and average links because they
+                  satisfy reducibility property, in this case merges are sorted by link distance at the end. Centroid
+                  link does not satisfy it, therefore the nearest neighbor of each cluster is stored and the closest pair
+                  is merged at each step.
+        
+        @return (numpy.array) Merge history, see get_linkage().
         
         """
         
-        if (self.__similarity == type_link.AVERAGE_LINK):
-            self.__merge_by_average_link();
+        if (self.__similarity not in (type_link.SINGLE_LINK, type_link.COMPLETE_LINK, type_link.AVERAGE_LINK, type_link.CENTROID_LINK)):
+            raise NameError('Not supported similarity is used');
         
-        elif (self.__similarity == type_link.CENTROID_LINK):
-            self.__merge_by_centroid_link();
+        data = numpy.array(self.__pointer_data, dtype=numpy.double);
+        amount_objects = len(data);
+        if (amount_objects == 0):
+            return numpy.empty((0, 4));
         
-        elif (self.__similarity == type_link.COMPLETE_LINK):
-            self.__merge_by_complete_link();
+        if (data.ndim == 1):
+            data = data.reshape(-1, 1);
         
-        elif (self.__similarity == type_link.SINGLE_LINK):
-            self.__merge_by_signle_link();
+        self.__links = self.__calculate_condensed_distances(data);
+        self.__sizes = numpy.ones(amount_objects);
+        self.__active = numpy.ones(amount_objects, dtype=bool);
         
+        if (self.__similarity == type_link.CENTROID_LINK):
+            merges = self.__merge_by_nearest_neighbors(amount_objects);
         else:
-            raise NameError('Not supported similarity is used');
+            merges = self.__merge_by_nearest_neighbor_chain(amount_objects);
+            merges.sort(key = lambda merge: merge[2]);      # stable sort keeps order of dependent merges
+        
+        self.__links, self.__sizes, self.__active = None, None, None;
+        return self.__label_merges(merges, amount_objects);
     
     
-    def __merge_by_average_link(self):
+    def __merge_by_nearest_neighbor_chain(self, amount_objects):
         """!
-        @brief Merges the most similar clusters in line with average link type.
+        @brief Merges clusters using nearest-neighbor chain until one cluster remains.
+        @details Chain is grown from arbitrary cluster by the nearest neighbor of the last cluster in the chain, two
+                  last clusters are merged when they are reciprocal nearest neighbors.
+        
+        @param[in] amount_objects (uint): Amount of objects in input data.
+        
+        @return (list) Merges as [slot 1, slot 2, link distance] in order of merging, where slot is index of object
+                 that represents cluster.
         
         """
         
-        minimum_average_distance = float('Inf');
+        merges = [];
+        chain = [];
         
-        for index_cluster1 in range(0, len(self.__clusters)):
-            for index_cluster2 in range(index_cluster1 + 1, len(self.__clusters)):
-                
-                # Find farthest objects
-                candidate_average_distance = 0.0;
-                for index_object1 in self.__clusters[index_cluster1]:
-                    for index_object2 in self.__clusters[index_cluster2]:
-                        candidate_average_distance += euclidean_distance_square(self.__pointer_data[index_object1], self.__pointer_data[index_object2]);
+        for _ in range(amount_objects - 1):
+            if (len(chain) == 0):
+                chain.append(int(numpy.argmax(self.__active)));
+            
+            while True:
+                index_cluster = chain[-1];
+                links = self.__get_links(index_cluster);
+                index_nearest = int(numpy.argmin(links));
                 
-                candidate_average_distance /= (len(self.__clusters[index_cluster1]) + len(self.__clusters[index_cluster2]));
+                # previous cluster in the chain is preferred in case of equal links to avoid cycles
+                if ((len(chain) > 1) and (links[chain[-2]] <= links[index_nearest])):
+                    index_nearest = chain[-2];
+                    break;
                 
-                if (candidate_average_distance < minimum_average_distance):
-                    minimum_average_distance = candidate_average_distance;
-                    indexes = [index_cluster1, index_cluster2];
-        
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]];  
-        self.__clusters.pop(indexes[1]);   # remove merged cluster.  
+                chain.append(index_nearest);
+            
+            chain.pop();
+            chain.pop();
+            
+            merges.append(self.__merge_clusters(index_cluster, index_nearest, links[index_nearest]));
         
+        return merges;
+    
     
-    def __merge_by_centroid_link(self):
+    def __merge_by_nearest_neighbors(self, amount_objects):
         """!
-        @brief Merges the most similar clusters in line with centroid link type.
+        @brief Merges the closest pair of clusters until one cluster remains using the nearest neighbor of each cluster.
+        @details Nearest neighbor is searched again only for clusters whose nearest neighbor was merged, other
+                  clusters compare their nearest neighbor with merged cluster.
+        
+        @param[in] amount_objects (uint): Amount of objects in input data.
+        
+        @return (list) Merges as [slot 1, slot 2, link distance] in order of merging, where slot is index of object
+                 that represents cluster.
         
         """
         
-        minimum_centroid_distance = float('Inf');
-        indexes = None;
+        merges = [];
         
-        for index1 in range(0, len(self.__centers)):
-            for index2 in range(index1 + 1, len(self.__centers)):
-                distance = euclidean_distance_square(self.__centers[index1], self.__centers[index2]);
-                if (distance < minimum_centroid_distance):
-                    minimum_centroid_distance = distance;
-                    indexes = [index1, index2];
+        nearest_indexes = numpy.zeros(amount_objects, dtype=numpy.intp);
+        nearest_links = numpy.full(amount_objects, float('inf'));
+        for index_cluster in range(amount_objects):
+            self.__update_nearest(index_cluster, nearest_indexes, nearest_links);
         
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]];
-        self.__centers[indexes[0]] = self.__calculate_center(self.__clusters[indexes[0]]);
-         
-        self.__clusters.pop(indexes[1]);   # remove merged cluster.
-        self.__centers.pop(indexes[1]);    # remove merged center.
+        for _ in range(amount_objects - 1):
+            index_cluster1 = int(numpy.argmin(nearest_links));
+            index_cluster2 = int(nearest_indexes[index_cluster1]);
+            
+            merges.append(self.__merge_clusters(index_cluster1, index_cluster2, nearest_links[index_cluster1]));
+            
+            index_merged = min(index_cluster1, index_cluster2);
+            index_removed = max(index_cluster1, index_cluster2);
+            nearest_links[index_removed] = float('inf');
+            
+            links = self.__get_links(index_merged);
+            
+            outdated = numpy.nonzero(self.__active & ((nearest_indexes == index_cluster1) | (nearest_indexes == index_cluster2)))[0];
+            for index_cluster in outdated.tolist() + [index_merged]:
+                self.__update_nearest(index_cluster, nearest_indexes, nearest_links);
+            
+            closer = self.__active & (links < nearest_links);
+            nearest_indexes[closer] = index_merged;
+            nearest_links[closer] = links[closer];
+        
+        return merges;
     
     
-    def __merge_by_complete_link(self):
+    def __update_nearest(self, index_cluster, nearest_indexes, nearest_links):
         """!
-        @brief Merges the most similar clusters in line with complete link type.
+        @brief Finds the nearest neighbor of the cluster.
         
-        """
+        @param[in] index_cluster (uint): Index of slot of the cluster.
+        @param[in|out] nearest_indexes (numpy.array): Slot of the nearest neighbor of each cluster.
+        @param[in|out] nearest_links (numpy.array): Link to the nearest neighbor of each cluster.
         
-        minimum_complete_distance = float('Inf');
-        indexes = None;
+        """
         
-        for index_cluster1 in range(0, len(self.__clusters)):
-            for index_cluster2 in range(index_cluster1 + 1, len(self.__clusters)):
-                candidate_maximum_distance = self.__calculate_farthest_distance(index_cluster1, index_cluster2);
-                
-                if (candidate_maximum_distance < minimum_complete_distance):
-                    minimum_complete_distance = candidate_maximum_distance;
-                    indexes = [index_cluster1, index_cluster2];
-
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]];  
-        self.__clusters.pop(indexes[1]);   # remove merged cluster.        
+        links = self.__get_links(index_cluster);
+        nearest_indexes[index_cluster] = numpy.argmin(links);
+        nearest_links[index_cluster] = links[nearest_indexes[index_cluster]];
     
     
-    def __calculate_farthest_distance(self, index_cluster1, index_cluster2):
+    def __merge_clusters(self, index_cluster1, index_cluster2, link):
         """!
-        @brief Finds two farthest objects in two specified clusters in terms and returns distance between them.
+        @brief Merges two clusters and updates links to the merged cluster by Lance-Williams formula.
+        @details Merged cluster is stored in the slot with smaller index.
         
-        @param[in] (uint) Index of the first cluster.
-        @param[in] (uint) Index of the second cluster.
+        @param[in] index_cluster1 (uint): Index of slot of the first cluster.
+        @param[in] index_cluster2 (uint): Index of slot of the second cluster.
+        @param[in] link (double): Link distance between clusters.
         
-        @return The farthest euclidean distance between two clusters.
+        @return (list) Merge description [slot 1, slot 2, link distance].
         
         """
-        candidate_maximum_distance = 0.0;
-        for index_object1 in self.__clusters[index_cluster1]:
-            for index_object2 in self.__clusters[index_cluster2]:
-                distance = euclidean_distance_square(self.__pointer_data[index_object1], self.__pointer_data[index_object2]);
-                
-                if (distance > candidate_maximum_distance):
-                    candidate_maximum_distance = distance;
+        
+        index_merged = min(index_cluster1, index_cluster2);
+        index_removed = max(index_cluster1, index_cluster2);
+        
+        self.__active[index_removed] = False;
+        others = numpy.nonzero(self.__active)[0];
+        others = others[others != index_merged];
+        
+        positions_merged = self.__condensed_positions(index_merged, others);
+        positions_removed = self.__condensed_positions(index_removed, others);
+        
+        links_merged = self.__links[positions_merged];
+        links_removed = self.__links[positions_removed];
+        
+        if (self.__similarity == type_link.SINGLE_LINK):
+            self.__links[positions_merged] = numpy.minimum(links_merged, links_removed);
+        
+        elif (self.__similarity == type_link.COMPLETE_LINK):
+            self.__links[positions_merged] = numpy.maximum(links_merged, links_removed);
+        
+        elif (self.__similarity == type_link.AVERAGE_LINK):
+            # sums of distances between objects are stored, link is calculated using sizes of clusters
+            self.__links[positions_merged] = links_merged + links_removed;
+        
+        else:
+            # square Euclidean distance between centers
+            size_merged, size_removed = self.__sizes[index_merged], self.__sizes[index_removed];
+            size_total = size_merged + size_removed;
+            
+            self.__links[positions_merged] = (size_merged * links_merged + size_removed * links_removed) / size_total - \
+                                             size_merged * size_removed * link / (size_total * size_total);
+        
+        self.__sizes[index_merged] += self.__sizes[index_removed];
+        return [index_cluster1, index_cluster2, link];
     
-        return candidate_maximum_distance;
+    
+    def __get_links(self, index_cluster):
+        """!
+        @brief Returns links from the cluster to each slot, links to itself and to inactive slots are infinity.
+        
+        @param[in] index_cluster (uint): Index of slot of the cluster.
+        
+        @return (numpy.array) Link from the cluster to each slot.
+        
+        """
+        
+        others = numpy.arange(len(self.__active));
+        links = self.__links[self.__condensed_positions(index_cluster, others)];
+        
+        if (self.__similarity == type_link.AVERAGE_LINK):
+            links = links / (self.__sizes[index_cluster] + self.__sizes);
+        
+        links[~self.__active] = float('inf');
+        links[index_cluster] = float('inf');
+        return links;
     
     
-    def __merge_by_signle_link(self):
+    def __condensed_positions(self, index_cluster, others):
         """!
-        @brief Merges the most similar clusters in line with single link type.
+        @brief Returns positions of links between the cluster and other clusters in condensed matrix.
+        @details Position of link to itself is replaced by zero.
+        
+        @param[in] index_cluster (uint): Index of slot of the cluster.
+        @param[in] others (numpy.array): Indexes of slots of other clusters.
+        
+        @return (numpy.array) Positions in condensed matrix.
         
         """
         
-        minimum_single_distance = float('Inf');
-        indexes = None;
+        amount_objects = len(self.__active);
         
-        for index_cluster1 in range(0, len(self.__clusters)):
-            for index_cluster2 in range(index_cluster1 + 1, len(self.__clusters)):
-                candidate_minimum_distance = self.__calculate_nearest_distance(index_cluster1, index_cluster2);
-                
-                if (candidate_minimum_distance < minimum_single_distance):
-                    minimum_single_distance = candidate_minimum_distance;
-                    indexes = [index_cluster1, index_cluster2];
-
-        self.__clusters[indexes[0]] += self.__clusters[indexes[1]];  
-        self.__clusters.pop(indexes[1]);   # remove merged cluster.
+        lower = numpy.minimum(index_cluster, others);
+        upper = numpy.maximum(index_cluster, others);
+        
+        positions = amount_objects * lower - lower * (lower + 1) // 2 + upper - lower - 1;
+        positions[lower == upper] = 0;
+        return positions;
     
     
-    def __calculate_nearest_distance(self, index_cluster1, index_cluster2):
+    @staticmethod
+    def __calculate_condensed_distances(data):
         """!
-        @brief Finds two nearest objects in two specified clusters and returns distance between them.
+        @brief Calculates square Euclidean distances between each pair of objects.
         
-        @param[in] (uint) Index of the first cluster.
-        @param[in] (uint) Index of the second cluster.
+        @param[in] data (numpy.array): Input data.
         
-        @return The nearest euclidean distance between two clusters.
+        @return (numpy.array) Condensed matrix: distances between object 'i' and objects 'i + 1', 'i + 2', ... are stored sequentially.
         
         """
-        candidate_minimum_distance = float('Inf');
         
-        for index_object1 in self.__clusters[index_cluster1]:
-            for index_object2 in self.__clusters[index_cluster2]:
-                distance = euclidean_distance_square(self.__pointer_data[index_object1], self.__pointer_data[index_object2]);
-                if (distance < candidate_minimum_distance):
-                    candidate_minimum_distance = distance;
+        amount_objects = len(data);
+        distances = numpy.empty(amount_objects * (amount_objects - 1) // 2);
+        
+        position = 0;
+        for index_object in range(amount_objects - 1):
+            row_distances = numpy.sum(numpy.square(data[index_object + 1:] - data[index_object]), axis=1);
+            distances[position:position + len(row_distances)] = row_distances;
+            position += len(row_distances);
         
-        return candidate_minimum_distance;
+        return distances;
     
     
-    def __calculate_center(self, cluster):
+    @staticmethod
+    def __label_merges(merges, amount_objects):
         """!
-        @brief Calculates new center.
+        @brief Converts merges of slots to merge history where each merge creates new cluster.
+        @details Slot is an index of object from merged cluster, therefore the current cluster of slot is found by union-find.
+        
+        @param[in] merges (list): Merges as [slot 1, slot 2, link distance].
+        @param[in] amount_objects (uint): Amount of objects in input data.
         
-        @return (list) New value of the center of the specified cluster.
+        @return (numpy.array) Merge history, see get_linkage().
         
         """
-         
-        dimension = len(self.__pointer_data[cluster[0]]);
-        center = [0] * dimension;
-        for index_point in cluster:
-            for index_dimension in range(0, dimension):
-                center[index_dimension] += self.__pointer_data[index_point][index_dimension];
-         
-        for index_dimension in range(0, dimension):
-            center[index_dimension] /= len(cluster);
-             
-        return center;
\ No newline at end of file
+        
+        linkage = numpy.empty((len(merges), 4));
+        
+        # union-find where the root of each tree is the latest cluster that contains the object
+        parents = list(range(amount_objects + len(merges)));
+        sizes = [1] * (amount_objects + len(merges));
+        
+        def find_cluster(index_object):
+            index_root = index_object;
+            while parents[index_root] != index_root:
+                index_root = parents[index_root];
+            
+            while parents[index_object] != index_root:
+                parents[index_object], index_object = index_root, parents[index_object];
+            
+            return index_root;
+        
+        for index_merge in range(len(merges)):
+            index_slot1, index_slot2, link = merges[index_merge];
+            index_cluster1, index_cluster2 = find_cluster(index_slot1), find_cluster(index_slot2);
+            index_created = amount_objects + index_merge;
+            
+            parents[index_cluster1] = parents[index_cluster2] = index_created;
+            sizes[index_created] = sizes[index_cluster1] + sizes[index_cluster2];
+            
+            linkage[index_merge] = [index_cluster1, index_cluster2, link, sizes[index_created]];
+        
+        return linkage;
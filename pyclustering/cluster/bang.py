@@ -32,6 +32,7 @@ import matplotlib.patches as patches
 import matplotlib.animation as animation
 
 import itertools
+import numpy
 
 from pyclustering.cluster import cluster_visualizer
 from pyclustering.cluster.encoder import type_encoding
@@ -750,18 +751,20 @@ class bang_block:
     @brief BANG-block that represent spatial region in data space.
 
     """
-    def __init__(self, data, region, level, space_block, cache_points=False):
+    def __init__(self, data, region, level, space_block, cache_points=False, candidates=None):
         """!
         @brief Create BANG-block.
 
-        @param[in] data (list): List of points that are processed.
+        @param[in] data (array_like): List of points that are processed.
         @param[in] region (uint): Region number - unique value on a level.
         @param[in] level (uint): Level number where block is created.
         @param[in] space_block (spatial_block): Spatial block description in data space.
         @param[in] cache_points (bool): if True then points are stored in memory (used for leaf blocks).
+        @param[in] candidates (numpy.array): Indexes of points that might be covered by the block (for example, points
+                    of parent block), if it is None then all points are considered.
 
         """
-        self.__data = data
+        self.__data = numpy.asarray(data, dtype=numpy.float64)
         self.__region_number = region
         self.__level = level
         self.__spatial_block = space_block
@@ -769,9 +772,13 @@ class bang_block:
 
         self.__cluster = None
         self.__points = None
-        self.__amount_points = self.__get_amount_points()
+        self.__covered_indexes = self.__find_covered_points(candidates)
+        self.__amount_points = len(self.__covered_indexes)
         self.__density = self.__calculate_density(self.__amount_points)
 
+        if self.__cache_points:
+            self.__points = self.__covered_indexes.tolist()
+
 
     def __str__(self):
         """!
@@ -882,8 +889,11 @@ class bang_block:
 
         first_spatial_block, second_spatial_block = self.__spatial_block.split(split_dimension)
 
-        left = bang_block(self.__data, left_region_number, self.__level + 1, first_spatial_block, cache_points)
-        right = bang_block(self.__data, right_region_number, self.__level + 1, second_spatial_block, cache_points)
+        left = bang_block(self.__data, left_region_number, self.__level + 1, first_spatial_block, cache_points, self.__covered_indexes)
+        right = bang_block(self.__data, right_region_number, self.__level + 1, second_spatial_block, cache_points, self.__covered_indexes)
+
+        # covered points are stored by new blocks, there is no need to keep them in non-leaf block
+        self.__covered_indexes = None
 
         return left, right
 
@@ -904,20 +914,24 @@ class bang_block:
         return 0.0
 
 
-    def __get_amount_points(self):
+    def __find_covered_points(self, candidates):
         """!
-        @brief Count covered points by the BANG-block and if cache is enable then covered points are stored.
+        @brief Finds points that are covered by the BANG-block using vectorized comparison with block corners.
+
+        @param[in] candidates (numpy.array): Indexes of points that might be covered by the block, if it is None then
+                    all points are considered.
 
-        @return (uint) Amount of covered points.
+        @return (numpy.array) Indexes of covered points.
 
         """
-        amount = 0
-        for index in range(len(self.__data)):
-            if self.__data[index] in self.__spatial_block:
-                self.__cache_point(index)
-                amount += 1
+        if candidates is None:
+            candidates = numpy.arange(len(self.__data))
+
+        max_corner, min_corner = self.__spatial_block.get_corners()
+        points = self.__data[candidates]
 
-        return amount
+        covered = numpy.all((points >= min_corner) & (points <= max_corner), axis=1)
+        return candidates[covered]
 
 
     def __cache_covered_data(self):
@@ -926,25 +940,11 @@ class bang_block:
 
         """
         self.__cache_points = True
-        self.__points = []
 
-        for index_point in range(len(self.__data)):
-            if self.__data[index_point] in self.__spatial_block:
-                self.__cache_point(index_point)
+        if self.__covered_indexes is None:
+            self.__covered_indexes = self.__find_covered_points(None)
 
-
-    def __cache_point(self, index):
-        """!
-        @brief Store index points.
-
-        @param[in] index (uint): Index point that should be stored.
-
-        """
-        if self.__cache_points:
-            if self.__points is None:
-                self.__points = []
-
-            self.__points.append(index)
+        self.__points = self.__covered_indexes.tolist()
 
 
 
@@ -1029,6 +1029,10 @@ class bang:
         self.__amount_threshold = kwargs.get('amount_threshold', 0)
         self.__ccore = ccore
 
+        self.__lattice_origin = None
+        self.__lattice_step = None
+        self.__leaf_index = None
+
         self.__validate_arguments()
 
 
@@ -1141,6 +1145,8 @@ class bang:
         leaf_blocks = self.__directory.get_leafs()
         unhandled_block_indexes = set([i for i in range(len(leaf_blocks)) if leaf_blocks[i].get_density() > self.__density_threshold])
 
+        self.__create_leaf_index(leaf_blocks)
+
         current_block = self.__find_block_center(leaf_blocks, unhandled_block_indexes)
         cluster_index = 0
 
@@ -1237,7 +1243,7 @@ class bang:
         neighbors = []
 
         handled_block_indexes = []
-        for unhandled_index in unhandled_block_indexes:
+        for unhandled_index in self.__find_neighbor_candidates(block, unhandled_block_indexes):
             if block.is_neighbor(level_blocks[unhandled_index]):
                 handled_block_indexes.append(unhandled_index)
                 neighbors.append(level_blocks[unhandled_index])
@@ -1252,6 +1258,76 @@ class bang:
         return neighbors
 
 
+    def __create_leaf_index(self, leaf_blocks):
+        """!
+        @brief Creates index of leaf BANG-blocks by their maximum corners.
+        @details Borders of blocks are obtained by halving, therefore maximum corner of each block lies on a lattice
+                  whose step is defined by the smallest block. Blocks are stored in dictionary by integer lattice
+                  coordinates of their maximum corners.
+
+        @param[in] leaf_blocks (list): Leaf BANG-blocks (the smallest cells).
+
+        """
+        max_corners = numpy.array([block.get_spatial_block().get_corners()[0] for block in leaf_blocks], dtype=numpy.float64)
+        min_corners = numpy.array([block.get_spatial_block().get_corners()[1] for block in leaf_blocks], dtype=numpy.float64)
+
+        self.__lattice_origin = numpy.min(min_corners, axis=0)
+        self.__lattice_step = numpy.min(max_corners - min_corners, axis=0)
+
+        self.__leaf_index = {}
+        for index_block, key in enumerate(self.__get_lattice_lengths(max_corners - self.__lattice_origin).tolist()):
+            self.__leaf_index.setdefault(tuple(key), []).append(index_block)
+
+
+    def __get_lattice_lengths(self, lengths):
+        """!
+        @brief Converts lengths in data space to amount of lattice steps in each dimension.
+
+        @param[in] lengths (numpy.array): Lengths in data space, for example, distances from lattice origin to corners.
+
+        @return (numpy.array) Integer amount of lattice steps, it is zero for dimension where all points are equal.
+
+        """
+        steps = numpy.where(self.__lattice_step > 0.0, self.__lattice_step, 1.0)
+        amount_steps = numpy.rint(lengths / steps).astype(numpy.int64)
+        return numpy.where(self.__lattice_step > 0.0, amount_steps, 0)
+
+
+    def __find_neighbor_candidates(self, block, unhandled_block_indexes):
+        """!
+        @brief Returns unhandled blocks whose maximum corners are located close enough to be neighbors of the block.
+        @details Candidates are found by the index of leaf blocks, if the block is too big in comparison with lattice
+                  step then all unhandled blocks are considered as candidates.
+
+        @param[in] block (bang_block): BANG-block for which neighbor candidates should be found.
+        @param[in] unhandled_block_indexes (set): Blocks that have not been processed yet.
+
+        @return (list) Sorted indexes of candidates.
+
+        """
+        max_corner, min_corner = block.get_spatial_block().get_corners()
+        max_corner = numpy.array(max_corner, dtype=numpy.float64)
+
+        center = self.__get_lattice_lengths(max_corner - self.__lattice_origin).tolist()
+        reach = self.__get_lattice_lengths(max_corner - min_corner).tolist()
+
+        amount_keys = 1
+        for distance in reach:
+            amount_keys *= 2 * distance + 1
+
+        if amount_keys > len(unhandled_block_indexes):
+            return sorted(unhandled_block_indexes)
+
+        candidates = []
+        ranges = [range(center[i] - reach[i], center[i] + reach[i] + 1) for i in range(len(center))]
+        for key in itertools.product(*ranges):
+            for index_block in self.__leaf_index.get(key, []):
+                if index_block in unhandled_block_indexes:
+                    candidates.append(index_block)
+
+        return sorted(candidates)
+
+
     def __update_cluster_dendrogram(self, index_cluster, blocks):
         """!
         @brief Append clustered blocks to dendrogram.
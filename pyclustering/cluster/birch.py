@@ -25,12 +25,14 @@
 """
 
 
-from pyclustering.utils import linear_sum, square_sum;
+import numpy;
 
 from pyclustering.cluster.encoder import type_encoding;
 
 from pyclustering.container.cftree import cftree, cfentry, measurement_type;
 
+from pyclustering.utils import split_blocks, euclidean_distance_square_blocks;
+
 
 class birch:
     """!
@@ -51,13 +53,26 @@ class birch:
         clusters = birch_instance.get_clusters();
     @endcode
     
+    Data can be also streamed through CF-tree by chunks, memory that is used by the tree is bounded by 'entry_size_limit':
+    @code
+        birch_instance = birch(None, 2);
+        
+        for chunk in chunks:
+            birch_instance.partial_fit(chunk);
+        
+        # build clusters from CF-tree features and assign points to them
+        birch_instance.process();
+        labels = birch_instance.predict(sample);
+    @endcode
+    
     """
     
     def __init__(self, data, number_clusters, branching_factor = 5, max_node_entries = 5, initial_diameter = 0.1, type_measurement = measurement_type.CENTROID_EUCLIDEAN_DISTANCE, entry_size_limit = 200, diameter_multiplier = 1.5, ccore = True):
         """!
         @brief Constructor of clustering algorithm BIRCH.
         
-        @param[in] data (list): Input data presented as list of points (objects), where each point should be represented by list or tuple.
+        @param[in] data (list): Input data presented as list of points (objects), where each point should be represented by list or tuple,
+                    if it is None then data should be provided by chunks using method partial_fit().
         @param[in] number_clusters (uint): Number of clusters that should be allocated.
         @param[in] branching_factor (uint): Maximum number of successor that might be contained by each non-leaf node in CF-Tree.
         @param[in] max_node_entries (uint): Maximum number of entries that might be contained by each leaf node in CF-Tree.
@@ -103,25 +118,64 @@ class birch:
         @remark Results of clustering can be obtained using corresponding gets methods.
         
         @see get_clusters()
+        @see partial_fit()
         
         """
         
-        self.__insert_data();
+        if (self.__pointer_data is not None):
+            self.partial_fit(self.__pointer_data);
+        
         self.__extract_features();
 
         # in line with specification modify hierarchical algorithm should be used for further clustering
-        current_number_clusters = len(self.__features);
+        self.__merge_features();
         
-        while (current_number_clusters > self.__number_clusters):
-            indexes = self.__find_nearest_cluster_features();
-            
-            self.__features[indexes[0]] += self.__features[indexes[1]];
-            self.__features.pop(indexes[1]);
-            
-            current_number_clusters = len(self.__features);
-            
         # decode data
-        self.__decode_data();
+        if (self.__pointer_data is not None):
+            self.__decode_data();
+    
+    
+    def partial_fit(self, chunk):
+        """!
+        @brief Inserts chunk of data to the CF-tree without storing it.
+        @details Each point is inserted to the tree as a clustering feature, if maximum number of entries is exceeded
+                  then diameter is increased and the tree is rebuilt from its leaf entries. Thus memory that is
+                  used by the tree is bounded by the entry size limit regardless of amount of inserted data.
+        
+        @param[in] chunk (array_like): Chunk of points, where each point should be represented by list or tuple.
+        
+        @see process()
+        
+        """
+        
+        points = numpy.asarray(chunk, dtype = numpy.float64);
+        if (points.ndim == 1):
+            points = points.reshape(-1, 1);
+        
+        square_sums = numpy.einsum('ij,ij->i', points, points).tolist();
+        
+        for index_point in range(0, len(points)):
+            self.__tree.insert(cfentry(1, points[index_point].copy(), square_sums[index_point]));
+            
+            if (self.__tree.amount_entries > self.__entry_size_limit):
+                self.__tree = self.__rebuild_tree();
+    
+    
+    def predict(self, points):
+        """!
+        @brief Assigns points to clusters that have been allocated by the algorithm.
+        
+        @remark Points can be assigned only after data processing (use method process() before).
+        
+        @param[in] points (array_like): Points that should be assigned, where each point should be represented by list or tuple.
+        
+        @return (list) Index of cluster for each point.
+        
+        @see process()
+        
+        """
+        
+        return self.__get_nearest_features(points).tolist();
     
     
     def get_clusters(self):
@@ -178,46 +232,29 @@ class birch:
         
         """
         
-        self.__clusters = [ [] for _ in range(self.__number_clusters) ];
-        self.__noise = [];
-        
-        for index_point in range(0, len(self.__pointer_data)):
-            (_, cluster_index) = self.__get_nearest_feature(self.__pointer_data[index_point], self.__features);
-            
-            self.__clusters[cluster_index].append(index_point);
-    
-    
-    def __insert_data(self):
-        """!
-        @brief Inserts input data to the tree.
-        
-        @remark If number of maximum number of entries is exceeded than diameter is increased and tree is rebuilt.
+        labels = self.__get_nearest_features(self.__pointer_data);
         
-        """
+        order = numpy.argsort(labels, kind = 'stable');
+        bounds = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(labels, minlength = self.__number_clusters)))).tolist();
         
-        for index_point in range(0, len(self.__pointer_data)):
-            point = self.__pointer_data[index_point];
-            self.__tree.insert_cluster( [ point ] );
-            
-            if (self.__tree.amount_entries > self.__entry_size_limit):
-                self.__tree = self.__rebuild_tree(index_point);
-        
-        #self.__tree.show_feature_destibution(self.__pointer_data);
+        self.__clusters = [ order[bounds[index]:bounds[index + 1]].tolist() for index in range(self.__number_clusters) ];
+        self.__noise = [];
     
     
-    def __rebuild_tree(self, index_point):
+    def __rebuild_tree(self):
         """!
         @brief Rebuilt tree in case of maxumum number of entries is exceeded.
+        @details Leaf entries of the current tree are re-inserted to the new tree with increased diameter, therefore
+                  previously inserted points are not required for re-building.
         
-        @param[in] index_point (uint): Index of point that is used as end point of re-building.
-        
-        @return (cftree) Rebuilt tree with encoded points till specified point from input data space.
+        @return (cftree) Rebuilt tree that encodes the same points as the current tree.
         
         """
         
         rebuild_result = False;
         increased_diameter = self.__tree.threshold * self.__diameter_multiplier;
         
+        entries = [ entry for leaf in self.__tree.leafes for entry in leaf.entries ];
         tree = None;
         
         while(rebuild_result is False):
@@ -228,67 +265,204 @@ class birch:
             # build tree with update parameters
             tree = cftree(self.__tree.branch_factor, self.__tree.max_entries, increased_diameter, self.__tree.type_measurement);
             
-            for index_point in range(0, index_point + 1):
-                point = self.__pointer_data[index_point];
-                tree.insert_cluster([point]);
+            # Re-build is successful if entries are absorbed by the new tree.
+            rebuild_result = True;
+            
+            for entry in entries:
+                tree.insert(entry);
             
                 if (tree.amount_entries > self.__entry_size_limit):
                     increased_diameter *= self.__diameter_multiplier;
-                    continue;
-            
-            # Re-build is successful.
-            rebuild_result = True;
+                    rebuild_result = False;
+                    break;
         
         return tree;
     
     
-    def __find_nearest_cluster_features(self):
+    def __merge_features(self):
+        """!
+        @brief Merges nearest features until required number of clusters is reached.
+        @details Distances between features are stored in matrix where nearest feature of each one is cached, therefore
+                  only distances to merged feature are calculated after each merging and only features whose nearest
+                  feature has been merged are searched again.
+        
+        """
+        
+        amount_features = len(self.__features);
+        if (amount_features <= self.__number_clusters):
+            return;
+        
+        (numbers, linear_sums, square_sums) = self.__get_feature_arrays(self.__features);
+        
+        distances = self.__calculate_distances(numbers, linear_sums, square_sums, numbers, linear_sums, square_sums);
+        numpy.fill_diagonal(distances, float('inf'));
+        
+        nearest_indexes = numpy.argmin(distances, axis = 1);
+        nearest_distances = distances[numpy.arange(amount_features), nearest_indexes];
+        
+        alive = numpy.ones(amount_features, dtype = bool);
+        
+        for _ in range(amount_features - self.__number_clusters):
+            index1 = int(numpy.argmin(nearest_distances));
+            index2 = int(nearest_indexes[index1]);
+            (index1, index2) = (min(index1, index2), max(index1, index2));
+            
+            # the second feature is absorbed by the first one
+            numbers[index1] += numbers[index2];
+            linear_sums[index1] += linear_sums[index2];
+            square_sums[index1] += square_sums[index2];
+            
+            alive[index2] = False;
+            distances[index2, :] = float('inf');
+            distances[:, index2] = float('inf');
+            nearest_distances[index2] = float('inf');
+            
+            merged_distances = self.__calculate_distances(numbers[index1:index1 + 1], linear_sums[index1:index1 + 1], square_sums[index1:index1 + 1], numbers, linear_sums, square_sums)[0];
+            merged_distances[~alive] = float('inf');
+            merged_distances[index1] = float('inf');
+            
+            distances[index1, :] = merged_distances;
+            distances[:, index1] = merged_distances;
+            
+            # features whose nearest feature has been changed
+            outdated = numpy.nonzero(alive & ((nearest_indexes == index1) | (nearest_indexes == index2)))[0];
+            outdated = numpy.union1d(outdated, [ index1 ]);
+            
+            nearest_indexes[outdated] = numpy.argmin(distances[outdated], axis = 1);
+            nearest_distances[outdated] = distances[outdated, nearest_indexes[outdated]];
+            
+            closer = merged_distances < nearest_distances;
+            nearest_indexes[closer] = index1;
+            nearest_distances[closer] = merged_distances[closer];
+        
+        survived = numpy.nonzero(alive)[0].tolist();
+        self.__features = [ cfentry(int(numbers[index]), linear_sums[index], square_sums[index]) for index in survived ];
+    
+    
+    def __get_nearest_features(self, points):
         """!
-        @brief Find pair of nearest CF entries.
+        @brief Finds nearest feature for each specified point.
+        @details Point is assigned to the feature with the nearest centroid (Manhattan distance is used in case of centroid
+                  Manhattan measurement, otherwise Euclidean distance). Average and variance measurements between a point
+                  and a feature depend on size and spread of the feature, therefore they are used only for merging of
+                  features, otherwise compact features may attract points of the others and some clusters become empty.
         
-        @return (list) List of two nearest enties that are represented by list [index_point1, index_point2].
+        @param[in] points (array_like): Points for which nearest features should be found.
+        
+        @return (numpy.array) Index of nearest feature for each point.
         
         """
         
-        minimum_distance = float("Inf");
-        index1 = 0;
-        index2 = 0;
-        
-        for index_candidate1 in range(0, len(self.__features)):
-            feature1 = self.__features[index_candidate1];
-            for index_candidate2 in range(index_candidate1 + 1, len(self.__features)):
-                feature2 = self.__features[index_candidate2];
-                
-                distance = feature1.get_distance(feature2, self.__measurement_type);
-                if (distance < minimum_distance):
-                    minimum_distance = distance;
-                    
-                    index1 = index_candidate1;
-                    index2 = index_candidate2;
-        
-        return [index1, index2];
+        points = numpy.asarray(points, dtype = numpy.float64);
+        if (points.ndim == 1):
+            points = points.reshape(-1, 1);
+        
+        (numbers, linear_sums, square_sums) = self.__get_feature_arrays(self.__features);
+        
+        if (self.__measurement_type == measurement_type.CENTROID_MANHATTAN_DISTANCE):
+            point_numbers = numpy.ones(len(points));
+            point_square_sums = numpy.einsum('ij,ij->i', points, points);
+            
+            distances = self.__calculate_distances(point_numbers, points, point_square_sums, numbers, linear_sums, square_sums);
+            return numpy.argmin(distances, axis = 1);
+        
+        centroids = linear_sums / numbers[:, numpy.newaxis];
+        labels = numpy.empty(len(points), dtype = numpy.intp);
+        for (begin, end, distances) in euclidean_distance_square_blocks(points, centroids):
+            labels[begin:end] = numpy.argmin(distances, axis = 1);
+        
+        return labels;
     
     
-    def __get_nearest_feature(self, point, feature_collection):
+    def __get_feature_arrays(self, features):
         """!
-        @brief Find nearest entry for specified point.
+        @brief Represents features by arrays where each feature is described by row.
         
-        @param[in] point (list): Pointer to point from input dataset.
-        @param[in] feature_collection (list): Feature collection that is used for obtaining nearest feature for the specified point.
+        @param[in] features (list): Clustering features (cfentry) that should be represented by arrays.
         
-        @return (double, uint) Tuple of distance to nearest entry to the specified point and index of that entry.
+        @return (tuple) Arrays (numbers of points, linear sums, square sums) of the features.
         
         """
         
-        minimum_distance = float("Inf");
-        index_nearest_feature = -1;
+        numbers = numpy.array([ feature.number_points for feature in features ], dtype = numpy.float64);
+        linear_sums = numpy.array([ feature.linear_sum for feature in features ], dtype = numpy.float64);
+        square_sums = numpy.array([ feature.square_sum for feature in features ], dtype = numpy.float64);
         
-        for index_entry in range(0, len(feature_collection)):
-            point_entry = cfentry(1, linear_sum([ point ]), square_sum([ point ]));
+        return (numbers, linear_sums, square_sums);
+    
+    
+    def __calculate_distances(self, numbers1, linear_sums1, square_sums1, numbers2, linear_sums2, square_sums2):
+        """!
+        @brief Calculates distances between each feature of the first set and each feature of the second set in line with measurement type.
+        @details Distances are calculated by blocks of the first set to bound memory that is used for intermediate arrays (see split_blocks()).
+        
+        @param[in] numbers1 (numpy.array): Number of points of each feature from the first set.
+        @param[in] linear_sums1 (numpy.array): Linear sum of each feature from the first set.
+        @param[in] square_sums1 (numpy.array): Square sum of each feature from the first set.
+        @param[in] numbers2 (numpy.array): Number of points of each feature from the second set.
+        @param[in] linear_sums2 (numpy.array): Linear sum of each feature from the second set.
+        @param[in] square_sums2 (numpy.array): Square sum of each feature from the second set.
+        
+        @return (numpy.array) Matrix of distances where rows correspond to the first set and columns to the second one.
+        
+        """
+        
+        distances = numpy.empty((len(numbers1), len(numbers2)));
+        
+        block_elements = len(numbers2);
+        if (self.__measurement_type in (measurement_type.CENTROID_EUCLIDEAN_DISTANCE, measurement_type.CENTROID_MANHATTAN_DISTANCE)):
+            block_elements *= max(linear_sums2.shape[1], 1);
+        
+        for (begin, end) in split_blocks(len(numbers1), block_elements):
+            distances[begin:end] = self.__calculate_block_distances(numbers1[begin:end], linear_sums1[begin:end], square_sums1[begin:end], numbers2, linear_sums2, square_sums2);
+        
+        return distances;
+    
+    
+    def __calculate_block_distances(self, numbers1, linear_sums1, square_sums1, numbers2, linear_sums2, square_sums2):
+        """!
+        @brief Calculates distances between each feature of the first set and each feature of the second set in line with measurement type.
+        @details Formulas are the same that are used by cfentry.get_distance(), but they are expressed by products of matrices.
+        
+        @return (numpy.array) Matrix of distances where rows correspond to the first set and columns to the second one.
+        
+        @see cfentry.get_distance()
+        
+        """
+        
+        numbers1 = numbers1[:, numpy.newaxis];
+        square_sums1 = square_sums1[:, numpy.newaxis];
+        
+        if (self.__measurement_type == measurement_type.CENTROID_EUCLIDEAN_DISTANCE):
+            centroids1 = linear_sums1 / numbers1;
+            centroids2 = linear_sums2 / numbers2[:, numpy.newaxis];
             
-            distance = feature_collection[index_entry].get_distance(point_entry, self.__measurement_type);
-            if (distance < minimum_distance):
-                minimum_distance = distance;
-                index_nearest_feature = index_entry;
-                
-        return (minimum_distance, index_nearest_feature);
+            return numpy.sum(numpy.square(centroids1[:, numpy.newaxis, :] - centroids2[numpy.newaxis, :, :]), axis = 2);
+        
+        elif (self.__measurement_type == measurement_type.CENTROID_MANHATTAN_DISTANCE):
+            centroids1 = linear_sums1 / numbers1;
+            centroids2 = linear_sums2 / numbers2[:, numpy.newaxis];
+            
+            return numpy.sum(numpy.abs(centroids1[:, numpy.newaxis, :] - centroids2[numpy.newaxis, :, :]), axis = 2);
+        
+        elif (self.__measurement_type == measurement_type.AVERAGE_INTER_CLUSTER_DISTANCE):
+            linear_part = numpy.dot(linear_sums1, linear_sums2.T);
+            distances = (numbers2 * square_sums1 - 2.0 * linear_part + numbers1 * square_sums2) / (numbers1 * numbers2);
+            return numpy.sqrt(numpy.maximum(distances, 0.0));
+        
+        elif (self.__measurement_type == measurement_type.AVERAGE_INTRA_CLUSTER_DISTANCE):
+            linear_part = numpy.einsum('ij,ij->i', linear_sums1, linear_sums1)[:, numpy.newaxis] + 2.0 * numpy.dot(linear_sums1, linear_sums2.T) + numpy.einsum('ij,ij->i', linear_sums2, linear_sums2);
+            numbers = numbers1 + numbers2;
+            
+            distances = (2.0 * numbers * (square_sums1 + square_sums2) - 2.0 * linear_part) / (numbers * (numbers - 1.0));
+            return numpy.sqrt(numpy.maximum(distances, 0.0));
+        
+        elif (self.__measurement_type == measurement_type.VARIANCE_INCREASE_DISTANCE):
+            linear_part_11 = numpy.einsum('ij,ij->i', linear_sums1, linear_sums1)[:, numpy.newaxis];
+            linear_part_22 = numpy.einsum('ij,ij->i', linear_sums2, linear_sums2);
+            linear_part_12 = linear_part_11 + 2.0 * numpy.dot(linear_sums1, linear_sums2.T) + linear_part_22;
+            
+            return linear_part_11 / numbers1 + linear_part_22 / numbers2 - linear_part_12 / (numbers1 + numbers2);
+        
+        else:
+            raise NameError("Unknown type of measurement '%s' is specified." % self.__measurement_type);
@@ -0,0 +1,452 @@
+"""!
+
+@brief Collection of center assigners that allocate points to the nearest centers for algorithms like K-Means or K-Medians.
+@details Implementation based on paper @cite inproceedings::kmeans::2.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2018
+@copyright GNU Public License
+
+@see pyclustering.cluster.kmeans
+@see pyclustering.cluster.kmedians
+@see pyclustering.cluster.mbkmeans
+@see pyclustering.cluster.xmeans
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+def labels_to_clusters(labels, amount_clusters):
+    """!
+    @brief Converts labels of points to clusters where each cluster is represented by list of indexes of points.
+
+    @param[in] labels (numpy.array): Label (index of cluster) of each point.
+    @param[in] amount_clusters (uint): Amount of clusters, clusters without points are represented by empty lists.
+
+    @return (list) Clusters, indexes of points in each cluster are sorted in ascending order.
+
+    """
+
+    order = numpy.argsort(labels, kind='stable')
+    borders = numpy.cumsum(numpy.bincount(labels, minlength=amount_clusters))[:-1]
+
+    return [cluster.tolist() for cluster in numpy.split(order, borders)]
+
+
+
+class block_assigner:
+    """!
+    @brief Assigner of points to the nearest centers that calculates distances to all centers by blocks of points.
+    @details Amount of distances that are stored at once is bounded instead of full matrix of distances between points
+              and centers. In case of square Euclidean distance ||c||^2 - 2 * x * c is calculated using matrix product,
+              because ||x||^2 is the same for all centers and does not affect choice of the nearest center. Any metric
+              including user-defined can be used, it should support numpy arrays of points.
+
+    Example:
+    @code
+        assigner = block_assigner(sample, distance_metric(type_metric.EUCLIDEAN_SQUARE, numpy_usage=True))
+        labels = assigner.assign(centers)
+    @endcode
+
+    """
+
+    ## Maximum amount of distances that are stored at once (block of points multiplied by amount of centers).
+    __distance_block_capacity = 2 ** 20
+
+
+    def __init__(self, data, metric):
+        """!
+        @brief Creates assigner of points to the nearest centers.
+
+        @param[in] data (array_like): Input data that is presented as array of points (objects).
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points and centers.
+
+        """
+
+        self.__data = numpy.asarray(data, dtype=numpy.double)
+        self.__metric = metric
+
+
+    def assign(self, centers):
+        """!
+        @brief Assigns each point to the nearest center.
+
+        @param[in] centers (array_like): Centers that points should be assigned to.
+
+        @return (numpy.array) Index of the nearest center for each point.
+
+        """
+
+        centers = numpy.asarray(centers, dtype=numpy.double)
+        block_size = max(1, block_assigner.__distance_block_capacity // len(centers))
+
+        labels = numpy.empty(len(self.__data), dtype=numpy.intp)
+        for index_begin in range(0, len(self.__data), block_size):
+            block_data = self.__data[index_begin:index_begin + block_size]
+            block_differences = self.__calculate_block_differences(block_data, centers)
+
+            labels[index_begin:index_begin + block_size] = numpy.argmin(block_differences, axis=0)
+
+        return labels
+
+
+    def get_skipped_distances(self):
+        """!
+        @brief Returns amount of distance calculations between points and centers that were skipped by the last assignment.
+
+        @return (uint) Always zero, all distances are calculated.
+
+        """
+        return 0
+
+
+    def __calculate_block_differences(self, block_data, centers):
+        """!
+        @brief Calculates values that are used to find the nearest center for each point from the block.
+
+        @param[in] block_data (numpy.array): Block of points.
+        @param[in] centers (numpy.array): Centers.
+
+        @return (numpy.array) Matrix (amount of centers x amount of points) where the smallest value in each column
+                 corresponds to the nearest center.
+
+        """
+
+        if self.__metric.get_type() == type_metric.EUCLIDEAN_SQUARE:
+            centers_norm = numpy.sum(numpy.square(centers), axis=1)
+            return centers_norm[:, numpy.newaxis] - 2.0 * numpy.dot(centers, block_data.T)
+
+        block_differences = numpy.empty((len(centers), len(block_data)))
+        for index_center in range(len(centers)):
+            block_differences[index_center] = self.__metric(block_data, centers[index_center])
+
+        return block_differences
+
+
+
+class elkan_assigner:
+    """!
+    @brief Assigner of points to the nearest centers that uses triangle inequality to skip distance calculations.
+    @details The assigner keeps upper bound of distance to the assigned center and lower bounds of distances to each
+              center for every point between calls (and the minimum of lower bounds of other centers as proposed by
+              G. Hamerly to skip points quickly). Bounds are corrected by center shifts on each call and a distance
+              is calculated only when bounds and center-to-center distances cannot prove that the center is not
+              closer than the assigned one. Lower bounds require memory for amount of points multiplied by amount of
+              centers values.
+
+             Triangle inequality should be satisfied by the metric, therefore only Euclidean, square Euclidean
+              (its root is used for bounds, the nearest center is the same), Manhattan and Chebyshev metrics are
+              supported.
+
+    Example:
+    @code
+        assigner = elkan_assigner(sample, distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        labels = assigner.assign(centers)
+        # ... centers are updated in line with labels ...
+        labels = assigner.assign(updated_centers)
+
+        print("Skipped distance calculations:", assigner.get_skipped_distances())
+    @endcode
+
+    """
+
+    ## Maximum amount of values that are stored at once during distance calculation.
+    __distance_block_capacity = 2 ** 20
+
+    ## Metrics that satisfy triangle inequality (root of square Euclidean distance is used for bounds).
+    __supported_metrics = (type_metric.EUCLIDEAN, type_metric.EUCLIDEAN_SQUARE, type_metric.MANHATTAN, type_metric.CHEBYSHEV)
+
+
+    def __init__(self, data, metric):
+        """!
+        @brief Creates assigner of points to the nearest centers.
+
+        @param[in] data (array_like): Input data that is presented as array of points (objects).
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points and centers.
+
+        """
+
+        if not elkan_assigner.is_supported(metric):
+            raise ValueError("Metric '%s' is not supported by the assigner: triangle inequality is required." % metric.get_type().name)
+
+        self.__data = numpy.asarray(data, dtype=numpy.double)
+        self.__metric = distance_metric(metric.get_type(), numpy_usage=True)
+        self.__root = metric.get_type() == type_metric.EUCLIDEAN_SQUARE
+
+        self.__centers = None
+        self.__labels = None
+        self.__upper_bounds = None
+        self.__lower_bounds = None
+        self.__second_bounds = None
+        self.__skipped_distances = 0
+
+
+    @staticmethod
+    def is_supported(metric):
+        """!
+        @brief Checks whether metric can be used by the assigner.
+
+        @param[in] metric (distance_metric): Metric that should be checked.
+
+        @return (bool) True if metric satisfies triangle inequality and can be used by the assigner.
+
+        """
+        return metric.get_type() in elkan_assigner.__supported_metrics
+
+
+    def assign(self, centers):
+        """!
+        @brief Assigns each point to the nearest center.
+        @details Bounds are initialized by the first call and after each call where amount of centers is changed,
+                  in this case all distances are calculated.
+
+        @param[in] centers (array_like): Centers that points should be assigned to.
+
+        @return (numpy.array) Index of the nearest center for each point.
+
+        """
+
+        centers = numpy.array(centers, dtype=numpy.double)
+
+        if (self.__centers is None) or (len(self.__centers) != len(centers)):
+            self.__initialize_bounds(centers)
+        else:
+            self.__update_bounds(centers)
+
+        self.__centers = centers
+        return self.__labels.copy()
+
+
+    def get_skipped_distances(self):
+        """!
+        @brief Returns amount of distance calculations between points and centers that were skipped by the last assignment.
+
+        @return (uint) Amount of skipped distance calculations.
+
+        """
+        return self.__skipped_distances
+
+
+    def __initialize_bounds(self, centers):
+        """!
+        @brief Calculates distances from each point to each center and uses them as exact bounds.
+
+        @param[in] centers (numpy.array): Centers that points should be assigned to.
+
+        """
+
+        self.__lower_bounds = numpy.empty((len(self.__data), len(centers)))
+
+        if self.__root is True:
+            # square Euclidean distances are calculated as ||x||^2 + ||c||^2 - 2 * x * c using matrix product
+            block_size = max(1, elkan_assigner.__distance_block_capacity // len(centers))
+            centers_norm = numpy.sum(numpy.square(centers), axis=1)
+
+            for index_begin in range(0, len(self.__data), block_size):
+                block_data = self.__data[index_begin:index_begin + block_size]
+                block_distances = self.__lower_bounds[index_begin:index_begin + block_size]
+
+                numpy.dot(block_data, centers.T, out=block_distances)
+                block_distances *= -2.0
+                block_distances += centers_norm
+                block_distances += numpy.sum(numpy.square(block_data), axis=1)[:, numpy.newaxis]
+                numpy.sqrt(numpy.maximum(block_distances, 0.0, out=block_distances), out=block_distances)
+
+        else:
+            for index_center in range(len(centers)):
+                self.__lower_bounds[:, index_center] = self.__metric(self.__data, centers[index_center])
+
+        self.__labels = numpy.argmin(self.__lower_bounds, axis=1)
+        self.__upper_bounds = self.__lower_bounds[numpy.arange(len(self.__data)), self.__labels]
+
+        self.__second_bounds = self.__calculate_second_bounds(self.__lower_bounds, self.__labels)
+        self.__lower_bounds[numpy.arange(len(self.__data)), self.__labels] = self.__upper_bounds
+
+        self.__skipped_distances = 0
+
+
+    def __update_bounds(self, centers):
+        """!
+        @brief Corrects bounds by center shifts and calculates distances only to centers that might be nearer than
+                the assigned center.
+
+        @param[in] centers (numpy.array): Updated centers, amount of centers is the same as on previous call.
+
+        """
+
+        shifts = self.__distance(self.__centers, centers)
+        self.__upper_bounds += shifts[self.__labels]
+        self.__second_bounds -= numpy.max(shifts)
+
+        half_center_distances = self.__calculate_center_distances(centers) / 2.0
+        half_nearest_distances = numpy.min(half_center_distances, axis=1)
+
+        calculations = 0
+        block_size = max(1, elkan_assigner.__distance_block_capacity // len(centers))
+
+        for index_begin in range(0, len(self.__data), block_size):
+            index_end = index_begin + block_size
+
+            lower_bounds = self.__lower_bounds[index_begin:index_end]
+            lower_bounds -= shifts
+            numpy.maximum(lower_bounds, 0.0, out=lower_bounds)
+
+            # points whose upper bound is less than half distance to the nearest other center or less than the
+            # lower bound of distance to the nearest other center keep their centers
+            separation = numpy.maximum(half_nearest_distances[self.__labels[index_begin:index_end]], self.__second_bounds[index_begin:index_end])
+            candidates = numpy.nonzero(self.__upper_bounds[index_begin:index_end] > separation)[0]
+            if len(candidates) > 0:
+                calculations += self.__update_block(candidates + index_begin, centers, half_center_distances)
+
+        self.__skipped_distances = len(self.__data) * len(centers) - calculations
+
+
+    def __update_block(self, block_points, centers, half_center_distances):
+        """!
+        @brief Updates assignment of points whose upper bound is not separated from other centers.
+
+        @param[in] block_points (numpy.array): Indexes of points that should be checked.
+        @param[in] centers (numpy.array): Updated centers.
+        @param[in] half_center_distances (numpy.array): Half of distances between centers (infinity on diagonal).
+
+        @return (uint) Amount of calculated distances between points and centers.
+
+        """
+
+        labels = self.__labels[block_points]
+        upper_bounds = self.__upper_bounds[block_points]
+        lower_bounds = self.__lower_bounds[block_points]
+        separation = half_center_distances[labels]
+
+        # the first check uses loose upper bounds, the assigned center is excluded by infinite diagonal
+        suspicious = (upper_bounds[:, numpy.newaxis] > lower_bounds) & (upper_bounds[:, numpy.newaxis] > separation)
+        suspicious = numpy.nonzero(numpy.any(suspicious, axis=1))[0]
+
+        calculations = len(suspicious)
+        if calculations > 0:
+            distances = self.__calculate_pair_distances(block_points[suspicious], centers, labels[suspicious])
+            upper_bounds[suspicious] = distances
+            lower_bounds[suspicious, labels[suspicious]] = distances
+
+            # the second check uses exact distances to assigned centers
+            distances = distances[:, numpy.newaxis]
+            rows, columns = numpy.nonzero((distances > lower_bounds[suspicious]) & (distances > separation[suspicious]))
+
+            if len(rows) > 0:
+                distances = self.__calculate_pair_distances(block_points[suspicious[rows]], centers, columns)
+                lower_bounds[suspicious[rows], columns] = distances
+                calculations += len(rows)
+
+                # the nearest of checked centers for each suspicious point
+                checked_distances = numpy.full((len(suspicious), len(centers)), float('inf'))
+                checked_distances[rows, columns] = distances
+
+                nearest_centers = numpy.argmin(checked_distances, axis=1)
+                nearest_distances = checked_distances[numpy.arange(len(suspicious)), nearest_centers]
+
+                improved = nearest_distances < upper_bounds[suspicious]
+                labels[suspicious[improved]] = nearest_centers[improved]
+                upper_bounds[suspicious[improved]] = nearest_distances[improved]
+
+            updated_points = block_points[suspicious]
+            self.__labels[updated_points] = labels[suspicious]
+            self.__upper_bounds[updated_points] = upper_bounds[suspicious]
+            self.__lower_bounds[updated_points] = lower_bounds[suspicious]
+
+        self.__second_bounds[block_points] = self.__calculate_second_bounds(lower_bounds, labels)
+        return calculations
+
+
+    @staticmethod
+    def __calculate_second_bounds(lower_bounds, labels):
+        """!
+        @brief Calculates lower bound of distance to the nearest center that is not assigned to a point.
+
+        @param[in] lower_bounds (numpy.array): Lower bounds of distances from points to each center, values of
+                    assigned centers are replaced by infinity.
+        @param[in] labels (numpy.array): Index of assigned center for each point.
+
+        @return (numpy.array) Minimum of lower bounds of not assigned centers for each point.
+
+        """
+
+        lower_bounds[numpy.arange(len(labels)), labels] = float('inf')
+        return numpy.min(lower_bounds, axis=1)
+
+
+    def __distance(self, objects1, objects2):
+        """!
+        @brief Calculates distances between objects in line with metric, root is taken from square Euclidean distance.
+
+        @param[in] objects1 (numpy.array): Objects or object.
+        @param[in] objects2 (numpy.array): Objects or object.
+
+        @return (numpy.array) Distances between objects.
+
+        """
+
+        distances = self.__metric(objects1, objects2)
+        if self.__root is True:
+            return numpy.sqrt(distances)
+
+        return distances
+
+
+    def __calculate_pair_distances(self, points, centers, labels):
+        """!
+        @brief Calculates distances between points and centers that are specified by pairs.
+
+        @param[in] points (numpy.array): Indexes of points.
+        @param[in] centers (numpy.array): Centers.
+        @param[in] labels (numpy.array): Index of center for each point.
+
+        @return (numpy.array) Distance for each pair.
+
+        """
+
+        distances = numpy.empty(len(points))
+        block_size = max(1, elkan_assigner.__distance_block_capacity // self.__data.shape[1])
+
+        for index_begin in range(0, len(points), block_size):
+            index_end = index_begin + block_size
+            distances[index_begin:index_end] = self.__distance(self.__data[points[index_begin:index_end]], centers[labels[index_begin:index_end]])
+
+        return distances
+
+
+    def __calculate_center_distances(self, centers):
+        """!
+        @brief Calculates distances between centers.
+
+        @param[in] centers (numpy.array): Centers.
+
+        @return (numpy.array) Matrix of distances between centers where distance of center to itself is infinity.
+
+        """
+
+        center_distances = numpy.empty((len(centers), len(centers)))
+        for index_center in range(len(centers)):
+            center_distances[index_center] = self.__distance(centers, centers[index_center])
+
+        numpy.fill_diagonal(center_distances, float('inf'))
+        return center_distances
@@ -27,18 +27,144 @@
 
 import random;
 
+import numpy;
+
+from multiprocessing import Pool;
+
 from pyclustering.cluster.encoder import type_encoding;
 
-from pyclustering.utils import euclidean_distance_square;
+
+class clarans_local_search:
+    """!
+    @brief Performs search of local minimum of CLARANS algorithm from random medoids.
+    @details Square Euclidean distances from each point to each medoid are cached, therefore the nearest and the
+              second nearest medoids of each point are known and cost of swap of medoid and candidate is calculated
+              by one vectorized pass over points. Instance can be sent to another process to perform searches in parallel.
+    
+    """
+
+    def __init__(self, data, number_clusters, maxneighbor):
+        """!
+        @brief Constructor of local search of CLARANS algorithm.
+        
+        @param[in] data (array_like): Input data that is presented as array of points (objects).
+        @param[in] number_clusters (uint): Amount of clusters that should be allocated.
+        @param[in] maxneighbor (uint): The maximum number of neighbors examined.
+        
+        """
+        
+        self.__data = numpy.array(data, dtype=numpy.double);
+        if (self.__data.ndim == 1):
+            self.__data = self.__data.reshape(-1, 1);
+        
+        self.__number_clusters = number_clusters;
+        self.__maxneighbor = maxneighbor;
+    
+    
+    def search(self, seed):
+        """!
+        @brief Finds local minimum from random medoids.
+        
+        @param[in] seed (uint): Seed of random generator that is used for choosing initial medoids and candidates,
+                    the same seed produces the same result.
+        
+        @return (tuple) Medoids and their estimation (sum of square distances from points to their medoids): (medoids, estimation).
+        
+        """
+        
+        generator = random.Random(seed);
+        amount_points = len(self.__data);
+        
+        medoids = generator.sample(range(amount_points), self.__number_clusters);
+        
+        distances = numpy.empty((amount_points, self.__number_clusters));
+        for index_cluster in range(self.__number_clusters):
+            distances[:, index_cluster] = self.__calculate_distances(medoids[index_cluster]);
+        
+        (labels, nearest, second) = self.__find_nearest_medoids(distances);
+        
+        index_neighbor = 0;
+        while (index_neighbor < self.__maxneighbor):
+            # get random current medoid that is to be replaced and new candidate to be medoid
+            index_cluster = generator.randint(0, self.__number_clusters - 1);
+            
+            candidate_medoid_index = generator.randint(0, amount_points - 1);
+            while (candidate_medoid_index in medoids):
+                candidate_medoid_index = generator.randint(0, amount_points - 1);
+            
+            candidate_distances = self.__calculate_distances(candidate_medoid_index);
+            
+            # points of replaced medoid choose between candidate and the second nearest medoid, other points - between candidate and own medoid
+            alternative = numpy.where(labels == index_cluster, second, nearest);
+            candidate_cost = numpy.sum(numpy.minimum(candidate_distances, alternative) - nearest);
+            
+            if (candidate_cost < 0):
+                medoids[index_cluster] = candidate_medoid_index;
+                distances[:, index_cluster] = candidate_distances;
+                (labels, nearest, second) = self.__find_nearest_medoids(distances);
+                
+                # reset iterations and starts investigation from the begining
+                index_neighbor = 0;
+            
+            else:
+                index_neighbor += 1;
+        
+        return medoids, float(numpy.sum(nearest));
+    
+    
+    def __calculate_distances(self, index_point):
+        """!
+        @brief Calculates square Euclidean distances from each point to the specified point.
+        
+        @param[in] index_point (uint): Index of point.
+        
+        @return (numpy.array) Distances from each point.
+        
+        """
+        
+        return numpy.sum(numpy.square(self.__data - self.__data[index_point]), axis=1);
+    
+    
+    def __find_nearest_medoids(self, distances):
+        """!
+        @brief Finds the nearest medoid of each point and distances to the nearest and to the second nearest medoid.
+        
+        @param[in] distances (numpy.array): Distances from each point to each medoid.
+        
+        @return (tuple) Arrays (index of the nearest medoid, distance to it, distance to the second nearest medoid).
+        
+        """
+        
+        labels = numpy.argmin(distances, axis=1);
+        nearest = distances[numpy.arange(len(distances)), labels];
+        
+        if (distances.shape[1] > 1):
+            second = numpy.partition(distances, 1, axis=1)[:, 1];
+        else:
+            second = numpy.full(len(distances), float('inf'));
+        
+        return labels, nearest, second;
 
 
 class clarans:
     """!
     @brief Class represents clustering algorithm CLARANS (a method for clustering objects for spatial data mining).
+    @details Local searches are independent, therefore they can be performed by pool of processes. Each local search
+              uses its own seed that is obtained from 'random_state', thus results do not depend on amount of processes.
+    
+    Example:
+    @code
+        # four local searches are performed by two processes, results are reproducible because of 'random_state'
+        clarans_instance = clarans(sample, 3, 4, 5, processes=2, random_state=1000);
+        clarans_instance.process();
+        
+        clusters = clarans_instance.get_clusters();
+        medoids = clarans_instance.get_medoids();
+    @endcode
     
     """
 
-    def __init__(self, data, number_clusters, numlocal, maxneighbor):
+    def __init__(self, data, number_clusters, numlocal, maxneighbor, **kwargs):
         """!
         @brief Constructor of clustering algorithm CLARANS.
         @details The higher the value of maxneighbor, the closer is CLARANS to K-Medoids (PAM - Partitioning Around Medoids), and the longer is each search of a local minima.
@@ -47,6 +173,11 @@ class clarans:
         @param[in] number_clusters (uint): amount of clusters that should be allocated.
         @param[in] numlocal (uint): the number of local minima obtained (amount of iterations for solving the problem).
         @param[in] maxneighbor (uint): the maximum number of neighbors examined.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'processes', 'random_state').
+        
+        <b>Keyword Args:</b><br>
+            - processes (uint): Amount of processes that perform local searches (by default is 1 - searches are performed by the current process).
+            - random_state (uint): Seed for random generator, if it is not specified then results are not reproducible.
         
         """
         
@@ -55,9 +186,10 @@ class clarans:
         self.__maxneighbor = maxneighbor;
         self.__number_clusters = number_clusters;
         
+        self.__processes = kwargs.get('processes', 1);
+        self.__random_state = kwargs.get('random_state', None);
+        
         self.__clusters = [];
-        self.__current = [];
-        self.__belong = [];
         
         self.__optimal_medoids = [];
         self.__optimal_estimation = float('inf');
@@ -72,22 +204,21 @@ class clarans:
         
         """
         
-        random.seed();
+        generator = random.Random(self.__random_state);
+        seeds = [generator.getrandbits(32) for _ in range(0, self.__numlocal)];
         
-        for _ in range(0, self.__numlocal):
-            # set (current) random medoids
-            self.__current = random.sample(range(0, len(self.__pointer_data)), self.__number_clusters);
-            
-            # update clusters in line with random allocated medoids
-            self.__update_clusters(self.__current);
-            
-            # optimize configuration
-            self.__optimize_configuration();
-            
-            # obtain cost of current cluster configuration and compare it with the best obtained
-            estimation = self.__calculate_estimation();
+        local_search = clarans_local_search(self.__pointer_data, self.__number_clusters, self.__maxneighbor);
+        
+        if ((self.__processes > 1) and (self.__numlocal > 1)):
+            with Pool(min(self.__processes, self.__numlocal)) as pool:
+                results = pool.map(local_search.search, seeds);
+        else:
+            results = [local_search.search(seed) for seed in seeds];
+        
+        # the first configuration is chosen among configurations with the same cost
+        for (medoids, estimation) in results:
             if (estimation < self.__optimal_estimation):
-                self.__optimal_medoids = self.__current[:];
+                self.__optimal_medoids = medoids;
                 self.__optimal_estimation = estimation;
         
         self.__update_clusters(self.__optimal_medoids);
@@ -140,135 +271,16 @@ class clarans:
         
         """
         
-        self.__belong = [0] * len(self.__pointer_data);
-        self.__clusters = [[] for i in range(len(medoids))];
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1;
-            dist_optim = 0.0;
-             
-            for index in range(len(medoids)):
-                dist = euclidean_distance_square(self.__pointer_data[index_point], self.__pointer_data[medoids[index]]);
-                 
-                if ( (dist < dist_optim) or (index is 0)):
-                    index_optim = index;
-                    dist_optim = dist;
-             
-            self.__clusters[index_optim].append(index_point);
-            self.__belong[index_point] = index_optim;
+        data = numpy.array(self.__pointer_data, dtype=numpy.double);
+        if (data.ndim == 1):
+            data = data.reshape(-1, 1);
         
-        # If cluster is not able to capture object it should be removed
-        self.__clusters = [cluster for cluster in self.__clusters if len(cluster) > 0];
-    
-    
-    def __optimize_configuration(self):
-        """!
-        @brief Finds quasi-optimal medoids and updates in line with them clusters in line with algorithm's rules. 
+        distances = numpy.empty((len(data), len(medoids)));
+        for index_cluster in range(len(medoids)):
+            distances[:, index_cluster] = numpy.sum(numpy.square(data - data[medoids[index_cluster]]), axis=1);
         
-        """
-        index_neighbor = 0;
-        while (index_neighbor < self.__maxneighbor):
-            # get random current medoid that is to be replaced
-            current_medoid_index = self.__current[random.randint(0, self.__number_clusters - 1)];
-            current_medoid_cluster_index = self.__belong[current_medoid_index];
-            
-            # get new candidate to be medoid
-            candidate_medoid_index = random.randint(0, len(self.__pointer_data) - 1);
-            
-            while (candidate_medoid_index in self.__current):
-                candidate_medoid_index = random.randint(0, len(self.__pointer_data) - 1);
-            
-            candidate_cost = 0.0;
-            for point_index in range(0, len(self.__pointer_data)):
-                if (point_index not in self.__current):
-                    # get non-medoid point and its medoid
-                    point_cluster_index = self.__belong[point_index];
-                    point_medoid_index = self.__current[point_cluster_index];
-                    
-                    # get other medoid that is nearest to the point (except current and candidate)
-                    other_medoid_index = self.__find_another_nearest_medoid(point_index, current_medoid_index);
-                    other_medoid_cluster_index = self.__belong[other_medoid_index];
-                    
-                    # for optimization calculate all required distances
-                    # from the point to current medoid
-                    distance_current = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[current_medoid_index]);
-                    
-                    # from the point to candidate median
-                    distance_candidate = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[candidate_medoid_index]);
-                    
-                    # from the point to nearest (own) medoid
-                    distance_nearest = float('inf');
-                    if ( (point_medoid_index != candidate_medoid_index) and (point_medoid_index != current_medoid_cluster_index) ):
-                        distance_nearest = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[point_medoid_index]);
-                    
-                    # apply rules for cost calculation
-                    if (point_cluster_index == current_medoid_cluster_index):
-                        # case 1:
-                        if (distance_candidate >= distance_nearest):
-                            candidate_cost += distance_nearest - distance_current;
-                        
-                        # case 2:
-                        else:
-                            candidate_cost += distance_candidate - distance_current;
-                    
-                    elif (point_cluster_index == other_medoid_cluster_index):
-                        # case 3 ('nearest medoid' is the representative object of that cluster and object is more similar to 'nearest' than to 'candidate'):
-                        if (distance_candidate > distance_nearest):
-                            pass;
-                        
-                        # case 4:
-                        else:
-                            candidate_cost += distance_candidate - distance_nearest;
-            
-            if (candidate_cost < 0):
-                # set candidate that has won
-                self.__current[current_medoid_cluster_index] = candidate_medoid_index;
-                
-                # recalculate clusters
-                self.__update_clusters(self.__current);
-                
-                # reset iterations and starts investigation from the begining
-                index_neighbor = 0;
-                
-            else:
-                index_neighbor += 1;
-    
-    
-    def __find_another_nearest_medoid(self, point_index, current_medoid_index):
-        """!
-        @brief Finds the another nearest medoid for the specified point that is differ from the specified medoid. 
-        
-        @param[in] point_index: index of point in dataspace for that searching of medoid in current list of medoids is perfomed.
-        @param[in] current_medoid_index: index of medoid that shouldn't be considered as a nearest.
+        labels = numpy.argmin(distances, axis=1);
+        self.__clusters = [numpy.nonzero(labels == index_cluster)[0].tolist() for index_cluster in range(len(medoids))];
         
-        @return (uint) index of the another nearest medoid for the point.
-        
-        """
-        other_medoid_index = -1;
-        other_distance_nearest = float('inf');
-        for index_medoid in self.__current:
-            if (index_medoid != current_medoid_index):
-                other_distance_candidate = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[current_medoid_index]);
-                
-                if (other_distance_candidate < other_distance_nearest):
-                    other_distance_nearest = other_distance_candidate;
-                    other_medoid_index = index_medoid;
-        
-        return other_medoid_index;
-    
-    
-    def __calculate_estimation(self):
-        """!
-        @brief Calculates estimation (cost) of the current clusters. The lower the estimation,
-               the more optimally configuration of clusters.
-        
-        @return (double) estimation of current clusters.
-        
-        """
-        estimation = 0.0;
-        for index_cluster in range(0, len(self.__clusters)):
-            cluster = self.__clusters[index_cluster];
-            index_medoid = self.__current[index_cluster];
-            for index_point in cluster:
-                estimation += euclidean_distance_square(self.__pointer_data[index_point], self.__pointer_data[index_medoid]);
-        
-        return estimation;
+        # If cluster is not able to capture object it should be removed
+        self.__clusters = [cluster for cluster in self.__clusters if len(cluster) > 0];
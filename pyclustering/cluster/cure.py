@@ -31,7 +31,7 @@ from pyclustering.cluster.encoder import type_encoding
 
 from pyclustering.utils import euclidean_distance_square
 
-from pyclustering.container.kdtree import kdtree
+from pyclustering.container.kdtree import kdtree, balanced_kdtree
 
 from pyclustering.core.wrapper import ccore_library
 
@@ -485,17 +485,22 @@ class cure:
         
         self.__queue = [cure_cluster(self.__pointer_data[index_point], index_point) for index_point in range(len(self.__pointer_data))]
         
-        # set closest clusters
+        # set closest clusters: each cluster consists of one point, so the nearest point (except itself) is found by k-d tree
+        nearest_indexes = [[] for _ in range(len(self.__queue))]
+        if len(self.__queue) > 1:
+            nearest_indexes, _ = balanced_kdtree(self.__pointer_data).query_nearest(self.__pointer_data, 2)
+            nearest_indexes = nearest_indexes.tolist()
+
         for i in range(0, len(self.__queue)):
             minimal_distance = float('inf')
             closest_index_cluster = -1
-            
-            for k in range(0, len(self.__queue)):
+
+            # neighbors with the same distance are ordered by index, therefore the first one that is not itself is taken
+            for k in nearest_indexes[i]:
                 if i != k:
-                    dist = self.__cluster_distance(self.__queue[i], self.__queue[k])
-                    if dist < minimal_distance:
-                        minimal_distance = dist
-                        closest_index_cluster = k
+                    minimal_distance = self.__cluster_distance(self.__queue[i], self.__queue[k])
+                    closest_index_cluster = k
+                    break
             
             self.__queue[i].closest = self.__queue[closest_index_cluster]
             self.__queue[i].distance = minimal_distance
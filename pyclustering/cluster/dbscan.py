@@ -25,7 +25,11 @@
 """
 
 
-from pyclustering.container.kdtree import kdtree
+import numpy
+
+from collections import deque
+
+from pyclustering.container.kdtree import balanced_kdtree
 
 from pyclustering.cluster.encoder import type_encoding
 
@@ -37,7 +41,9 @@ import pyclustering.core.dbscan_wrapper as wrapper
 class dbscan:
     """!
     @brief Class represents clustering algorithm DBSCAN.
-    @details This DBSCAN algorithm is KD-tree optimized.
+    @details This DBSCAN algorithm is KD-tree optimized: neighbors of all points are found at once by balanced KD-tree.
+             Python implementation expands clusters using array of labels and queue of core points, therefore each
+             point is processed only once.
              
              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
     
@@ -75,21 +81,17 @@ class dbscan:
         """
         
         self.__pointer_data = data
-        self.__kdtree = None
         self.__eps = eps
-        self.__sqrt_eps = eps * eps
         self.__neighbors = neighbors
 
-        self.__visited = [False] * len(self.__pointer_data)
-        self.__belong = [False] * len(self.__pointer_data)
-
         self.__data_type = kwargs.get('data_type', 'points')
+        if self.__data_type not in ('points', 'distance_matrix'):
+            raise TypeError("Unknown type of data is specified '%s'" % self.__data_type)
 
+        self.__labels = None
         self.__clusters = []
         self.__noise = []
 
-        self.__neighbor_searcher = self.__create_neighbor_searcher(self.__data_type)
-
         self.__ccore = ccore
         if self.__ccore:
             self.__ccore = ccore_library.workable()
@@ -101,25 +103,23 @@ class dbscan:
         
         @see get_clusters()
         @see get_noise()
+        @see get_labels()
         
         """
         
         if self.__ccore is True:
-            (self.__clusters, self.__noise) = wrapper.dbscan(self.__pointer_data, self.__eps, self.__neighbors, self.__data_type)
-            
-        else:
-            if self.__data_type == 'points':
-                self.__kdtree = kdtree(self.__pointer_data, range(len(self.__pointer_data)))
+            (clusters, noise) = wrapper.dbscan(self.__pointer_data, self.__eps, self.__neighbors, self.__data_type)
 
-            for i in range(0, len(self.__pointer_data)):
-                if self.__visited[i] is False:
-                    cluster = self.__expand_cluster(i)
-                    if cluster is not None:
-                        self.__clusters.append(cluster)
+            self.__labels = numpy.full(len(self.__pointer_data), -1, dtype=numpy.intp)
+            for index_cluster in range(len(clusters)):
+                self.__labels[clusters[index_cluster]] = index_cluster
 
-            for i in range(0, len(self.__pointer_data)):
-                if self.__belong[i] is False:
-                    self.__noise.append(i)
+            self.__clusters = [cluster.tolist() for cluster in clusters]
+            self.__noise = noise.tolist()
+            
+        else:
+            self.__labels = self.__allocate_labels()
+            (self.__clusters, self.__noise) = self.__labels_to_clusters(self.__labels)
 
 
     def get_clusters(self):
@@ -154,6 +154,23 @@ class dbscan:
         return self.__noise
 
 
+    def get_labels(self):
+        """!
+        @brief Returns label (index of cluster) of each object, noise is marked by -1.
+        
+        @remark Labels can be returned only after data processing (use method process() before). Otherwise None is returned.
+        
+        @return (numpy.array) Label of each object from the input data.
+        
+        @see process()
+        @see get_clusters()
+        @see get_noise()
+        
+        """
+
+        return self.__labels
+
+
     def get_cluster_encoding(self):
         """!
         @brief Returns clustering result representation type that indicate how clusters are encoded.
@@ -167,78 +184,96 @@ class dbscan:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __create_neighbor_searcher(self, data_type):
+    def __allocate_labels(self):
         """!
-        @brief Returns neighbor searcher in line with data type.
+        @brief Allocates clusters: each cluster is expanded from core object that does not belong to any cluster yet.
+        
+        @return (numpy.array) Label of each object, noise is marked by -1.
+        
+        """
 
-        @param[in] data_type (string): Data type (points or distance matrix).
+        (offsets, indexes) = self.__find_neighbors()
+        core_objects = numpy.diff(offsets) >= self.__neighbors
 
-        """
-        if data_type == 'points':
-            return self.__neighbor_indexes_points
-        elif data_type == 'distance_matrix':
-            return self.__neighbor_indexes_distance_matrix
-        else:
-            raise TypeError("Unknown type of data is specified '%s'" % data_type)
+        labels = numpy.full(len(self.__pointer_data), -1, dtype=numpy.intp)
+
+        amount_clusters = 0
+        for index_point in numpy.nonzero(core_objects)[0].tolist():
+            if labels[index_point] == -1:
+                self.__expand_cluster(index_point, amount_clusters, labels, core_objects, offsets, indexes)
+                amount_clusters += 1
 
+        return labels
 
-    def __expand_cluster(self, index_point):
+
+    def __expand_cluster(self, index_point, index_cluster, labels, core_objects, offsets, indexes):
         """!
-        @brief Expands cluster from specified point in the input data space.
+        @brief Expands cluster from specified core object: all objects that are reachable from it are labeled by the cluster.
+        @details Object that is not core object is captured by the first cluster that reaches it, only core objects
+                  are placed to the queue, thus neighbors of each object are processed only once.
         
-        @param[in] index_point (list): Index of a point from the data.
-
-        @return (list) Return tuple of list of indexes that belong to the same cluster and list of points that are marked as noise: (cluster, noise), or None if nothing has been expanded.
+        @param[in] index_point (uint): Index of core object from which cluster is expanded.
+        @param[in] index_cluster (uint): Index of cluster that is expanded.
+        @param[in|out] labels (numpy.array): Label of each object, -1 if object is not captured by any cluster.
+        @param[in] core_objects (numpy.array): Marks of core objects.
+        @param[in] offsets (numpy.array): Offsets of neighbors of each object in array of neighbor indexes.
+        @param[in] indexes (numpy.array): Indexes of neighbors of all objects.
         
         """
-        
-        cluster = None
-        self.__visited[index_point] = True
-        neighbors = self.__neighbor_searcher(index_point)
-         
-        if len(neighbors) >= self.__neighbors:
-            cluster = [ index_point ]
-             
-            self.__belong[index_point] = True
-             
-            for i in neighbors:
-                if self.__visited[i] is False:
-                    self.__visited[i] = True
 
-                    next_neighbors = self.__neighbor_searcher(i)
-                     
-                    if len(next_neighbors) >= self.__neighbors:
-                        neighbors += [k for k in next_neighbors if ( (k in neighbors) == False) and k != index_point]
-                 
-                if self.__belong[i] is False:
-                    cluster.append(i)
-                    self.__belong[i] = True
+        labels[index_point] = index_cluster
+        frontier = deque([index_point])
+
+        while len(frontier) > 0:
+            index_core = frontier.popleft()
 
-        return cluster
+            neighbors = indexes[offsets[index_core]:offsets[index_core + 1]]
+            captured = neighbors[labels[neighbors] == -1]
 
+            labels[captured] = index_cluster
+            frontier.extend(captured[core_objects[captured]].tolist())
 
-    def __neighbor_indexes_points(self, index_point):
+
+    def __labels_to_clusters(self, labels):
         """!
-        @brief Return neighbors of the specified object in case of sequence of points.
+        @brief Converts labels to list of clusters and list of noise.
+        
+        @param[in] labels (numpy.array): Label of each object, noise is marked by -1.
+        
+        @return (tuple) List of clusters where each cluster contains indexes of objects and list of noise objects: (clusters, noise).
+        
+        """
 
-        @param[in] index_point (uint): Index point whose neighbors are should be found.
+        order = numpy.argsort(labels, kind='stable')
+        bounds = numpy.cumsum(numpy.bincount(labels + 1, minlength=1)).tolist()
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+        noise = order[:bounds[0]].tolist()
+        clusters = [order[bounds[index]:bounds[index + 1]].tolist() for index in range(len(bounds) - 1)]
 
-        """
-        kdnodes = self.__kdtree.find_nearest_dist_nodes(self.__pointer_data[index_point], self.__eps)
-        return [node_tuple[1].payload for node_tuple in kdnodes if node_tuple[1].payload != index_point]
+        return clusters, noise
 
 
-    def __neighbor_indexes_distance_matrix(self, index_point):
+    def __find_neighbors(self):
         """!
-        @brief Return neighbors of the specified object in case of distance matrix.
+        @brief Finds neighbors of all objects at once in line with data type.
+        @details Neighbors are presented in compressed sparse row format: neighbors of object 'i' are
+                  'indexes[offsets[i]:offsets[i + 1]]', object is not a neighbor of itself.
+        
+        @return (tuple) Arrays (offsets, indexes) with neighbors of each object.
+        
+        """
 
-        @param[in] index_point (uint): Index point whose neighbors are should be found.
+        if self.__data_type == 'points':
+            (offsets, indexes, _) = balanced_kdtree(self.__pointer_data).query_radius(self.__pointer_data, self.__eps)
+            owners = numpy.repeat(numpy.arange(len(self.__pointer_data)), numpy.diff(offsets))
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+        else:
+            (owners, indexes) = numpy.nonzero(numpy.asarray(self.__pointer_data) <= self.__eps)
 
-        """
-        distances = self.__pointer_data[index_point]
-        return [index_neighbor for index_neighbor in range(len(distances))
-                if ((distances[index_neighbor] <= self.__eps) and (index_neighbor != index_point))]
\ No newline at end of file
+        other = owners != indexes
+        owners, indexes = owners[other], indexes[other]
+
+        offsets = numpy.zeros(len(self.__pointer_data) + 1, dtype=numpy.intp)
+        numpy.cumsum(numpy.bincount(owners, minlength=len(self.__pointer_data)), out=offsets[1:])
+
+        return offsets, indexes
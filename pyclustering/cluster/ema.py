@@ -51,7 +51,7 @@ def gaussian(data, mean, covariance):
     @param[in] mean (float|numpy.array): Mathematical expectation used for calculation.
     @param[in] covariance (float|numpy.array): Variance or covariance matrix for calculation.
     
-    @return (list) Value of gaussian function for each point in dataset.
+    @return (numpy.array) Value of gaussian function for each point in dataset.
     
     """
     dimension = float(len(data[0]));
@@ -67,14 +67,10 @@ def gaussian(data, mean, covariance):
     else:
         right_const = float('inf');
     
-    result = [];
+    mean_delta = numpy.array(data) - mean;
+    mahalanobis = numpy.sum(mean_delta.dot(inv_variance) * mean_delta, axis = 1);
     
-    for point in data:
-        mean_delta = point - mean;
-        point_gaussian = right_const * numpy.exp( -0.5 * mean_delta.dot(inv_variance).dot(numpy.transpose(mean_delta)) );
-        result.append(point_gaussian);
-    
-    return result;
+    return right_const * numpy.exp(-0.5 * mahalanobis);
 
 
 
@@ -96,6 +92,24 @@ class ema_init_type(IntEnum):
 
 
 
+class ema_covariance_type(IntEnum):
+    """!
+    @brief Enumeration of covariance types that are used by Expectation-Maximization algorithm.
+    @details Diagonal and spherical covariances require less memory and time in case of high-dimensional data.
+    
+    """
+    
+    ## Each cluster has its own general covariance matrix.
+    FULL = 0;
+    
+    ## Each cluster has its own diagonal covariance matrix (variance of each dimension).
+    DIAGONAL = 1;
+    
+    ## Each cluster has its own single variance that is the same for all dimensions.
+    SPHERICAL = 2;
+
+
+
 class ema_initializer():
     """!
     @brief Provides servies for preparing initial means and covariances for Expectation-Maximization algorithm.
@@ -440,7 +454,9 @@ class ema_visualizer:
 class ema:
     """!
     @brief Expectation-Maximization clustering algorithm for Gaussian Mixture Model (GMM).
-    @details The algorithm provides only clustering services (unsupervised learning).
+    @details The algorithm provides only clustering services (unsupervised learning). Belong probabilities are calculated
+              in log space and points are processed by chunks, therefore memory that is required for intermediate results
+              is bounded. Diagonal and spherical covariances can be used for high-dimensional data (see 'ema_covariance_type').
               Here an example of data clustering process:
     @code
         # Read dataset from text file
@@ -485,7 +501,10 @@ class ema:
     @see ema_observer
     
     """
-    def __init__(self, data, amount_clusters, means = None, variances = None, observer = None, tolerance = 0.00001, iterations = 100):
+    __DEFAULT_CHUNK_SIZE = 65536;
+    __REGULARIZATION = 1e-6;
+
+    def __init__(self, data, amount_clusters, means = None, variances = None, observer = None, tolerance = 0.00001, iterations = 100, **kwargs):
         """!
         @brief Initializes Expectation-Maximization algorithm for cluster analysis.
         
@@ -501,28 +520,42 @@ class ema:
                     previous log-likelihood estimation is less then 'tolerance' then clustering is over).
         @param[in] iterations (uint): Additional stop condition parameter that defines maximum number of steps that can be
                     performed by the algorithm during clustering process.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'covariance_type', 'chunk_size').
+        
+        <b>Keyword Args:</b><br>
+            - covariance_type (ema_covariance_type): Type of covariance of clusters (by default is ema_covariance_type.FULL).
+            - chunk_size (uint): Amount of points that are processed at once, it bounds memory that is required for
+               intermediate results (by default is 65536).
         
         """
         
-        self.__data = numpy.array(data);
+        self.__data = numpy.array(data, dtype = numpy.double);
+        if (self.__data.ndim == 1):
+            self.__data = self.__data.reshape(-1, 1);
+        
         self.__amount_clusters = amount_clusters;
         self.__tolerance = tolerance;
         self.__iterations = iterations;
         self.__observer = observer;
         
-        self.__means = means;
-        self.__variances = variances;
+        self.__covariance_type = kwargs.get('covariance_type', ema_covariance_type.FULL);
+        if (self.__covariance_type not in (ema_covariance_type.FULL, ema_covariance_type.DIAGONAL, ema_covariance_type.SPHERICAL)):
+            raise NameError("Unknown type of covariance is specified.");
+        
+        self.__chunk_size = max(1, kwargs.get('chunk_size', ema.__DEFAULT_CHUNK_SIZE));
         
         if ((means is None) or (variances is None)):
-            self.__means, self.__variances = ema_initializer(data, amount_clusters).initialize(ema_init_type.KMEANS_INITIALIZATION);
+            means, variances = ema_initializer(data, amount_clusters).initialize(ema_init_type.KMEANS_INITIALIZATION);
             
-            if (len(self.__means) != amount_clusters):
-                self.__amount_clusters = len(self.__means);
+            if (len(means) != amount_clusters):
+                self.__amount_clusters = len(means);
+        
+        self.__means = numpy.array(means, dtype = numpy.double).reshape(len(means), self.__data.shape[1]);
+        self.__variances = self.__prepare_variances(variances);
         
-        self.__rc = [ [0.0] * len(self.__data) for _ in range(amount_clusters) ];
-        self.__pic = [1.0] * amount_clusters;
+        self.__rc = numpy.zeros((self.__amount_clusters, len(self.__data)));
+        self.__pic = numpy.full(self.__amount_clusters, 1.0 / self.__amount_clusters);
         self.__clusters = [];
-        self.__gaussians = [ [] for _ in range(amount_clusters) ];
         self.__stop = False;
 
 
@@ -538,7 +571,7 @@ class ema:
         
         current_iteration = 0;
         while( (self.__stop is False) and (abs(previous_likelihood - current_likelihood) > self.__tolerance) and (current_iteration < self.__iterations) ):
-            self.__expectation_step();
+            likelihood = self.__expectation_step();
             self.__maximization_step();
             
             current_iteration += 1;
@@ -547,7 +580,7 @@ class ema:
             self.__notify();
             
             previous_likelihood = current_likelihood;
-            current_likelihood = self.__log_likelihood();
+            current_likelihood = likelihood;
             self.__stop = self.__get_stop_condition();
         
         self.__normalize_probabilities();
@@ -568,21 +601,28 @@ class ema:
         
         """
         
-        return self.__means;
+        return list(self.__means);
 
 
     def get_covariances(self):
         """!
-        @return (list) Corresponding variances (or covariances in case of multi-dimensional data) of clusters.
+        @return (list) Corresponding covariance matrices of clusters, diagonal and spherical covariances are also
+                        represented by matrices.
         
         """
         
-        return self.__variances;
+        if (self.__covariance_type == ema_covariance_type.DIAGONAL):
+            return [ numpy.diag(variance) for variance in self.__variances ];
+        
+        elif (self.__covariance_type == ema_covariance_type.SPHERICAL):
+            return [ numpy.eye(self.__data.shape[1]) * variance for variance in self.__variances ];
+        
+        return list(self.__variances);
 
 
     def get_probabilities(self):
         """!
-        @brief Returns 2-dimensional list with belong probability of each object from data to cluster correspondingly,
+        @brief Returns 2-dimensional array with belong probability of each object from data to cluster correspondingly,
                 where that first index is for cluster and the second is for point.
         
         @code
@@ -595,104 +635,167 @@ class ema:
             print("Probability in the first cluster:", probabilities[1][index_point]);
         @endcode
         
-        @return (list) 2-dimensional list with belong probability of each object from data to cluster.
+        @return (numpy.array) 2-dimensional array with belong probability of each object from data to cluster.
         
         """
         
         return self.__rc;
 
 
+    def __prepare_variances(self, variances):
+        """!
+        @brief Converts initial variances to representation that corresponds to the covariance type.
+        @details Variance can be specified by scalar, by vector of variances of each dimension or by covariance matrix.
+        
+        @param[in] variances (list): Initial variance of each cluster.
+        
+        @return (numpy.array) Covariance matrices, diagonals or variances of clusters in line with the covariance type.
+        
+        """
+        
+        dimension = self.__data.shape[1];
+        covariances = numpy.empty((len(variances), dimension, dimension));
+        
+        for index_cluster in range(len(variances)):
+            variance = numpy.array(variances[index_cluster], dtype = numpy.double);
+            if (variance.ndim == 2):
+                covariances[index_cluster] = variance;
+            else:
+                covariances[index_cluster] = numpy.diag(numpy.broadcast_to(variance.ravel(), (dimension,)));
+        
+        if (self.__covariance_type == ema_covariance_type.FULL):
+            return covariances;
+        
+        diagonals = numpy.diagonal(covariances, axis1 = 1, axis2 = 2).copy();
+        if (self.__covariance_type == ema_covariance_type.DIAGONAL):
+            return diagonals;
+        
+        return numpy.mean(diagonals, axis = 1);
+
+
     def __erase_empty_clusters(self):
-        clusters, means, variances, pic, gaussians, rc = [], [], [], [], [], [];
-
-        for index_cluster in range(len(self.__clusters)):
-            if (len(self.__clusters[index_cluster]) > 0):
-                clusters.append(self.__clusters[index_cluster]);
-                means.append(self.__means[index_cluster]);
-                variances.append(self.__variances[index_cluster]);
-                pic.append(self.__pic[index_cluster]);
-                gaussians.append(self.__gaussians[index_cluster]);
-                rc.append(self.__rc[index_cluster]);
-        
-        if (len(self.__clusters) != len(clusters)):
-            self.__clusters, self.__means, self.__variances, self.__pic = clusters, means, variances, pic;
-            self.__gaussians, self.__rc = gaussians, rc;
+        non_empty = [ index_cluster for index_cluster in range(len(self.__clusters)) if len(self.__clusters[index_cluster]) > 0 ];
+        
+        if (len(self.__clusters) != len(non_empty)):
+            self.__clusters = [ self.__clusters[index_cluster] for index_cluster in non_empty ];
+            self.__means, self.__variances = self.__means[non_empty], self.__variances[non_empty];
+            self.__pic, self.__rc = self.__pic[non_empty], self.__rc[non_empty];
             self.__amount_clusters = len(self.__clusters);
 
 
     def __notify(self):
         if (self.__observer is not None):
-            self.__observer.notify(self.__means, self.__variances, self.__clusters);
+            self.__observer.notify(self.get_centers(), self.get_covariances(), self.__clusters);
 
 
     def __extract_clusters(self):
-        self.__clusters = [ [] for _ in range(self.__amount_clusters) ];
-        for index_point in range(len(self.__data)):
-            candidates = [];
-            for index_cluster in range(self.__amount_clusters):
-                candidates.append((index_cluster, self.__rc[index_cluster][index_point]));
-            
-            index_winner = max(candidates, key = lambda candidate : candidate[1])[0];
-            self.__clusters[index_winner].append(index_point);
+        labels = numpy.argmax(self.__rc, axis = 0);
+        self.__clusters = [ numpy.nonzero(labels == index_cluster)[0].tolist() for index_cluster in range(self.__amount_clusters) ];
         
         self.__erase_empty_clusters();
 
 
-    def __log_likelihood(self):
-        likelihood = 0.0;
+    def __prepare_precisions(self):
+        """!
+        @brief Calculates representation of inverse covariances and logarithm of determinant of covariance of each cluster.
+        @details Regularization is added to variances, therefore degenerate covariance (for example, totally similar objects)
+                  does not lead to division by zero.
         
-        for index_point in range(len(self.__data)):
-            particle = 0.0;
-            for index_cluster in range(self.__amount_clusters):
-                particle += self.__pic[index_cluster] * self.__gaussians[index_cluster][index_point];
-
-            if particle > 0.0:
-                likelihood += numpy.log(particle);
+        @return (list) Pairs (precision, log determinant) where precision is matrix 'P' such that mahalanobis distance is
+                        sum of squares of 'deviation.dot(P)' in case of full covariance or inverse variances otherwise.
         
-        return likelihood;
-
-
-    def __probabilities(self, index_cluster, index_point):
-        divider = 0.0;
-        for i in range(self.__amount_clusters):
-            divider += self.__pic[i] * self.__gaussians[i][index_point];
+        """
+        
+        dimension = self.__data.shape[1];
+        precisions = [];
         
-        if ( (divider != 0.0) and (divider != float('inf')) ):
-            return self.__pic[index_cluster] * self.__gaussians[index_cluster][index_point] / divider;
+        for variance in self.__variances:
+            if (self.__covariance_type == ema_covariance_type.FULL):
+                eigenvalues, eigenvectors = numpy.linalg.eigh(variance);
+                eigenvalues = numpy.maximum(eigenvalues, 0.0) + ema.__REGULARIZATION;
+                precisions.append((eigenvectors / numpy.sqrt(eigenvalues), numpy.sum(numpy.log(eigenvalues))));
+            
+            elif (self.__covariance_type == ema_covariance_type.DIAGONAL):
+                variance = variance + ema.__REGULARIZATION;
+                precisions.append((1.0 / variance, numpy.sum(numpy.log(variance))));
+            
+            else:
+                variance = variance + ema.__REGULARIZATION;
+                precisions.append((1.0 / variance, dimension * numpy.log(variance)));
         
-        return 1.0;
+        return precisions;
 
 
-    def __expectation_step(self):
-        self.__gaussians = [ [] for _ in range(self.__amount_clusters) ];
-        for index in range(self.__amount_clusters):
-            self.__gaussians[index] = gaussian(self.__data, self.__means[index], self.__variances[index]);
+    def __log_gaussians(self, points, precisions):
+        """!
+        @brief Calculates logarithm of gaussian of each cluster for specified points.
+        
+        @param[in] points (numpy.array): Points for that gaussians are calculated.
+        @param[in] precisions (list): Inverse covariances that are prepared by '__prepare_precisions'.
+        
+        @return (numpy.array) Logarithm of gaussian where the first index is for point and the second is for cluster.
+        
+        """
+        
+        constant = points.shape[1] * numpy.log(2.0 * pi);
+        result = numpy.empty((len(points), self.__amount_clusters));
         
-        self.__rc = [ [0.0] * len(self.__data) for _ in range(self.__amount_clusters) ];
         for index_cluster in range(self.__amount_clusters):
-            for index_point in range(len(self.__data)):
-                self.__rc[index_cluster][index_point] = self.__probabilities(index_cluster, index_point);
+            deviation = points - self.__means[index_cluster];
+            precision, log_determinant = precisions[index_cluster];
+            
+            if (self.__covariance_type == ema_covariance_type.FULL):
+                mahalanobis = numpy.sum(numpy.square(deviation.dot(precision)), axis = 1);
+            elif (self.__covariance_type == ema_covariance_type.DIAGONAL):
+                mahalanobis = numpy.square(deviation).dot(precision);
+            else:
+                mahalanobis = numpy.sum(numpy.square(deviation), axis = 1) * precision;
+            
+            result[:, index_cluster] = -0.5 * (constant + log_determinant + mahalanobis);
+        
+        return result;
 
 
-    def __maximization_step(self):
-        self.__pic = [];
-        self.__means = [];
-        self.__variances = [];
+    def __expectation_step(self):
+        """!
+        @brief Calculates belong probability of each point to each cluster in log space by chunks of points.
         
-        amount_impossible_clusters = 0;
+        @return (float) Log-likelihood of current parameters of the model.
         
-        for index_cluster in range(self.__amount_clusters):
-            mc = numpy.sum(self.__rc[index_cluster]);
+        """
+        
+        precisions = self.__prepare_precisions();
+        log_weights = numpy.log(self.__pic);
+        
+        self.__rc = numpy.empty((self.__amount_clusters, len(self.__data)));
+        likelihood = 0.0;
+        
+        for begin in range(0, len(self.__data), self.__chunk_size):
+            end = begin + self.__chunk_size;
             
-            if (mc == 0.0):
-                amount_impossible_clusters += 1;
-                continue;
+            log_probabilities = self.__log_gaussians(self.__data[begin:end], precisions) + log_weights;
             
-            self.__pic.append( mc / len(self.__data) );
-            self.__means.append( self.__update_mean(self.__rc[index_cluster], mc) );
-            self.__variances.append( self.__update_covariance(self.__means[-1], self.__rc[index_cluster], mc) );
+            # log-sum-exp to avoid underflow of gaussians of distant points
+            maximum = numpy.max(log_probabilities, axis = 1, keepdims = True);
+            log_normalizer = maximum + numpy.log(numpy.sum(numpy.exp(log_probabilities - maximum), axis = 1, keepdims = True));
+            
+            self.__rc[:, begin:end] = numpy.exp(log_probabilities - log_normalizer).T;
+            likelihood += numpy.sum(log_normalizer);
+        
+        return likelihood;
+
+
+    def __maximization_step(self):
+        mc = numpy.sum(self.__rc, axis = 1);
+        
+        possible_clusters = mc > 0.0;
+        if (not numpy.all(possible_clusters)):
+            self.__rc, mc = self.__rc[possible_clusters], mc[possible_clusters];
+            self.__amount_clusters = len(mc);
         
-        self.__amount_clusters -= amount_impossible_clusters;
+        self.__pic = mc / len(self.__data);
+        self.__means = self.__rc.dot(self.__data) / mc[:, numpy.newaxis];
+        self.__variances = self.__update_variances(mc);
 
 
     def __get_stop_condition(self):
@@ -703,40 +806,45 @@ class ema:
         return False;
 
 
-    def __update_covariance(self, means, rc, mc):
-        covariance = 0.0;
-        for index_point in range(len(self.__data)):
-            deviation = numpy.array( [ self.__data[index_point] - means ]);
-            covariance += rc[index_point] * deviation.T.dot(deviation);
+    def __update_variances(self, mc):
+        """!
+        @brief Calculates weighted covariances of clusters by chunks of points in line with the covariance type.
         
-        covariance = covariance / mc;
-        return covariance;
-
-
-    def __update_mean(self, rc, mc):
-        mean = 0.0;
-        for index_point in range(len(self.__data)):
-            mean += rc[index_point] * self.__data[index_point];
+        @param[in] mc (numpy.array): Sum of belong probabilities of each cluster.
         
-        mean = mean / mc;
-        return mean;
-
-
-    def __normalize_probabilities(self):
-        for index_point in range(len(self.__data)):
-            probability = 0.0;
-            for index_cluster in range(len(self.__clusters)):
-                probability += self.__rc[index_cluster][index_point];
+        @return (numpy.array) Covariance matrices, diagonals or variances of clusters.
+        
+        """
+        
+        dimension = self.__data.shape[1];
+        if (self.__covariance_type == ema_covariance_type.FULL):
+            variances = numpy.zeros((self.__amount_clusters, dimension, dimension));
+        else:
+            variances = numpy.zeros((self.__amount_clusters, dimension));
+        
+        for begin in range(0, len(self.__data), self.__chunk_size):
+            end = begin + self.__chunk_size;
+            points = self.__data[begin:end];
             
-            if (abs(probability - 1.0) > 0.000001):
-                self.__normalize_probability(index_point, probability);
+            for index_cluster in range(self.__amount_clusters):
+                deviation = points - self.__means[index_cluster];
+                rc = self.__rc[index_cluster, begin:end];
+                
+                if (self.__covariance_type == ema_covariance_type.FULL):
+                    variances[index_cluster] += (deviation * rc[:, numpy.newaxis]).T.dot(deviation);
+                else:
+                    variances[index_cluster] += rc.dot(numpy.square(deviation));
+        
+        variances /= mc.reshape((-1,) + (1,) * (variances.ndim - 1));
+        
+        if (self.__covariance_type == ema_covariance_type.SPHERICAL):
+            return numpy.mean(variances, axis = 1);
+        
+        return variances;
 
 
-    def __normalize_probability(self, index_point, probability):
-        if (probability == 0.0):
-            return;
+    def __normalize_probabilities(self):
+        probability = numpy.sum(self.__rc, axis = 0);
         
-        normalization = 1.0 / probability;
-
-        for index_cluster in range(len(self.__clusters)):
-            self.__rc[index_cluster][index_point] *= normalization;
+        unnormalized = (numpy.abs(probability - 1.0) > 0.000001) & (probability != 0.0);
+        self.__rc[:, unnormalized] /= probability[unnormalized];
@@ -26,6 +26,8 @@
 
 import random
 
+import numpy
+
 from pyclustering.cluster import cluster_visualizer
 from pyclustering.cluster.dbscan import dbscan
 
@@ -195,6 +197,30 @@ def performance_measure_random_points(ccore):
     clustering_random_points(20000, ccore)
 
 
+def clustering_scaled_sample(path, radius, neighbors, amount, ccore):
+    sample = numpy.array(read_sample(path))
+
+    # copies of the sample are placed side by side along the first axis, so density of the sample is not changed
+    repeat = amount // len(sample) + 1
+    width = numpy.ptp(sample[:, 0]) + 2.0 * radius
+
+    scaled_sample = numpy.tile(sample, (repeat, 1))
+    scaled_sample[:, 0] += numpy.repeat(numpy.arange(repeat) * width, len(sample))
+    scaled_sample = scaled_sample[:amount]
+
+    dbscan_instance = dbscan(scaled_sample, radius, neighbors, ccore)
+    (ticks, _) = timedcall(dbscan_instance.process)
+
+    print("Execution time (" + str(amount) + " points, " + path + "):", ticks, ", clusters:", len(dbscan_instance.get_clusters()))
+
+
+def performance_measure_scaled_fcps(ccore):
+    for amount in [10000, 100000, 1000000]:
+        clustering_scaled_sample(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 3, amount, ccore)
+        clustering_scaled_sample(FCPS_SAMPLES.SAMPLE_HEPTA, 1, 3, amount, ccore)
+        clustering_scaled_sample(FCPS_SAMPLES.SAMPLE_TETRA, 0.4, 3, amount, ccore)
+
+
 
 cluster_sample1()
 cluster_sample2()
@@ -222,4 +248,6 @@ display_fcps_clustering_results()
 display_fcps_dependence_clustering_results()
 
 performance_measure_random_points(False)
-performance_measure_random_points(True)
\ No newline at end of file
+performance_measure_random_points(True)
+
+performance_measure_scaled_fcps(False)
\ No newline at end of file
@@ -24,6 +24,7 @@
 """
 
 import random
+import numpy
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES, FAMOUS_SAMPLES
 
@@ -33,6 +34,7 @@ from pyclustering.cluster.kmeans import kmeans, kmeans_observer, kmeans_visualiz
 
 from pyclustering.utils import read_sample
 from pyclustering.utils import timedcall
+from pyclustering.utils.metric import distance_metric, type_metric
 
 
 def template_clustering(start_centers, path, tolerance = 0.25, ccore = True):
@@ -167,6 +169,107 @@ def performance_measure_random_points(ccore):
     clustering_random_points(20000, 5, ccore)
 
 
+def compare_python_ccore_random_points(amount_points, amount_centers, dimension):
+    sample = numpy.random.rand(amount_points, dimension)
+    centers = sample[numpy.random.choice(amount_points, amount_centers, replace=False)]
+
+    for ccore in [False, True]:
+        kmeans_instance = kmeans(sample, centers, 0.0001, ccore)
+        (ticks, _) = timedcall(kmeans_instance.process)
+
+        print("Execution time (" + str(amount_points) + " " + str(dimension) + "D-points, " + str(amount_centers) +
+              " centers, " + ("C++" if ccore else "Python") + "):", ticks)
+
+
+def performance_compare_python_ccore():
+    compare_python_ccore_random_points(10000, 8, 2)
+    compare_python_ccore_random_points(100000, 8, 2)
+    compare_python_ccore_random_points(100000, 32, 8)
+    compare_python_ccore_random_points(1000000, 16, 32)
+
+
+def process_kmeans_per_point_loop(sample, centers, tolerance):
+    """!
+    @brief Previous Python implementation of K-Means (before vectorization) that is used as a reference in benchmarks:
+            full k x N distance matrix, clusters are filled point by point and centers are calculated per cluster.
+
+    """
+    sample = numpy.array(sample, dtype=numpy.double)
+    centers = numpy.array(centers, dtype=numpy.double)
+    metric = distance_metric(type_metric.EUCLIDEAN_SQUARE, numpy_usage=True)
+
+    maximum_change = float('inf')
+    clusters = []
+    while maximum_change > tolerance * tolerance:
+        dataset_differences = numpy.zeros((len(centers), len(sample)))
+        for index_center in range(len(centers)):
+            dataset_differences[index_center] = metric(sample, centers[index_center])
+
+        clusters = [[] for _ in range(len(centers))]
+        optimum_indexes = numpy.argmin(dataset_differences, axis=0)
+        for index_point in range(len(optimum_indexes)):
+            clusters[optimum_indexes[index_point]].append(index_point)
+
+        clusters = [cluster for cluster in clusters if len(cluster) > 0]
+
+        updated_centers = numpy.zeros((len(clusters), sample.shape[1]))
+        for index in range(len(clusters)):
+            updated_centers[index] = sample[clusters[index], :].mean(axis=0)
+
+        if len(centers) != len(updated_centers):
+            maximum_change = float('inf')
+        else:
+            maximum_change = numpy.max(metric(centers, updated_centers))
+
+        centers = updated_centers
+
+    return clusters, centers
+
+
+def compare_previous_vectorized_random_points(amount_points, amount_centers, dimension):
+    sample = numpy.random.rand(amount_points, dimension)
+    centers = sample[numpy.random.choice(amount_points, amount_centers, replace=False)]
+
+    (ticks_previous, (previous_clusters, _)) = timedcall(process_kmeans_per_point_loop, sample, centers, 0.0001)
+
+    kmeans_instance = kmeans(sample, centers, 0.0001, False)
+    (ticks_vectorized, _) = timedcall(kmeans_instance.process)
+
+    same_result = sorted(previous_clusters) == sorted(kmeans_instance.get_clusters())
+
+    print("Execution time (" + str(amount_points) + " " + str(dimension) + "D-points, " + str(amount_centers) +
+          " centers): previous", ticks_previous, ", vectorized", ticks_vectorized, ", same clusters:", same_result)
+
+
+def performance_compare_previous_vectorized():
+    compare_previous_vectorized_random_points(10000, 8, 2)
+    compare_previous_vectorized_random_points(20000, 8, 4)
+    compare_previous_vectorized_random_points(100000, 16, 4)
+    compare_previous_vectorized_random_points(100000, 32, 8)
+
+
+def compare_accelerated_random_points(amount_points, amount_centers, dimension, metric):
+    sample = numpy.random.rand(amount_points, dimension)
+    centers = sample[numpy.random.choice(amount_points, amount_centers, replace=False)]
+
+    for accelerated in [False, True]:
+        observer = kmeans_observer()
+        kmeans_instance = kmeans(sample, centers, 0.0001, False, accelerated=accelerated, observer=observer, metric=metric)
+        (ticks, _) = timedcall(kmeans_instance.process)
+
+        calculations = len(observer) * amount_points * amount_centers
+        skipped = sum([observer.get_skipped_distances(iteration) for iteration in range(len(observer))])
+
+        print("Execution time (" + str(amount_points) + " " + str(dimension) + "D-points, " + str(amount_centers) +
+              " centers, " + ("accelerated" if accelerated else "full") + "):", ticks, ", distance calculations:", calculations - skipped)
+
+
+def performance_compare_accelerated():
+    compare_accelerated_random_points(10000, 32, 16, distance_metric(type_metric.EUCLIDEAN_SQUARE))
+    compare_accelerated_random_points(20000, 256, 128, distance_metric(type_metric.EUCLIDEAN_SQUARE))
+    compare_accelerated_random_points(20000, 256, 128, distance_metric(type_metric.MANHATTAN))
+
+
 cluster_sample1()
 cluster_sample2()
 cluster_sample3()
@@ -188,4 +291,7 @@ cluster_iris()
 experiment_execution_time(False)   # Python code
 experiment_execution_time(True)    # C++ code + Python env.
 
-performance_measure_random_points(False)
\ No newline at end of file
+performance_measure_random_points(False)
+performance_compare_previous_vectorized()
+performance_compare_python_ccore()
+performance_compare_accelerated()
\ No newline at end of file
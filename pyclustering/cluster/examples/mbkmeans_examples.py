@@ -0,0 +1,87 @@
+"""!
+
+@brief Examples of usage and demonstration of abilities of Mini-Batch K-Means algorithm in cluster analysis.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2018
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.kmeans import kmeans_visualizer
+from pyclustering.cluster.mbkmeans import mbkmeans
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils import read_sample
+from pyclustering.utils import timedcall
+
+
+def template_clustering(path, amount_clusters, batch_size):
+    sample = read_sample(path)
+    initial_centers = kmeans_plusplus_initializer(sample, amount_clusters).initialize()
+
+    mbkmeans_instance = mbkmeans(sample, initial_centers, batch_size)
+    (ticks, _) = timedcall(mbkmeans_instance.process)
+
+    clusters = mbkmeans_instance.get_clusters()
+    centers = mbkmeans_instance.get_centers()
+
+    print("Sample: ", path, "\t\tExecution time: ", ticks, "\n")
+
+    kmeans_visualizer.show_clusters(sample, clusters, centers, initial_centers)
+
+
+def template_stream_clustering(amount_batches, batch_size, amount_clusters, dimension):
+    def generate_batches():
+        cluster_centers = numpy.random.rand(amount_clusters, dimension) * 10.0
+        for _ in range(amount_batches):
+            labels = numpy.random.randint(0, amount_clusters, batch_size)
+            yield cluster_centers[labels] + numpy.random.normal(0.0, 0.5, (batch_size, dimension))
+
+    mbkmeans_instance = mbkmeans(generate_batches(), amount_clusters)
+    (ticks, _) = timedcall(mbkmeans_instance.process)
+
+    print("Stream of " + str(amount_batches * batch_size) + " " + str(dimension) + "D-points, execution time:", ticks)
+
+
+def cluster_sample1():
+    template_clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5)
+
+def cluster_sample3():
+    template_clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 20)
+
+def cluster_lsun():
+    template_clustering(FCPS_SAMPLES.SAMPLE_LSUN, 3, 50)
+
+def cluster_two_diamonds():
+    template_clustering(FCPS_SAMPLES.SAMPLE_TWO_DIAMONDS, 2, 100)
+
+def cluster_stream():
+    template_stream_clustering(1000, 1000, 16, 32)
+
+
+cluster_sample1()
+cluster_sample3()
+cluster_lsun()
+cluster_two_diamonds()
+cluster_stream()
@@ -26,7 +26,6 @@
 
 
 import numpy as np;
-import math;
 
 import matplotlib.pyplot as plt;
 import matplotlib.animation as animation;
@@ -34,6 +33,60 @@ import matplotlib.animation as animation;
 from pyclustering.cluster import cluster_visualizer;
 from pyclustering.cluster.ga_maths import ga_math;
 
+from pyclustering.utils import split_blocks;
+
+from multiprocessing import Pool;
+
+
+# Shared memory (None if data is copied to the process) and input data in the process of pool of genetic algorithm.
+_shared_data = None
+
+
+def _attach_shared_data(name, shape, dtype):
+    """!
+    @brief Attaches input data that is placed to shared memory by genetic algorithm, it is initializer of process of pool.
+    
+    @param[in] name (string): Name of shared memory block.
+    @param[in] shape (tuple): Shape of input data.
+    @param[in] dtype (string): Type of elements of input data.
+    
+    """
+    
+    global _shared_data
+    
+    from multiprocessing import shared_memory
+    
+    memory = shared_memory.SharedMemory(name=name)
+    _shared_data = (memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf))
+
+
+def _attach_data(data):
+    """!
+    @brief Stores copy of input data in the process, it is initializer of process of pool when shared memory is not
+            available (Python older than 3.8).
+    
+    @param[in] data (numpy.array): Input data.
+    
+    """
+    
+    global _shared_data
+    
+    _shared_data = (None, data)
+
+
+def _calc_shared_fitness(chromosomes, count_clusters):
+    """!
+    @brief Calculates fitness function values for chromosomes using input data from shared memory.
+    
+    @param[in] chromosomes (numpy.array): Chromosomes whose fitness function's values are calculated.
+    @param[in] count_clusters (uint): Amount of clusters that should be allocated.
+    
+    @return (numpy.array) Fitness function value for each chromosome correspondingly.
+    
+    """
+    
+    return genetic_algorithm._calc_fitness(chromosomes, _shared_data[1], count_clusters)
+
 
 
 class ga_observer:
@@ -337,13 +390,31 @@ class genetic_algorithm:
     
     @image html ga_clustering_sample_simple_04.png
 
+    Fitness function of all chromosomes is calculated at once on each iteration, therefore it can be calculated by
+    pool of processes where input data is shared via shared memory. Several populations (islands) can evolve
+    independently, the best chromosomes of each island periodically migrate to the next island:
+    @code
+        # four islands of 25 chromosomes, two best chromosomes migrate each 10 iterations,
+        # fitness function is calculated by four processes
+        ga_instance = genetic_algorithm(data=sample,
+                                      count_clusters=4,
+                                      chromosome_count=25,
+                                      population_count=200,
+                                      count_mutation_gens=1,
+                                      processes=4,
+                                      island_count=4,
+                                      migration_interval=10,
+                                      migration_count=2);
+        ga_instance.process();
+    @endcode
+
     @see ga_visualizer
     @see ga_observer
 
     """
 
     def __init__(self, data, count_clusters, chromosome_count, population_count, count_mutation_gens=2,
-                 coeff_mutation_count=0.25, select_coeff=1.0, observer=ga_observer()):
+                 coeff_mutation_count=0.25, select_coeff=1.0, observer=ga_observer(), **kwargs):
         """!
         @brief Initialize genetic clustering algorithm for cluster analysis.
         
@@ -358,6 +429,15 @@ class genetic_algorithm:
         @param[in] select_coeff (float): Exponential coefficient for selection procedure that is used as follows:
                    math.exp(1 + fitness(chromosome) * select_coeff).
         @param[in] observer (ga_observer): Observer that is used for collecting information of about clustering process on each step.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'processes', 'island_count', 'migration_interval', 'migration_count').
+        
+        <b>Keyword Args:</b><br>
+            - processes (uint): Amount of processes that calculate fitness function, input data is shared with them via
+               shared memory (by default is 1 - fitness function is calculated by the current process).
+            - island_count (uint): Amount of islands - populations of 'chromosome_count' chromosomes that evolve independently (by default is 1).
+            - migration_interval (uint): Amount of iterations between migrations, on each migration the best chromosomes of
+               each island replace the worst chromosomes of the next island (by default is 10).
+            - migration_count (uint): Amount of the best chromosomes that migrate from each island (by default is 1).
         
         """
         
@@ -391,6 +471,24 @@ class genetic_algorithm:
         # Exponential coeff for selection
         self._select_coeff = select_coeff
 
+        # Count of processes that calculate fitness function
+        self._processes = kwargs.get('processes', 1)
+
+        # Island model: count of islands and migration between them
+        self._island_count = kwargs.get('island_count', 1)
+        self._migration_interval = kwargs.get('migration_interval', 10)
+        self._migration_count = kwargs.get('migration_count', 1)
+
+        if self._island_count < 1:
+            raise ValueError("Amount of islands should be greater than 0 (current value: '%d')." % self._island_count)
+
+        if self._migration_interval < 1:
+            raise ValueError("Migration interval should be greater than 0 (current value: '%d')." % self._migration_interval)
+
+        if (self._migration_count < 0) or (self._migration_count > self._chromosome_count):
+            raise ValueError("Amount of migrating chromosomes should be in range [0, %d] (current value: '%d')."
+                             % (self._chromosome_count, self._migration_count))
+
         # Result of clustering : best chromosome
         self._result_clustering = {'best_chromosome': [],
                                   'best_fitness_function': 0.0}
@@ -406,34 +504,99 @@ class genetic_algorithm:
         
         """
 
-        # Initialize population
-        chromosomes = self._init_population(self._count_clusters, len(self._data), self._chromosome_count)
+        pool, memory = None, None
+        if self._processes > 1:
+            (pool, memory) = self.__create_pool()
+
+        try:
+            best_chromosome, best_ff = self.__evolve(pool)
+
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+
+        # Save result
+        self._result_clustering['best_chromosome'] = best_chromosome
+        self._result_clustering['best_fitness_function'] = best_ff
+
+        return best_chromosome, best_ff
+
+
+    def get_observer(self):
+        """!
+        @brief Returns genetic algorithm observer.
+        
+        """
+        return self._observer
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns list of allocated clusters, each cluster contains indexes of objects from the data.
+        
+        @return (list) List of allocated clusters.
+        
+        @see process()
+        
+        """
+
+        return ga_math.get_clusters_representation(self._result_clustering['best_chromosome'], self._count_clusters)
+
+
+    def __evolve(self, pool):
+        """!
+        @brief Evolves populations of islands and returns the best chromosome.
+        
+        @param[in] pool (multiprocessing.Pool): Pool of processes that calculate fitness function, if it is 'None' then
+                    fitness function is calculated by the current process.
+        
+        @return (numpy.array, float) The best chromosome and its fitness function value.
+        
+        """
+
+        # Initialize populations
+        islands = [self._init_population(self._count_clusters, len(self._data), self._chromosome_count)
+                   for _ in range(self._island_count)]
+
+        fitness_functions = self.__calc_islands_fitness(islands, pool)
 
         # Initialize the Best solution
-        best_chromosome, best_ff, first_fitness_functions \
-            = self._get_best_chromosome(chromosomes, self._data, self._count_clusters)
+        best_chromosome, best_ff = self.__get_best_chromosome(islands, fitness_functions)
 
         # Save best result into observer
         if self._observer is not None:
             self._observer.collect_global_best(best_chromosome, best_ff)
             self._observer.collect_population_best(best_chromosome, best_ff)
-            self._observer.collect_mean(first_fitness_functions)
+            self._observer.collect_mean(np.concatenate(fitness_functions))
 
         # Next population
-        for _ in range(self._population_count):
+        for _idx_population in range(self._population_count):
+
+            for _idx_island in range(self._island_count):
+
+                # Select
+                chromosomes = self._select(islands[_idx_island], fitness_functions[_idx_island], self._select_coeff)
 
-            # Select
-            chromosomes = self._select(chromosomes, self._data, self._count_clusters, self._select_coeff)
+                # Crossover
+                self._crossover(chromosomes)
 
-            # Crossover
-            self._crossover(chromosomes)
+                # Mutation
+                self._mutation(chromosomes, self._count_clusters, self._count_mutation_gens, self._coeff_mutation_count)
 
-            # Mutation
-            self._mutation(chromosomes, self._count_clusters, self._count_mutation_gens, self._coeff_mutation_count)
+                islands[_idx_island] = chromosomes
+
+            fitness_functions = self.__calc_islands_fitness(islands, pool)
+
+            # Migration
+            if (self._island_count > 1) and ((_idx_population + 1) % self._migration_interval == 0):
+                self.__migrate(islands, fitness_functions)
 
             # Update the Best Solution
-            new_best_chromosome, new_best_ff, fitness_functions \
-                = self._get_best_chromosome(chromosomes, self._data, self._count_clusters)
+            new_best_chromosome, new_best_ff = self.__get_best_chromosome(islands, fitness_functions)
 
             # Get best chromosome
             if new_best_ff < best_ff:
@@ -444,65 +607,136 @@ class genetic_algorithm:
             if self._observer is not None:
                 self._observer.collect_global_best(best_chromosome, best_ff)
                 self._observer.collect_population_best(new_best_chromosome, new_best_ff)
-                self._observer.collect_mean(fitness_functions)
-
-        # Save result
-        self._result_clustering['best_chromosome'] = best_chromosome
-        self._result_clustering['best_fitness_function'] = best_ff
+                self._observer.collect_mean(np.concatenate(fitness_functions))
 
         return best_chromosome, best_ff
 
 
-    def get_observer(self):
+    def __create_pool(self):
         """!
-        @brief Returns genetic algorithm observer.
+        @brief Places input data to shared memory and creates pool of processes that are attached to it.
+        @details Shared memory is available since Python 3.8, input data is copied to each process by initializer of
+                  the pool on older versions.
+        
+        @return (multiprocessing.Pool, multiprocessing.shared_memory.SharedMemory) Pool of processes and shared memory
+                 that should be released by caller (None if shared memory is not available).
         
         """
-        return self._observer
 
+        data = np.ascontiguousarray(self._data)
 
-    def get_clusters(self):
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            return Pool(self._processes, initializer=_attach_data, initargs=(data,)), None
+
+        memory = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+        np.ndarray(data.shape, dtype=data.dtype, buffer=memory.buf)[:] = data
+
+        try:
+            pool = Pool(self._processes, initializer=_attach_shared_data,
+                        initargs=(memory.name, data.shape, data.dtype.str))
+
+        except Exception:
+            memory.close()
+            memory.unlink()
+            raise
+
+        return pool, memory
+
+
+    def __calc_islands_fitness(self, islands, pool):
         """!
-        @brief Returns list of allocated clusters, each cluster contains indexes of objects from the data.
+        @brief Calculates fitness function values for chromosomes of all islands at once.
         
-        @return (list) List of allocated clusters.
+        @param[in] islands (list): Populations (chromosomes) of islands.
+        @param[in] pool (multiprocessing.Pool): Pool of processes that calculate fitness function or 'None'.
         
-        @see process()
+        @return (list) Fitness function values of chromosomes of each island.
         
         """
 
-        return ga_math.get_clusters_representation(self._result_clustering['best_chromosome'], self._count_clusters)
+        chromosomes = np.concatenate(islands)
+
+        if pool is None:
+            fitness_functions = self._calc_fitness(chromosomes, self._data, self._count_clusters)
+
+        else:
+            tasks = [(block, self._count_clusters) for block in np.array_split(chromosomes, self._processes) if len(block) > 0]
+            fitness_functions = np.concatenate(pool.starmap(_calc_shared_fitness, tasks))
+
+        return np.split(fitness_functions, self._island_count)
+
+
+    def __migrate(self, islands, fitness_functions):
+        """!
+        @brief Replaces the worst chromosomes of each island by the best chromosomes of the previous island (ring topology).
+        
+        @param[in|out] islands (list): Populations (chromosomes) of islands.
+        @param[in|out] fitness_functions (list): Fitness function values of chromosomes of each island.
+        
+        """
+
+        if self._migration_count == 0:
+            return
+
+        # The best chromosomes are chosen before replacement, therefore each island sends its own chromosomes
+        emigrants = []
+        for chromosomes, fitness in zip(islands, fitness_functions):
+            best_indexes = np.argsort(fitness, kind='stable')[:self._migration_count]
+            emigrants.append((chromosomes[best_indexes], fitness[best_indexes]))
+
+        for _idx_island in range(self._island_count):
+            chromosomes, fitness = emigrants[_idx_island - 1]
+
+            worst_indexes = np.argsort(fitness_functions[_idx_island], kind='stable')[::-1][:self._migration_count]
+            islands[_idx_island][worst_indexes] = chromosomes
+            fitness_functions[_idx_island][worst_indexes] = fitness
 
 
     @staticmethod
-    def _select(chromosomes, data, count_clusters, select_coeff):
+    def __get_best_chromosome(islands, fitness_functions):
         """!
-        @brief Performs selection procedure where new chromosomes are calculated.
+        @brief Returns the current best chromosome among all islands.
         
-        @param[in] chromosomes (numpy.array): Chromosomes 
+        @param[in] islands (list): Populations (chromosomes) of islands.
+        @param[in] fitness_functions (list): Fitness function values of chromosomes of each island.
+        
+        @return (numpy.array, float) The best chromosome and its fitness function value.
         
         """
 
-        # Calc centers
-        centres = ga_math.get_centres(chromosomes, data, count_clusters)
+        best_island_idx = int(np.argmin([fitness.min() for fitness in fitness_functions]))
+        best_chromosome_idx = fitness_functions[best_island_idx].argmin()
+
+        best_chromosome = islands[best_island_idx][best_chromosome_idx].copy()
+        return best_chromosome, fitness_functions[best_island_idx][best_chromosome_idx]
 
-        # Calc fitness functions
-        fitness = genetic_algorithm._calc_fitness_function(centres, data, chromosomes)
 
-        for _idx in range(len(fitness)):
-            fitness[_idx] = math.exp(1 + fitness[_idx] * select_coeff)
+    @staticmethod
+    def _select(chromosomes, fitness, select_coeff):
+        """!
+        @brief Performs selection procedure where new chromosomes are calculated.
+        @details Probability to select chromosome is inversely proportional to math.exp(1 + fitness * select_coeff),
+                  values are shifted by the best fitness function value that does not change probabilities, but
+                  prevents overflow.
+        
+        @param[in] chromosomes (numpy.array): Chromosomes 
+        @param[in] fitness (numpy.array): Fitness function values of the chromosomes.
+        @param[in] select_coeff (float): Exponential coefficient for selection procedure.
+        
+        """
+
+        with np.errstate(over='ignore'):
+            fitness = np.exp((fitness - fitness.min()) * select_coeff)
 
         # Calc probability vector
         probabilities = ga_math.calc_probability_vector(fitness)
 
         # Select P chromosomes with probabilities
-        new_chromosomes = np.zeros(chromosomes.shape, dtype=np.int)
-
-        # Selecting
-        for _idx in range(len(chromosomes)):
-            new_chromosomes[_idx] = chromosomes[ga_math.get_uniform(probabilities)]
+        selected = np.searchsorted(probabilities, np.random.rand(len(chromosomes)), side='right')
 
-        return new_chromosomes
+        return chromosomes[selected]
 
 
     @staticmethod
@@ -571,11 +805,9 @@ class genetic_algorithm:
         
         """
 
-        for _idx in range(len(chromosome_1)):
-
-            if mask[_idx] == 1:
-                # Swap values
-                chromosome_1[_idx], chromosome_2[_idx] = chromosome_2[_idx], chromosome_1[_idx]
+        # Swap values
+        swap = mask == 1
+        chromosome_1[swap], chromosome_2[swap] = chromosome_2[swap], chromosome_1[swap]
 
 
     @staticmethod
@@ -616,16 +848,15 @@ class genetic_algorithm:
 
 
     @staticmethod
-    def _get_best_chromosome(chromosomes, data, count_clusters):
+    def _calc_fitness(chromosomes, data, count_clusters):
         """!
-        @brief Returns the current best chromosome.
+        @brief Calculates centers of clusters and fitness function values for chromosomes.
         
-        @param[in] chromosomes (list): Chromosomes that are used for searching.
-        @param[in] data (list): Input data that is used for clustering process.
+        @param[in] chromosomes (numpy.array): Chromosomes whose fitness function's values are calculated.
+        @param[in] data (numpy.array): Input data that is used for clustering process.
         @param[in] count_clusters (uint): Amount of clusters that should be allocated.
         
-        @return (list, float, list) The best chromosome, its fitness function value and fitness function values for
-                 all chromosomes.
+        @return (numpy.array) Fitness function value for each chromosome correspondingly.
         
         """
 
@@ -633,19 +864,14 @@ class genetic_algorithm:
         centres = ga_math.get_centres(chromosomes, data, count_clusters)
 
         # Calc Fitness functions
-        fitness_functions = genetic_algorithm._calc_fitness_function(centres, data, chromosomes)
-
-        # Index of the best chromosome
-        best_chromosome_idx = fitness_functions.argmin()
-
-        # Get chromosome with the best fitness function
-        return chromosomes[best_chromosome_idx], fitness_functions[best_chromosome_idx], fitness_functions
+        return genetic_algorithm._calc_fitness_function(centres, data, chromosomes)
 
 
     @staticmethod
     def _calc_fitness_function(centres, data, chromosomes):
         """!
         @brief Calculate fitness function values for chromosomes.
+        @details Centers of points are gathered by labels for block of chromosomes at once.
         
         @param[in] centres (list): Cluster centers.
         @param[in] data (list): Input data that is used for clustering process.
@@ -655,23 +881,22 @@ class genetic_algorithm:
         
         """
 
-        # Get count of chromosomes and clusters
+        data = np.asarray(data)
+        chromosomes = np.asarray(chromosomes)
+
+        # Get count of chromosomes
         count_chromosome = len(chromosomes)
 
         # Initialize fitness function values
         fitness_function = np.zeros(count_chromosome)
 
-        # Calc fitness function for each chromosome
-        for _idx_chromosome in range(count_chromosome):
-
-            # Get centers for a selected chromosome
-            centres_data = np.zeros(data.shape)
+        for (begin, end) in split_blocks(count_chromosome, data.size):
+            labels = chromosomes[begin:end]
 
-            # Fill data centres
-            for _idx in range(len(data)):
-                centres_data[_idx] = centres[_idx_chromosome][chromosomes[_idx_chromosome][_idx]]
+            # Get centers of points for each chromosome in the block
+            centres_data = centres[begin:end][np.arange(len(labels))[:, None], labels]
 
-            # Get City Block distance for a chromosome
-            fitness_function[_idx_chromosome] += np.sum(abs(data - centres_data))
+            # Get City Block distance for each chromosome
+            fitness_function[begin:end] = np.sum(np.abs(data - centres_data), axis=(1, 2))
 
         return fitness_function
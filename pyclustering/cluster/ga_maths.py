@@ -26,6 +26,8 @@
 
 import numpy as np;
 
+from pyclustering.utils import split_blocks;
+
 
 class ga_math:
     """
@@ -68,61 +70,76 @@ class ga_math:
     @staticmethod
     def calc_centers(chromosomes, data, count_clusters=None):
         """!
+        @brief Calculates cluster centers that are encoded by each chromosome.
+        @details Centers are calculated by summation of points with the same label using 'numpy.bincount' where labels
+                  of each chromosome are shifted by 'count_clusters', therefore block of chromosomes is processed at once.
+                  Center of empty cluster is zero point.
+
+        @param[in] chromosomes (numpy.array): Chromosomes where each gene is a label of cluster of corresponding point.
+        @param[in] data (numpy.array): Input data that is used for clustering process.
+        @param[in] count_clusters (uint): Amount of clusters, if it is not specified then it is calculated using the first chromosome.
+
+        @return (numpy.array) Centers with shape (amount of chromosomes, amount of clusters, dimension).
+
         """
 
+        chromosomes = np.asarray(chromosomes)
+        data = np.asarray(data, dtype=np.double)
+
         if count_clusters is None:
             count_clusters = ga_math.calc_count_centers(chromosomes[0])
 
+        count_chromosomes, count_data = chromosomes.shape
+        dimension = data.shape[1]
+
         # Initialize center
-        centers = np.zeros(shape=(len(chromosomes), count_clusters, len(data[0])))
+        centers = np.zeros(shape=(count_chromosomes, count_clusters, dimension))
 
-        for _idx_chromosome in range(len(chromosomes)):
+        for (begin, end) in split_blocks(count_chromosomes, count_data):
+            labels = chromosomes[begin:end]
+            count_block = len(labels)
 
-            # Get count data in clusters
-            count_data_in_cluster = np.zeros(count_clusters)
+            # Unique label of cluster of each chromosome in the block
+            flat_labels = (labels + (np.arange(count_block) * count_clusters)[:, None]).ravel()
+            length = count_block * count_clusters
 
-            # Next data point
-            for _idx in range(len(chromosomes[_idx_chromosome])):
+            count_data_in_cluster = np.bincount(flat_labels, minlength=length)
 
-                cluster_num = chromosomes[_idx_chromosome][_idx]
+            block_centers = np.empty((length, dimension))
+            for index_dimension in range(dimension):
+                weights = np.tile(data[:, index_dimension], count_block)
+                block_centers[:, index_dimension] = np.bincount(flat_labels, weights=weights, minlength=length)
 
-                centers[_idx_chromosome][cluster_num] += data[_idx]
-                count_data_in_cluster[cluster_num] += 1
+            non_empty = count_data_in_cluster > 0
+            block_centers[non_empty] /= count_data_in_cluster[non_empty, None]
 
-            for _idx_cluster in range(count_clusters):
-                if count_data_in_cluster[_idx_cluster] != 0:
-                    centers[_idx_chromosome][_idx_cluster] /= count_data_in_cluster[_idx_cluster]
+            centers[begin:end] = block_centers.reshape(count_block, count_clusters, dimension)
 
         return centers
 
     @staticmethod
     def calc_probability_vector(fitness):
         """!
+        @brief Calculates cumulative probability vector where probability of each element is proportional to inverted fitness.
+
+        @param[in] fitness (list): Values that are inverted to obtain probabilities, zero value has zero probability.
+
+        @return (numpy.array) Cumulative probabilities in increasing sequence where the last value is 1.
+
         """
 
         if len(fitness) == 0:
             raise AttributeError("Has no any fitness functions.")
 
+        fitness = np.asarray(fitness, dtype=np.double)
+
         # Get 1/fitness function
         inv_fitness = np.zeros(len(fitness))
-
-        #
-        for _idx in range(len(inv_fitness)):
-
-            if fitness[_idx] != 0.0:
-                inv_fitness[_idx] = 1.0 / fitness[_idx]
-            else:
-                inv_fitness[_idx] = 0.0
-
-        # Initialize vector
-        prob = np.zeros(len(fitness))
-
-        # Initialize first element
-        prob[0] = inv_fitness[0]
+        non_zero = fitness != 0.0
+        inv_fitness[non_zero] = 1.0 / fitness[non_zero]
 
         # Accumulate values in probability vector
-        for _idx in range(1, len(inv_fitness)):
-            prob[_idx] = prob[_idx - 1] + inv_fitness[_idx]
+        prob = np.cumsum(inv_fitness)
 
         # Normalize
         prob /= prob[-1]
@@ -139,18 +156,8 @@ class ga_math:
         
         """
 
-        # Start from the last elem
-        back_idx = - 1
-
         # All values equal to the last elem should be set to 1
-        last_val = probabilities[back_idx]
-
-        # for all elements or if a elem not equal to the last elem
-        for _ in range(-1, -len(probabilities) - 1):
-            if probabilities[back_idx] == last_val:
-                probabilities[back_idx] = 1
-            else:
-                break
+        probabilities[probabilities == probabilities[-1]] = 1
 
     @staticmethod
     def get_uniform(probabilities):
@@ -161,21 +168,13 @@ class ga_math:
                    for example, [0 0.1 0.2 0.3 1.0].
         """
 
-        # Initialize return value
-        res_idx = None
-
         # Get random num in range [0, 1)
         random_num = np.random.rand()
 
-        # Find segment with  val1 < random_num < val2
-        for _idx in range(len(probabilities)):
-            if random_num < probabilities[_idx]:
-                res_idx = _idx
-                break
+        # Find segment with  val1 <= random_num < val2
+        res_idx = int(np.searchsorted(probabilities, random_num, side='right'))
 
-        if res_idx is None:
-            print('Probabilities : ', probabilities)
+        if res_idx == len(probabilities):
             raise AttributeError("'probabilities' should contain 1 as the end of last segment(s)")
 
         return res_idx
-
@@ -25,6 +25,8 @@
 """
 
 
+import numpy;
+
 import pyclustering.core.hsyncnet_wrapper as wrapper;
 
 from pyclustering.core.wrapper import ccore_library;
@@ -33,7 +35,7 @@ from pyclustering.nnet import initial_type, solve_type;
 
 from pyclustering.cluster.syncnet import syncnet, syncnet_analyser;
 
-from pyclustering.utils import average_neighbor_distance;
+from pyclustering.utils import euclidean_distance_square_blocks;
 
 
 class hsyncnet(syncnet):
@@ -87,6 +89,8 @@ class hsyncnet(syncnet):
             self.__initial_neighbors = initial_neighbors;
             self.__increase_persent = increase_persent;
             self._number_clusters = number_clusters;
+            
+            self.__neighbor_distances = None;
     
     
     def __del__(self):
@@ -124,7 +128,7 @@ class hsyncnet(syncnet):
         dyn_phase = [];
         dyn_time = [];
         
-        radius = average_neighbor_distance(self._osc_loc, number_neighbors);
+        radius = self.__average_neighbor_distance(number_neighbors);
         
         increase_step = int(len(self._osc_loc) * self.__increase_persent);
         if (increase_step < 1):
@@ -173,7 +177,47 @@ class hsyncnet(syncnet):
         if (number_neighbors >= len(self._osc_loc)):
             return radius * self.__increase_persent + radius;
         
-        return average_neighbor_distance(self._osc_loc, number_neighbors);
+        return self.__average_neighbor_distance(number_neighbors);
+
+
+    def __average_neighbor_distance(self, number_neighbors):
+        """!
+        @brief Returns average distance between oscillators and their specified number of nearest neighbors.
+        @details Distances to neighbors are calculated once for all numbers of neighbors, therefore increase of
+                  connectivity radius does not require calculation of distances again.
+        
+        @param[in] number_neighbors (uint): Number of nearest neighbors of each oscillator that are considered.
+        
+        @return (double) Average distance to 'number_neighbors' nearest neighbors.
+        
+        """
+        
+        if (self.__neighbor_distances is None):
+            self.__neighbor_distances = self.__calculate_neighbor_distances();
+        
+        return self.__neighbor_distances[number_neighbors - 1] / number_neighbors;
+
+
+    def __calculate_neighbor_distances(self):
+        """!
+        @brief Calculates total distance to the nearest neighbors for each number of neighbors averaged by oscillators.
+        @details Distances are sorted by blocks of oscillators (see euclidean_distance_square_blocks()), therefore distance matrix is not stored.
+        
+        @return (numpy.array) Average sum of distances to 'k + 1' nearest neighbors in element 'k'.
+        
+        """
+        
+        locations = numpy.array(self._osc_loc, dtype = numpy.double);
+        amount_oscillators = len(locations);
+        
+        rank_distances = numpy.zeros(amount_oscillators);
+        
+        for (_, _, distances) in euclidean_distance_square_blocks(locations, locations):
+            distances = numpy.sqrt(distances);
+            rank_distances += numpy.sum(numpy.sort(distances, axis = 1), axis = 0);
+        
+        # the first rank is distance from oscillator to itself
+        return numpy.cumsum(rank_distances[1:]) / amount_oscillators;
 
 
     def __store_dynamic(self, dyn_phase, dyn_time, analyser, begin_state):
@@ -189,8 +233,8 @@ class hsyncnet(syncnet):
         
         if (begin_state is True):
             dyn_time.append(0);
-            dyn_phase.append(analyser.output[0]);
+            dyn_phase.append(analyser.output_view[0].tolist());
         
         else:
-            dyn_phase.append(analyser.output[len(analyser.output) - 1]);
+            dyn_phase.append(analyser.output_view[-1].tolist());
             dyn_time.append(len(dyn_time));
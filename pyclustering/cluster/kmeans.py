@@ -36,6 +36,7 @@ from pyclustering.core.wrapper import ccore_library
 from pyclustering.core.metric_wrapper import metric_wrapper
 
 from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.center_assigner import block_assigner, elkan_assigner, labels_to_clusters
 from pyclustering.cluster import cluster_visualizer
 
 from pyclustering.utils.metric import distance_metric, type_metric
@@ -56,6 +57,7 @@ class kmeans_observer:
         """
         self.__evolution_clusters   = []
         self.__evolution_centers    = []
+        self.__evolution_skipped    = []
         self.__initial_centers      = []
 
 
@@ -67,16 +69,18 @@ class kmeans_observer:
         return len(self.__evolution_clusters)
 
 
-    def notify(self, clusters, centers):
+    def notify(self, clusters, centers, skipped_distances = 0):
         """!
         @brief This method is called by K-Means algorithm to notify about changes.
         
         @param[in] clusters (array_like): Allocated clusters by K-Means algorithm.
         @param[in] centers (array_like): Allocated centers by K-Means algorithm.
+        @param[in] skipped_distances (uint): Amount of distance calculations that were skipped by accelerated assignment.
         
         """
         self.__evolution_clusters.append(clusters)
         self.__evolution_centers.append(centers)
+        self.__evolution_skipped.append(skipped_distances)
 
 
     def set_evolution_centers(self, evolution_centers):
@@ -123,6 +127,23 @@ class kmeans_observer:
         return self.__evolution_clusters[iteration]
 
 
+    def get_skipped_distances(self, iteration):
+        """!
+        @brief Get method to return amount of distance calculations that were skipped at specific iteration of clustering process.
+        @details Distance calculations are skipped only if accelerated assignment is used by Python implementation of
+                  the algorithm, otherwise zero is returned.
+        
+        @param[in] iteration (uint): Clustering process iteration at which amount of skipped calculations is required.
+        
+        @return (uint) Amount of skipped distance calculations between points and centers.
+        
+        """
+        if iteration < len(self.__evolution_skipped):
+            return self.__evolution_skipped[iteration]
+
+        return 0
+
+
 
 class kmeans_visualizer:
     """!
@@ -306,6 +327,16 @@ class kmeans:
         final_centers = kmeans_instance.get_centers()
     @endcode
     
+    Example #3 - Python implementation that uses triangle inequality to skip distance calculations @cite inproceedings::kmeans::2:
+    @code
+        # observer is used to get amount of skipped distance calculations on each iteration
+        observer = kmeans_observer()
+        kmeans_instance = kmeans(sample, initial_centers, ccore=False, accelerated=True, observer=observer)
+        kmeans_instance.process()
+        
+        skipped = [observer.get_skipped_distances(iteration) for iteration in range(len(observer))]
+    @endcode
+    
     @see center_initializer
     
     """
@@ -319,23 +350,33 @@ class kmeans:
         @param[in] initial_centers (array_like): Initial coordinates of centers of clusters that are represented by array_like data structure: [center1, center2, ...].
         @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance then algorithm stops processing.
         @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric', 'accelerated').
         
         <b>Keyword Args:</b><br>
             - observer (kmeans_observer): Observer of the algorithm to collect information about clustering process on each iteration.
             - metric (distance_metric): Metric that is used for distance calculation between two points.
+            - accelerated (bool): If True then Python implementation keeps bounds of distances between points and centers
+               to skip distance calculations using triangle inequality (by default is False). It is used only for
+               metrics that are supported by 'elkan_assigner', memory for amount of points multiplied by amount of
+               centers values is required.
         
         @see center_initializer
         
         """
-        self.__pointer_data = numpy.matrix(data)
+        self.__pointer_data = numpy.array(data, dtype=numpy.double)
         self.__clusters = []
-        self.__centers = numpy.matrix(initial_centers)
+        self.__labels = None
+        self.__centers = numpy.array(initial_centers, dtype=numpy.double)
         self.__tolerance = tolerance
 
         self.__observer = kwargs.get('observer', None)
         self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
         self.__metric.enable_numpy_usage()
+
+        if kwargs.get('accelerated', False) and elkan_assigner.is_supported(self.__metric):
+            self.__assigner = elkan_assigner(self.__pointer_data, self.__metric)
+        else:
+            self.__assigner = block_assigner(self.__pointer_data, self.__metric)
         
         self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
         if self.__ccore is True:
@@ -354,7 +395,7 @@ class kmeans:
         """
 
         if len(self.__pointer_data[0]) != len(self.__centers[0]):
-            raise NameError('Dimension of the input data and dimension of the initial cluster centers must be equal.')
+            raise ValueError('Dimension of the input data and dimension of the initial cluster centers must be equal.')
 
         if self.__ccore is True:
             self.__process_by_ccore()
@@ -370,17 +411,19 @@ class kmeans:
         ccore_metric = metric_wrapper.create_instance(self.__metric)
 
         results = wrapper.kmeans(self.__pointer_data, self.__centers, self.__tolerance, (self.__observer is not None), ccore_metric.get_pointer())
-        self.__clusters = results[0]
+        self.__clusters = [cluster.tolist() for cluster in results[0]]
         self.__centers = results[1]
 
         if self.__observer is not None:
-            self.__observer.set_evolution_clusters(results[2])
-            self.__observer.set_evolution_centers(results[3])
+            self.__observer.set_evolution_clusters([[cluster.tolist() for cluster in clusters] for clusters in results[2]])
+            self.__observer.set_evolution_centers([centers.tolist() for centers in results[3]])
 
 
     def __process_by_python(self):
         """!
         @brief Performs cluster analysis using python code.
+        @details Labels of points are stored as an integer array during processing, clusters as lists of indexes are
+                  created only at the end of processing (and on each iteration if observer is used).
 
         """
 
@@ -388,15 +431,15 @@ class kmeans:
         stop_condition = self.__tolerance * self.__tolerance
 
         if self.__observer is not None:
-            initial_clusters = self.__update_clusters()
-            self.__observer.notify(initial_clusters, self.__centers.tolist())
+            initial_labels = self.__update_labels()
+            self.__observer.notify(labels_to_clusters(initial_labels, len(self.__centers)), self.__centers.tolist(), self.__get_skipped_distances())
 
         while maximum_change > stop_condition:
-            self.__clusters = self.__update_clusters()
+            self.__labels = self.__update_labels()
             updated_centers = self.__update_centers()  # changes should be calculated before assignment
 
             if self.__observer is not None:
-                self.__observer.notify(self.__clusters, updated_centers.tolist())
+                self.__observer.notify(labels_to_clusters(self.__labels, len(updated_centers)), updated_centers.tolist(), self.__get_skipped_distances())
 
             if len(self.__centers) != len(updated_centers):
                 maximum_change = float('inf')
@@ -405,7 +448,9 @@ class kmeans:
                 changes = self.__metric(self.__centers, updated_centers)
                 maximum_change = numpy.max(changes)
 
-            self.__centers = updated_centers.tolist()
+            self.__centers = updated_centers
+
+        self.__clusters = labels_to_clusters(self.__labels, len(self.__centers))
 
 
     def get_clusters(self):
@@ -448,43 +493,54 @@ class kmeans:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __update_clusters(self):
+    def __update_labels(self):
         """!
-        @brief Calculate Euclidean distance to each point from the each cluster. Nearest points are captured by according clusters and as a result clusters are updated.
+        @brief Calculate distance to each point from the each center. Nearest points are captured by according clusters.
+        @details Distances are calculated by blocks of points to bound memory that is required for distance matrix,
+                  or by assigner that skips distance calculations if acceleration is used. Clusters without points are
+                  removed and labels are renumbered in line with remaining clusters.
         
-        @return (list) updated clusters as list of clusters. Each cluster contains indexes of objects from data.
+        @return (numpy.array) Label (index of cluster) of each point.
         
         """
         
-        clusters = [[] for _ in range(len(self.__centers))]
-        
-        dataset_differences = numpy.zeros((len(clusters), len(self.__pointer_data)))
-        for index_center in range(len(self.__centers)):
-            dataset_differences[index_center] = self.__metric(self.__pointer_data, self.__centers[index_center])
+        amount_centers = len(self.__centers)
+        labels = self.__assigner.assign(self.__centers)
+
+        occupied_clusters = numpy.bincount(labels, minlength=amount_centers) > 0
+        if not numpy.all(occupied_clusters):
+            labels = (numpy.cumsum(occupied_clusters) - 1)[labels]
+
+        return labels
+    
+    
+    def __get_skipped_distances(self):
+        """!
+        @brief Returns amount of distance calculations that were skipped by the last update of labels.
         
-        optimum_indexes = numpy.argmin(dataset_differences, axis=0)
-        for index_point in range(len(optimum_indexes)):
-            index_cluster = optimum_indexes[index_point]
-            clusters[index_cluster].append(index_point)
+        @return (uint) Amount of skipped distance calculations, zero if acceleration is not used.
         
-        clusters = [cluster for cluster in clusters if len(cluster) > 0]
+        """
         
-        return clusters
-    
-    
+        return self.__assigner.get_skipped_distances()
+
+
     def __update_centers(self):
         """!
         @brief Calculate centers of clusters in line with contained objects.
         
-        @return (numpy.matrix) Updated centers as list of centers.
+        @return (numpy.array) Updated centers as array of centers.
         
         """
         
+        amount_clusters = self.__labels.max() + 1
         dimension = self.__pointer_data.shape[1]
-        centers = numpy.zeros((len(self.__clusters), dimension))
+
+        sizes = numpy.bincount(self.__labels, minlength=amount_clusters)
+        centers = numpy.empty((amount_clusters, dimension))
         
-        for index in range(len(self.__clusters)):
-            cluster_points = self.__pointer_data[self.__clusters[index], :]
-            centers[index] = cluster_points.mean(axis=0)
+        for index_dimension in range(dimension):
+            coordinates = self.__pointer_data[:, index_dimension]
+            centers[:, index_dimension] = numpy.bincount(self.__labels, weights=coordinates, minlength=amount_clusters)
 
-        return numpy.matrix(centers)
+        return centers / sizes[:, numpy.newaxis]
@@ -28,6 +28,7 @@
 import math
 
 from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.center_assigner import elkan_assigner
 
 from pyclustering.utils.metric import distance_metric, type_metric
 
@@ -67,10 +68,12 @@ class kmedians:
         @param[in] initial_centers (list): Initial coordinates of medians of clusters that are represented by list: [center1, center2, ...].
         @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing
         @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'accelerated').
 
         <b>Keyword Args:</b><br>
             - metric (distance_metric): Metric that is used for distance calculation between two points.
+            - accelerated (bool): If True then Python implementation uses triangle inequality to skip distance
+               calculations between points and medians (by default is False), see 'elkan_assigner'.
         
         """
         self.__pointer_data = data
@@ -82,6 +85,9 @@ class kmedians:
         if self.__metric is None:
             self.__metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
 
+        self.__assigner = None
+        self.__accelerated = kwargs.get('accelerated', False) and elkan_assigner.is_supported(self.__metric)
+
         self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
         if self.__ccore:
             self.__ccore = ccore_library.workable()
@@ -108,6 +114,9 @@ class kmedians:
             # Check for dimension
             if len(self.__pointer_data[0]) != len(self.__medians[0]):
                 raise NameError('Dimension of the input data and dimension of the initial medians must be equal.')
+
+            if self.__accelerated is True:
+                self.__assigner = elkan_assigner(self.__pointer_data, self.__metric)
              
             while changes > self.__tolerance:
                 self.__clusters = self.__update_clusters()
@@ -158,25 +167,33 @@ class kmedians:
     def __update_clusters(self):
         """!
         @brief Calculate Manhattan distance to each point from the each cluster. 
-        @details Nearest points are captured by according clusters and as a result clusters are updated.
+        @details Nearest points are captured by according clusters and as a result clusters are updated. Distance
+                  calculations are skipped using triangle inequality if acceleration is enabled.
         
         @return (list) updated clusters as list of clusters where each cluster contains indexes of objects from data.
         
         """
         
         clusters = [[] for i in range(len(self.__medians))]
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1
-            dist_optim = 0.0
-             
-            for index in range(len(self.__medians)):
-                dist = self.__metric(self.__pointer_data[index_point], self.__medians[index])
-                 
-                if (dist < dist_optim) or (index is 0):
-                    index_optim = index
-                    dist_optim = dist
-             
-            clusters[index_optim].append(index_point)
+
+        if self.__assigner is not None:
+            labels = self.__assigner.assign(self.__medians)
+            for index_point, index_optim in enumerate(labels.tolist()):
+                clusters[index_optim].append(index_point)
+
+        else:
+            for index_point in range(len(self.__pointer_data)):
+                index_optim = -1
+                dist_optim = 0.0
+
+                for index in range(len(self.__medians)):
+                    dist = self.__metric(self.__pointer_data[index_point], self.__medians[index])
+
+                    if (dist < dist_optim) or (index is 0):
+                        index_optim = index
+                        dist_optim = dist
+
+                clusters[index_optim].append(index_point)
             
         # If cluster is not able to capture object it should be removed
         clusters = [cluster for cluster in clusters if len(cluster) > 0]
@@ -0,0 +1,344 @@
+"""!
+
+@brief Cluster analysis algorithm: Mini-Batch K-Means
+@details Implementation based on paper @cite inproceedings::mbkmeans::1.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2018
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.cluster.center_assigner import block_assigner, labels_to_clusters
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.encoder import type_encoding
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class mbkmeans:
+    """!
+    @brief Class represents Mini-Batch K-Means clustering algorithm.
+    @details Mini-Batch K-Means updates centers using small random subsets (mini-batches) of data instead of the whole
+              data on each iteration. Each center has its own learning rate that is equal to inverse amount of points
+              that have been assigned to the center so far, thus center is a running mean of its points.
+
+    Input data might be represented by points that are stored in memory (list or numpy array) - in this case mini-batches
+    are randomly drawn from the data, or by any other iterable object (for example, generator) that produces
+    mini-batches - in this case each mini-batch is consumed once. Centers also can be updated incrementally by
+    mini-batches using method 'partial_fit()'.
+
+    Example #1 - Clustering data in memory:
+    @code
+        # load list of points for cluster analysis
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+
+        # initialize initial centers using K-Means++ method
+        initial_centers = kmeans_plusplus_initializer(sample, 3).initialize()
+
+        # create instance of Mini-Batch K-Means algorithm with prepared centers
+        mbkmeans_instance = mbkmeans(sample, initial_centers, batch_size=100)
+
+        # run cluster analysis and obtain results
+        mbkmeans_instance.process()
+        clusters = mbkmeans_instance.get_clusters()
+        centers = mbkmeans_instance.get_centers()
+    @endcode
+
+    Example #2 - Clustering stream of mini-batches, initial centers are initialized by K-Means++ using the first mini-batch:
+    @code
+        # generator that reads data chunk by chunk
+        def read_batches(amount_batches, batch_size):
+            for _ in range(amount_batches):
+                yield numpy.random.rand(batch_size, 2)
+
+        mbkmeans_instance = mbkmeans(read_batches(1000, 256), 8)
+        mbkmeans_instance.process()
+
+        centers = mbkmeans_instance.get_centers()
+        labels = mbkmeans_instance.predict([[0.5, 0.5], [0.1, 0.9]])
+    @endcode
+
+    Example #3 - Incremental processing:
+    @code
+        mbkmeans_instance = mbkmeans(None, initial_centers)
+        for batch in batches:
+            mbkmeans_instance.partial_fit(batch)
+
+        centers = mbkmeans_instance.get_centers()
+    @endcode
+
+    @see kmeans
+
+    """
+
+    def __init__(self, data, initial_centers, batch_size = 100, tolerance = 0.001, **kwargs):
+        """!
+        @brief Constructor of clustering algorithm Mini-Batch K-Means.
+
+        @param[in] data (array_like|iterable): Input data that is presented as array of points (list or numpy array),
+                    or iterable object that produces mini-batches of points (for example, generator), or None if only
+                    'partial_fit()' is going to be used.
+        @param[in] initial_centers (array_like|uint): Initial coordinates of centers of clusters that are represented
+                    by array_like data structure: [center1, center2, ...], or amount of centers that should be
+                    initialized by K-Means++ method using the first mini-batch.
+        @param[in] batch_size (uint): Size of mini-batch that is drawn from data that is stored in memory.
+        @param[in] tolerance (double): Stop condition for data in memory: if maximum value of change of centers of
+                    clusters is less than tolerance then algorithm stops processing.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric', 'itermax', 'assign').
+
+        <b>Keyword Args:</b><br>
+            - observer (kmeans_observer): Observer of the algorithm to collect information about clustering process
+               on each iteration (clusters contain indexes of points of the mini-batch).
+            - metric (distance_metric): Metric that is used for distance calculation between two points.
+            - itermax (uint): Maximum amount of mini-batches that are drawn from data in memory (by default 100).
+            - assign (bool): If True then all points are assigned to the nearest centers after processing to form
+               clusters (by default True). Stream of mini-batches is read again for that purpose, therefore it
+               is performed only for iterable objects that can be iterated several times (not for generators).
+
+        """
+        self.__data = None
+        self.__batches = None
+
+        if isinstance(data, (list, tuple, numpy.ndarray)):
+            self.__data = numpy.array(data, dtype=numpy.double)
+        else:
+            self.__batches = data
+
+        self.__centers = None
+        self.__amount_centers = initial_centers
+        if not isinstance(initial_centers, (int, numpy.integer)):
+            self.__centers = numpy.array(initial_centers, dtype=numpy.double)
+            self.__amount_centers = len(self.__centers)
+
+        self.__center_weights = numpy.zeros(self.__amount_centers)
+        self.__clusters = []
+
+        self.__batch_size = batch_size
+        self.__tolerance = tolerance
+
+        self.__observer = kwargs.get('observer', None)
+        self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        self.__metric.enable_numpy_usage()
+        self.__itermax = kwargs.get('itermax', 100)
+        self.__assign = kwargs.get('assign', True)
+
+        self.__verify_arguments()
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis in line with rules of Mini-Batch K-Means algorithm.
+
+        @remark Results of clustering can be obtained using corresponding get methods.
+
+        @see get_clusters()
+        @see get_centers()
+
+        """
+
+        if self.__data is not None:
+            self.__process_data()
+
+        elif self.__batches is not None:
+            self.__process_batches()
+
+
+    def partial_fit(self, batch):
+        """!
+        @brief Updates centers of clusters using mini-batch of points.
+
+        @param[in] batch (array_like): Mini-batch of points.
+
+        @return (double) Maximum change of centers of clusters.
+
+        """
+        return self.__update_centers(numpy.array(batch, dtype=numpy.double))
+
+
+    def predict(self, points):
+        """!
+        @brief Finds the nearest center for each point.
+
+        @param[in] points (array_like): Points that should be assigned to clusters.
+
+        @return (list) Index of the nearest center (cluster) for each point.
+
+        """
+        return self.__find_nearest_centers(numpy.array(points, dtype=numpy.double)).tolist()
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns list of allocated clusters, each cluster contains indexes of objects in list of data.
+        @details Clusters are formed by final assignment of points and correspond to centers, therefore some of them
+                  might be empty.
+
+        @see process()
+        @see get_centers()
+
+        """
+
+        return self.__clusters
+
+
+    def get_centers(self):
+        """!
+        @brief Returns list of centers of allocated clusters.
+
+        @see process()
+        @see get_clusters()
+
+        """
+
+        if self.__centers is None:
+            return []
+
+        return self.__centers.tolist()
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __process_data(self):
+        """!
+        @brief Performs cluster analysis using mini-batches that are randomly drawn from data in memory.
+
+        """
+
+        stop_condition = self.__tolerance * self.__tolerance
+        batch_size = min(self.__batch_size, len(self.__data))
+
+        for _ in range(self.__itermax):
+            batch_indexes = numpy.random.randint(0, len(self.__data), batch_size)
+            maximum_change = self.__update_centers(self.__data[batch_indexes], batch_indexes)
+
+            if maximum_change < stop_condition:
+                break
+
+        if self.__assign is True:
+            labels = self.__find_nearest_centers(self.__data)
+            self.__clusters = labels_to_clusters(labels, len(self.__centers))
+
+
+    def __process_batches(self):
+        """!
+        @brief Performs cluster analysis using stream of mini-batches.
+
+        """
+
+        for batch in self.__batches:
+            self.partial_fit(batch)
+
+        if (self.__assign is True) and (iter(self.__batches) is not self.__batches):
+            labels = [ self.__find_nearest_centers(numpy.array(batch, dtype=numpy.double)) for batch in self.__batches ]
+            self.__clusters = labels_to_clusters(numpy.concatenate(labels), len(self.__centers))
+
+
+    def __update_centers(self, batch, batch_indexes = None):
+        """!
+        @brief Updates centers using mini-batch, each center moves to running mean of points that are assigned to it.
+
+        @param[in] batch (numpy.array): Mini-batch of points.
+        @param[in] batch_indexes (numpy.array): Indexes of points of the mini-batch in data, if None then indexes in
+                    the mini-batch are used for observer.
+
+        @return (double) Maximum change of centers.
+
+        """
+
+        if len(batch) == 0:
+            return 0.0
+
+        if self.__centers is None:
+            initial_centers = kmeans_plusplus_initializer(batch, self.__amount_centers).initialize()
+            self.__centers = numpy.array(initial_centers, dtype=numpy.double)
+
+        labels = self.__find_nearest_centers(batch)
+
+        batch_weights = numpy.bincount(labels, minlength=len(self.__centers))
+        batch_sums = numpy.empty(self.__centers.shape)
+        for index_dimension in range(self.__centers.shape[1]):
+            batch_sums[:, index_dimension] = numpy.bincount(labels, weights=batch[:, index_dimension], minlength=len(self.__centers))
+
+        updated_weights = self.__center_weights + batch_weights
+        updated_centers = self.__centers.copy()
+
+        captured = batch_weights > 0
+        updated_centers[captured] = (self.__centers[captured] * self.__center_weights[captured, numpy.newaxis] +
+                                     batch_sums[captured]) / updated_weights[captured, numpy.newaxis]
+
+        maximum_change = numpy.max(self.__metric(self.__centers, updated_centers))
+
+        self.__centers = updated_centers
+        self.__center_weights = updated_weights
+
+        if self.__observer is not None:
+            if batch_indexes is None:
+                batch_indexes = numpy.arange(len(batch))
+
+            clusters = [ batch_indexes[labels == index_center].tolist() for index_center in range(len(self.__centers)) ]
+            self.__observer.notify(clusters, self.__centers.tolist())
+
+        return maximum_change
+
+
+    def __find_nearest_centers(self, points):
+        """!
+        @brief Calculates index of the nearest center for each point by blocks of points.
+
+        @param[in] points (numpy.array): Points that should be assigned to centers.
+
+        @return (numpy.array) Index of the nearest center for each point.
+
+        """
+
+        return block_assigner(points, self.__metric).assign(self.__centers)
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Checks input parameters of the algorithm and if something wrong then corresponding exception is thrown.
+
+        """
+
+        if self.__amount_centers <= 0:
+            raise ValueError("Amount of cluster centers should be at least 1.")
+
+        if self.__batch_size <= 0:
+            raise ValueError("Size of mini-batch should be at least 1.")
+
+        if (self.__data is not None) and (self.__data.ndim != 2):
+            raise ValueError("Input data should be represented by array of points.")
+
+        if (self.__data is not None) and (self.__centers is not None):
+            if self.__data.shape[1] != self.__centers.shape[1]:
+                raise ValueError("Dimension of the input data and dimension of the initial cluster centers must be equal.")
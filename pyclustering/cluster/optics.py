@@ -25,11 +25,14 @@
 """
 
 
-import math;
+import heapq;
+import itertools;
+
+import numpy;
 
 import matplotlib.pyplot as plt;
 
-from pyclustering.container.kdtree import kdtree;
+from pyclustering.container.kdtree import balanced_kdtree;
 
 from pyclustering.cluster.encoder import type_encoding;
 
@@ -125,6 +128,7 @@ class ordering_analyser:
         
         """
         self.__ordering = ordering_diagram
+        self.__ordering_array = numpy.array(ordering_diagram, dtype=numpy.double)
     
     
     def __len__(self):
@@ -148,7 +152,7 @@ class ordering_analyser:
         
         """
         
-        maximum_distance = max(self.__ordering)
+        maximum_distance = numpy.max(self.__ordering_array)
         
         upper_distance = maximum_distance
         lower_distance = 0.0
@@ -191,89 +195,39 @@ class ordering_analyser:
         
         """
         
-        amount_clusters = 1
-        
-        cluster_start = False
-        cluster_pick = False
-        total_similarity = True
-        previous_cluster_distance = None
-        previous_distance = None
-        
-        cluster_borders = []
-        
-        for index_ordering in range(len(self.__ordering)):
-            distance = self.__ordering[index_ordering]
-            if distance >= radius:
-                if cluster_start is False:
-                    cluster_start = True
-                    amount_clusters += 1
-                    
-                    if index_ordering != 0:
-                        cluster_borders.append(index_ordering)
-                
-                else:
-                    if (distance < previous_cluster_distance) and (cluster_pick is False):
-                        cluster_pick = True
-                    
-                    elif (distance > previous_cluster_distance) and (cluster_pick is True):
-                        cluster_pick = False
-                        amount_clusters += 1
-                        
-                        if index_ordering != 0:
-                            cluster_borders.append(index_ordering)
-                
-                previous_cluster_distance = distance
-            
-            else:
-                cluster_start = False
-                cluster_pick = False
-            
-            if (previous_distance is not None) and (distance != previous_distance):
-                total_similarity = False
-            
-            previous_distance = distance
-        
-        if (total_similarity is True) and (previous_distance > radius):
-            amount_clusters = 0
+        ordering = self.__ordering_array
+        if len(ordering) == 0:
+            return 1, []
 
-        return amount_clusters, cluster_borders
+        above = ordering >= radius
 
+        # cluster starts when growth over the radius is observed
+        cluster_starts = above.copy()
+        cluster_starts[1:] &= ~above[:-1]
 
-class optics_descriptor:
-    """!
-    @brief Object description that used by OPTICS algorithm for cluster analysis.
-    
-    """
+        # inside region over the radius new cluster starts when growth is observed after recession (pick)
+        changes = numpy.zeros(len(ordering), dtype=numpy.int8)
+        changes[1:] = numpy.sign(ordering[1:] - ordering[:-1])
+        changes[~above | cluster_starts] = 0
 
-    def __init__(self, index, core_distance = None, reachability_distance = None):
-        """!
-        @brief Constructor of object description in optics terms.
-        
-        @param[in] index (uint): Index of the object in the data set.
-        @param[in] core_distance (double): Core distance that is minimum distance to specified number of neighbors.
-        @param[in] reachability_distance (double): Reachability distance to this object.
-        
-        """
+        # state is defined by the last change that is reset by start of cluster or by value that is less than the
+        # radius, recession means that pick has been passed
+        states = numpy.where(cluster_starts, 1, changes)
+        marked = (states != 0) | ~above
+        last_marked = numpy.maximum.accumulate(numpy.where(marked, numpy.arange(len(ordering)), 0))
 
-        ## Index of object from the input data.
-        self.index_object = index
-        
-        ## Core distance - the smallest distance to reach specified number of neighbors that is not greater then connectivity radius.
-        self.core_distance = core_distance
+        cluster_growths = numpy.zeros(len(ordering), dtype=bool)
+        cluster_growths[1:] = (changes[1:] > 0) & (states[last_marked[:-1]] < 0)
 
-        ## Reachability distance - the smallest distance to be reachable by core object.
-        self.reachability_distance = reachability_distance
-        
-        ## True is object has been already traversed.
-        self.processed = False
+        borders = numpy.nonzero(cluster_starts | cluster_growths)[0]
+        amount_clusters = 1 + len(borders)
 
-    def __repr__(self):
-        """!
-        @brief Returns string representation of the optics descriptor.
-        
-        """
-        
-        return '(%s, [c: %s, r: %s])' % (self.index_object, self.core_distance, self.reachability_distance);
+        cluster_borders = borders[borders != 0].tolist()
+
+        if numpy.all(ordering == ordering[0]) and (ordering[-1] > radius):
+            amount_clusters = 0
+
+        return amount_clusters, cluster_borders
 
 
 class optics:
@@ -363,11 +317,15 @@ class optics:
 
         self.__data_type = kwargs.get('data_type', 'points')
         
+        if self.__data_type not in ('points', 'distance_matrix'):
+            raise TypeError("Unknown type of data is specified '%s'" % self.__data_type)
+        
         self.__kdtree = None
+        self.__neighbor_offsets = None
+        self.__neighbor_indexes = None
+        self.__neighbor_distances = None
         self.__ccore = ccore
 
-        self.__neighbor_searcher = self.__create_neighbor_searcher(self.__data_type)
-
         if (self.__ccore):
             self.__ccore = ccore_library.workable()
 
@@ -389,7 +347,7 @@ class optics:
         
         else:
             if self.__data_type == 'points':
-                self.__kdtree = kdtree(self.__sample_pointer, range(len(self.__sample_pointer)))
+                self.__kdtree = balanced_kdtree(self.__sample_pointer)
 
             self.__allocate_clusters()
             
@@ -404,12 +362,15 @@ class optics:
     def __initialize(self, sample):
         """!
         @brief Initializes internal states and resets clustering results in line with input sample.
+        @details State of objects is stored in arrays where object index from input sample is used as an index,
+                  undefined core and reachability distances are represented by infinity.
         
         """
         
-        self.__processed = [False] * len(sample)
-        self.__optics_objects = [optics_descriptor(i) for i in range(len(sample))]      # List of OPTICS objects that corresponds to objects from input sample.
-        self.__ordered_database = []        # List of OPTICS objects in traverse order.
+        self.__processed = numpy.zeros(len(sample), dtype=bool)
+        self.__core_distances = numpy.full(len(sample), float('inf'))             # Core distance of each object.
+        self.__reachability_distances = numpy.full(len(sample), float('inf'))     # Reachability distance of each object.
+        self.__ordered_database = []        # List of object indexes in traverse order.
         
         self.__clusters = None      # Result of clustering (list of clusters where each cluster contains indexes of objects from input data).
         self.__noise = None         # Result of clustering (noise).
@@ -422,10 +383,11 @@ class optics:
         """
         
         self.__initialize(self.__sample_pointer)
-        
-        for optic_object in self.__optics_objects:
-            if optic_object.processed is False:
-                self.__expand_cluster_order(optic_object)
+        self.__find_neighbors()
+
+        for index_object in range(len(self.__sample_pointer)):
+            if not self.__processed[index_object]:
+                self.__expand_cluster_order(index_object)
         
         self.__extract_clusters()
     
@@ -480,10 +442,8 @@ class optics:
             self.__ordering = []
         
             for cluster in self.__clusters:
-                for index_object in cluster:
-                    optics_object = self.__optics_objects[index_object]
-                    if optics_object.reachability_distance is not None:
-                        self.__ordering.append(optics_object.reachability_distance)
+                reachability_distances = self.__reachability_distances[cluster]
+                self.__ordering += reachability_distances[numpy.isfinite(reachability_distances)].tolist()
             
         return self.__ordering
     
@@ -517,66 +477,72 @@ class optics:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __create_neighbor_searcher(self, data_type):
+    def __find_neighbors(self):
         """!
-        @brief Returns neighbor searcher in line with data type.
+        @brief Finds neighbors of all objects at once in line with current connectivity radius and calculates core distances.
+        @details Neighbors are stored in compressed sparse row format: neighbors of object 'i' are located in range
+                  [offsets[i], offsets[i + 1]) of arrays of indexes and distances, object is not a neighbor of itself.
+                  Neighbors of each object are ordered by distance.
+        
+        """
 
-        @param[in] data_type (string): Data type (points or distance matrix).
+        amount_objects = len(self.__sample_pointer)
+
+        if self.__data_type == 'points':
+            (offsets, indexes, distances) = self.__kdtree.query_radius(self.__sample_pointer, self.__eps)
+            owners = numpy.repeat(numpy.arange(amount_objects), numpy.diff(offsets))
 
-        """
-        if data_type == 'points':
-            return self.__neighbor_indexes_points
-        elif data_type == 'distance_matrix':
-            return self.__neighbor_indexes_distance_matrix
         else:
-            raise TypeError("Unknown type of data is specified '%s'" % data_type)
+            distance_matrix = numpy.asarray(self.__sample_pointer, dtype=numpy.double)
+            (owners, indexes) = numpy.nonzero(distance_matrix <= self.__eps)
+            distances = distance_matrix[owners, indexes]
+
+        other = owners != indexes
+        order = numpy.lexsort((indexes[other], distances[other], owners[other]))
+
+        self.__neighbor_indexes = indexes[other][order]
+        self.__neighbor_distances = distances[other][order]
+
+        self.__neighbor_offsets = numpy.zeros(amount_objects + 1, dtype=numpy.intp)
+        numpy.cumsum(numpy.bincount(owners[other], minlength=amount_objects), out=self.__neighbor_offsets[1:])
 
+        # core distance is distance to 'minpts'-th nearest neighbor
+        core_objects = numpy.nonzero(numpy.diff(self.__neighbor_offsets) >= self.__minpts)[0]
+        self.__core_distances[core_objects] = self.__neighbor_distances[self.__neighbor_offsets[core_objects] + self.__minpts - 1]
 
-    def __expand_cluster_order(self, optics_object):
+
+    def __expand_cluster_order(self, index_object):
         """!
-        @brief Expand cluster order from not processed optic-object that corresponds to object from input data.
+        @brief Expand cluster order from not processed object from input data.
                Traverse procedure is performed until objects are reachable from core-objects in line with connectivity radius.
                Order database is updated during expanding.
+        @details Order seeds are stored in binary heap, object whose reachability distance is decreased is pushed
+                  again and outdated records are skipped when they are popped.
                
-        @param[in] optics_object (optics_descriptor): Object that hasn't been processed.
+        @param[in] index_object (uint): Index of object that hasn't been processed.
         
         """
         
-        optics_object.processed = True
-        
-        neighbors_descriptor = self.__neighbor_searcher(optics_object)
-        optics_object.reachability_distance = None
-        
-        self.__ordered_database.append(optics_object)
+        self.__processed[index_object] = True
+        self.__ordered_database.append(index_object)
         
         # Check core distance
-        if len(neighbors_descriptor) >= self.__minpts:
-            neighbors_descriptor.sort(key = lambda obj: obj[1])
-            optics_object.core_distance = neighbors_descriptor[self.__minpts - 1][1]
-            
-            # Continue processing
-            order_seed = list()
-            self.__update_order_seed(optics_object, neighbors_descriptor, order_seed)
+        if self.__core_distances[index_object] != float('inf'):
+            # Continue processing, sequence number keeps order of objects with the same reachability distance
+            order_seed = []
+            sequence = itertools.count()
+            self.__update_order_seed(index_object, order_seed, sequence)
             
             while len(order_seed) > 0:
-                optic_descriptor = order_seed[0]
-                order_seed.remove(optic_descriptor)
+                (reachability_distance, _, index_seed) = heapq.heappop(order_seed)
+                if self.__processed[index_seed] or (reachability_distance != self.__reachability_distances[index_seed]):
+                    continue    # outdated record
                 
-                neighbors_descriptor = self.__neighbor_searcher(optic_descriptor)
-                optic_descriptor.processed = True
+                self.__processed[index_seed] = True
+                self.__ordered_database.append(index_seed)
                 
-                self.__ordered_database.append(optic_descriptor)
-                
-                if len(neighbors_descriptor) >= self.__minpts:
-                    neighbors_descriptor.sort(key = lambda obj: obj[1])
-                    optic_descriptor.core_distance = neighbors_descriptor[self.__minpts - 1][1]
-                    
-                    self.__update_order_seed(optic_descriptor, neighbors_descriptor, order_seed)
-                else:
-                    optic_descriptor.core_distance = None
-                    
-        else:
-            optics_object.core_distance = None
+                if self.__core_distances[index_seed] != float('inf'):
+                    self.__update_order_seed(index_seed, order_seed, sequence)
 
     
     def __extract_clusters(self):
@@ -588,75 +554,41 @@ class optics:
         self.__clusters = []
         self.__noise = []
 
+        reachability_distances = self.__reachability_distances.tolist()
+        core_distances = self.__core_distances.tolist()
+
         current_cluster = self.__noise
-        for optics_object in self.__ordered_database:
-            if (optics_object.reachability_distance is None) or (optics_object.reachability_distance > self.__eps):
-                if (optics_object.core_distance is not None) and (optics_object.core_distance <= self.__eps):
-                    self.__clusters.append([ optics_object.index_object ])
+        for index_object in self.__ordered_database:
+            if reachability_distances[index_object] > self.__eps:
+                if core_distances[index_object] <= self.__eps:
+                    self.__clusters.append([ index_object ])
                     current_cluster = self.__clusters[-1]
                 else:
-                    self.__noise.append(optics_object.index_object)
+                    self.__noise.append(index_object)
             else:
-                current_cluster.append(optics_object.index_object)
+                current_cluster.append(index_object)
 
 
-    def __update_order_seed(self, optic_descriptor, neighbors_descriptors, order_seed):
+    def __update_order_seed(self, index_core, order_seed, sequence):
         """!
-        @brief Update sorted list of reachable objects (from core-object) that should be processed using neighbors of core-object.
+        @brief Update heap of reachable objects (from core-object) that should be processed using neighbors of core-object.
         
-        @param[in] optic_descriptor (optics_descriptor): Core-object whose neighbors should be analysed.
-        @param[in] neighbors_descriptors (list): List of neighbors of core-object.
-        @param[in|out] order_seed (list): List of sorted object in line with reachable distance.
+        @param[in] index_core (uint): Index of core-object whose neighbors should be analysed.
+        @param[in|out] order_seed (list): Binary heap of records (reachability distance, sequence number, object index).
+        @param[in] sequence (iterator): Generator of sequence numbers for records.
         
         """
         
-        for neighbor_descriptor in neighbors_descriptors:
-            index_neighbor = neighbor_descriptor[0]
-            current_reachable_distance = neighbor_descriptor[1]
-            
-            if self.__optics_objects[index_neighbor].processed is not True:
-                reachable_distance = max(current_reachable_distance, optic_descriptor.core_distance)
-                if self.__optics_objects[index_neighbor].reachability_distance is None:
-                    self.__optics_objects[index_neighbor].reachability_distance = reachable_distance
-                    
-                    # insert element in queue O(n) - worst case.
-                    index_insertion = len(order_seed)
-                    for index_seed in range(0, len(order_seed)):
-                        if reachable_distance < order_seed[index_seed].reachability_distance:
-                            index_insertion = index_seed
-                            break
-                    
-                    order_seed.insert(index_insertion, self.__optics_objects[index_neighbor])
-
-                else:
-                    if reachable_distance < self.__optics_objects[index_neighbor].reachability_distance:
-                        self.__optics_objects[index_neighbor].reachability_distance = reachable_distance
-                        order_seed.sort(key = lambda obj: obj.reachability_distance)
+        index_begin = self.__neighbor_offsets[index_core]
+        index_end = self.__neighbor_offsets[index_core + 1]
 
+        neighbors = self.__neighbor_indexes[index_begin:index_end]
+        reachable_distances = numpy.maximum(self.__neighbor_distances[index_begin:index_end], self.__core_distances[index_core])
 
-    def __neighbor_indexes_points(self, optic_object):
-        """!
-        @brief Return neighbors of the specified object in case of sequence of points.
-
-        @param[in] optic_object (optics_descriptor): Object for which neighbors should be returned in line with connectivity radius.
+        improved = ~self.__processed[neighbors] & (reachable_distances < self.__reachability_distances[neighbors])
+        neighbors = neighbors[improved]
+        reachable_distances = reachable_distances[improved]
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
-
-        """
-        kdnodes = self.__kdtree.find_nearest_dist_nodes(self.__sample_pointer[optic_object.index_object], self.__eps)
-        return [[node_tuple[1].payload, math.sqrt(node_tuple[0])] for node_tuple in kdnodes if
-                node_tuple[1].payload != optic_object.index_object]
-
-
-    def __neighbor_indexes_distance_matrix(self, optic_object):
-        """!
-        @brief Return neighbors of the specified object in case of distance matrix.
-
-        @param[in] optic_object (optics_descriptor): Object for which neighbors should be returned in line with connectivity radius.
-
-        @return (list) List of indexes of neighbors in line the connectivity radius.
-
-        """
-        distances = self.__sample_pointer[optic_object.index_object]
-        return [[index_neighbor, distances[index_neighbor]] for index_neighbor in range(len(distances))
-                if ((distances[index_neighbor] <= self.__eps) and (index_neighbor != optic_object.index_object))]
\ No newline at end of file
+        self.__reachability_distances[neighbors] = reachable_distances
+        for index_neighbor, reachable_distance in zip(neighbors.tolist(), reachable_distances.tolist()):
+            heapq.heappush(order_seed, (reachable_distance, next(sequence), index_neighbor))
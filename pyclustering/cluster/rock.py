@@ -25,19 +25,32 @@
 """
 
 
+import heapq;
+import numpy;
+
+from scipy.sparse import csr_matrix;
+
 from pyclustering.cluster.encoder import type_encoding;
 
-from pyclustering.utils import euclidean_distance;
+from pyclustering.container.kdtree import balanced_kdtree;
 
 from pyclustering.core.wrapper import ccore_library;
 
+from pyclustering.utils import euclidean_distance_square_bound;
+
 import pyclustering.core.rock_wrapper as wrapper;
 
 
 class rock:
     """!
     @brief Class represents clustering algorithm ROCK.
-    @details CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
+    @details Python implementation finds neighbors of points by balanced KD-tree and stores them in sparse adjacency matrix.
+              Amount of links between clusters is kept in sparse form and it is updated locally when clusters are merged,
+              each cluster has local heap of goodness measures with its linked clusters and the best of them are kept
+              in global heap in line with the original paper, therefore pair of clusters for merging is not searched
+              among all pairs of clusters.
+    
+              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
 
     Example:
     @code
@@ -102,17 +115,8 @@ class rock:
         if (self.__ccore is True):
             self.__clusters = wrapper.rock(self.__pointer_data, self.__eps, self.__number_clusters, self.__threshold);
         
-        else:  
-            self.__clusters = [[index] for index in range(len(self.__pointer_data))];
-            
-            while (len(self.__clusters) > self.__number_clusters):
-                indexes = self.__find_pair_clusters(self.__clusters);
-                
-                if (indexes != [-1, -1]):
-                    self.__clusters[indexes[0]] += self.__clusters[indexes[1]];
-                    self.__clusters.pop(indexes[1]);   # remove merged cluster.
-                else:
-                    break;  # totally separated clusters have been allocated
+        else:
+            self.__clusters = self.__merge_clusters();
     
     
     def get_clusters(self):
@@ -141,82 +145,220 @@ class rock:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION;
 
 
-    def __find_pair_clusters(self, clusters):
+    def __merge_clusters(self):
         """!
-        @brief Returns pair of clusters that are best candidates for merging in line with goodness measure.
-               The pair of clusters for which the above goodness measure is maximum is the best pair of clusters to be merged.
-               
-        @param[in] clusters (list): List of clusters that have been allocated during processing, each cluster is represented by list of indexes of points from the input data set.
+        @brief Merges clusters with the best goodness measure until required amount of clusters is allocated or there
+                are no links between clusters.
+        @details Clusters are identified by index of their first object. Pair of clusters with the maximum goodness
+                  measure is merged, if there are several such pairs then pair with the smallest identifiers is chosen.
+                  Merged cluster keeps the smallest identifier and objects of the second cluster are appended to it.
         
-        @return (list) List that contains two indexes of clusters (from list 'clusters') that should be merged on this step.
-                It can be equals to [-1, -1] when no links between clusters.
+        @return (list) List of allocated clusters, each cluster contains indexes of objects in list of data.
         
         """
         
-        maximum_goodness = 0.0;
-        cluster_indexes = [-1, -1];
+        size_data = self.__adjacency_matrix.shape[0];
+        
+        clusters = [[index] for index in range(size_data)];
+        sizes = [1] * size_data;
+        versions = [0] * size_data;
+        alive = [True] * size_data;
+        
+        # amount of links between clusters: links[i][j] = links[j][i], only linked clusters are stored.
+        offsets, indexes = self.__adjacency_matrix.indptr, self.__adjacency_matrix.indices;
+        links = [dict.fromkeys(indexes[offsets[index]:offsets[index + 1]].tolist(), 1) for index in range(size_data)];
+        
+        local_heaps = [self.__create_local_heap(index, links, sizes, versions) for index in range(size_data)];
         
-        for i in range(0, len(clusters)):
-            for j in range(i + 1, len(clusters)):
-                goodness = self.__calculate_goodness(clusters[i], clusters[j]);
-                if (goodness > maximum_goodness):
-                    maximum_goodness = goodness;
-                    cluster_indexes = [i, j];
+        # the best element of local heap of each cluster that is placed to global heap.
+        registered = [heap[0] if len(heap) > 0 else None for heap in local_heaps];
+        global_heap = [(registered[index], index) for index in range(size_data) if registered[index] is not None];
+        heapq.heapify(global_heap);
+        
+        amount_clusters = size_data;
+        while (amount_clusters > self.__number_clusters):
+            pair = self.__pop_best_pair(global_heap, local_heaps, registered, alive, versions);
+            if (pair is None):
+                break;  # totally separated clusters have been allocated
+            
+            (index1, index2) = pair;
+            
+            # merged cluster obtains links of both clusters
+            merged_links = links[index1];
+            merged_links.pop(index2);
+            for (index_neighbor, amount_links) in links[index2].items():
+                if (index_neighbor != index1):
+                    merged_links[index_neighbor] = merged_links.get(index_neighbor, 0) + amount_links;
+            
+            links[index2] = None;
+            for (index_neighbor, amount_links) in merged_links.items():
+                neighbor_links = links[index_neighbor];
+                neighbor_links.pop(index2, None);
+                neighbor_links[index1] = amount_links;
+            
+            clusters[index1] += clusters[index2];
+            clusters[index2] = None;
+            
+            sizes[index1] += sizes[index2];
+            versions[index1] += 1;
+            alive[index2] = False;
+            local_heaps[index2] = None;
+            amount_clusters -= 1;
+            
+            # update goodness measures of merged cluster and its neighbors only
+            local_heaps[index1] = self.__create_local_heap(index1, links, sizes, versions);
+            self.__push_best_pair(global_heap, local_heaps, registered, index1, alive, versions);
+            
+            for index_neighbor in merged_links:
+                (index_first, index_second) = (min(index1, index_neighbor), max(index1, index_neighbor));
+                
+                goodness = self.__calculate_goodness(merged_links[index_neighbor], sizes[index_first], sizes[index_second]);
+                entry = (-goodness, index_first, index_second, index1, versions[index1]);
+                
+                heapq.heappush(local_heaps[index_neighbor], entry);
+                self.__push_best_pair(global_heap, local_heaps, registered, index_neighbor, alive, versions);
         
-        return cluster_indexes;
+        return [cluster for cluster in clusters if cluster is not None];
 
 
-    def __calculate_links(self, cluster1, cluster2):
+    def __create_local_heap(self, index_cluster, links, sizes, versions):
         """!
-        @brief Returns number of link between two clusters. 
-        @details Link between objects (points) exists only if distance between them less than connectivity radius.
+        @brief Creates heap of goodness measures between specified cluster and its linked clusters.
+        @details Each element of heap is presented by tuple (-goodness, smallest identifier of pair, largest identifier
+                  of pair, identifier of linked cluster, version of linked cluster), thus the best pair is on the top.
         
-        @param[in] cluster1 (list): The first cluster.
-        @param[in] cluster2 (list): The second cluster.
+        @param[in] index_cluster (uint): Identifier of cluster.
+        @param[in] links (list): Amount of links between clusters.
+        @param[in] sizes (list): Size of each cluster.
+        @param[in] versions (list): Version of each cluster that is changed when cluster absorbs another one.
         
-        @return (uint) Number of links between two clusters.
+        @return (list) Heap of goodness measures.
         
         """
         
-        number_links = 0;
+        heap = [];
+        for (index_neighbor, amount_links) in links[index_cluster].items():
+            (index1, index2) = (min(index_cluster, index_neighbor), max(index_cluster, index_neighbor));
+            
+            goodness = self.__calculate_goodness(amount_links, sizes[index1], sizes[index2]);
+            heap.append((-goodness, index1, index2, index_neighbor, versions[index_neighbor]));
         
-        for index1 in cluster1:
-            for index2 in cluster2:
-                number_links += self.__adjacency_matrix[index1][index2];
-                
-        return number_links;
+        heapq.heapify(heap);
+        return heap;
+
+
+    def __get_local_best(self, local_heaps, index_cluster, alive, versions):
+        """!
+        @brief Removes outdated elements from the top of local heap of cluster and returns its best element.
+        @details Element is outdated if linked cluster has been merged with another cluster after creation of the element.
+        
+        @param[in] local_heaps (list): Local heaps of goodness measures of clusters.
+        @param[in] index_cluster (uint): Identifier of cluster.
+        @param[in] alive (list): Marks of clusters that have not been absorbed.
+        @param[in] versions (list): Version of each cluster.
+        
+        @return (tuple) The best element of local heap or None if there are no linked clusters.
+        
+        """
+        
+        heap = local_heaps[index_cluster];
+        while (len(heap) > 0):
+            index_neighbor, version = heap[0][3], heap[0][4];
+            if (alive[index_neighbor] and (versions[index_neighbor] == version)):
+                return heap[0];
+            
+            heapq.heappop(heap);
+        
+        return None;
+
+
+    def __push_best_pair(self, global_heap, local_heaps, registered, index_cluster, alive, versions):
+        """!
+        @brief Places the best element of local heap of cluster to global heap if it has been changed.
+        
+        @param[in|out] global_heap (list): Global heap of the best elements of local heaps.
+        @param[in|out] local_heaps (list): Local heaps of goodness measures of clusters.
+        @param[in|out] registered (list): The best element of local heap of each cluster that is placed to global heap.
+        @param[in] index_cluster (uint): Identifier of cluster.
+        @param[in] alive (list): Marks of clusters that have not been absorbed.
+        @param[in] versions (list): Version of each cluster.
+        
+        """
+        
+        best = self.__get_local_best(local_heaps, index_cluster, alive, versions);
+        if (best != registered[index_cluster]):
+            registered[index_cluster] = best;
+            if (best is not None):
+                heapq.heappush(global_heap, (best, index_cluster));
+
+
+    def __pop_best_pair(self, global_heap, local_heaps, registered, alive, versions):
+        """!
+        @brief Returns pair of clusters that are best candidates for merging in line with goodness measure.
+        @details Element of global heap is outdated if it is not the best element of local heap of its cluster anymore.
+        
+        @param[in|out] global_heap (list): Global heap of the best elements of local heaps.
+        @param[in|out] local_heaps (list): Local heaps of goodness measures of clusters.
+        @param[in|out] registered (list): The best element of local heap of each cluster that is placed to global heap.
+        @param[in] alive (list): Marks of clusters that have not been absorbed.
+        @param[in] versions (list): Version of each cluster.
+        
+        @return (tuple) Identifiers of clusters (smallest, largest) that should be merged or None when there are no links between clusters.
+        
+        """
+        
+        while (len(global_heap) > 0):
+            (entry, index_cluster) = heapq.heappop(global_heap);
+            if ((not alive[index_cluster]) or (entry != registered[index_cluster])):
+                continue;
             
+            if (self.__get_local_best(local_heaps, index_cluster, alive, versions) == entry):
+                return entry[1], entry[2];
+            
+            registered[index_cluster] = None;
+            self.__push_best_pair(global_heap, local_heaps, registered, index_cluster, alive, versions);
+        
+        return None;
+
 
     def __create_adjacency_matrix(self):
         """!
-        @brief Creates 2D adjacency matrix (list of lists) where each element described existence of link between points (means that points are neighbors).
+        @brief Creates sparse adjacency matrix where each element describes existence of link between points (means that points are neighbors).
+        @details Neighbors of all points are found at once using balanced KD-tree. Points are neighbors if Euclidean
+                  distance between them is not greater than connectivity radius, candidates are found by the tree with
+                  slightly extended radius and their square distances are compared with the bound that corresponds
+                  to the radius, so points on the border are neighbors as well.
         
         """
         
-        size_data = len(self.__pointer_data);
+        data = numpy.array(self.__pointer_data, dtype=numpy.double);
+        size_data = len(data);
         
-        self.__adjacency_matrix = [ [ 0 for i in range(size_data) ] for j in range(size_data) ];
-        for i in range(0, size_data):
-            for j in range(i + 1, size_data):
-                distance = euclidean_distance(self.__pointer_data[i], self.__pointer_data[j]);
-                if (distance <= self.__eps):
-                    self.__adjacency_matrix[i][j] = 1;
-                    self.__adjacency_matrix[j][i] = 1;
+        square_bound = euclidean_distance_square_bound(self.__eps);
         
-    
+        (offsets, indexes, _) = balanced_kdtree(data).query_radius(data, square_bound**(0.5) * (1.0 + 1e-12));
+        owners = numpy.repeat(numpy.arange(size_data), numpy.diff(offsets));
+        
+        square_distances = numpy.sum(numpy.square(data[owners] - data[indexes]), axis=1);
+        neighbors = (owners != indexes) & (square_distances <= square_bound);
+        owners, indexes = owners[neighbors], indexes[neighbors];
+        
+        values = numpy.ones(len(indexes), dtype=numpy.int8);
+        self.__adjacency_matrix = csr_matrix((values, (owners, indexes)), shape=(size_data, size_data));
+
 
-    def __calculate_goodness(self, cluster1, cluster2):
+    def __calculate_goodness(self, number_links, size_cluster1, size_cluster2):
         """!
         @brief Calculates coefficient 'goodness measurement' between two clusters. The coefficient defines level of suitability of clusters for merging.
         
-        @param[in] cluster1 (list): The first cluster.
-        @param[in] cluster2 (list): The second cluster.
+        @param[in] number_links (uint): Number of links between two clusters.
+        @param[in] size_cluster1 (uint): Size of the first cluster (with the smallest identifier).
+        @param[in] size_cluster2 (uint): Size of the second cluster.
         
         @return Goodness measure between two clusters.
         
         """
         
-        number_links = self.__calculate_links(cluster1, cluster2);
-        devider = (len(cluster1) + len(cluster2)) ** self.__degree_normalization - len(cluster1) ** self.__degree_normalization - len(cluster2) ** self.__degree_normalization;
+        devider = (size_cluster1 + size_cluster2) ** self.__degree_normalization - size_cluster1 ** self.__degree_normalization - size_cluster2 ** self.__degree_normalization;
         
         return (number_links / devider);
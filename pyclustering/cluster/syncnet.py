@@ -29,19 +29,24 @@ import matplotlib.pyplot as plt;
 import matplotlib.animation as animation;
 
 import math;
+import numpy;
+
+from scipy.sparse import csr_matrix;
 
 from pyclustering.cluster.encoder import type_encoding;
 from pyclustering.cluster import cluster_visualizer;
 
+from pyclustering.container.kdtree import balanced_kdtree;
+
 from pyclustering.core.syncnet_wrapper import syncnet_create_network, syncnet_process, syncnet_destroy_network, syncnet_analyser_destroy;
 from pyclustering.core.sync_wrapper import sync_connectivity_matrix;
 from pyclustering.core.wrapper import ccore_library;
 
+from pyclustering.utils import euclidean_distance_square_bound, euclidean_distance_square_blocks;
+
 from pyclustering.nnet.sync import sync_dynamic, sync_network, sync_visualizer;
 from pyclustering.nnet import conn_represent, initial_type, conn_type, solve_type;
 
-from pyclustering.utils import euclidean_distance;
-
 
 class syncnet_analyser(sync_dynamic):
     """!
@@ -134,7 +139,7 @@ class syncnet_visualizer(sync_visualizer):
             ax1 = figure.add_subplot(121, projection='polar');
             
             clusters = analyser.allocate_clusters(eps = tolerance, iteration = index_dynamic);
-            dynamic = analyser.output[index_dynamic];
+            dynamic = analyser.output_view[index_dynamic];
             
             visualizer = cluster_visualizer(size_row = 2);
             visualizer.append_clusters(clusters, dataset);
@@ -195,7 +200,7 @@ class syncnet(sync_network):
         
         @param[in] sample (list): Input data that is presented as list of points (objects), each point should be represented by list or tuple.
         @param[in] radius (double): Connectivity radius between points, points should be connected if distance between them less then the radius.
-        @param[in] conn_repr (conn_represent): Internal representation of connection in the network: matrix or list. Ignored in case of usage of CCORE library.
+        @param[in] conn_repr (conn_represent): Internal representation of connection in the network: matrix, list or compressed sparse rows (CSR). Ignored in case of usage of CCORE library.
         @param[in] initial_phases (initial_type): Type of initialization of initial phases of oscillators (random, uniformly distributed, etc.).
         @param[in] enable_conn_weight (bool): If True - enable mode when strength between oscillators depends on distance between two oscillators.
               If False - all connection between oscillators have the same strength that equals to 1 (True).
@@ -219,6 +224,13 @@ class syncnet(sync_network):
             self._conn_weight = None;
             self._ena_conn_weight = enable_conn_weight;
             
+            self.__coupling_weights = None;
+            self.__weighted_connections = None;
+            
+            self.__kdtree = None;
+            self.__connection_bound = None;
+            self.__distance_range = None;
+            
             # Create connections.
             if (radius is not None):
                 self._create_connections(radius);
@@ -238,46 +250,100 @@ class syncnet(sync_network):
     def _create_connections(self, radius):
         """!
         @brief Create connections between oscillators in line with input radius of connectivity.
+        @details Neighbors of oscillators are found by radius query to KD-tree that is built once for the network. Oscillators
+                  are connected if Euclidean distance between them is not greater than the radius. Connections are only
+                  added, therefore if connections have been already created by smaller radius then only pairs of oscillators
+                  that are not covered by the previous radius are connected.
         
         @param[in] radius (double): Connectivity radius between oscillators.
         
         """
         
+        if (self.__kdtree is None):
+            self.__kdtree = balanced_kdtree(self._osc_loc);
+        
+        # tree compares square distances, candidates are filtered by the bound that is equivalent to 'distance <= radius'
+        square_bound = euclidean_distance_square_bound(radius);
+        (offsets, neighbors, _) = self.__kdtree.query_radius(self._osc_loc, square_bound**(0.5) * (1.0 + 1e-12));
+        owners = numpy.repeat(numpy.arange(self._num_osc), numpy.diff(offsets));
+        
+        locations = numpy.array(self._osc_loc, dtype = numpy.double);
+        square_distances = numpy.sum(numpy.square(locations[owners] - locations[neighbors]), axis = 1);
+        
+        # each pair is considered once, pairs that are covered by the previous radius are already connected
+        new_pairs = (owners < neighbors) & (square_distances <= square_bound);
+        if (self.__connection_bound is not None):
+            new_pairs &= square_distances > self.__connection_bound;
+            square_bound = max(square_bound, self.__connection_bound);
+        
+        (owners, neighbors) = (owners[new_pairs], neighbors[new_pairs]);
+        distances = numpy.sqrt(square_distances[new_pairs]);
+        self.__connection_bound = square_bound;
+        
+        for (i, j) in zip(owners.tolist(), neighbors.tolist()):
+            self.set_connection(i, j);
+        
         if (self._ena_conn_weight is True):
-            self._conn_weight = [[0] * self._num_osc for _ in range(0, self._num_osc, 1)];
+            self.__append_connection_weights(owners, neighbors, distances);
+        
+        self._conn_matrix = None;
+
+
+    def __append_connection_weights(self, owners, neighbors, distances):
+        """!
+        @brief Stores weights of new connections to sparse matrix of weights.
+        @details Weight of connection is distance between oscillators that is normalized by minimum and maximum distances
+                  between all oscillators of the network.
+        
+        @param[in] owners (numpy.array): Indexes of oscillators of new connections.
+        @param[in] neighbors (numpy.array): Indexes of oscillators that are connected to the corresponding owners.
+        @param[in] distances (numpy.array): Distances between connected oscillators.
+        
+        """
+        
+        if ( (len(distances) > 0) and (self.__distance_range is None) ):
+            self.__distance_range = self.__calculate_distance_range();
+        
+        multiplier = 1;
+        subtractor = 0;
+        
+        if ( (self.__distance_range is not None) and (self.__distance_range[0] != self.__distance_range[1]) ):
+            multiplier = self.__distance_range[1] - self.__distance_range[0];
+            subtractor = self.__distance_range[0];
+        
+        values = (distances - subtractor) / multiplier;
+        weights = csr_matrix((numpy.concatenate((values, values)), (numpy.concatenate((owners, neighbors)), numpy.concatenate((neighbors, owners)))),
+                             shape = (self._num_osc, self._num_osc));
+        
+        if (self._conn_weight is None):
+            self._conn_weight = weights;
+        else:
+            self._conn_weight = self._conn_weight + weights;
+
+
+    def __calculate_distance_range(self):
+        """!
+        @brief Calculates minimum and maximum distances between oscillators.
+        @details Distances are calculated by blocks of oscillators (see euclidean_distance_square_blocks()), therefore distance matrix is not stored.
+        
+        @return (tuple) Minimum and maximum distances between oscillators.
+        
+        """
+        
+        locations = numpy.array(self._osc_loc, dtype = numpy.double);
+        indexes = numpy.arange(self._num_osc);
         
-        maximum_distance = 0;
         minimum_distance = float('inf');
+        maximum_distance = 0.0;
         
-        # Create connections
-        for i in range(0, self._num_osc, 1):
-            for j in range(i + 1, self._num_osc, 1):
-                    dist = euclidean_distance(self._osc_loc[i], self._osc_loc[j]);
-                    
-                    if (self._ena_conn_weight is True):
-                        self._conn_weight[i][j] = dist;
-                        self._conn_weight[j][i] = dist;
-                        
-                        if (dist > maximum_distance): maximum_distance = dist;
-                        if (dist < minimum_distance): minimum_distance = dist;
-                    
-                    if (dist <= radius):
-                        self.set_connection(i, j);
+        for (index_begin, index_end, distances) in euclidean_distance_square_blocks(locations, locations):
+            # each pair is considered once
+            distances = numpy.sqrt(distances[indexes[numpy.newaxis, :] > indexes[index_begin:index_end, numpy.newaxis]]);
+            if (len(distances) > 0):
+                minimum_distance = min(minimum_distance, numpy.min(distances));
+                maximum_distance = max(maximum_distance, numpy.max(distances));
         
-        if (self._ena_conn_weight is True):
-            multiplier = 1; 
-            subtractor = 0;
-            
-            if (maximum_distance != minimum_distance):
-                multiplier = (maximum_distance - minimum_distance);
-                subtractor = minimum_distance;
-            
-            for i in range(0, self._num_osc, 1):
-                for j in range(i + 1, self._num_osc, 1):
-                    value_conn_weight = (self._conn_weight[i][j] - subtractor) / multiplier;
-                    
-                    self._conn_weight[i][j] = value_conn_weight;
-                    self._conn_weight[j][i] = value_conn_weight;
+        return minimum_distance, maximum_distance;
 
 
     def process(self, order = 0.998, solution = solve_type.FAST, collect_dynamic = True):
@@ -300,34 +366,43 @@ class syncnet(sync_network):
             return syncnet_analyser(output_sync_dynamic.output, output_sync_dynamic.time, None);
     
     
-    def _phase_kuramoto(self, teta, t, argv):
+    def _phase_kuramoto(self, phases, t):
         """!
-        @brief Overrided method for calculation of oscillator phase.
+        @brief Overrided method for calculation of derivative of phases of all oscillators.
         
-        @param[in] teta (double): Current value of phase.
+        @param[in] phases (numpy.array): Current values of phases.
         @param[in] t (double): Time (can be ignored).
-        @param[in] argv (uint): Index of oscillator whose phase represented by argument teta.
         
-        @return (double) New value of phase of oscillator with index 'argv'.
+        @return (numpy.array) Derivative of phase of each oscillator.
         
         """
         
-        index = argv;   # index of oscillator
-        phase = 0.0;      # phase of a specified oscillator that will calculated in line with current env. states.
+        coupling = self._calculate_coupling(phases, self.__get_coupling_weights());
+        return numpy.asarray(self._freq) + self._weight * coupling;
+    
+    
+    def __get_coupling_weights(self):
+        """!
+        @brief Returns sparse matrix of weights of connections where each weight is divided by amount of neighbors of the oscillator.
+        @details Weights are calculated again only when connections are changed.
         
-        neighbors = self.get_neighbors(index);
-        for k in neighbors:
-            conn_weight = 1.0;
-            if (self._ena_conn_weight is True):
-                conn_weight = self._conn_weight[index][k];
-                
-            phase += conn_weight * self._weight * math.sin(self._phases[k] - teta);
+        @return (csr_matrix) Matrix of weights of connections.
         
-        divider = len(neighbors);
-        if (divider == 0):
-            divider = 1.0;
+        """
+        
+        connections = self._get_connection_matrix();
+        if (self.__weighted_connections is not connections):
+            dividers = numpy.asarray(connections.sum(axis = 1)).ravel();
+            dividers[dividers == 0] = 1.0;
             
-        return ( self._freq[index] + (phase / divider) );   
+            weights = connections.copy();
+            if (self._ena_conn_weight is True):
+                weights = weights.multiply(self._conn_weight).tocsr();
+            
+            weights.data /= numpy.repeat(dividers, numpy.diff(weights.indptr));
+            self.__coupling_weights, self.__weighted_connections = weights, connections;
+        
+        return self.__coupling_weights;
     
     
     def show_network(self):
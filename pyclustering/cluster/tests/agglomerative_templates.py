@@ -24,7 +24,9 @@
 """
 
 
-from pyclustering.cluster.agglomerative import agglomerative;
+import numpy;
+
+from pyclustering.cluster.agglomerative import agglomerative, type_link;
 from pyclustering.utils import read_sample;
 
 from random import random;
@@ -76,4 +78,68 @@ class AgglomerativeTestTemplates:
                 object_mark[index_object] = True;
                 allocated_number_objects += 1;
             
-        assert (number_objects == allocated_number_objects);    # number of allocated objects should be the same.
\ No newline at end of file
+        assert (number_objects == allocated_number_objects);    # number of allocated objects should be the same.
+
+    @staticmethod
+    def templateMergeHistory(path, link):
+        AgglomerativeTestTemplates.templateMergeHistoryData(read_sample(path), link);
+
+    @staticmethod
+    def templateMergeHistoryRandomData(amount_objects, link, seed):
+        random_state = numpy.random.RandomState(seed);
+        AgglomerativeTestTemplates.templateMergeHistoryData(random_state.rand(amount_objects, 2).tolist(), link);
+
+    @staticmethod
+    def templateMergeHistoryData(sample, link):
+        agglomerative_instance = agglomerative(sample, 1, link, False);
+        agglomerative_instance.process();
+        
+        linkage = agglomerative_instance.get_linkage();
+        assert linkage.shape == (len(sample) - 1, 4);
+        assert linkage[-1][3] == len(sample);
+        
+        expected_history = AgglomerativeTestTemplates.mergeByBruteForce(sample, link);
+        
+        for number_clusters in range(1, len(sample) + 1):
+            clusters = agglomerative_instance.extract_clusters(number_clusters);
+            
+            assert len(clusters) == number_clusters;
+            assert sorted([sorted(cluster) for cluster in clusters]) == expected_history[number_clusters];
+
+    @staticmethod
+    def mergeByBruteForce(sample, link):
+        """!
+        @brief Reference implementation: on each step links between all pairs of clusters are calculated by definition
+                (using square Euclidean distance between objects) and the closest pair is merged.
+        
+        @return (dict) Clusters (sorted lists of indexes) for each amount of clusters.
+        
+        """
+        data = numpy.array(sample, dtype=numpy.double);
+        clusters = [ [index] for index in range(len(data)) ];
+        history = { len(clusters): sorted([sorted(cluster) for cluster in clusters]) };
+        
+        def calculate_link(cluster1, cluster2):
+            distances = numpy.sum(numpy.square(data[cluster1][:, numpy.newaxis, :] - data[cluster2][numpy.newaxis, :, :]), axis=2);
+            if (link == type_link.SINGLE_LINK):
+                return numpy.min(distances);
+            elif (link == type_link.COMPLETE_LINK):
+                return numpy.max(distances);
+            elif (link == type_link.AVERAGE_LINK):
+                return numpy.sum(distances) / (len(cluster1) + len(cluster2));
+            
+            return numpy.sum(numpy.square(numpy.mean(data[cluster1], axis=0) - numpy.mean(data[cluster2], axis=0)));
+        
+        while (len(clusters) > 1):
+            best_pair = None;
+            for index_cluster1 in range(len(clusters)):
+                for index_cluster2 in range(index_cluster1 + 1, len(clusters)):
+                    candidate_link = calculate_link(clusters[index_cluster1], clusters[index_cluster2]);
+                    if ((best_pair is None) or (candidate_link < best_pair[0])):
+                        best_pair = (candidate_link, index_cluster1, index_cluster2);
+            
+            clusters[best_pair[1]] += clusters[best_pair[2]];
+            clusters.pop(best_pair[2]);
+            history[len(clusters)] = sorted([sorted(cluster) for cluster in clusters]);
+        
+        return history;
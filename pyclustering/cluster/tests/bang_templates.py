@@ -81,6 +81,27 @@ class bang_test_template:
         return bang_instance
 
 
+    @staticmethod
+    def leaf_coverage(path, levels, density_threshold, ccore, **kwargs):
+        sample = read_sample(path)
+
+        amount_threshold = kwargs.get('amount_threshold', 0)
+
+        bang_instance = bang(sample, levels, ccore,
+                             density_threshold=density_threshold,
+                             amount_threshold=amount_threshold)
+
+        bang_instance.process()
+
+        directory = bang_instance.get_directory()
+        blocks = directory.get_leafs() + [block for level in range(directory.get_height()) for block in directory.get_level(level)]
+
+        for block in blocks:
+            expected_points = [index for index in range(len(sample)) if sample[index] in block.get_spatial_block()]
+            assertion.eq(expected_points, sorted(block.get_points()))
+            assertion.eq(len(expected_points), len(block))
+
+
     @staticmethod
     def visualize(path, levels, threshold, ccore, **kwargs):
         sample = read_sample(path)
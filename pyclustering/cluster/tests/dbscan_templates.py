@@ -48,11 +48,17 @@ class DbscanTestTemplates:
          
         clusters = dbscan_instance.get_clusters()
         noise = dbscan_instance.get_noise()
+        labels = dbscan_instance.get_labels()
 
         assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]) + len(noise))
         assertion.eq(sum(expected_length_clusters), sum([len(cluster) for cluster in clusters]))
         assertion.eq(expected_length_clusters, sorted([len(cluster) for cluster in clusters]))
 
+        assertion.eq(len(sample), len(labels))
+        for index_cluster in range(len(clusters)):
+            assertion.eq(sorted(clusters[index_cluster]), [index for index in range(len(labels)) if labels[index] == index_cluster])
+        assertion.eq(sorted(noise), [index for index in range(len(labels)) if labels[index] == -1])
+
 
     @staticmethod
     def templateClusteringWithAnswers(sample_path, answer_path, radius, neighbors, ccore, **kwargs):
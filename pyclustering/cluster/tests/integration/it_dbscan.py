@@ -24,6 +24,7 @@
 """
 
 import unittest
+import numpy
 
 import matplotlib
 matplotlib.use('Agg')
@@ -31,6 +32,8 @@ matplotlib.use('Agg')
 from pyclustering.cluster.tests.dbscan_templates import DbscanTestTemplates
 from pyclustering.cluster.dbscan import dbscan
 
+import pyclustering.core.dbscan_wrapper as dbscan_wrapper
+
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, SIMPLE_ANSWERS
 from pyclustering.samples.definitions import FCPS_SAMPLES
 
@@ -109,6 +112,32 @@ class DbscanIntegrationTest(unittest.TestCase):
         assert len(dbscan_instance.get_clusters()) == 2
 
 
+    def testCoreInterfaceNumpyOutput(self):
+        sample = [ [0.0], [0.1], [0.2], [5.0], [5.1], [5.2], [20.0] ]
+        (clusters, noise) = dbscan_wrapper.dbscan(sample, 0.5, 2, "points")
+
+        assert all(isinstance(cluster, numpy.ndarray) for cluster in clusters)
+        assert isinstance(noise, numpy.ndarray)
+        assert [[0, 1, 2], [3, 4, 5]] == sorted(sorted(cluster.tolist()) for cluster in clusters)
+        assert [6] == noise.tolist()
+
+        dbscan_instance = dbscan(sample, 0.5, 2, True)
+        dbscan_instance.process()
+        assert [[0, 1, 2], [3, 4, 5]] == sorted(sorted(cluster) for cluster in dbscan_instance.get_clusters())
+        assert [6] == dbscan_instance.get_noise()
+
+        labels = dbscan_instance.get_labels()
+        assert -1 == labels[6]
+        assert len(set(labels[0:3])) == 1 and len(set(labels[3:6])) == 1 and labels[0] != labels[3]
+
+    def testCoreInterfaceNumpyOutputNoNoise(self):
+        (clusters, noise) = dbscan_wrapper.dbscan([ [0.0], [0.1], [5.0], [5.1] ], 0.5, 1, "points")
+
+        assert isinstance(noise, numpy.ndarray)
+        assert 0 == len(noise)
+        assert numpy.issubdtype(noise.dtype, numpy.integer)
+        assert [[0, 1], [2, 3]] == sorted(sorted(cluster.tolist()) for cluster in clusters)
+
     def testPermutationSampleSimple14(self):
         DbscanTestTemplates.templateClusteringWithAnswers(SIMPLE_SAMPLES.SAMPLE_SIMPLE14,
                                                           SIMPLE_ANSWERS.ANSWER_SIMPLE14, 1.0, 5, False,
@@ -25,6 +25,7 @@
 
 
 import unittest
+import numpy
 
 import matplotlib
 matplotlib.use('Agg')
@@ -32,6 +33,8 @@ matplotlib.use('Agg')
 from pyclustering.cluster.tests.kmeans_templates import KmeansTestTemplates
 from pyclustering.cluster.kmeans import kmeans
 
+import pyclustering.core.kmeans_wrapper as kmeans_wrapper
+
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
 from pyclustering.core.tests import remove_library
@@ -128,6 +131,21 @@ class KmeansIntegrationTest(unittest.TestCase):
         kmeans_instance.process()
         assert len(kmeans_instance.get_clusters()) == 2
 
+    def testCoreInterfaceNumpyOutput(self):
+        sample = numpy.array([ [1.0], [2.0], [3.0], [20.0], [21.0], [22.0] ])
+        results = kmeans_wrapper.kmeans(sample, [ [2.0], [21.0] ], 0.025, False, None)
+
+        assert isinstance(results[1], numpy.ndarray)
+        assert (2, 1) == results[1].shape
+        assert all(isinstance(cluster, numpy.ndarray) for cluster in results[0])
+        assert [[0, 1, 2], [3, 4, 5]] == sorted(cluster.tolist() for cluster in results[0])
+
+        kmeans_instance = kmeans(sample, [ [2.0], [21.0] ], 0.025, True)
+        kmeans_instance.process()
+        assert [[0, 1, 2], [3, 4, 5]] == sorted(kmeans_instance.get_clusters())
+        assert isinstance(kmeans_instance.get_clusters()[0], list)
+        assert [[2.0], [21.0]] == sorted(kmeans_instance.get_centers())
+
 
     def testObserveSampleSimple1ByCore(self):
         KmeansTestTemplates.templateCollectEvolution(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.5, 5.6], [6.8, 7.4]], [5, 5], True)
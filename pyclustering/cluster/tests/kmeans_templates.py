@@ -41,8 +41,9 @@ class KmeansTestTemplates:
         sample = read_sample(path_to_file)
 
         metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        accelerated = kwargs.get('accelerated', False)
         
-        kmeans_instance = kmeans(sample, start_centers, 0.025, ccore, metric=metric)
+        kmeans_instance = kmeans(sample, start_centers, 0.025, ccore, metric=metric, accelerated=accelerated)
         kmeans_instance.process()
         
         clusters = kmeans_instance.get_clusters()
@@ -61,6 +62,29 @@ class KmeansTestTemplates:
             assertion.eq(obtained_cluster_sizes, expected_cluster_length)
 
 
+    @staticmethod
+    def templateCompareAcceleratedProcessing(path_to_file, start_centers, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        kmeans_instance = kmeans(sample, start_centers, 0.001, False, metric=metric)
+        kmeans_instance.process()
+
+        observer = kmeans_observer()
+        accelerated_instance = kmeans(sample, start_centers, 0.001, False, metric=metric, accelerated=True, observer=observer)
+        accelerated_instance.process()
+
+        assertion.eq(kmeans_instance.get_clusters(), accelerated_instance.get_clusters())
+        assertion.eq(kmeans_instance.get_centers(), accelerated_instance.get_centers())
+
+        assertion.eq(0, observer.get_skipped_distances(0))
+        for iteration in range(len(observer)):
+            assertion.ge(len(sample) * len(observer.get_centers(iteration)), observer.get_skipped_distances(iteration))
+
+        if len(start_centers) > 1:
+            assertion.lt(0, observer.get_skipped_distances(len(observer) - 1))
+
+
     @staticmethod
     def templateClusterAllocationOneDimensionData(ccore_flag):
         input_data = [ [random()] for _ in range(10) ] + [ [random() + 3] for _ in range(10) ] + [ [random() + 5] for _ in range(10) ] + [ [random() + 8] for _ in range(10) ];
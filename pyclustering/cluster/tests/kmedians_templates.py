@@ -36,13 +36,14 @@ class KmediansTestTemplates:
     def templateLengthProcessData(data, start_centers, expected_cluster_length, ccore, **kwargs):
         tolerance = kwargs.get('tolerance', 0.01)
         metric = kwargs.get('metric', None)
+        accelerated = kwargs.get('accelerated', False)
 
         if isinstance(data, str):
             sample = read_sample(data)
         else:
             sample = data
 
-        kmedians_instance = kmedians(sample, start_centers, tolerance, ccore, metric=metric)
+        kmedians_instance = kmedians(sample, start_centers, tolerance, ccore, metric=metric, accelerated=accelerated)
         kmedians_instance.process()
         
         clusters = kmedians_instance.get_clusters()
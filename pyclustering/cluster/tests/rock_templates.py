@@ -50,6 +50,19 @@ class RockTestTemplates:
         assert obtained_cluster_sizes == expected_cluster_length;
 
 
+    @staticmethod
+    def templateClusterAllocationRadiusBoundary(ccore_flag):
+        # Euclidean distance between points is exactly 1.0 - they are neighbors.
+        rock_instance = rock([ [0.5, 1.2], [1.3, 1.8] ], 1.0, 1, 0.5, ccore_flag);
+        rock_instance.process();
+        assert [ [0, 1] ] == sorted([ sorted(cluster) for cluster in rock_instance.get_clusters() ]);
+
+        # Euclidean distance between points is 0.5000000000000001 - they are not neighbors.
+        rock_instance = rock([ [0.5, 0.6], [0.8, 1.0] ], 0.5, 1, 0.5, ccore_flag);
+        rock_instance.process();
+        assert [ [0], [1] ] == sorted([ sorted(cluster) for cluster in rock_instance.get_clusters() ]);
+
+
     @staticmethod
     def templateClusterAllocationOneDimensionData(ccore_flag):
         input_data = [ [random()] for i in range(10) ] + [ [random() + 3] for i in range(10) ] + [ [random() + 5] for i in range(10) ] + [ [random() + 8] for i in range(10) ];
@@ -48,6 +48,7 @@ from pyclustering.cluster.tests.unit               import ut_hsyncnet
 from pyclustering.cluster.tests.unit               import ut_kmeans             as cluster_kmeans_unit_tests
 from pyclustering.cluster.tests.unit               import ut_kmedians           as cluster_kmedians_unit_tests
 from pyclustering.cluster.tests.unit               import ut_kmedoids           as cluster_kmedoids_unit_tests
+from pyclustering.cluster.tests.unit               import ut_mbkmeans           as cluster_mbkmeans_unit_tests
 from pyclustering.cluster.tests.unit               import ut_mbsas              as cluster_mbsas_unit_tests
 from pyclustering.cluster.tests.unit               import ut_optics             as cluster_optics_unit_tests
 from pyclustering.cluster.tests.unit               import ut_rock               as cluster_rock_unit_tests
@@ -83,6 +84,7 @@ class clustering_unit_tests(suite_holder):
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmeans_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedians_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedoids_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_mbkmeans_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_mbsas_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_optics_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_rock_unit_tests))
@@ -32,7 +32,7 @@ matplotlib.use('Agg');
 from pyclustering.cluster.tests.agglomerative_templates import AgglomerativeTestTemplates;
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES;
-from pyclustering.cluster.agglomerative import type_link;
+from pyclustering.cluster.agglomerative import agglomerative, type_link;
 
 
 class AgglomerativeUnitTests(unittest.TestCase):
@@ -192,5 +192,41 @@ class AgglomerativeUnitTests(unittest.TestCase):
         AgglomerativeTestTemplates.templateClusterAllocationTheSameObjects(10, 2, type_link.SINGLE_LINK, False); 
 
 
+    def testMergeHistorySampleSimple3LinkAverage(self):
+        AgglomerativeTestTemplates.templateMergeHistory(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.AVERAGE_LINK);
+
+    def testMergeHistorySampleSimple3LinkCentroid(self):
+        AgglomerativeTestTemplates.templateMergeHistory(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.CENTROID_LINK);
+
+    def testMergeHistorySampleSimple3LinkComplete(self):
+        AgglomerativeTestTemplates.templateMergeHistory(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.COMPLETE_LINK);
+
+    def testMergeHistorySampleSimple3LinkSingle(self):
+        AgglomerativeTestTemplates.templateMergeHistory(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, type_link.SINGLE_LINK);
+
+    def testMergeHistoryRandomDataLinkAverage(self):
+        for seed in range(10):
+            AgglomerativeTestTemplates.templateMergeHistoryRandomData(15, type_link.AVERAGE_LINK, seed);
+
+    def testMergeHistoryRandomDataLinkCentroid(self):
+        for seed in range(10):
+            AgglomerativeTestTemplates.templateMergeHistoryRandomData(15, type_link.CENTROID_LINK, seed);
+
+    def testMergeHistoryRandomDataLinkComplete(self):
+        for seed in range(10):
+            AgglomerativeTestTemplates.templateMergeHistoryRandomData(15, type_link.COMPLETE_LINK, seed);
+
+    def testMergeHistoryRandomDataLinkSingle(self):
+        for seed in range(10):
+            AgglomerativeTestTemplates.templateMergeHistoryRandomData(15, type_link.SINGLE_LINK, seed);
+
+    def testMergeHistoryOneObject(self):
+        agglomerative_instance = agglomerative([[1.0, 2.0]], 1, type_link.AVERAGE_LINK, False);
+        agglomerative_instance.process();
+
+        assert agglomerative_instance.get_linkage().shape == (0, 4);
+        assert agglomerative_instance.get_clusters() == [[0]];
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -31,7 +31,7 @@ matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.bang_templates import bang_test_template
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 
 class bsas_unit_test(unittest.TestCase):
@@ -109,6 +109,22 @@ class bsas_unit_test(unittest.TestCase):
         bang_test_template.clustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE13, 1, 0.0, [10], 0, False)
 
 
+    def test_clustering_three_dimensional_data_chainlink(self):
+        bang_test_template.clustering(FCPS_SAMPLES.SAMPLE_CHAINLINK, 11, 0.0, [500, 500], 0, False)
+
+    def test_clustering_big_leafs(self):
+        bang_test_template.clustering(FCPS_SAMPLES.SAMPLE_HEPTA, 9, 0.0, [30, 60, 122], 0, False, amount_threshold=3)
+
+
+    def test_leaf_coverage(self):
+        bang_test_template.leaf_coverage(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 8, 0.0, False)
+        bang_test_template.leaf_coverage(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, 7, 0.0, False)
+        bang_test_template.leaf_coverage(SIMPLE_SAMPLES.SAMPLE_SIMPLE13, 6, 0.0, False)
+
+    def test_leaf_coverage_big_leafs(self):
+        bang_test_template.leaf_coverage(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 8, 0.0, False, amount_threshold=5)
+
+
     def test_visualize_no_failure_one_dimensional(self):
         bang_test_template.visualize(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, 4, 0.0, False)
         bang_test_template.visualize(SIMPLE_SAMPLES.SAMPLE_SIMPLE8, 7, 0.0, False)
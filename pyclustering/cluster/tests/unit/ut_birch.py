@@ -143,5 +143,68 @@ class BirchUnitTest(unittest.TestCase):
         self.templateClusterAllocationOneDimensionData(type_measurement = measurement_type.VARIANCE_INCREASE_DISTANCE);
 
 
+    def templateClusterAllocationByChunks(self, path, cluster_sizes, number_clusters, chunk_size, entry_size_limit = 200):
+        sample = read_sample(path);
+        
+        birch_instance = birch(None, number_clusters, entry_size_limit = entry_size_limit);
+        for index_chunk in range(0, len(sample), chunk_size):
+            birch_instance.partial_fit(sample[index_chunk:index_chunk + chunk_size]);
+        
+        birch_instance.process();
+        assert [] == birch_instance.get_clusters();
+        
+        labels = birch_instance.predict(sample);
+        assert len(sample) == len(labels);
+        
+        obtained_cluster_sizes = [ labels.count(index_cluster) for index_cluster in range(number_clusters) ];
+        assert sorted(cluster_sizes) == sorted(obtained_cluster_sizes);
+
+    def testClusterAllocationByChunksSampleSimple1(self):
+        self.templateClusterAllocationByChunks(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [5, 5], 2, 3);
+
+    def testClusterAllocationByChunksSampleSimple3(self):
+        self.templateClusterAllocationByChunks(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, 7);
+
+    def testClusterAllocationByChunksSampleSimple3Rebuilding(self):
+        self.templateClusterAllocationByChunks(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, 7, entry_size_limit = 5);
+
+    def testClusterAllocationRebuildingSampleSimple5(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE5, [15, 15, 15, 15], 4, entry_size_limit = 5);
+
+    def testClusterAllocationManyLeafsSampleSimple3(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [10, 10, 10, 30], 4, branching_factor = 2, max_node_entries = 1, initial_diameter = 0.0);
+
+    def testClusterAllocationManyLeafsSampleSimple4(self):
+        self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [15, 15, 15, 15, 15], 5, branching_factor = 2, max_node_entries = 1, initial_diameter = 0.0);
+
+    def testClusterAllocationRebuildingAllMeasurements(self):
+        for type_measurement in measurement_type:
+            self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [15, 15, 15, 15, 15], 5, type_measurement = type_measurement, entry_size_limit = 50);
+            self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE5, [15, 15, 15, 15], 4, type_measurement = type_measurement, entry_size_limit = 50);
+
+    def testNoEmptyClustersAllMeasurements(self):
+        # points are assigned to features with nearest centroids, therefore each merged feature keeps its points.
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3);
+        
+        for type_measurement in measurement_type:
+            birch_instance = birch(sample, 4, type_measurement = type_measurement, entry_size_limit = 50);
+            birch_instance.process();
+            
+            clusters = birch_instance.get_clusters();
+            assert len(clusters) == 4;
+            assert all(len(cluster) > 0 for cluster in clusters);
+            assert sorted(sum(clusters, [])) == list(range(len(sample)));
+
+    def testPredictProcessedData(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3);
+        
+        birch_instance = birch(sample, 4);
+        birch_instance.process();
+        
+        labels = birch_instance.predict(sample);
+        for index_cluster, cluster in enumerate(birch_instance.get_clusters()):
+            assert all(labels[index_point] == index_cluster for index_point in cluster);
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
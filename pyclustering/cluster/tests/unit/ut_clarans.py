@@ -90,6 +90,28 @@ class ClaransUnitTest(unittest.TestCase):
     def testClusterAllocationTheSameData2(self):
         self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, [5, 10], 2, 15, 5);
 
+    def templateReproducibleResult(self, path, number_clusters, iterations, maxneighbors, processes):
+        sample = read_sample(path);
+        
+        clarans_instance = clarans(sample, number_clusters, iterations, maxneighbors, random_state=1000);
+        clarans_instance.process();
+        
+        parallel_instance = clarans(sample, number_clusters, iterations, maxneighbors, random_state=1000, processes=processes);
+        parallel_instance.process();
+        
+        assert clarans_instance.get_medoids() == parallel_instance.get_medoids();
+        assert clarans_instance.get_clusters() == parallel_instance.get_clusters();
+        assert sum([len(cluster) for cluster in parallel_instance.get_clusters()]) == len(sample);
+
+    def testReproducibleResultSampleSimple3(self):
+        self.templateReproducibleResult(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 10, 3, 1);
+
+    def testReproducibleResultSampleSimple3Processes(self):
+        self.templateReproducibleResult(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 10, 3, 2);
+
+    def testReproducibleResultSampleSimple8Processes(self):
+        self.templateReproducibleResult(SIMPLE_SAMPLES.SAMPLE_SIMPLE8, 4, 15, 5, 4);
+
 
 if __name__ == "__main__":
     unittest.main();
@@ -24,12 +24,13 @@
 """
 
 import unittest;
+import numpy;
 
 # Generate images without having a window appear.
 import matplotlib;
 matplotlib.use('Agg');
 
-from pyclustering.cluster.ema import ema, ema_observer, ema_initializer, ema_init_type, ema_visualizer;
+from pyclustering.cluster.ema import ema, ema_observer, ema_initializer, ema_init_type, ema_covariance_type, ema_visualizer;
 from pyclustering.utils import read_sample;
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES, FAMOUS_SAMPLES;
@@ -39,7 +40,8 @@ class EmaUnitTest(unittest.TestCase):
     def templateDataClustering(self, sample_path, 
                                amount_clusters, 
                                expected_clusters_sizes, 
-                               init_type = ema_init_type.KMEANS_INITIALIZATION):
+                               init_type = ema_init_type.KMEANS_INITIALIZATION,
+                               **kwargs):
         testing_result = False;
         if (init_type != ema_init_type.KMEANS_INITIALIZATION):
             attempts = 10;
@@ -53,7 +55,7 @@ class EmaUnitTest(unittest.TestCase):
             if (init_type is not ema_init_type.KMEANS_INITIALIZATION):
                 means, variances = ema_initializer(sample, amount_clusters).initialize(init_type);
             
-            ema_instance = ema(sample, amount_clusters, means, variances);
+            ema_instance = ema(sample, amount_clusters, means, variances, **kwargs);
             ema_instance.process();
             
             clusters = ema_instance.get_clusters();
@@ -178,6 +180,49 @@ class EmaUnitTest(unittest.TestCase):
     def testClusteringTotallySimilarObjectsFiveClustersRandomInit(self):
         self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, 5, None, ema_init_type.RANDOM_INITIALIZATION);
 
+    def testClusteringSampleSimple03Diagonal(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, [10, 10, 10, 30], covariance_type=ema_covariance_type.DIAGONAL);
+
+    def testClusteringSampleSimple03Spherical(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, [10, 10, 10, 30], covariance_type=ema_covariance_type.SPHERICAL);
+
+    def testClusteringOneDimensionalDataSpherical(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, 2, [10, 10], covariance_type=ema_covariance_type.SPHERICAL);
+
+    def testClusteringThreeDimensionalDataDiagonal(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, 2, [10, 10], covariance_type=ema_covariance_type.DIAGONAL);
+
+    def testClusteringTotallySimilarObjectsDiagonal(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, 2, None, covariance_type=ema_covariance_type.DIAGONAL);
+
+    def testClusteringSampleSimple04Chunks(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, [15, 15, 15, 15, 15], chunk_size=7);
+
+
+    def templateChunkIndependence(self, sample_path, amount_clusters, covariance_type):
+        sample = read_sample(sample_path);
+        means, variances = ema_initializer(sample, amount_clusters).initialize(ema_init_type.RANDOM_INITIALIZATION);
+        
+        reference_instance = ema(sample, amount_clusters, means, variances, covariance_type=covariance_type);
+        reference_instance.process();
+        
+        chunk_instance = ema(sample, amount_clusters, means, variances, covariance_type=covariance_type, chunk_size=3);
+        chunk_instance.process();
+        
+        assert reference_instance.get_clusters() == chunk_instance.get_clusters();
+        assert numpy.allclose(reference_instance.get_probabilities(), chunk_instance.get_probabilities());
+        assert numpy.allclose(reference_instance.get_centers(), chunk_instance.get_centers());
+        assert numpy.allclose(reference_instance.get_covariances(), chunk_instance.get_covariances());
+
+    def testChunkIndependenceFull(self):
+        self.templateChunkIndependence(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, ema_covariance_type.FULL);
+
+    def testChunkIndependenceDiagonal(self):
+        self.templateChunkIndependence(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, ema_covariance_type.DIAGONAL);
+
+    def testChunkIndependenceSpherical(self):
+        self.templateChunkIndependence(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, ema_covariance_type.SPHERICAL);
+
 
     def testObserver(self):
         sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE2);
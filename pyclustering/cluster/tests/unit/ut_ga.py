@@ -24,7 +24,11 @@
 """
 
 import unittest;
+import unittest.mock;
 import inspect;
+import multiprocessing;
+import numpy;
+import sys;
 
 # Generate images without having a window appear.
 import matplotlib;
@@ -126,14 +130,15 @@ class GeneticAlgorithmClusteringUnitTest(unittest.TestCase):
                                      population_count,
                                      count_mutation_gens,
                                      coeff_mutation_count,
-                                     expected_clusters_sizes):
+                                     expected_clusters_sizes,
+                                     **kwargs):
         testing_result = False;
         
         for _ in range(3):
             sample = read_sample(sample_path);
             
             ga_instance = genetic_algorithm(sample, amount_clusters, chromosome_count,
-                                    population_count, count_mutation_gens, coeff_mutation_count);
+                                    population_count, count_mutation_gens, coeff_mutation_count, **kwargs);
             
             ga_instance.process();
             clusters = ga_instance.get_clusters();
@@ -181,6 +186,57 @@ class GeneticAlgorithmClusteringUnitTest(unittest.TestCase):
     def testTenClustersTotallySimilarObjects(self):
         self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, 10, 20, 30, 2, 0.25, None);
 
+    def testClusteringTwoDimensionalDataByProcesses(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 20, 30, 2, 0.25, [5, 5], processes=2);
+
+    def testClusteringThreeDimensionalDataByProcesses(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, 2, 20, 30, 2, 0.25, [10, 10], processes=3);
+
+    def testClusteringByProcessesWithoutSharedMemory(self):
+        # multiprocessing.shared_memory is not available before Python 3.8
+        shared_memory_module = multiprocessing.__dict__.pop('shared_memory', None);
+        
+        try:
+            with unittest.mock.patch.dict(sys.modules, { 'multiprocessing.shared_memory': None }):
+                self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 20, 30, 2, 0.25, [5, 5], processes=2);
+        
+        finally:
+            if shared_memory_module is not None:
+                multiprocessing.shared_memory = shared_memory_module;
+
+    def testClusteringTwoDimensionalDataIslands(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 10, 30, 2, 0.25, [5, 5], island_count=3, migration_interval=5, migration_count=2);
+
+    def testClusteringOneDimensionalDataIslandsEachIterationMigration(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, 2, 10, 30, 2, 0.25, [10, 10], island_count=2, migration_interval=1);
+
+    def testClusteringIslandsWithoutMigration(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 10, 30, 2, 0.25, [5, 5], island_count=2, migration_count=0);
+
+    def testClusteringIslandsByProcesses(self):
+        self.templateDataClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, 2, 10, 30, 2, 0.25, [10, 10], island_count=2, processes=2);
+
+    def testIncorrectIslandArguments(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
+        
+        self.assertRaises(ValueError, genetic_algorithm, sample, 2, 10, 10, island_count=0);
+        self.assertRaises(ValueError, genetic_algorithm, sample, 2, 10, 10, migration_interval=0);
+        self.assertRaises(ValueError, genetic_algorithm, sample, 2, 10, 10, migration_count=11);
+
+
+    def testCentersCalculation(self):
+        data = [[0.0, 0.0], [2.0, 0.0], [4.0, 4.0], [6.0, 6.0]];
+        chromosomes = [[0, 0, 1, 1], [1, 1, 1, 1], [0, 2, 0, 2]];
+        
+        centers = ga_math.calc_centers(chromosomes, data, 3);
+        
+        self.assertEqual([[1.0, 0.0], [5.0, 5.0], [0.0, 0.0]], centers[0].tolist());
+        self.assertEqual([[0.0, 0.0], [3.0, 2.5], [0.0, 0.0]], centers[1].tolist());
+        self.assertEqual([[2.0, 2.0], [0.0, 0.0], [4.0, 3.0]], centers[2].tolist());
+        
+        fitness = genetic_algorithm._calc_fitness_function(centers, numpy.array(data), numpy.array(chromosomes));
+        self.assertEqual([6.0, 18.0, 18.0], fitness.tolist());
+
 
     def templateTestObserverCollecting(self, amount_clusters, iterations, global_optimum, local_optimum, average):
         testing_result = False;
@@ -271,6 +327,19 @@ class GeneticAlgorithmClusteringUnitTest(unittest.TestCase):
         ga_visualizer.show_evolution(observer, 2, len(observer), display = False);
 
 
+    def testObserveIslands(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
+        observer_instance = ga_observer(True, True, True);
+        
+        ga_instance = genetic_algorithm(sample, 2, 10, 10, 2, 0.25, observer=observer_instance, island_count=3, migration_interval=3);
+        _, best_ff = ga_instance.process();
+        
+        self.assertEqual(11, len(observer_instance));
+        self.assertEqual(best_ff, observer_instance.get_global_best()['fitness_function'][-1]);
+        self.assertEqual(sorted(observer_instance.get_global_best()['fitness_function'], reverse=True),
+                         observer_instance.get_global_best()['fitness_function']);
+
+
     def testNoneObserver(self):
         sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
         ga_instance = genetic_algorithm(sample, 2, 20, 20, 2, 0.25, observer=None);
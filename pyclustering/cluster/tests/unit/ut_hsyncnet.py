@@ -32,8 +32,12 @@ matplotlib.use('Agg');
 
 from pyclustering.cluster.tests.hsyncnet_templates import HsyncnetTestTemplates;
 
+from pyclustering.cluster.hsyncnet import hsyncnet;
+
 from pyclustering.nnet import solve_type;
 
+from pyclustering.utils import read_sample, average_neighbor_distance;
+
 from pyclustering.samples.definitions import SIMPLE_SAMPLES;
 
 
@@ -65,6 +69,14 @@ class HsyncnetUnitTest(unittest.TestCase):
     def testDynamicLengthWithoutCollecting(self):
         HsyncnetTestTemplates.templateDynamicLength(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, None, 5, 0.3, False, False);
 
+    def testNeighborDistancesCache(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3);
+        network = hsyncnet(sample, 4, ccore = False);
+        
+        for number_neighbors in [1, 3, 10, 50, len(sample) - 1]:
+            expected_distance = average_neighbor_distance(sample, number_neighbors);
+            assert abs(network._hsyncnet__average_neighbor_distance(number_neighbors) - expected_distance) < 0.0000001;
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
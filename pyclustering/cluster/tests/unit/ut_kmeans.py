@@ -34,7 +34,7 @@ from pyclustering.cluster.tests.kmeans_templates import KmeansTestTemplates
 
 from pyclustering.cluster.kmeans import kmeans
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 from pyclustering.utils.metric import distance_metric, type_metric
 
@@ -139,6 +139,50 @@ class KmeansUnitTest(unittest.TestCase):
         self.assertRaises(ValueError, kmeans_instance.process)
 
 
+    def testAcceleratedClusterAllocationSampleSimple1(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, accelerated=True)
+
+    def testAcceleratedClusterAllocationSampleSimple1Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric, accelerated=True)
+
+    def testAcceleratedClusterAllocationSampleSimple1UserDefined(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=distance_metric(type_metric.EUCLIDEAN, numpy_usage=True))
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False, metric=metric, accelerated=True)
+
+    def testAcceleratedClusterAllocationSampleSimple2(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5]], [10, 5, 8], False, accelerated=True)
+
+    def testAcceleratedClusterAllocationSampleSimple4(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [[1.5, 0.0], [1.5, 2.0], [1.5, 4.0], [1.5, 6.0], [1.5, 8.0]], [15, 15, 15, 15, 15], False, accelerated=True)
+
+    def testAcceleratedOneDimensionalData(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, [[-2.0], [4.0]], [10, 10], False, accelerated=True)
+
+    def testAcceleratedWrongNumberOfCentersSimpleSample2(self):
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5], [7.3, 4.5], [3.1, 5.4]], None, False, accelerated=True)
+
+    def testCompareAcceleratedSampleSimple3(self):
+        KmeansTestTemplates.templateCompareAcceleratedProcessing(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]])
+
+    def testCompareAcceleratedSampleSimple1OneCluster(self):
+        KmeansTestTemplates.templateCompareAcceleratedProcessing(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.3, 5.4]])
+
+    def testCompareAcceleratedLsun(self):
+        KmeansTestTemplates.templateCompareAcceleratedProcessing(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [3.5, 2.5], [1.0, 4.0]])
+
+    def testCompareAcceleratedLsunManhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateCompareAcceleratedProcessing(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [3.5, 2.5], [1.0, 4.0]], metric=metric)
+
+    def testCompareAcceleratedLsunChebyshev(self):
+        metric = distance_metric(type_metric.CHEBYSHEV)
+        KmeansTestTemplates.templateCompareAcceleratedProcessing(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [3.5, 2.5], [1.0, 4.0]], metric=metric)
+
+    def testCompareAcceleratedTarget(self):
+        KmeansTestTemplates.templateCompareAcceleratedProcessing(FCPS_SAMPLES.SAMPLE_TARGET, [[0.0, 0.0], [1.0, 1.0], [-1.0, -1.0], [2.0, -2.0], [-2.0, 2.0], [3.0, 3.0], [-3.0, -3.0], [0.5, -0.5]])
+
+
     def testClusterAllocationOneDimensionData(self):
         KmeansTestTemplates.templateClusterAllocationOneDimensionData(False)
 
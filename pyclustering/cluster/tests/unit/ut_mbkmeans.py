@@ -0,0 +1,153 @@
+"""!
+
+@brief Unit-tests for Mini-Batch K-Means algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2018
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy
+
+from pyclustering.cluster.kmeans import kmeans_observer
+from pyclustering.cluster.mbkmeans import mbkmeans
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class MbkmeansUnitTest(unittest.TestCase):
+    def templateLengthProcessData(self, path_to_file, start_centers, expected_cluster_length, batch_size=10, **kwargs):
+        sample = read_sample(path_to_file)
+
+        mbkmeans_instance = mbkmeans(sample, start_centers, batch_size, 0.001, **kwargs)
+        mbkmeans_instance.process()
+
+        clusters = mbkmeans_instance.get_clusters()
+        centers = mbkmeans_instance.get_centers()
+
+        assert len(clusters) == len(centers)
+        assert len(sample) == sum([len(cluster) for cluster in clusters])
+
+        obtained_cluster_sizes = sorted([len(cluster) for cluster in clusters])
+        assert sorted(expected_cluster_length) == obtained_cluster_sizes
+
+
+    def templateStreamProcessing(self, amount_batches, batch_size, **kwargs):
+        expected_centers = numpy.array([[0.0, 0.0], [5.0, 5.0], [10.0, 0.0]])
+        random_state = numpy.random.RandomState(1000)
+
+        def generate_batches():
+            for _ in range(amount_batches):
+                labels = random_state.randint(0, len(expected_centers), batch_size)
+                yield expected_centers[labels] + random_state.normal(0.0, 0.1, (batch_size, 2))
+
+        mbkmeans_instance = mbkmeans(generate_batches(), [[1.0, 1.0], [4.0, 4.0], [9.0, 1.0]], **kwargs)
+        mbkmeans_instance.process()
+
+        centers = numpy.array(mbkmeans_instance.get_centers())
+        assert numpy.allclose(expected_centers, centers, atol=0.1)
+
+
+    def testClusterAllocationSampleSimple1(self):
+        self.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5])
+
+    def testClusterAllocationSampleSimple1Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        self.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], metric=metric)
+
+    def testClusterAllocationSampleSimple3(self):
+        self.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30])
+
+    def testClusterAllocationSampleSimple4(self):
+        self.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [[1.5, 0.0], [1.5, 2.0], [1.5, 4.0], [1.5, 6.0], [1.5, 8.0]], [15, 15, 15, 15, 15], 75)
+
+    def testClusterOneDimensionSampleSimple7(self):
+        self.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, [[-3.0], [2.0]], [10, 10])
+
+    def testKmeansPlusPlusInitialization(self):
+        self.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, [10])
+
+    def testStreamProcessing(self):
+        self.templateStreamProcessing(100, 50)
+
+    def testStreamProcessingSmallBatches(self):
+        self.templateStreamProcessing(1000, 3)
+
+    def testStreamReiterableAssignment(self):
+        batches = [numpy.array([[0.0, 0.1], [5.0, 5.1]]), numpy.array([[0.1, 0.0], [5.1, 5.0], [5.0, 4.9]])]
+
+        class reiterable_stream:
+            def __iter__(self):
+                return iter(batches)
+
+        mbkmeans_instance = mbkmeans(reiterable_stream(), [[1.0, 1.0], [4.0, 4.0]])
+        mbkmeans_instance.process()
+
+        assert [[0, 2], [1, 3, 4]] == mbkmeans_instance.get_clusters()
+
+    def testPartialFit(self):
+        mbkmeans_instance = mbkmeans(None, [[0.0], [10.0]])
+
+        mbkmeans_instance.partial_fit([[1.0], [2.0], [9.0]])
+        assert [[1.5], [9.0]] == mbkmeans_instance.get_centers()
+
+        mbkmeans_instance.partial_fit([[3.0], [11.0]])
+        assert [[2.0], [10.0]] == mbkmeans_instance.get_centers()
+
+        assert [0, 1, 0] == mbkmeans_instance.predict([[0.0], [7.0], [5.0]])
+
+    def testObserver(self):
+        observer = kmeans_observer()
+
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1)
+        mbkmeans_instance = mbkmeans(sample, [[3.7, 5.5], [6.7, 7.5]], 4, itermax=10, tolerance=0.0, observer=observer)
+        mbkmeans_instance.process()
+
+        assert 10 == len(observer)
+        for iteration in range(len(observer)):
+            assert 2 == len(observer.get_centers(iteration))
+            assert 4 == sum([len(cluster) for cluster in observer.get_clusters(iteration)])
+
+    def testWithoutAssignment(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1)
+        mbkmeans_instance = mbkmeans(sample, [[3.7, 5.5], [6.7, 7.5]], assign=False)
+        mbkmeans_instance.process()
+
+        assert [] == mbkmeans_instance.get_clusters()
+        assert 2 == len(mbkmeans_instance.get_centers())
+
+    def testDifferentDimensions(self):
+        self.assertRaises(ValueError, mbkmeans, [ [0, 1, 5], [0, 2, 3] ], [ [0, 3] ])
+
+    def testIncorrectBatchSize(self):
+        self.assertRaises(ValueError, mbkmeans, [ [0, 1], [0, 2] ], [ [0, 3] ], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -159,6 +159,28 @@ class OpticsUnitTest(unittest.TestCase):
         assert None == amount_clusters;
         assert 0 == len(borders);
 
+    def testClusterOrderingPickExtraction(self):
+        analyser = ordering_analyser([1.0, 5.0, 3.0, 3.0, 6.0, 2.0, 7.0, 4.0, 8.0, 1.0]);
+
+        amount_clusters, borders = analyser.extract_cluster_amount(2.5);
+        assert 5 == amount_clusters;
+        assert [1, 4, 6, 8] == borders;
+
+        amount_clusters, borders = analyser.extract_cluster_amount(4.5);
+        assert 5 == amount_clusters;
+        assert [1, 4, 6, 8] == borders;
+
+        amount_clusters, borders = analyser.extract_cluster_amount(0.5);
+        assert 5 == amount_clusters;
+        assert [4, 6, 8] == borders;
+
+    def testClusterOrderingRadiusCalculation(self):
+        analyser = ordering_analyser([1.0, 5.0, 3.0, 3.0, 6.0, 2.0, 7.0, 4.0, 8.0, 1.0]);
+
+        radius, borders = analyser.calculate_connvectivity_radius(3);
+        assert 7.0 == radius;
+        assert [6, 8] == borders;
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -32,7 +32,7 @@ matplotlib.use('Agg');
 
 from pyclustering.cluster.tests.rock_templates import RockTestTemplates;
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES;
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES;
 
 
 class RockUnitTest(unittest.TestCase):  
@@ -69,6 +69,18 @@ class RockUnitTest(unittest.TestCase):
     def testClusterAllocationIncorrectNumberClusters(self):
         RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 1, 4, 0.5, [15, 15, 15, 15, 15], False);
 
+    def testClusterAllocationWithoutLinks(self):
+        RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.01, 4, 0.5, [1] * 60, False);
+
+    def testClusterAllocationHepta(self):
+        RockTestTemplates.templateLengthProcessData(FCPS_SAMPLES.SAMPLE_HEPTA, 1, 7, 0.5, [30, 30, 30, 30, 30, 30, 32], False);
+
+    def testClusterAllocationLsun(self):
+        RockTestTemplates.templateLengthProcessData(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 3, 0.5, [100, 101, 202], False);
+
+    def testClusterAllocationRadiusBoundary(self):
+        RockTestTemplates.templateClusterAllocationRadiusBoundary(False);
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
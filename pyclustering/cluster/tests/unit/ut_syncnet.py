@@ -148,6 +148,64 @@ class SyncnetUnitTest(unittest.TestCase):
         SyncnetTestTemplates.templateConnectionApi(conn_represent.LIST, False);
 
 
+    def testConnectionRadiusIncrease(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3);
+        
+        for representation in [conn_represent.MATRIX, conn_represent.LIST, conn_represent.CSR]:
+            network = syncnet(sample, 0.3, conn_repr = representation, ccore = False);
+            network._create_connections(0.8);
+            network._create_connections(0.5);
+            
+            expected_network = syncnet(sample, 0.8, conn_repr = representation, ccore = False);
+            
+            for i in range(len(network)):
+                assert sorted(network.get_neighbors(i)) == sorted(expected_network.get_neighbors(i));
+
+
+    def testConnectionRadiusBoundary(self):
+        # Euclidean distance between oscillators is exactly 1.0 - they are connected by radius 1.0.
+        sample = [ [1.3, 1.8], [0.5, 1.2] ];
+        for representation in [conn_represent.MATRIX, conn_represent.LIST, conn_represent.CSR]:
+            network = syncnet(sample, 1.0, conn_repr = representation, ccore = False);
+            assert network.has_connection(0, 1) is True;
+            
+            network = syncnet(sample, 0.5, conn_repr = representation, ccore = False);
+            assert network.has_connection(0, 1) is False;
+            
+            network._create_connections(1.0);
+            assert network.has_connection(0, 1) is True;
+            
+            network = syncnet(sample, 1.0, conn_repr = representation, ccore = False);
+            network._create_connections(2.0);
+            assert network.has_connection(0, 1) is True;
+        
+        # Euclidean distance between oscillators is 0.5000000000000001 - they are not connected by radius 0.5.
+        sample = [ [0.5, 0.6], [0.8, 1.0] ];
+        network = syncnet(sample, 0.5, ccore = False);
+        assert network.has_connection(0, 1) is False;
+        
+        network._create_connections(0.6);
+        assert network.has_connection(0, 1) is True;
+
+
+    def testConnectionWeights(self):
+        sample = [ [0.0, 0.0], [1.0, 0.0], [3.0, 0.0], [7.0, 0.0] ];
+        network = syncnet(sample, 2.5, enable_conn_weight = True, ccore = False);
+        network._create_connections(4.5);
+        
+        # distances are normalized by minimum (1.0) and maximum (7.0) distances between oscillators
+        expected_weights = { (0, 1): 0.0, (0, 2): 2.0 / 6.0, (1, 2): 1.0 / 6.0, (2, 3): 3.0 / 6.0, (1, 3): None, (0, 3): None };
+        
+        for ((i, j), weight) in expected_weights.items():
+            assert network.has_connection(i, j) == (weight is not None);
+            if (weight is not None):
+                assert abs(network._conn_weight[i, j] - weight) < 0.0000001;
+                assert abs(network._conn_weight[j, i] - weight) < 0.0000001;
+        
+        analyser = network.process(0.998, solve_type.FAST, True);
+        assert len(analyser.allocate_clusters()) > 0;
+
+
     def testVisualizerNoFailure(self):
         sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
         network = syncnet(sample, 1.0, ccore = False);
@@ -35,7 +35,7 @@ from pyclustering.tests.assertion import assertion;
 
 class XmeansTestTemplates:
     @staticmethod
-    def templateLengthProcessData(input_sample, start_centers, expected_cluster_length, type_splitting, kmax, ccore):
+    def templateLengthProcessData(input_sample, start_centers, expected_cluster_length, type_splitting, kmax, ccore, **kwargs):
         sample = None;
         if (isinstance(input_sample, str)):
             sample = read_sample(input_sample);
@@ -43,7 +43,7 @@ class XmeansTestTemplates:
             sample = input_sample;
         
         #clusters = xmeans(sample, start_centers, 20, ccore);
-        xmeans_instance = xmeans(sample, start_centers, kmax, 0.025, type_splitting, ccore);
+        xmeans_instance = xmeans(sample, start_centers, kmax, 0.025, type_splitting, ccore, accelerated=kwargs.get('accelerated', False));
         xmeans_instance.process();
          
         clusters = xmeans_instance.get_clusters();
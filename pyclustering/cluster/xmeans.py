@@ -111,7 +111,7 @@ class xmeans:
     
     """
     
-    def __init__(self, data, initial_centers = None, kmax = 20, tolerance = 0.025, criterion = splitting_type.BAYESIAN_INFORMATION_CRITERION, ccore = True):
+    def __init__(self, data, initial_centers = None, kmax = 20, tolerance = 0.025, criterion = splitting_type.BAYESIAN_INFORMATION_CRITERION, ccore = True, **kwargs):
         """!
         @brief Constructor of clustering algorithm X-Means.
         
@@ -122,6 +122,11 @@ class xmeans:
         @param[in] tolerance (double): Stop condition for each iteration: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing.
         @param[in] criterion (splitting_type): Type of splitting creation.
         @param[in] ccore (bool): Defines should be CCORE (C++ pyclustering library) used instead of Python code or not.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'accelerated').
+        
+        <b>Keyword Args:</b><br>
+            - accelerated (bool): If True then K-Means that is performed by Python implementation uses triangle
+               inequality to skip distance calculations (by default is False).
         
         """
         
@@ -136,6 +141,7 @@ class xmeans:
         self.__kmax = kmax
         self.__tolerance = tolerance
         self.__criterion = criterion
+        self.__accelerated = kwargs.get('accelerated', False)
          
         self.__ccore = ccore
         if (self.__ccore):
@@ -237,7 +243,7 @@ class xmeans:
         if centers is None:
             local_centers = kmeans_plusplus_initializer(local_data, 2, kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE).initialize();
 
-        kmeans_instance = kmeans(local_data, local_centers, tolerance=self.__tolerance, ccore=False);
+        kmeans_instance = kmeans(local_data, local_centers, tolerance=self.__tolerance, ccore=False, accelerated=self.__accelerated);
         kmeans_instance.process();
 
         local_centers = kmeans_instance.get_centers();
@@ -24,15 +24,12 @@
 
 """
 
+import numpy
+
 from copy import copy
 
 from pyclustering.cluster import cluster_visualizer
 
-from pyclustering.utils import euclidean_distance_square
-from pyclustering.utils import manhattan_distance
-from pyclustering.utils import list_math_addition, list_math_subtraction, list_math_multiplication
-from pyclustering.utils import linear_sum, square_sum
-
 from enum import IntEnum
 
 
@@ -103,7 +100,7 @@ class cfentry:
         """!
         @brief Returns linear sum.
         
-        @return (list) Linear sum.
+        @return (numpy.array) Linear sum.
         
         """
         
@@ -125,20 +122,40 @@ class cfentry:
         @brief CF-entry constructor.
         
         @param[in] number_points (uint): Number of objects that is represented by the entry.
-        @param[in] linear_sum (list): Linear sum of values that represent objects in each dimension.
+        @param[in] linear_sum (array_like): Linear sum of values that represent objects in each dimension, it is stored as numpy array.
         @param[in] square_sum (double): Square sum of values that represent objects.
         
         """
         
         self.__number_points = number_points;
-        self.__linear_sum = linear_sum;
-        self.__square_sum = square_sum;
+        self.__linear_sum = numpy.asarray(linear_sum, dtype = numpy.float64);
+        if (self.__linear_sum.ndim == 0):
+            self.__linear_sum = self.__linear_sum.reshape(1);
+        self.__square_sum = float(square_sum);
         
         self.__centroid = None;
         self.__radius = None;
         self.__diameter = None;
     
     
+    @staticmethod
+    def from_points(points):
+        """!
+        @brief Creates clustering feature that describes specified points.
+        
+        @param[in] points (array_like): Points that should be described, each point is represented by list of coordinates.
+        
+        @return (cfentry) Clustering feature of the points.
+        
+        """
+        
+        points = numpy.asarray(points, dtype = numpy.float64);
+        if (points.ndim == 1):
+            points = points.reshape(-1, 1);
+        
+        return cfentry(len(points), numpy.sum(points, axis = 0), numpy.sum(points * points));
+    
+    
     def __copy__(self):
         """!
         @returns (cfentry) Makes copy of the cfentry instance.
@@ -152,7 +169,7 @@ class cfentry:
         @return (string) Default cfentry representation.
         
         """
-        return 'CF (%s, %s, %0.2f) [%s]' % ( self.number_points, self.linear_sum, self.__square_sum, hex(id(self)) );    
+        return 'CF (%s, %s, %0.2f) [%s]' % ( self.number_points, self.linear_sum.tolist(), self.__square_sum, hex(id(self)) );    
     
     
     def __str__(self):
@@ -174,7 +191,7 @@ class cfentry:
         """
         
         number_points = self.number_points + entry.number_points;
-        result_linear_sum = list_math_addition(self.linear_sum, entry.linear_sum);
+        result_linear_sum = self.linear_sum + entry.linear_sum;
         result_square_sum = self.square_sum + entry.square_sum;  
         
         return cfentry(number_points, result_linear_sum, result_square_sum);
@@ -192,7 +209,7 @@ class cfentry:
         """
                 
         number_points = self.number_points - entry.number_points;
-        result_linear_sum = list_math_subtraction(self.linear_sum, entry.linear_sum);
+        result_linear_sum = self.linear_sum - entry.linear_sum;
         result_square_sum = self.square_sum - entry.square_sum;
         
         if ( (number_points < 0) or (result_square_sum < 0) ):
@@ -216,9 +233,7 @@ class cfentry:
         
         result = (self.__number_points == entry.number_points);
         result &= ( (self.square_sum + tolerance > entry.square_sum) and (self.square_sum - tolerance < entry.square_sum) );
-        
-        for index_dimension in range(0, len(self.linear_sum)):
-            result &= ( (self.linear_sum[index_dimension] + tolerance > entry.linear_sum[index_dimension]) and (self.linear_sum[index_dimension] - tolerance < entry.linear_sum[index_dimension]) );
+        result &= bool(numpy.all(numpy.abs(self.linear_sum - entry.linear_sum) < tolerance));
         
         return result;
     
@@ -239,10 +254,11 @@ class cfentry:
         """
         
         if (type_measurement is measurement_type.CENTROID_EUCLIDEAN_DISTANCE):
-            return euclidean_distance_square(entry.get_centroid(), self.get_centroid());
+            difference = entry.get_centroid() - self.get_centroid();
+            return float(difference.dot(difference));
         
         elif (type_measurement is measurement_type.CENTROID_MANHATTAN_DISTANCE):
-            return manhattan_distance(entry.get_centroid(), self.get_centroid());
+            return float(numpy.sum(numpy.abs(entry.get_centroid() - self.get_centroid())));
         
         elif (type_measurement is measurement_type.AVERAGE_INTER_CLUSTER_DISTANCE):
             return self.__get_average_inter_cluster_distance(entry);
@@ -262,17 +278,14 @@ class cfentry:
         @brief Calculates centroid of cluster that is represented by the entry. 
         @details It's calculated once when it's requested after the last changes.
         
-        @return (list) Centroid of cluster that is represented by the entry.
+        @return (numpy.array) Centroid of cluster that is represented by the entry.
         
         """
         
         if (self.__centroid is not None):
             return self.__centroid;
         
-        self.__centroid = [0] * len(self.linear_sum);
-        for index_dimension in range(0, len(self.linear_sum)):
-            self.__centroid[index_dimension] = self.linear_sum[index_dimension] / self.number_points;
-        
+        self.__centroid = self.linear_sum / self.number_points;
         return self.__centroid;
     
     
@@ -291,16 +304,8 @@ class cfentry:
         centroid = self.get_centroid();
         
         radius_part_1 = self.square_sum;
-        
-        radius_part_2 = 0.0;
-        radius_part_3 = 0.0;
-        
-        if (type(centroid) == list):
-            radius_part_2 = 2.0 * sum(list_math_multiplication(self.linear_sum, centroid));
-            radius_part_3 = self.number_points * sum(list_math_multiplication(centroid, centroid));
-        else:
-            radius_part_2 = 2.0 * self.linear_sum * centroid;
-            radius_part_3 = self.number_points * centroid * centroid;
+        radius_part_2 = 2.0 * float(self.linear_sum.dot(centroid));
+        radius_part_3 = self.number_points * float(centroid.dot(centroid));
         
         self.__radius = ( (1.0 / self.number_points) * (radius_part_1 - radius_part_2 + radius_part_3) ) ** 0.5;
         return self.__radius;
@@ -318,11 +323,7 @@ class cfentry:
         if (self.__diameter is not None):
             return self.__diameter;
         
-        diameter_part = 0.0;
-        if (type(self.linear_sum) == list):
-            diameter_part = self.square_sum * self.number_points - 2.0 * sum(list_math_multiplication(self.linear_sum, self.linear_sum)) + self.square_sum * self.number_points;
-        else:
-            diameter_part = self.square_sum * self.number_points - 2.0 * self.linear_sum * self.linear_sum + self.square_sum * self.number_points;
+        diameter_part = self.square_sum * self.number_points - 2.0 * float(self.linear_sum.dot(self.linear_sum)) + self.square_sum * self.number_points;
             
         self.__diameter = ( diameter_part / (self.number_points * (self.number_points - 1)) ) ** 0.5;
         return self.__diameter;
@@ -338,7 +339,7 @@ class cfentry:
         
         """
         
-        linear_part_distance = sum(list_math_multiplication(self.linear_sum, entry.linear_sum));
+        linear_part_distance = float(self.linear_sum.dot(entry.linear_sum));
         
         return ( (entry.number_points * self.square_sum - 2.0 * linear_part_distance + self.number_points * entry.square_sum) / (self.number_points * entry.number_points) ) ** 0.5;
     
@@ -353,10 +354,8 @@ class cfentry:
         
         """
         
-        linear_part_first = list_math_addition(self.linear_sum, entry.linear_sum);
-        linear_part_second = linear_part_first;
-        
-        linear_part_distance = sum(list_math_multiplication(linear_part_first, linear_part_second));
+        linear_part = self.linear_sum + entry.linear_sum;
+        linear_part_distance = float(linear_part.dot(linear_part));
         
         general_part_distance = 2.0 * (self.number_points + entry.number_points) * (self.square_sum + entry.square_sum) - 2.0 * linear_part_distance;
         
@@ -372,17 +371,18 @@ class cfentry:
         @return (double) Variance increase distance.
         
         """
-                
-        linear_part_12 = list_math_addition(self.linear_sum, entry.linear_sum);
+        
+        linear_part_12 = self.linear_sum + entry.linear_sum;
+        linear_part_12 = float(linear_part_12.dot(linear_part_12));
         variance_part_first = (self.square_sum + entry.square_sum) - \
-            2.0 * sum(list_math_multiplication(linear_part_12, linear_part_12)) / (self.number_points + entry.number_points) + \
-            (self.number_points + entry.number_points) * sum(list_math_multiplication(linear_part_12, linear_part_12)) / (self.number_points + entry.number_points)**2.0;
+            2.0 * linear_part_12 / (self.number_points + entry.number_points) + \
+            (self.number_points + entry.number_points) * linear_part_12 / (self.number_points + entry.number_points)**2.0;
 
         
-        linear_part_11 = sum(list_math_multiplication(self.linear_sum, self.linear_sum));
+        linear_part_11 = float(self.linear_sum.dot(self.linear_sum));
         variance_part_second = -( self.square_sum - (2.0 * linear_part_11 / self.number_points) + (linear_part_11 / self.number_points) );
         
-        linear_part_22 = sum(list_math_multiplication(entry.linear_sum, entry.linear_sum));
+        linear_part_22 = float(entry.linear_sum.dot(entry.linear_sum));
         variance_part_third = -( entry.square_sum - (2.0 / entry.number_points) * linear_part_22 + entry.number_points * (1.0 / entry.number_points ** 2.0) * linear_part_22 );
 
         return (variance_part_first + variance_part_second + variance_part_third);
@@ -738,6 +738,7 @@ class leaf_node(cfnode):
         for candidate_index in range(0, len(self.entries)):
             candidate_distance = self.entries[candidate_index].get_distance(entry, type_measurement);
             if (candidate_distance < minimum_distance):
+                minimum_distance = candidate_distance;
                 nearest_index = candidate_index;
         
         return nearest_index;
@@ -926,7 +927,7 @@ class cftree:
         
         """
         
-        entry = cfentry(len(cluster), linear_sum(cluster), square_sum(cluster));
+        entry = cfentry.from_points(cluster);
         self.insert(entry);
     
     
@@ -1052,7 +1053,7 @@ class cftree:
         
         node_amount_updation = False;
         
-        min_key = lambda child_node: child_node.get_distance(search_node, self.__type_measurement);
+        min_key = lambda child_node: child_node.feature.get_distance(entry, self.__type_measurement);
         nearest_child_node = min(search_node.successors, key = min_key);
         
         child_node_updation = self.__recursive_insert(entry, nearest_child_node);
@@ -584,3 +584,313 @@ class kdtree:
                 items += self.traverse(child, level + 1)
         
         return items
+
+
+
+class balanced_kdtree:
+    """!
+    @brief Represents static KD-tree that is built at once by median partitioning and stored in flat arrays.
+    @details Points are not copied to tree nodes: each node keeps its split dimension and threshold, references to
+              successors, bounding box of its points and range of the index permutation that contains its points.
+              Leaves are buckets of points that are processed together using numpy, therefore a lot of queries are
+              answered at once. Points cannot be inserted or removed after creation, use 'kdtree' for this purpose.
+              Euclidean distance is used for queries.
+
+    Example:
+    @code
+        from pyclustering.samples.definitions import SIMPLE_SAMPLES
+        from pyclustering.container.kdtree import balanced_kdtree
+        from pyclustering.utils import read_sample
+
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        tree_instance = balanced_kdtree(sample)
+
+        # neighbors of each point in radius 0.5: neighbors of point 'i' are located in 'indexes[offsets[i]:offsets[i + 1]]'
+        offsets, indexes, distances = tree_instance.query_radius(sample, 0.5)
+
+        # three nearest neighbors of two points
+        indexes, distances = tree_instance.query_nearest([[1.12, 4.31], [2.5, 0.6]], 3)
+    @endcode
+
+    """
+
+    ## Maximum amount of values that are stored at once during distance calculation.
+    __distance_block_capacity = 2 ** 20
+
+
+    def __init__(self, data, leaf_size = 16):
+        """!
+        @brief Builds balanced KD-tree from points.
+
+        @param[in] data (array_like): Points that are presented as array of coordinates.
+        @param[in] leaf_size (uint): Maximum amount of points in leaf, nodes with more points are split by median.
+
+        """
+
+        if leaf_size < 1:
+            raise ValueError("Leaf size should be greater than 0 (current value: '%d')." % leaf_size)
+
+        self.__data = numpy.array(data, dtype=numpy.double, ndmin=2)
+        if len(data) == 0:
+            self.__data = numpy.empty((0, 0))
+
+        self.__leaf_size = leaf_size
+
+        self.__permutation = numpy.arange(len(self.__data))
+        self.__split_dimensions = None
+        self.__split_values = None
+        self.__left = None
+        self.__right = None
+        self.__begin = None
+        self.__end = None
+        self.__lower = None
+        self.__upper = None
+
+        self.__build()
+
+
+    def __len__(self):
+        """!
+        @return (uint) Amount of points that are stored in the tree.
+
+        """
+        return len(self.__data)
+
+
+    def get_permutation(self):
+        """!
+        @brief Returns permutation of point indexes where points of each node are located sequentially.
+
+        @return (numpy.array) Indexes of points in order of tree nodes.
+
+        """
+        return self.__permutation
+
+
+    def query_radius(self, points, radius):
+        """!
+        @brief Finds neighbors of each point in area that is covered by the radius.
+        @details Result is presented by three arrays in compressed sparse row format: neighbors of point 'i' are
+                  'indexes[offsets[i]:offsets[i + 1]]' with distances 'distances[offsets[i]:offsets[i + 1]]', neighbors
+                  of each point are ordered by index. Point from the tree is a neighbor of itself if it is queried.
+
+        @param[in] points (array_like): Points whose neighbors should be found.
+        @param[in] radius (double): Distance from points where neighbors are searched (neighbors on the border are included).
+
+        @return (tuple) Arrays (offsets, indexes, distances) with neighbors of each point.
+
+        """
+
+        points = self.__prepare_points(points)
+        square_radius = radius * radius
+
+        query_indexes, neighbor_indexes, neighbor_distances = [], [], []
+
+        stack = []
+        if (len(points) > 0) and (len(self.__data) > 0):
+            stack.append((0, numpy.arange(len(points))))
+
+        while len(stack) > 0:
+            index_node, queries = stack.pop()
+
+            queries = queries[self.__box_distances(index_node, points[queries]) <= square_radius]
+            if len(queries) == 0:
+                continue
+
+            if self.__split_dimensions[index_node] >= 0:
+                stack.append((self.__right[index_node], queries))
+                stack.append((self.__left[index_node], queries))
+                continue
+
+            bucket = self.__permutation[self.__begin[index_node]:self.__end[index_node]]
+            for block_queries, block_distances in self.__bucket_distances(bucket, points, queries):
+                rows, columns = numpy.nonzero(block_distances <= square_radius)
+
+                query_indexes.append(block_queries[rows])
+                neighbor_indexes.append(bucket[columns])
+                neighbor_distances.append(block_distances[rows, columns])
+
+        if len(query_indexes) == 0:
+            return numpy.zeros(len(points) + 1, dtype=numpy.intp), numpy.empty(0, dtype=numpy.intp), numpy.empty(0)
+
+        query_indexes = numpy.concatenate(query_indexes)
+        neighbor_indexes = numpy.concatenate(neighbor_indexes)
+        neighbor_distances = numpy.concatenate(neighbor_distances)
+
+        order = numpy.lexsort((neighbor_indexes, query_indexes))
+
+        offsets = numpy.zeros(len(points) + 1, dtype=numpy.intp)
+        numpy.cumsum(numpy.bincount(query_indexes, minlength=len(points)), out=offsets[1:])
+
+        return offsets, neighbor_indexes[order], numpy.sqrt(neighbor_distances[order])
+
+
+    def query_nearest(self, points, amount):
+        """!
+        @brief Finds specified amount of the nearest neighbors of each point.
+        @details Neighbors are ordered by distance, neighbors with the same distance are ordered by index. Point
+                  from the tree is a neighbor of itself if it is queried.
+
+        @param[in] points (array_like): Points whose neighbors should be found.
+        @param[in] amount (uint): Amount of neighbors that should be found for each point.
+
+        @return (tuple) Arrays (indexes, distances) of size [amount of points x amount] with neighbors of each point.
+
+        """
+
+        if (amount < 1) or (amount > len(self.__data)):
+            raise ValueError("Amount of neighbors '%d' should be in range [1, %d]." % (amount, len(self.__data)))
+
+        points = self.__prepare_points(points)
+
+        indexes = numpy.empty((len(points), amount), dtype=numpy.intp)
+        distances = numpy.empty((len(points), amount))
+
+        for index_point in range(len(points)):
+            point = points[index_point:index_point + 1]
+
+            best_indexes = numpy.empty(0, dtype=numpy.intp)
+            best_distances = numpy.empty(0)
+
+            stack = [(0, 0.0)]
+            while len(stack) > 0:
+                index_node, box_distance = stack.pop()
+                if (len(best_distances) == amount) and (box_distance > best_distances[-1]):
+                    continue
+
+                if self.__split_dimensions[index_node] >= 0:
+                    successors = [self.__left[index_node], self.__right[index_node]]
+                    successor_distances = [self.__box_distances(index_successor, point)[0] for index_successor in successors]
+
+                    # the nearest successor is processed first
+                    if successor_distances[0] < successor_distances[1]:
+                        successors.reverse()
+                        successor_distances.reverse()
+
+                    stack += zip(successors, successor_distances)
+                    continue
+
+                bucket = self.__permutation[self.__begin[index_node]:self.__end[index_node]]
+                candidate_distances = numpy.sum(numpy.square(self.__data[bucket] - point), axis=1)
+
+                best_indexes = numpy.concatenate((best_indexes, bucket))
+                best_distances = numpy.concatenate((best_distances, candidate_distances))
+
+                order = numpy.lexsort((best_indexes, best_distances))[:amount]
+                best_indexes, best_distances = best_indexes[order], best_distances[order]
+
+            indexes[index_point] = best_indexes
+            distances[index_point] = best_distances
+
+        return indexes, numpy.sqrt(distances)
+
+
+    def __prepare_points(self, points):
+        """!
+        @brief Converts query points to array and checks their dimension.
+
+        @param[in] points (array_like): Query points.
+
+        @return (numpy.array) Query points as two-dimensional array.
+
+        """
+
+        if len(points) == 0:
+            return numpy.empty((0, self.__data.shape[1]))
+
+        points = numpy.array(points, dtype=numpy.double, ndmin=2)
+        if (len(points) > 0) and (len(self.__data) > 0) and (points.shape[1] != self.__data.shape[1]):
+            raise ValueError("Dimension of points '%d' is not equal to dimension of the tree '%d'." % (points.shape[1], self.__data.shape[1]))
+
+        return points
+
+
+    def __box_distances(self, index_node, points):
+        """!
+        @brief Calculates square Euclidean distances from points to the bounding box of the node.
+
+        @param[in] index_node (uint): Index of the node.
+        @param[in] points (numpy.array): Points whose distances should be calculated.
+
+        @return (numpy.array) Square distance from each point to the bounding box (zero for points inside the box).
+
+        """
+
+        gaps = numpy.maximum(self.__lower[index_node] - points, 0.0) + numpy.maximum(points - self.__upper[index_node], 0.0)
+        return numpy.sum(numpy.square(gaps), axis=1)
+
+
+    def __bucket_distances(self, bucket, points, queries):
+        """!
+        @brief Calculates square Euclidean distances between query points and points of the leaf by blocks.
+
+        @param[in] bucket (numpy.array): Indexes of points of the leaf.
+        @param[in] points (numpy.array): All query points.
+        @param[in] queries (numpy.array): Indexes of query points that should be processed.
+
+        @return (generator) Pairs (indexes of queries of the block, matrix of square distances of the block).
+
+        """
+
+        bucket_points = self.__data[bucket]
+        block_size = max(1, balanced_kdtree.__distance_block_capacity // (len(bucket) * bucket_points.shape[1]))
+
+        for index_begin in range(0, len(queries), block_size):
+            block_queries = queries[index_begin:index_begin + block_size]
+            differences = points[block_queries][:, numpy.newaxis, :] - bucket_points[numpy.newaxis, :, :]
+            yield block_queries, numpy.sum(numpy.square(differences), axis=2)
+
+
+    def __build(self):
+        """!
+        @brief Builds the tree: nodes are split by median of dimension with the largest spread until they fit to leaf.
+
+        """
+
+        split_dimensions, split_values, left, right, begin, end, lower, upper = [], [], [], [], [], [], [], []
+
+        def create_node(index_begin, index_end):
+            node_points = self.__data[self.__permutation[index_begin:index_end]]
+
+            split_dimensions.append(-1)
+            split_values.append(0.0)
+            left.append(-1)
+            right.append(-1)
+            begin.append(index_begin)
+            end.append(index_end)
+            lower.append(numpy.min(node_points, axis=0))
+            upper.append(numpy.max(node_points, axis=0))
+            return len(begin) - 1
+
+        if len(self.__data) > 0:
+            stack = [create_node(0, len(self.__data))]
+
+            while len(stack) > 0:
+                index_node = stack.pop()
+                index_begin, index_end = begin[index_node], end[index_node]
+
+                spread = upper[index_node] - lower[index_node]
+                dimension = int(numpy.argmax(spread))
+                if (index_end - index_begin <= self.__leaf_size) or (spread[dimension] == 0.0):
+                    continue    # leaf - too small or all points are the same
+
+                segment = self.__permutation[index_begin:index_end]
+                median = (index_end - index_begin) // 2
+
+                self.__permutation[index_begin:index_end] = segment[numpy.argpartition(self.__data[segment, dimension], median)]
+
+                split_dimensions[index_node] = dimension
+                split_values[index_node] = self.__data[self.__permutation[index_begin + median], dimension]
+                left[index_node] = create_node(index_begin, index_begin + median)
+                right[index_node] = create_node(index_begin + median, index_end)
+
+                stack += [left[index_node], right[index_node]]
+
+        self.__split_dimensions = numpy.array(split_dimensions, dtype=numpy.intp)
+        self.__split_values = numpy.array(split_values)
+        self.__left = numpy.array(left, dtype=numpy.intp)
+        self.__right = numpy.array(right, dtype=numpy.intp)
+        self.__begin = numpy.array(begin, dtype=numpy.intp)
+        self.__end = numpy.array(end, dtype=numpy.intp)
+        self.__lower = numpy.array(lower)
+        self.__upper = numpy.array(upper)
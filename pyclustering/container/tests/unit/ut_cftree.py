@@ -425,5 +425,29 @@ class CftreeUnitTest(unittest.TestCase):
         self.templateLeafNodeAndEntriesAmount(16, 4);
 
 
+    def testCfEntryFromPoints(self):
+        cluster = [ [0.1, 0.1], [0.2, 0.2], [0.5, 0.5], [0.4, 0.4], [0.6, 0.6] ];
+        
+        entry = cfentry.from_points(cluster);
+        assert cfentry(len(cluster), linear_sum(cluster), square_sum(cluster)) == entry;
+        assert isinstance(entry.linear_sum, numpy.ndarray);
+        assert isinstance(entry.get_centroid(), numpy.ndarray);
+
+    def testCfEntryFromPointsOneDimension(self):
+        entry = cfentry.from_points([ 0.1, 0.2, 0.5, 0.4, 0.6 ]);
+        assert cfentry(5, [1.8], 0.82) == entry;
+
+    def testCfTreeNearestEntryAbsorption(self):
+        tree = cftree(5, 5, 0.5);
+        
+        for point in [ [0.0, 0.0], [10.0, 10.0], [20.0, 20.0] ]:
+            tree.insert_cluster([ point ]);
+        
+        tree.insert_cluster([ [10.1, 10.1] ]);
+        
+        assert 3 == tree.amount_entries;
+        assert cfentry.from_points([ [10.0, 10.0], [10.1, 10.1] ]) in tree.leafes[0].entries;
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -30,7 +30,7 @@ import math
 
 import numpy
 
-from pyclustering.container.kdtree import kdtree, kdtree_text_visualizer
+from pyclustering.container.kdtree import kdtree, kdtree_text_visualizer, balanced_kdtree
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
@@ -415,5 +415,90 @@ class KDTreeUnitTest(unittest.TestCase):
         self.templateTheSameDataSearchAndRemove(numpy.array([ [2] ]), [ None ]);
 
 
+    def templateBalancedRadiusSearch(self, points, queries, radius, leaf_size):
+        tree = balanced_kdtree(points, leaf_size)
+        offsets, indexes, distances = tree.query_radius(queries, radius)
+
+        points = numpy.array(points, dtype=float)
+        assert len(offsets) == len(queries) + 1
+
+        for index_query in range(len(queries)):
+            expected_distances = numpy.sqrt(numpy.sum(numpy.square(points - numpy.array(queries[index_query])), axis=1))
+            expected_indexes = numpy.nonzero(expected_distances <= radius)[0]
+
+            actual_indexes = indexes[offsets[index_query]:offsets[index_query + 1]]
+            actual_distances = distances[offsets[index_query]:offsets[index_query + 1]]
+
+            assert expected_indexes.tolist() == actual_indexes.tolist()
+            assert numpy.allclose(expected_distances[expected_indexes], actual_distances)
+
+    def testBalancedRadiusSearchSimple3(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        self.templateBalancedRadiusSearch(sample, sample, 0.5, 4)
+
+    def testBalancedRadiusSearchOneLeaf(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        self.templateBalancedRadiusSearch(sample, sample, 0.7, len(sample))
+
+    def testBalancedRadiusSearchLsun(self):
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        self.templateBalancedRadiusSearch(sample, [[0.5, 0.5], [1.0, 3.0], [10.0, 10.0]], 0.3, 2)
+
+    def testBalancedRadiusSearchOneDimensional(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE7)
+        self.templateBalancedRadiusSearch(sample, sample, 1.0, 1)
+
+    def testBalancedRadiusSearchThreeDimensional(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE11)
+        self.templateBalancedRadiusSearch(sample, sample, 1.5, 3)
+
+    def testBalancedRadiusSearchTheSameData(self):
+        self.templateBalancedRadiusSearch([[1.1, 2.1]] * 20 + [[3.0, 3.0]], [[1.1, 2.1], [3.0, 3.0]], 0.0, 2)
+
+    def testBalancedRadiusSearchNoNeighbors(self):
+        self.templateBalancedRadiusSearch([[0.0, 0.0], [1.0, 1.0]], [[5.0, 5.0]], 1.0, 1)
+
+    def testBalancedEmptyTree(self):
+        tree = balanced_kdtree([])
+        offsets, indexes, distances = tree.query_radius([[1.0, 1.0]], 1.0)
+
+        assert len(tree) == 0
+        assert offsets.tolist() == [0, 0]
+        assert len(indexes) == 0 and len(distances) == 0
+
+
+    def templateBalancedNearestSearch(self, points, queries, amount, leaf_size):
+        tree = balanced_kdtree(points, leaf_size)
+        indexes, distances = tree.query_nearest(queries, amount)
+
+        points = numpy.array(points, dtype=float)
+        for index_query in range(len(queries)):
+            expected_distances = numpy.sqrt(numpy.sum(numpy.square(points - numpy.array(queries[index_query])), axis=1))
+            expected_indexes = numpy.lexsort((numpy.arange(len(points)), expected_distances))[:amount]
+
+            assert expected_indexes.tolist() == indexes[index_query].tolist()
+            assert numpy.allclose(expected_distances[expected_indexes], distances[index_query])
+
+    def testBalancedNearestSearchSimple3(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        self.templateBalancedNearestSearch(sample, sample, 5, 4)
+
+    def testBalancedNearestSearchAllPoints(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1)
+        self.templateBalancedNearestSearch(sample, [[0.0, 0.0], [5.0, 5.0]], len(sample), 2)
+
+    def testBalancedNearestSearchTheSameData(self):
+        self.templateBalancedNearestSearch([[2.0]] * 10 + [[3.0]] * 10, [[2.0], [2.6]], 12, 3)
+
+    def testBalancedNearestSearchWrongAmount(self):
+        tree = balanced_kdtree([[1.0], [2.0]])
+        self.assertRaises(ValueError, tree.query_nearest, [[1.0]], 3)
+        self.assertRaises(ValueError, tree.query_nearest, [[1.0]], 0)
+
+    def testBalancedWrongDimension(self):
+        tree = balanced_kdtree([[1.0, 1.0], [2.0, 2.0]])
+        self.assertRaises(ValueError, tree.query_radius, [[1.0]], 1.0)
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
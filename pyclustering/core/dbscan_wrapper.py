@@ -39,10 +39,10 @@ def dbscan(sample, eps, min_neighbors, data_type):
     ccore.dbscan_algorithm.restype = POINTER(pyclustering_package);
     package = ccore.dbscan_algorithm(pointer_data, c_double(eps), c_size_t(min_neighbors), c_data_type);
 
-    list_of_clusters = package_extractor(package).extract();
+    list_of_clusters = package_extractor(package, numpy_output=True).extract();
     ccore.free_pyclustering_package(package);
     
     noise = list_of_clusters[len(list_of_clusters) - 1];
-    list_of_clusters.remove(noise);
+    list_of_clusters = list_of_clusters[:len(list_of_clusters) - 1];
 
     return list_of_clusters, noise;
\ No newline at end of file
@@ -39,7 +39,7 @@ def kmeans(sample, centers, tolerance, observe, metric_pointer):
     ccore.kmeans_algorithm.restype = POINTER(pyclustering_package)
     package = ccore.kmeans_algorithm(pointer_data, pointer_centers, c_double(tolerance), c_bool(observe), metric_pointer)
     
-    result = package_extractor(package).extract()
+    result = package_extractor(package, numpy_output=True).extract()
     ccore.free_pyclustering_package(package)
     
     return result
\ No newline at end of file
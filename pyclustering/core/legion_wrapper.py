@@ -23,6 +23,8 @@
 
 """
 
+import numpy;
+
 from pyclustering.core.wrapper import *;
 from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor, package_builder;
 
@@ -143,4 +145,47 @@ def legion_dynamic_get_size(legion_dynamic_pointer):
     ccore = ccore_library.get();
     ccore.legion_dynamic_get_size.restype = c_size_t;
     return ccore.legion_dynamic_get_size(legion_dynamic_pointer);
-    
\ No newline at end of file
+    
+
+
+def legion_dynamic_get_oscillators(legion_dynamic_pointer):
+    ccore = ccore_library.get();
+    ccore.legion_dynamic_get_oscillators.restype = c_size_t;
+    return ccore.legion_dynamic_get_oscillators(legion_dynamic_pointer);
+
+
+def legion_dynamic_get_output_window(legion_dynamic_pointer, iterations, indexes):
+    ccore = ccore_library.get();
+    
+    if indexes is None:
+        output = numpy.empty((len(iterations), legion_dynamic_get_oscillators(legion_dynamic_pointer)), dtype=numpy.float64);
+        c_indexes, amount_indexes = None, 0;
+    else:
+        indexes = numpy.ascontiguousarray(indexes, dtype=numpy.uintp);
+        output = numpy.empty((len(iterations), len(indexes)), dtype=numpy.float64);
+        c_indexes, amount_indexes = indexes.ctypes.data_as(POINTER(c_size_t)), len(indexes);
+    
+    if len(iterations) > 0:
+        ccore.legion_dynamic_get_output_window(legion_dynamic_pointer, c_size_t(iterations[0]), c_size_t(iterations[-1] + 1), c_size_t(iterations.step), c_indexes, c_size_t(amount_indexes), output.ctypes.data_as(POINTER(c_double)));
+    
+    return output;
+
+
+def legion_dynamic_get_inhibitory_output_window(legion_dynamic_pointer, iterations):
+    ccore = ccore_library.get();
+    
+    output = numpy.empty(len(iterations), dtype=numpy.float64);
+    if len(iterations) > 0:
+        ccore.legion_dynamic_get_inhibitory_output_window(legion_dynamic_pointer, c_size_t(iterations[0]), c_size_t(iterations[-1] + 1), c_size_t(iterations.step), output.ctypes.data_as(POINTER(c_double)));
+    
+    return output;
+
+
+def legion_dynamic_get_time_window(legion_dynamic_pointer, iterations):
+    ccore = ccore_library.get();
+    
+    output = numpy.empty(len(iterations), dtype=numpy.float64);
+    if len(iterations) > 0:
+        ccore.legion_dynamic_get_time_window(legion_dynamic_pointer, c_size_t(iterations[0]), c_size_t(iterations[-1] + 1), c_size_t(iterations.step), output.ctypes.data_as(POINTER(c_double)));
+    
+    return output;
\ No newline at end of file
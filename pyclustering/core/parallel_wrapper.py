@@ -0,0 +1,99 @@
+"""!
+
+@brief CCORE Wrapper for control of parallel processing in the library.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2018
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+
+"""
+
+
+from pyclustering.core.wrapper import ccore_library
+
+from ctypes import c_size_t
+
+
+## Environment variable that defines amount of threads of the library when it is loaded.
+ENVIRONMENT_THREADS = "PYCLUSTERING_CCORE_THREADS"
+
+## Environment variable that defines grain size of parallel loops of the library when it is loaded.
+ENVIRONMENT_GRAIN_SIZE = "PYCLUSTERING_CCORE_GRAIN_SIZE"
+
+
+def set_amount_threads(amount_threads):
+    """!
+    @brief Sets amount of threads that are used by parallel loops of CCORE library in the current process (including calling thread).
+    @details Threads are created once and they are reused by all algorithms, value 1 means that loops are executed
+              sequentially. Default amount is defined by environment variable 'PYCLUSTERING_CCORE_THREADS' or it is
+              equal to amount of hardware threads if the variable is not specified.
+
+    @param[in] amount_threads (uint): Amount of threads, if it is 0 then default amount is used.
+
+    """
+
+    if amount_threads < 0:
+        raise ValueError("Amount of threads should be non-negative (current value: '%d')." % amount_threads)
+
+    ccore = ccore_library.get()
+    ccore.parallel_set_amount_threads(c_size_t(amount_threads))
+
+
+def get_amount_threads():
+    """!
+    @brief Returns amount of threads that are used by parallel loops of CCORE library in the current process (including calling thread).
+
+    @return (uint) Amount of threads.
+
+    """
+
+    ccore = ccore_library.get()
+    ccore.parallel_get_amount_threads.restype = c_size_t
+    return ccore.parallel_get_amount_threads()
+
+
+def set_grain_size(grain_size):
+    """!
+    @brief Sets amount of iterations of parallel loop that is taken by thread at once, threads that finish their
+            iterations steal iterations of other threads.
+    @details Initial value is defined by environment variable 'PYCLUSTERING_CCORE_GRAIN_SIZE'.
+
+    @param[in] grain_size (uint): Amount of iterations, if it is 0 then it is chosen for each loop in line with its
+                length and amount of threads.
+
+    """
+
+    if grain_size < 0:
+        raise ValueError("Grain size should be non-negative (current value: '%d')." % grain_size)
+
+    ccore = ccore_library.get()
+    ccore.parallel_set_grain_size(c_size_t(grain_size))
+
+
+def get_grain_size():
+    """!
+    @brief Returns amount of iterations of parallel loop that is taken by thread at once.
+
+    @return (uint) Grain size, 0 means that grain size is chosen automatically for each loop.
+
+    """
+
+    ccore = ccore_library.get()
+    ccore.parallel_get_grain_size.restype = c_size_t
+    return ccore.parallel_get_grain_size()
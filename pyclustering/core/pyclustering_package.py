@@ -27,7 +27,7 @@
 
 from ctypes import *
 
-import collections
+import collections.abc
 import numpy
 
 
@@ -50,6 +50,27 @@ class pyclustering_package(Structure):
 
 
 
+class pyclustering_matrix(Structure):
+    """!
+    @brief pyclustering_matrix description in memory.
+    @details Represents following C++ structure that describes row-major matrix of doubles:
+    
+            typedef struct pyclustering_matrix {
+                std::size_t      rows;
+                std::size_t      columns;
+                double *         data;
+            }
+    
+    Matrix does not own its buffer, it is a view over memory of C-contiguous numpy array.
+    
+    """
+    
+    _fields_ = [ ("rows", c_size_t),
+                 ("columns", c_size_t),
+                 ("data", POINTER(c_double)) ]
+
+
+
 class pyclustering_type_data:
     """!
     @brief Contains constants that defines type of package.
@@ -65,6 +86,7 @@ class pyclustering_type_data:
     PYCLUSTERING_TYPE_LIST              = 0x06
     PYCLUSTERING_TYPE_SIZE_T            = 0x07
     PYCLUSTERING_TYPE_UNDEFINED         = 0x08
+    PYCLUSTERING_TYPE_DOUBLE_MATRIX     = 0x09
 
     __CTYPE_PYCLUSTERING_MAP = { 
         c_int                           : PYCLUSTERING_TYPE_INT,
@@ -75,7 +97,8 @@ class pyclustering_type_data:
         c_ulong                         : PYCLUSTERING_TYPE_UNSIGNED_LONG,
         POINTER(pyclustering_package)   : PYCLUSTERING_TYPE_LIST,
         c_size_t                        : PYCLUSTERING_TYPE_SIZE_T,
-        None                            : PYCLUSTERING_TYPE_UNDEFINED
+        None                            : PYCLUSTERING_TYPE_UNDEFINED,
+        POINTER(pyclustering_matrix)    : PYCLUSTERING_TYPE_DOUBLE_MATRIX
     }
 
     __PYCLUSTERING_CTYPE_MAP = {
@@ -87,7 +110,8 @@ class pyclustering_type_data:
         PYCLUSTERING_TYPE_UNSIGNED_LONG   : c_ulong,
         PYCLUSTERING_TYPE_LIST            : POINTER(pyclustering_package),
         PYCLUSTERING_TYPE_SIZE_T          : c_size_t,
-        PYCLUSTERING_TYPE_UNDEFINED       : None
+        PYCLUSTERING_TYPE_UNDEFINED       : None,
+        PYCLUSTERING_TYPE_DOUBLE_MATRIX   : POINTER(pyclustering_matrix)
     }
 
     @staticmethod
@@ -110,13 +134,17 @@ class pyclustering_type_data:
 class package_builder:
     """!
     @brief Package builder provides service to create 'pyclustering_package' from data that is stored in 'list' container.
+    @details C-contiguous numpy arrays are packed without copying: one-dimensional array is passed as a plain array
+              package and two-dimensional array of doubles is passed as a row-major matrix package (pointer to the
+              first element and shape). Arrays with other layout or type are converted once by numpy. Rectangular
+              list of lists that should be packed as doubles is converted to two-dimensional array before packing.
 
     """
     def __init__(self, dataset, c_data_type):
         """!
         @brief Initialize package builder object by dataset.
         
-        @param[in] dataset (list): Data that should be packed in 'pyclustering_package'.
+        @param[in] dataset (list|numpy.ndarray): Data that should be packed in 'pyclustering_package'.
         @param[in] c_data_type (ctype.type): If specified than specified data type is used for data storing in package. 
         
         """
@@ -127,6 +155,8 @@ class package_builder:
     def create(self):
         """!
         @brief Performs packing procedure of the data to the package.
+        @details Package that is built over numpy array refers to its memory, therefore the array should not be
+                  changed while the package is used.
         
         @return (pointer) ctype-pointer to pyclustering package.
         
@@ -135,7 +165,7 @@ class package_builder:
 
 
     def __is_container_type(self, value):
-        return isinstance(value, collections.Iterable)
+        return isinstance(value, collections.abc.Iterable)
 
 
     def __get_type(self, pyclustering_data_type):
@@ -146,11 +176,14 @@ class package_builder:
 
 
     def __create_package(self, dataset):
+        if isinstance(dataset, numpy.ndarray):
+            return self.__create_package_numpy(numpy.asarray(dataset))
+
+        dataset_matrix = self.__convert_to_double_matrix(dataset)
+        if dataset_matrix is not None:
+            return self.__create_package_numpy(dataset_matrix)
+
         dataset_package = pyclustering_package()
-        
-        if isinstance(dataset, numpy.matrix):
-            return self.__create_package_numpy_matrix(dataset_package, dataset)
-        
         dataset_package.size = len(dataset)
     
         if len(dataset) == 0:
@@ -165,6 +198,21 @@ class package_builder:
         return pointer(dataset_package)
 
 
+    def __convert_to_double_matrix(self, dataset):
+        if (self.__c_data_type is not c_double) or (len(dataset) == 0) or (not self.__is_container_type(dataset[0])):
+            return None
+
+        try:
+            dataset_matrix = numpy.array(dataset, dtype=numpy.float64)
+        except (ValueError, TypeError):
+            return None     # rows have different length - it is packed as a list of packages.
+
+        if dataset_matrix.ndim != 2:
+            return None
+
+        return dataset_matrix
+
+
     def __fill_dataset_type(self, dataset_package, dataset):
         if self.__is_container_type(dataset[0]):
             dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
@@ -209,26 +257,64 @@ class package_builder:
             dataset_package.data = cast(array_object, POINTER(c_void_p))
 
 
-    def __create_package_numpy_matrix(self, dataset_package, dataset):
-        (rows, cols) = dataset.shape
-        
-        dataset_package.size = rows
-        dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
-        
-        package_data = (POINTER(pyclustering_package) * rows)()
-        for row_index in range(rows):
-            array_package = pyclustering_package()
-            array_package.size = cols
-            array_package.type = pyclustering_type_data.get_pyclustering_type(self.__c_data_type)
-            
-            array_object = (self.__c_data_type * cols)()
-            for col_index in range(cols):
-                array_object[col_index] = self.__c_data_type(dataset[row_index, col_index])
-        
-            array_package.data = cast(array_object, POINTER(c_void_p))
-            package_data[row_index] = pointer(array_package)
-            
-        dataset_package.data = cast(package_data, POINTER(c_void_p))
+    def __get_numpy_ctype(self, dataset):
+        if self.__c_data_type is not None:
+            return self.__c_data_type
+
+        if numpy.issubdtype(dataset.dtype, numpy.integer):
+            return pyclustering_type_data.get_ctype(pyclustering_type_data.PYCLUSTERING_TYPE_LONG)
+
+        return pyclustering_type_data.get_ctype(pyclustering_type_data.PYCLUSTERING_TYPE_DOUBLE)
+
+
+    def __get_numpy_buffer(self, dataset, c_data_type):
+        buffer = numpy.ascontiguousarray(dataset, dtype=numpy.dtype(c_data_type))
+        if not buffer.flags.writeable:
+            buffer = buffer.copy()      # ctypes array can be created only over writable memory.
+
+        return buffer
+
+
+    def __create_package_numpy(self, dataset):
+        dataset_package = pyclustering_package()
+
+        if (dataset.ndim == 0) or (len(dataset) == 0):
+            dataset_package.size = dataset.size
+            dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_UNDEFINED
+            dataset_package.data = None
+
+            return pointer(dataset_package)
+
+        c_data_type = self.__get_numpy_ctype(dataset)
+        dataset_package.size = len(dataset)
+
+        if dataset.ndim == 1:
+            buffer = self.__get_numpy_buffer(dataset, c_data_type)
+            array_object = (c_data_type * len(buffer)).from_buffer(buffer)
+
+            dataset_package.type = pyclustering_type_data.get_pyclustering_type(c_data_type)
+            dataset_package.data = cast(array_object, POINTER(c_void_p))
+
+        elif (dataset.ndim == 2) and (c_data_type is c_double):
+            buffer = self.__get_numpy_buffer(dataset, c_data_type)
+
+            matrix = pyclustering_matrix()
+            (matrix.rows, matrix.columns) = buffer.shape
+            if buffer.size > 0:
+                matrix.data = cast((c_double * buffer.size).from_buffer(buffer), POINTER(c_double))
+
+            dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_DOUBLE_MATRIX
+            dataset_package.data = cast(pointer(matrix), POINTER(c_void_p))
+
+        else:
+            dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
+
+            package_data = (POINTER(pyclustering_package) * len(dataset))()
+            for index in range(len(dataset)):
+                package_data[index] = self.__create_package_numpy(dataset[index])
+
+            dataset_package.data = cast(package_data, POINTER(c_void_p))
+
         return pointer(dataset_package)
 
 
@@ -238,21 +324,25 @@ class package_extractor:
     @brief Package extractor provides servies to unpack pyclustering package.
     
     """
-    def __init__(self, package_pointer):
+    def __init__(self, package_pointer, numpy_output=False):
         """!
         @brief Initialize package extractor object by ctype-pointer to 'pyclustering_package'.
         
         @param[in] package_pointer (pointer): ctype-pointer to 'pyclustering_package' that should be used for unpacking.
+        @param[in] numpy_output (bool): If 'True' then arrays of the package are returned as numpy arrays that are
+                    built over the package memory and copied (to stay valid after package deallocation), nested
+                    arrays with the same shape are stacked into multi-dimensional numpy array.
         
         """
         self.__package_pointer = package_pointer
+        self.__numpy_output = numpy_output
 
 
     def extract(self):
         """!
         @brief Performs unpacking procedure of the pyclustering package to the data.
         
-        @return (list) Extracted data from the pyclustering package.
+        @return (list|numpy.ndarray) Extracted data from the pyclustering package.
         
         """
         return self.__extract_data(self.__package_pointer)
@@ -260,31 +350,77 @@ class package_extractor:
 
     def __extract_data(self, ccore_package_pointer):
         if ccore_package_pointer == 0:
-            return []
+            return self.__create_empty()
         
         pointer_package = cast(ccore_package_pointer, POINTER(pyclustering_package))
         return self.__unpack_pointer_data(pointer_package)
-    
-    
-    def __unpack_data(self, pointer_package, pointer_data, type_package):
+
+
+    def __create_empty(self, c_data_type=None):
+        if self.__numpy_output is True:
+            return numpy.empty(0, dtype=(c_data_type or c_double))
+
+        return []
+
+
+    def __unpack_list(self, pointer_package, pointer_data):
         result = []
         
         for index in range(0, pointer_package[0].size):
-            if type_package == pyclustering_type_data.PYCLUSTERING_TYPE_LIST:
-                pointer_package = cast(pointer_data[index], (POINTER(pyclustering_package)))
-                result.append(self.__extract_data(pointer_package))
-            
-            else:
-                result.append(pointer_data[index])
+            pointer_package = cast(pointer_data[index], (POINTER(pyclustering_package)))
+            result.append(self.__extract_data(pointer_package))
+
+        if (self.__numpy_output is True) and self.__is_same_shape(result):
+            return numpy.array(result)
         
         return result
 
 
+    def __is_same_shape(self, arrays):
+        if not all(isinstance(array, numpy.ndarray) for array in arrays):
+            return False
+
+        return len(set(array.shape for array in arrays)) == 1
+
+
+    def __unpack_array(self, pointer_package, pointer_data):
+        size = pointer_package[0].size
+
+        if self.__numpy_output is True:
+            return numpy.ctypeslib.as_array(pointer_data, shape=(size,)).copy()
+
+        return pointer_data[:size]
+
+
+    def __unpack_matrix(self, pointer_package):
+        matrix = cast(pointer_package[0].data, POINTER(pyclustering_matrix))[0]
+
+        if matrix.rows * matrix.columns == 0:
+            result = numpy.empty((matrix.rows, matrix.columns))
+        else:
+            result = numpy.ctypeslib.as_array(matrix.data, shape=(matrix.rows, matrix.columns))
+
+        if self.__numpy_output is True:
+            return result.copy()
+
+        return result.tolist()
+
+
     def __unpack_pointer_data(self, pointer_package):
         type_package = pointer_package[0].type
         
         if pointer_package[0].size == 0:
-            return []
+            c_data_type = pyclustering_type_data.get_ctype(type_package)
+            if type_package in (pyclustering_type_data.PYCLUSTERING_TYPE_LIST, pyclustering_type_data.PYCLUSTERING_TYPE_DOUBLE_MATRIX):
+                c_data_type = None
+
+            return self.__create_empty(c_data_type)
+
+        if type_package == pyclustering_type_data.PYCLUSTERING_TYPE_DOUBLE_MATRIX:
+            return self.__unpack_matrix(pointer_package)
         
         pointer_data = cast(pointer_package[0].data, POINTER(pyclustering_type_data.get_ctype(type_package)))
-        return self.__unpack_data(pointer_package, pointer_data, type_package)
+        if type_package == pyclustering_type_data.PYCLUSTERING_TYPE_LIST:
+            return self.__unpack_list(pointer_package, pointer_data)
+
+        return self.__unpack_array(pointer_package, pointer_data)
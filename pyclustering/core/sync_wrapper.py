@@ -24,6 +24,8 @@
 """
 
 
+import numpy
+
 from pyclustering.core.wrapper import *
 from pyclustering.core.pyclustering_package import pyclustering_package, package_extractor
 
@@ -88,7 +90,7 @@ def sync_connectivity_matrix(pointer_network):
 
 def sync_dynamic_get_size(pointer_dynamic):
     ccore = ccore_library.get()
-    ccore.sync_dynamic_get_time.restype = c_size_t
+    ccore.sync_dynamic_get_size.restype = c_size_t
     return ccore.sync_dynamic_get_size(pointer_dynamic)
 
 
@@ -174,3 +176,36 @@ def sync_dynamic_calculate_local_order(pointer_dynamic, pointer_network, start_i
     ccore.free_pyclustering_package(package)
     
     return result
+
+
+def sync_dynamic_get_oscillators(pointer_dynamic):
+    ccore = ccore_library.get()
+    ccore.sync_dynamic_get_oscillators.restype = c_size_t
+    return ccore.sync_dynamic_get_oscillators(pointer_dynamic)
+
+
+def sync_dynamic_get_output_window(pointer_dynamic, iterations, indexes):
+    ccore = ccore_library.get()
+    
+    if indexes is None:
+        output = numpy.empty((len(iterations), sync_dynamic_get_oscillators(pointer_dynamic)), dtype=numpy.float64)
+        c_indexes, amount_indexes = None, 0
+    else:
+        indexes = numpy.ascontiguousarray(indexes, dtype=numpy.uintp)
+        output = numpy.empty((len(iterations), len(indexes)), dtype=numpy.float64)
+        c_indexes, amount_indexes = indexes.ctypes.data_as(POINTER(c_size_t)), len(indexes)
+    
+    if len(iterations) > 0:
+        ccore.sync_dynamic_get_output_window(pointer_dynamic, c_size_t(iterations[0]), c_size_t(iterations[-1] + 1), c_size_t(iterations.step), c_indexes, c_size_t(amount_indexes), output.ctypes.data_as(POINTER(c_double)))
+    
+    return output
+
+
+def sync_dynamic_get_time_window(pointer_dynamic, iterations):
+    ccore = ccore_library.get()
+    
+    output = numpy.empty(len(iterations), dtype=numpy.float64)
+    if len(iterations) > 0:
+        ccore.sync_dynamic_get_time_window(pointer_dynamic, c_size_t(iterations[0]), c_size_t(iterations[-1] + 1), c_size_t(iterations.step), output.ctypes.data_as(POINTER(c_double)))
+    
+    return output
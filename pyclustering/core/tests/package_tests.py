@@ -39,7 +39,7 @@ class Test(unittest.TestCase):
         unpacked_package = package_extractor(package_pointer).extract();
 
         packing_data = dataset;
-        if (isinstance(packing_data, numpy.matrix)):
+        if (isinstance(packing_data, numpy.ndarray)):
             packing_data = dataset.tolist();
 
         assert self.compare_containers(packing_data, unpacked_package);
@@ -141,6 +141,47 @@ class Test(unittest.TestCase):
     def testNumpyMatrixThreeColumns(self):
         self.templatePackUnpack(numpy.matrix([[1.1, 2.2, 3.3], [2.2, 3.3, 4.4], [3.3, 4.4, 5.5]]), c_double);
 
+    def testNumpyArrayDouble(self):
+        self.templatePackUnpack(numpy.array([1.1, -2.2, 3.3]), c_double);
+
+    def testNumpyArraySizeT(self):
+        self.templatePackUnpack(numpy.array([1, 2, 3, 4]), c_size_t);
+
+    def testNumpyArrayTwoDimensions(self):
+        self.templatePackUnpack(numpy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), c_double);
+
+    def testNumpyArrayNonContiguous(self):
+        self.templatePackUnpack(numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]).T, c_double);
+
+    def testNumpyArrayEmpty(self):
+        self.templatePackUnpack(numpy.empty((0, 2)), c_double);
+
+    def testListOfListDoubleMatrix(self):
+        self.templatePackUnpack([ [1.1, 5.4], [1.3, 2.0], [1.4, -9.4] ], c_double);
+
+    def testNumpyArrayPackageRefersToArray(self):
+        dataset = numpy.array([[1.0, 2.0], [3.0, 4.0]]);
+        package_pointer = package_builder(dataset, c_double).create();
+
+        dataset[1, 1] = 10.0;
+        assert [[1.0, 2.0], [3.0, 10.0]] == package_extractor(package_pointer).extract();
+
+    def testNumpyOutputMatrix(self):
+        dataset = numpy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]);
+        package_pointer = package_builder(dataset, c_double).create();
+        unpacked_package = package_extractor(package_pointer, numpy_output=True).extract();
+
+        assert isinstance(unpacked_package, numpy.ndarray);
+        assert numpy.array_equal(dataset, unpacked_package);
+
+    def testNumpyOutputListOfArrays(self):
+        package_pointer = package_builder([ [1, 2, 3], [4, 5] ], c_size_t).create();
+        unpacked_package = package_extractor(package_pointer, numpy_output=True).extract();
+
+        assert len(unpacked_package) == 2;
+        assert numpy.array_equal(unpacked_package[0], [1, 2, 3]);
+        assert numpy.array_equal(unpacked_package[1], [4, 5]);
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
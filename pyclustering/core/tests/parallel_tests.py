@@ -0,0 +1,113 @@
+"""!
+
+@brief Unit-tests for control of parallel processing in ccore library.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2018
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os;
+import subprocess;
+import sys;
+import unittest;
+
+from multiprocessing import Pool;
+
+from pyclustering.core.wrapper import ccore_library;
+from pyclustering.core.parallel_wrapper import set_amount_threads, get_amount_threads, set_grain_size, get_grain_size, ENVIRONMENT_THREADS, ENVIRONMENT_GRAIN_SIZE;
+
+from pyclustering.cluster.kmedoids import kmedoids;
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES;
+from pyclustering.utils import read_sample;
+
+
+def cluster_by_kmedoids(amount_threads):
+    set_amount_threads(amount_threads);
+    
+    sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3);
+    kmedoids_instance = kmedoids(sample, [4, 12, 25, 37], 0.025, True);
+    kmedoids_instance.process();
+    
+    return sorted(kmedoids_instance.get_clusters());
+
+
+@unittest.skipUnless(ccore_library.workable(), "CCORE library is required")
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.__amount_threads = get_amount_threads();
+        self.__grain_size = get_grain_size();
+
+    def tearDown(self):
+        set_amount_threads(self.__amount_threads);
+        set_grain_size(self.__grain_size);
+
+
+    def testSetGetAmountThreads(self):
+        for amount_threads in [1, 2, 5]:
+            set_amount_threads(amount_threads);
+            assert amount_threads == get_amount_threads();
+
+    def testDefaultAmountThreads(self):
+        set_amount_threads(0);
+        assert get_amount_threads() >= 1;
+
+    def testSetGetGrainSize(self):
+        for grain_size in [1, 16, 0]:
+            set_grain_size(grain_size);
+            assert grain_size == get_grain_size();
+
+    def testIncorrectArguments(self):
+        self.assertRaises(ValueError, set_amount_threads, -1);
+        self.assertRaises(ValueError, set_grain_size, -1);
+
+
+    def testClusteringDoesNotDependOnAmountThreads(self):
+        expected_clusters = cluster_by_kmedoids(1);
+        
+        for amount_threads in [2, 4]:
+            for grain_size in [0, 1, 7]:
+                set_grain_size(grain_size);
+                assert expected_clusters == cluster_by_kmedoids(amount_threads);
+
+    def testProcessingInChildProcesses(self):
+        expected_clusters = cluster_by_kmedoids(3);
+        
+        with Pool(2) as pool:
+            results = pool.map(cluster_by_kmedoids, [1, 2, 3, 4]);
+        
+        for clusters in results:
+            assert expected_clusters == clusters;
+
+
+    def testEnvironmentVariables(self):
+        environment = dict(os.environ);
+        environment[ENVIRONMENT_THREADS] = "3";
+        environment[ENVIRONMENT_GRAIN_SIZE] = "5";
+        
+        script = "from pyclustering.core.parallel_wrapper import get_amount_threads, get_grain_size; print(get_amount_threads(), get_grain_size())";
+        output = subprocess.check_output([sys.executable, "-c", script], env=environment);
+        
+        assert [b"3", b"5"] == output.split()[-2:];
+
+
+if __name__ == "__main__":
+    unittest.main();
@@ -127,27 +127,21 @@ class syncgcolor(sync_network):
                     self.set_connection(row, column);
                 
     
-    def _phase_kuramoto(self, teta, t, argv):
+    def _phase_kuramoto(self, phases, t):
         """!
-        @brief Returns result of phase calculation for oscillator in the network.
+        @brief Returns derivative of phases of all oscillators in the network.
+        @details Connected oscillators are coupled by negative weight, other oscillators - by positive weight.
         
-        @param[in] teta (double): Value of phase of the oscillator with index argv in the network.
+        @param[in] phases (numpy.array): Values of phases of oscillators in the network.
         @param[in] t (double): Unused, can be ignored.
-        @param[in] argv (uint): Index of the oscillator in the network.
         
-        @return (double) New value of phase for oscillator with index argv.
+        @return (numpy.array) Derivative of phase of each oscillator.
         
         """
         
-        index = argv;
-        phase = 0;
+        phase = self._positive_weight * self._calculate_coupling(phases);
+        phase += (self._negative_weight - self._positive_weight) * self._calculate_coupling(phases, self._get_connection_matrix());
         
-        for k in range(0, self._num_osc):
-            if (self.has_connection(index, k) == True):
-                phase += self._negative_weight * math.sin(self._phases[k] - teta);
-            else:
-                phase += self._positive_weight * math.sin(self._phases[k] - teta);
-            
         return ( phase / self._reduction );
     
     
@@ -24,6 +24,7 @@
 """
 
 import math;
+import numpy;
 
 from enum import IntEnum;
 
@@ -91,7 +92,262 @@ class conn_represent(IntEnum):
     LIST = 0;
     
     ## Connections are represented my matrix connection NxN, where N is number of oscillators.
-    MATRIX = 1;    
+    MATRIX = 1;
+    
+    ## Connections are represented by compressed sparse rows: sorted indexes of neighbors of all oscillators are stored in one
+    ## array and offset of neighbors of each oscillator in it is stored in another one, memory is proportional to amount of connections.
+    CSR = 2;
+
+
+class dynamic_view:
+    """!
+    @brief Lazy read-only view over output dynamic of oscillatory network.
+    @details View does not copy the dynamic when it is created, only window that is requested by indexing is copied to numpy
+              array. The first index selects iterations of simulation (integer or slice), the second one selects oscillators
+              (integer, slice or sequence of indexes). View of values that are stored once per iteration (for example, time
+              of simulation) is one-dimensional and supports only the first index.
+              
+              Output dynamics of oscillatory networks use the view to provide access to dynamic that is stored by CCORE
+              without conversion of the whole dynamic to python lists.
+    
+    Example:
+    @code
+        output_dynamic = sync_network(100, ccore = True).simulate(1000, 10, solve_type.RK4, True);
+        view = output_dynamic.output_view;
+        
+        last_phases = view[-1];                 # phases of all oscillators on the last iteration
+        window = view[100:200, [0, 5, 7]];      # phases of three oscillators on 100 iterations
+        
+        for chunk in view.chunks(256):          # the whole dynamic by chunks of 256 iterations
+            print(chunk.mean());
+    @endcode
+    
+    """
+    
+    def __init__(self, source, amount_iterations, amount_oscillators = None, owner = None):
+        """!
+        @brief Constructor of view over output dynamic.
+        
+        @param[in] source (callable|list|numpy.ndarray): Dynamic itself or function that copies its window: 'source(iterations, indexes)'
+                    for two-dimensional view or 'source(iterations)' for one-dimensional view, where 'iterations' is a range with
+                    positive step and 'indexes' is an array of oscillator indexes or 'None' (all oscillators), the function
+                    should return numpy array.
+        @param[in] amount_iterations (uint): Amount of iterations that are stored in the dynamic.
+        @param[in] amount_oscillators (uint): Amount of oscillators, if it is 'None' then view is one-dimensional.
+        @param[in] owner (object): Object that owns the dynamic, view keeps reference to it, therefore dynamic that is stored
+                    by CCORE is not destroyed while the view is used.
+        
+        """
+        
+        self.__owner = owner;
+        self.__source = source;
+        self.__amount_iterations = amount_iterations;
+        self.__amount_oscillators = amount_oscillators;
+    
+    
+    @property
+    def shape(self):
+        """!
+        @brief (tuple) Shape of the dynamic: (amount of iterations, amount of oscillators) or (amount of iterations,) for one-dimensional view.
+        
+        """
+        if self.__amount_oscillators is None:
+            return (self.__amount_iterations,);
+        
+        return (self.__amount_iterations, self.__amount_oscillators);
+    
+    
+    def __len__(self):
+        """!
+        @brief (uint) Returns amount of iterations that are stored in the dynamic.
+        
+        """
+        return self.__amount_iterations;
+    
+    
+    def __getitem__(self, key):
+        """!
+        @brief Copies window of the dynamic that is defined by the key to numpy array.
+        @details Dimension that is selected by integer is removed from the result like in case of numpy array.
+        
+        @param[in] key (int|slice|tuple): Iterations or pair (iterations, oscillators) that should be copied.
+        
+        @return (numpy.ndarray) Window of the dynamic.
+        
+        """
+        
+        if isinstance(key, tuple):
+            if (len(key) != 2) or (self.__amount_oscillators is None):
+                raise IndexError("Too many indexes for view over dynamic with shape '%s'." % str(self.shape));
+            
+            (key_iterations, key_oscillators) = key;
+        
+        else:
+            (key_iterations, key_oscillators) = (key, None);
+        
+        (iterations, single_iteration) = self.__get_iterations(key_iterations);
+        
+        if self.__amount_oscillators is None:
+            window = self.__read(iterations, None);
+        
+        else:
+            (indexes, single_oscillator) = self.__get_oscillators(key_oscillators);
+            window = self.__read(iterations, indexes);
+            
+            if single_oscillator is True:
+                window = window[:, 0];
+        
+        if single_iteration is True:
+            window = window[0];
+        
+        return window;
+    
+    
+    def __iter__(self):
+        """!
+        @brief Iterates over iterations of the dynamic, the dynamic is copied by chunks.
+        
+        """
+        for chunk in self.chunks():
+            for state in chunk:
+                yield state;
+    
+    
+    def __array__(self, dtype = None, copy = None):
+        """!
+        @brief Copies the whole dynamic to numpy array.
+        
+        """
+        window = self[:];
+        if dtype is not None:
+            window = window.astype(dtype, copy = False);
+        
+        return window;
+    
+    
+    def chunks(self, amount_iterations = 1024):
+        """!
+        @brief Iterates over the dynamic by windows of consecutive iterations, only one window is copied at once.
+        
+        @param[in] amount_iterations (uint): Amount of iterations in each window (the last window may be smaller).
+        
+        @return (generator) Windows of the dynamic where each window is numpy array.
+        
+        """
+        if amount_iterations <= 0:
+            raise ValueError("Amount of iterations in chunk should be greater than zero (current value: '%d')." % amount_iterations);
+        
+        for start_iteration in range(0, self.__amount_iterations, amount_iterations):
+            yield self[start_iteration:start_iteration + amount_iterations];
+    
+    
+    def __read(self, iterations, indexes):
+        """!
+        @brief Copies window of the dynamic from the source.
+        
+        @param[in] iterations (range): Iterations that should be copied.
+        @param[in] indexes (numpy.ndarray): Indexes of oscillators that should be copied, 'None' - all oscillators.
+        
+        @return (numpy.ndarray) Window of the dynamic.
+        
+        """
+        
+        if iterations.step < 0:
+            return self.__read(iterations[::-1], indexes)[::-1];
+        
+        if callable(self.__source):
+            if self.__amount_oscillators is None:
+                return self.__source(iterations);
+            
+            return self.__source(iterations, indexes);
+        
+        if isinstance(self.__source, numpy.ndarray):
+            window = self.__source[iterations.start:iterations.stop:iterations.step];
+        else:
+            window = numpy.array([ self.__source[index] for index in iterations ], dtype = numpy.float64);
+            window = window.reshape((len(iterations),) + self.shape[1:]);
+        
+        if indexes is not None:
+            return window[:, indexes];
+        
+        return window.copy();
+    
+    
+    def __get_iterations(self, key):
+        """!
+        @brief Converts key of iterations to range of iterations.
+        
+        @param[in] key (int|slice): Key of iterations.
+        
+        @return (tuple) Range of iterations and flag that shows whether single iteration is selected by integer.
+        
+        """
+        
+        if isinstance(key, slice):
+            return (range(*key.indices(self.__amount_iterations)), False);
+        
+        if isinstance(key, (int, numpy.integer)):
+            index = self.__normalize_index(int(key), self.__amount_iterations, "Iteration");
+            return (range(index, index + 1), True);
+        
+        raise IndexError("Iterations of the dynamic can be selected by integer or slice only.");
+    
+    
+    def __get_oscillators(self, key):
+        """!
+        @brief Converts key of oscillators to array of oscillator indexes.
+        
+        @param[in] key (int|slice|list|numpy.ndarray): Key of oscillators, 'None' - all oscillators.
+        
+        @return (tuple) Array of indexes ('None' - all oscillators) and flag that shows whether single oscillator is selected by integer.
+        
+        """
+        
+        if key is None:
+            return (None, False);
+        
+        if isinstance(key, slice):
+            oscillators = range(*key.indices(self.__amount_oscillators));
+            if oscillators == range(self.__amount_oscillators):
+                return (None, False);
+            
+            return (numpy.arange(oscillators.start, oscillators.stop, oscillators.step, dtype = numpy.intp), False);
+        
+        if isinstance(key, (int, numpy.integer)):
+            index = self.__normalize_index(int(key), self.__amount_oscillators, "Oscillator");
+            return (numpy.array([index], dtype = numpy.intp), True);
+        
+        indexes = numpy.asarray(key);
+        if (indexes.ndim != 1) or ( (len(indexes) > 0) and (not numpy.issubdtype(indexes.dtype, numpy.integer)) ):
+            raise IndexError("Oscillators of the dynamic can be selected by integer, slice or sequence of integers only.");
+        
+        indexes = indexes.astype(numpy.intp);
+        if numpy.any( (indexes < -self.__amount_oscillators) | (indexes >= self.__amount_oscillators) ):
+            raise IndexError("Oscillator index is out of range [%d; %d)." % (-self.__amount_oscillators, self.__amount_oscillators));
+        
+        return (numpy.where(indexes < 0, indexes + self.__amount_oscillators, indexes), False);
+    
+    
+    @staticmethod
+    def __normalize_index(index, size, title):
+        """!
+        @brief Converts negative index to positive one and checks that it is in range.
+        
+        @param[in] index (int): Index that should be normalized.
+        @param[in] size (uint): Size of dimension where index is used.
+        @param[in] title (string): Title of dimension that is used in error message.
+        
+        @return (uint) Normalized index.
+        
+        """
+        
+        if (index < -size) or (index >= size):
+            raise IndexError("%s index '%d' is out of range [%d; %d)." % (title, index, -size, size));
+        
+        if index < 0:
+            index += size;
+        
+        return index;
 
 
 class network:
@@ -158,6 +414,7 @@ class network:
         self._num_osc = num_osc;
         self._conn_represent = conn_repr;
         self.__conn_type = type_conn;
+        self.__pending_connections = [];
         
         if (conn_repr is None):
             self._conn_represent = conn_represent.MATRIX;
@@ -331,6 +588,83 @@ class network:
             self._osc_conn = [[] for _ in range(0, self._num_osc, 1)];
         
     
+    def __create_sparse_connections(self, type_conn):
+        """!
+        @brief Creates connections in compressed sparse row format, the same structures are created as in case of other representations.
+        
+        @param[in] type_conn (conn_type): Connection type (all-to-all, bidirectional list, grid structure, etc.) that is used by the network.
+        
+        """
+        
+        indexes = numpy.arange(self._num_osc, dtype = numpy.intp);
+        
+        if ( (type_conn == conn_type.NONE) or (type_conn == conn_type.DYNAMIC) ):
+            neighbors, valid = indexes[:, numpy.newaxis][:, :0], numpy.zeros((self._num_osc, 0), dtype = bool);
+        
+        elif (type_conn == conn_type.ALL_TO_ALL):
+            neighbors = numpy.broadcast_to(indexes, (self._num_osc, self._num_osc));
+            valid = neighbors != indexes[:, numpy.newaxis];
+        
+        elif (type_conn == conn_type.LIST_BIDIR):
+            neighbors = numpy.stack((indexes - 1, indexes + 1), axis = 1);
+            valid = (neighbors >= 0) & (neighbors < self._num_osc);
+        
+        elif ( (type_conn == conn_type.GRID_FOUR) or (type_conn == conn_type.GRID_EIGHT) ):
+            neighbors, valid = self.__get_grid_neighbors(indexes, type_conn == conn_type.GRID_EIGHT);
+        
+        else:
+            raise NameError('The unknown type of connections');
+        
+        # neighbors are sorted in each row, therefore they are stored as is
+        offsets = numpy.zeros(self._num_osc + 1, dtype = numpy.intp);
+        numpy.cumsum(numpy.count_nonzero(valid, axis = 1), out = offsets[1:]);
+        
+        self._osc_conn = (offsets, neighbors[valid]);
+    
+    
+    def __get_grid_neighbors(self, indexes, diagonals):
+        """!
+        @brief Returns candidates to neighbors of each oscillator in grid structure, rules are the same as for other representations.
+        
+        @param[in] indexes (numpy.array): Indexes of all oscillators.
+        @param[in] diagonals (bool): If True then diagonal neighbors are connected too (eight grid structure).
+        
+        @return (tuple) Matrices (neighbors, valid) where row contains sorted candidates of oscillator and marks of real neighbors.
+        
+        """
+        
+        side_size = self.__width;
+        
+        row_ceil = numpy.ceil(indexes / side_size);
+        row_floor = numpy.floor(indexes / side_size);
+        
+        # shift of neighbor and rule of its validity in line with creation of connections for other representations
+        rules = [ (-side_size, lambda neighbors: neighbors >= 0),
+                  (side_size, lambda neighbors: neighbors < self._num_osc),
+                  (-1, lambda neighbors: (neighbors >= 0) & (numpy.ceil(neighbors / side_size) == row_ceil)),
+                  (1, lambda neighbors: (neighbors < self._num_osc) & (numpy.ceil(neighbors / side_size) == row_ceil)) ];
+        
+        if (diagonals is True):
+            for (shift, row_shift) in [ (-side_size - 1, -1), (-side_size + 1, -1), (side_size - 1, 1), (side_size + 1, 1) ]:
+                rules.append((shift, lambda neighbors, row_shift = row_shift: (neighbors >= 0) & (neighbors < self._num_osc) & (numpy.floor(neighbors / side_size) == row_floor + row_shift)));
+        
+        rules.sort(key = lambda rule: rule[0]);
+        
+        neighbors = numpy.empty((len(indexes), len(rules)), dtype = numpy.intp);
+        valid = numpy.empty((len(indexes), len(rules)), dtype = bool);
+        
+        for index_rule in range(len(rules)):
+            (shift, rule) = rules[index_rule];
+            neighbors[:, index_rule] = indexes + shift;
+            valid[:, index_rule] = rule(neighbors[:, index_rule]);
+            
+            # different rules may lead to the same neighbor (for example, in grid with width 2)
+            if ( (index_rule > 0) and (rules[index_rule - 1][0] == shift) ):
+                valid[:, index_rule] &= ~valid[:, index_rule - 1];
+        
+        return neighbors, valid;
+    
+    
     def _create_structure(self, type_conn = conn_type.ALL_TO_ALL):
         """!
         @brief Creates connection in line with representation of matrix connections [NunOsc x NumOsc].
@@ -341,7 +675,10 @@ class network:
         
         self._osc_conn = list();
         
-        if (type_conn == conn_type.NONE):
+        if (self._conn_represent == conn_represent.CSR):
+            self.__create_sparse_connections(type_conn);
+        
+        elif (type_conn == conn_type.NONE):
             self.__create_none_connections();
         
         elif (type_conn == conn_type.ALL_TO_ALL):
@@ -380,6 +717,13 @@ class network:
                     return True;
             return False;
         
+        elif (self._conn_represent == conn_represent.CSR):
+            (offsets, indexes) = self.__get_csr_connections();
+            neighbors = indexes[offsets[i]:offsets[i + 1]];
+            
+            position = numpy.searchsorted(neighbors, j);
+            return bool((position < len(neighbors)) and (neighbors[position] == j));
+        
         else:
             raise NameError("Unknown type of representation of coupling");
     
@@ -401,9 +745,11 @@ class network:
         if (self._conn_represent == conn_represent.MATRIX):
             self._osc_conn[i][j] = True;
             self._osc_conn[j][i] = True;
+        elif (self._conn_represent == conn_represent.CSR):
+            self.__pending_connections.append((i, j));     # connections are inserted to arrays when they are required
         else:
             self._osc_conn[i].append(j);
-            self._osc_conn[j].append(i); 
+            self._osc_conn[j].append(i);
     
     
     def get_neighbors(self, index):
@@ -412,7 +758,7 @@ class network:
         
         @param[in] index (uint): index of oscillator for which neighbors should be found in the network.
         
-        @return (list) Indexes of neighbors of the specified oscillator.
+        @return (list) Indexes of neighbors of the specified oscillator (numpy.array in case of CSR representation).
         
         """
         
@@ -420,5 +766,79 @@ class network:
             return self._osc_conn[index];      # connections are represented by list.
         elif (self._conn_represent == conn_represent.MATRIX):
             return [neigh_index for neigh_index in range(self._num_osc) if self._osc_conn[index][neigh_index] == True];
+        elif (self._conn_represent == conn_represent.CSR):
+            (offsets, indexes) = self.__get_csr_connections();
+            return indexes[offsets[index]:offsets[index + 1]];
+        else:
+            raise NameError("Unknown type of representation of connections");
+    
+    
+    def _get_sparse_connections(self):
+        """!
+        @brief Returns connections of all oscillators in compressed sparse row format regardless of representation.
+        @details Neighbors of oscillator 'i' are 'indexes[offsets[i]:offsets[i + 1]]'. In case of CSR representation
+                  arrays of the network are returned without copying, otherwise they are created from the representation.
+        
+        @return (tuple) Arrays (offsets, indexes) of connections.
+        
+        """
+        
+        if (self._conn_represent == conn_represent.CSR):
+            return self.__get_csr_connections();
+        
+        elif (self._conn_represent == conn_represent.MATRIX):
+            (rows, indexes) = numpy.nonzero(numpy.array(self._osc_conn, dtype = bool).reshape(self._num_osc, self._num_osc));
+            amount_neighbors = numpy.bincount(rows, minlength = self._num_osc);
+        
+        elif (self._conn_represent == conn_represent.LIST):
+            amount_neighbors = [len(neighbors) for neighbors in self._osc_conn];
+            indexes = numpy.array([neighbor for neighbors in self._osc_conn for neighbor in neighbors], dtype = numpy.intp);
+        
         else:
             raise NameError("Unknown type of representation of connections");
+        
+        offsets = numpy.zeros(self._num_osc + 1, dtype = numpy.intp);
+        numpy.cumsum(amount_neighbors, out = offsets[1:]);
+        
+        return offsets, indexes;
+    
+    
+    def __get_csr_connections(self):
+        """!
+        @brief Returns arrays of CSR representation, connections that have been set since the last call are inserted to them.
+        
+        @return (tuple) Arrays (offsets, indexes) of connections.
+        
+        """
+        
+        if (len(self.__pending_connections) > 0):
+            (offsets, indexes) = self._osc_conn;
+            (pending_rows, pending_columns) = numpy.array(self.__pending_connections, dtype = numpy.intp).T;
+            
+            rows = numpy.repeat(numpy.arange(self._num_osc), numpy.diff(offsets));
+            
+            self.__pending_connections = [];
+            self._osc_conn = self.__compress_connections(numpy.concatenate((rows, pending_rows, pending_columns)),
+                                                         numpy.concatenate((indexes, pending_columns, pending_rows)));
+        
+        return self._osc_conn;
+    
+    
+    def __compress_connections(self, rows, columns):
+        """!
+        @brief Converts connections that are defined by pairs of oscillators to compressed sparse row format.
+        @details Duplicated connections are removed and neighbors of each oscillator are sorted.
+        
+        @param[in] rows (numpy.array): Indexes of oscillators that have connections.
+        @param[in] columns (numpy.array): Indexes of neighbors of corresponding oscillators.
+        
+        @return (tuple) Arrays (offsets, indexes) of connections.
+        
+        """
+        
+        keys = numpy.unique(numpy.asarray(rows, dtype = numpy.int64) * self._num_osc + numpy.asarray(columns, dtype = numpy.int64));
+        
+        offsets = numpy.zeros(self._num_osc + 1, dtype = numpy.intp);
+        numpy.cumsum(numpy.bincount(keys // self._num_osc, minlength = self._num_osc), out = offsets[1:]);
+        
+        return offsets, (keys % self._num_osc).astype(numpy.intp);
@@ -214,7 +214,7 @@ class fsync_network(network):
                     single double value and for each separately by list.
         @param[in] factor_coupling (double): Coupling strength between oscillators.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network (all-to-all, grid, bidirectional list, etc.).
-        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix, list or compressed sparse rows (CSR).
         
         """
         
@@ -216,7 +216,7 @@ class hhn_network(network):
         @param[in] stimulus (list): List of stimulus for oscillators, number of stimulus should be equal to number of peripheral oscillators.
         @param[in] parameters (hhn_parameters): Parameters of the network.
         @param[in] type_conn (conn_type): Type of connections between oscillators in the network (ignored for this type of network).
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or compressed sparse rows (CSR).
         @param[in] ccore (bool): If 'True' then CCORE is used (C/C++ implementation of the model).
         
         """
@@ -227,7 +227,7 @@ class hysteresis_network(network):
         @param[in] own_weight (double): Weight of connection from oscillator to itself - own weight.
         @param[in] neigh_weight (double): Weight of connection between oscillators.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network.
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or compressed sparse rows (CSR).
         
         """
         
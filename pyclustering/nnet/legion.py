@@ -33,9 +33,10 @@ from pyclustering.core.wrapper import ccore_library;
 
 from pyclustering.nnet import *;
 
-from pyclustering.utils import heaviside, allocate_sync_ensembles;
+from pyclustering.utils import allocate_sync_ensembles;
 
 from scipy.integrate import odeint;
+from scipy.sparse import csr_matrix;
 
 
 class legion_parameters:
@@ -152,6 +153,57 @@ class legion_dynamic:
         return list(range(len(self)));
     
     
+    @property
+    def output_view(self):
+        """!
+        @brief Returns lazy view (dynamic_view) over output dynamic of the network, only window that is requested by indexing is copied,
+                for example, 'output_view[-1]' or 'output_view[10:20, [0, 5]]'.
+        
+        @see get_output()
+        
+        """
+        if (self.__ccore_legion_dynamic_pointer is not None):
+            dynamic_pointer = self.__ccore_legion_dynamic_pointer;
+            amount_oscillators = wrapper.legion_dynamic_get_oscillators(dynamic_pointer);
+            return dynamic_view(lambda iterations, indexes: wrapper.legion_dynamic_get_output_window(dynamic_pointer, iterations, indexes), len(self), amount_oscillators, self);
+        
+        amount_oscillators = 0;
+        if (len(self.__output) > 0):
+            amount_oscillators = len(self.__output[0]);
+        
+        return dynamic_view(self.__output, len(self), amount_oscillators);
+    
+    
+    @property
+    def inhibitor_view(self):
+        """!
+        @brief Returns lazy one-dimensional view (dynamic_view) over output dynamic of the global inhibitor of the network.
+        
+        @see get_inhibitor()
+        
+        """
+        if (self.__ccore_legion_dynamic_pointer is not None):
+            dynamic_pointer = self.__ccore_legion_dynamic_pointer;
+            return dynamic_view(lambda iterations: wrapper.legion_dynamic_get_inhibitory_output_window(dynamic_pointer, iterations), len(self), owner = self);
+        
+        return dynamic_view(self.__inhibitor, len(self));
+    
+    
+    @property
+    def time_view(self):
+        """!
+        @brief Returns lazy one-dimensional view (dynamic_view) over simulation time.
+        
+        @see get_time()
+        
+        """
+        if (self.__ccore_legion_dynamic_pointer is not None):
+            dynamic_pointer = self.__ccore_legion_dynamic_pointer;
+            return dynamic_view(lambda iterations: wrapper.legion_dynamic_get_time_window(dynamic_pointer, iterations), len(self), owner = self);
+        
+        return dynamic_view(lambda iterations: numpy.arange(iterations.start, iterations.stop, iterations.step, dtype = numpy.float64), len(self));
+    
+    
     def __init__(self, output, inhibitor, time, ccore = None):
         """!
         @brief Constructor of legion dynamic.
@@ -190,6 +242,50 @@ class legion_dynamic:
         return len(self._time);
 
 
+    def get_output(self, start_iteration = None, stop_iteration = None, indexes = None):
+        """!
+        @brief Returns window of output dynamic of the network as numpy array where each row corresponds to iteration.
+        @details In case of CCORE only the window is copied from the dynamic.
+        
+        @param[in] start_iteration (int): The first iteration of the window, if 'None' then the first iteration is used.
+        @param[in] stop_iteration (int): Iteration where the window is ended (it is not included), if 'None' then the window is ended by the last iteration.
+        @param[in] indexes (list): Indexes of oscillators whose outputs should be returned, if 'None' then all oscillators are used.
+        
+        @return (numpy.ndarray) Outputs of oscillators with shape [amount_iterations x amount_oscillators].
+        
+        """
+        
+        return self.output_view[start_iteration:stop_iteration, indexes];
+
+
+    def get_inhibitor(self, start_iteration = None, stop_iteration = None):
+        """!
+        @brief Returns window of output dynamic of the global inhibitor as numpy array.
+        
+        @param[in] start_iteration (int): The first iteration of the window, if 'None' then the first iteration is used.
+        @param[in] stop_iteration (int): Iteration where the window is ended (it is not included), if 'None' then the window is ended by the last iteration.
+        
+        @return (numpy.ndarray) Output of the global inhibitor on iterations of the window.
+        
+        """
+        
+        return self.inhibitor_view[start_iteration:stop_iteration];
+
+
+    def get_time(self, start_iteration = None, stop_iteration = None):
+        """!
+        @brief Returns window of simulation time as numpy array.
+        
+        @param[in] start_iteration (int): The first iteration of the window, if 'None' then the first iteration is used.
+        @param[in] stop_iteration (int): Iteration where the window is ended (it is not included), if 'None' then the window is ended by the last iteration.
+        
+        @return (numpy.ndarray) Simulation time of the window.
+        
+        """
+        
+        return self.time_view[start_iteration:stop_iteration];
+
+
     def allocate_sync_ensembles(self, tolerance = 0.1):
         """!
         @brief Allocate clusters in line with ensembles of synchronous oscillators where each synchronous ensemble corresponds to only one cluster.
@@ -213,6 +309,10 @@ class legion_network(network):
            
     @details The model uses global inhibitor to de-synchronize synchronous ensembles of oscillators.
              
+             Python implementation integrates states of all oscillators and the global inhibitor as a single system of
+             differential equations on each step of simulation: by fixed step Runge-Kutta method (RK4) or by adaptive solver
+             (RKF45) that is provided by 'scipy.integrate.odeint'.
+             
              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
     
     Example:
@@ -243,7 +343,7 @@ class legion_network(network):
         @param[in] num_osc (uint): Number of oscillators in the network.
         @param[in] parameters (legion_parameters): Parameters of the network that are defined by structure 'legion_parameters'.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network.
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or compressed sparse rows (CSR).
         @param[in] ccore (bool): If True then all interaction with object will be performed via CCORE library (C++ implementation of pyclustering).
         
         """
@@ -264,20 +364,19 @@ class legion_network(network):
             super().__init__(num_osc, type_conn, type_conn_represent);
                 
             # initial states
-            self._excitatory = [ random.random() for _ in range(self._num_osc) ];
-            self._inhibitory = [0.0] * self._num_osc;
-            self._potential = [0.0] * self._num_osc;
+            self._excitatory = numpy.array([ random.random() for _ in range(self._num_osc) ]);
+            self._inhibitory = numpy.zeros(self._num_osc);
+            self._potential = numpy.zeros(self._num_osc);
             
-            self._coupling_term = None;      # coupling term of each oscillator
             self._global_inhibitor = 0;      # value of global inhibitory
             self._stimulus = None;           # stimulus of each oscillator
             
-            self._dynamic_coupling = None;   # dynamic connection between oscillators
-            self._coupling_term = [0.0] * self._num_osc;
-            self._buffer_coupling_term = [0.0] * self._num_osc;
+            self._dynamic_coupling = None;   # sparse matrix of dynamic connections between oscillators
+            self._static_coupling = None;    # sparse matrix of connections between oscillators that is used for lateral potential
+            self._coupling_term = numpy.zeros(self._num_osc);   # coupling term of each oscillator
                 
             # generate first noises
-            self._noise = [random.random() * self._params.ro for i in range(self._num_osc)];
+            self._noise = self.__create_noise();
 
 
     def __del__(self):
@@ -313,38 +412,49 @@ class legion_network(network):
         if (len(stimulus) != self._num_osc):
             raise NameError("Number of stimulus should be equal number of oscillators in the network.");
         else:
-            self._stimulus = [];
-             
-            for val in stimulus:
-                if (val > 0): self._stimulus.append(self._params.I);
-                else: self._stimulus.append(0);
+            self._stimulus = numpy.where(numpy.asarray(stimulus) > 0, self._params.I, 0.0);
+    
+    
+    def __create_noise(self):
+        """!
+        @brief Generates noise for each oscillator in the network.
+        
+        @return (numpy.array) Noise of each oscillator.
+        
+        """
+        
+        return numpy.array([ random.random() for _ in range(self._num_osc) ]) * self._params.ro;
     
     
     def __create_dynamic_connections(self):
         """!
         @brief Create dynamic connection in line with input stimulus.
+        @details Weight of dynamic connection from each stimulated oscillator to its neighbors is 'Wt' divided by number of its
+                  stimulated neighbors, unstimulated oscillators do not have dynamic connections. Both dynamic and static
+                  connections are stored as sparse matrices.
         
         """
         
         if (self._stimulus is None):
             raise NameError("Stimulus should initialed before creation of the dynamic connections in the network.");
         
-        self._dynamic_coupling = [ [0] * self._num_osc for i in range(self._num_osc)];
+        (offsets, indexes) = self._get_sparse_connections();
+        owners = numpy.repeat(numpy.arange(self._num_osc), numpy.diff(offsets));
         
-        for i in range(self._num_osc):
-            neighbors = self.get_neighbors(i);
-            
-            if ( (len(neighbors) > 0) and (self._stimulus[i] > 0) ):
-                number_stimulated_neighbors = 0.0;
-                for j in neighbors:
-                    if (self._stimulus[j] > 0):
-                        number_stimulated_neighbors += 1.0;
-                
-                if (number_stimulated_neighbors > 0):
-                    dynamic_weight = self._params.Wt / number_stimulated_neighbors;
-                    
-                    for j in neighbors:
-                        self._dynamic_coupling[i][j] = dynamic_weight;
+        stimulated = self._stimulus > 0;
+        number_stimulated_neighbors = numpy.bincount(owners, weights = stimulated[indexes], minlength = self._num_osc);
+        
+        dynamic_weights = numpy.zeros(self._num_osc);
+        weighted = stimulated & (number_stimulated_neighbors > 0);
+        dynamic_weights[weighted] = self._params.Wt / number_stimulated_neighbors[weighted];
+        
+        shape = (self._num_osc, self._num_osc);
+        
+        self._dynamic_coupling = csr_matrix((dynamic_weights[owners], indexes, offsets), shape = shape);
+        self._dynamic_coupling.sum_duplicates();
+        
+        self._static_coupling = csr_matrix((numpy.ones(len(indexes)), indexes, offsets), shape = shape);
+        self._static_coupling.sum_duplicates();
     
     
     def simulate(self, steps, time, stimulus, solution = solve_type.RK4, collect_dynamic = True):
@@ -355,7 +465,8 @@ class legion_network(network):
         @param[in] time (double): Time of simulation.
         @param[in] stimulus (list): Stimulus for oscillators, number of stimulus should be equal to number of oscillators,
                    example of stimulus for 5 oscillators [0, 0, 1, 1, 0], value of stimulus is defined by parameter 'I'.
-        @param[in] solution (solve_type): Method that is used for differential equation.
+        @param[in] solution (solve_type): Method that is used for differential equation: RK4 - Runge-Kutta method with
+                    step that is reduced when it is required for stability, RKF45 - adaptive solver, FAST is not supported.
         @param[in] collect_dynamic (bool): If True - returns whole dynamic of oscillatory network, otherwise returns only last values of dynamics.
         
         @return (list) Dynamic of oscillatory network. If argument 'collect_dynamic' = True, than return dynamic for the whole simulation time,
@@ -371,8 +482,8 @@ class legion_network(network):
         if (solution == solve_type.FAST):
             raise NameError("Solver FAST is not support due to low accuracy that leads to huge error.");
         
-        elif (solution == solve_type.RKF45):
-            raise NameError("Solver RKF45 is not support in python version. RKF45 is supported in CCORE implementation.");
+        elif ( (solution != solve_type.RK4) and (solution != solve_type.RKF45) ):
+            raise NameError("Unknown type of solver is specified.");
         
         # set stimulus
         self.__create_stimulus(stimulus);
@@ -399,11 +510,11 @@ class legion_network(network):
             
             # update states of oscillators
             if (collect_dynamic == True):
-                dyn_exc.append(self._excitatory);
+                dyn_exc.append(self._excitatory.tolist());
                 dyn_time.append(t);
                 dyn_ginh.append(self._global_inhibitor);
             else:
-                dyn_exc = self._excitatory;
+                dyn_exc = self._excitatory.tolist();
                 dyn_time = t;
                 dyn_ginh = self._global_inhibitor;
         
@@ -413,6 +524,7 @@ class legion_network(network):
     def _calculate_states(self, solution, t, step, int_step):
         """!
         @brief Calculates new state of each oscillator in the network.
+        @details States of all oscillators and the global inhibitor are integrated at once as a single system of differential equations.
         
         @param[in] solution (solve_type): Type solver of the differential equation.
         @param[in] t (double): Current time of simulation.
@@ -421,127 +533,136 @@ class legion_network(network):
         
         """
         
-        next_excitatory = [0.0] * self._num_osc;
-        next_inhibitory = [0.0] * self._num_osc;
+        active_neighbors = (self._excitatory > self._params.teta_x).astype(float);
+        
+        # lateral potential of each oscillator and activity of the global inhibitor are constant during the step
+        lateral_potential = (self._static_coupling.dot(self._params.T * active_neighbors) > self._params.teta_p).astype(float);
+        sigma = 1.0 if numpy.any(self._excitatory > self._params.teta_zx) else 0.0;
         
-        next_potential = [];
+        states = [ self._excitatory, self._inhibitory ];
         if (self._params.ENABLE_POTENTIONAL is True):
-            next_potential = [0.0] * self._num_osc;
+            states.append(self._potential);
         
-        # Update states of oscillators
-        for index in range (0, self._num_osc, 1):
-            if (self._params.ENABLE_POTENTIONAL is True):
-                result = odeint(self._legion_state, [self._excitatory[index], self._inhibitory[index], self._potential[index]], numpy.arange(t - step, t, int_step), (index , ));
-                [ next_excitatory[index], next_inhibitory[index], next_potential[index] ] = result[len(result) - 1][0:3];
-                
-            else:
-                result = odeint(self._legion_state_simplify, [self._excitatory[index], self._inhibitory[index] ], numpy.arange(t - step, t, int_step), (index , ));
-                [ next_excitatory[index], next_inhibitory[index] ] = result[len(result) - 1][0:2];
-            
-            # Update coupling term
-            neighbors = self.get_neighbors(index);
-            
-            coupling = 0
-            for index_neighbor in neighbors:
-                coupling += self._dynamic_coupling[index][index_neighbor] * heaviside(self._excitatory[index_neighbor] - self._params.teta_x);
-            
-            self._buffer_coupling_term[index] = coupling - self._params.Wz * heaviside(self._global_inhibitor - self._params.teta_xz);
+        states.append([ self._global_inhibitor ]);
+        
+        # external input that does not depend on states of oscillators
+        external = 2.0 + self._coupling_term + self._noise;
+        if (self._params.ENABLE_POTENTIONAL is not True):
+            external += self._stimulus;
+        
+        times = numpy.arange(t - step, t, int_step);
+        argv = (lateral_potential, sigma, external);
+        
+        if (solution == solve_type.RK4):
+            next_states = self.__integrate_rk4(numpy.concatenate(states), times, argv);
+        else:
+            next_states = odeint(self._legion_state, numpy.concatenate(states), times, (argv, ))[-1];
         
-        # Update state of global inhibitory
-        result = odeint(self._global_inhibitor_state, self._global_inhibitor, numpy.arange(t - step, t, int_step), (None, ));
-        self._global_inhibitor = result[len(result) - 1][0];
+        # Update coupling term
+        next_coupling_term = self._dynamic_coupling.dot(active_neighbors);
+        if (self._global_inhibitor > self._params.teta_xz):
+            next_coupling_term -= self._params.Wz;
         
-        self._noise = [random.random() * self._params.ro for i in range(self._num_osc)];
-        self._coupling_term = self._buffer_coupling_term[:];
-        self._inhibitory = next_inhibitory[:];
-        self._excitatory = next_excitatory[:];
+        self._excitatory = next_states[0 : self._num_osc];
+        self._inhibitory = next_states[self._num_osc : 2 * self._num_osc];
         
         if (self._params.ENABLE_POTENTIONAL is True):
-            self._potential = next_potential[:];
-            
+            self._potential = next_states[2 * self._num_osc : 3 * self._num_osc];
+        
+        self._global_inhibitor = next_states[-1];
+        
+        self._noise = self.__create_noise();
+        self._coupling_term = next_coupling_term;
     
     
-    def _global_inhibitor_state(self, z, t, argv):
+    def __integrate_rk4(self, states, times, argv):
         """!
-        @brief Returns new value of global inhibitory
+        @brief Integrates states of the network by classic fourth-order Runge-Kutta method.
+        @details Interval between neighbor time points is divided into several steps if it is too large for stable
+                  integration (see __calculate_stable_step()), stable step is estimated for states before each step,
+                  therefore coarse simulation steps do not lead to divergence of the solution.
         
-        @param[in] z (dobule): Current value of inhibitory.
-        @param[in] t (double): Current time of simulation.
-        @param[in] argv (tuple): It's not used, can be ignored.
+        @param[in] states (numpy.array): Initial states of the network.
+        @param[in] times (numpy.array): Sequence of time points, integration step is defined by neighbor points.
+        @param[in] argv (tuple): Extra arguments that are passed to the function of the network state.
         
-        @return (double) New value if global inhibitory (not assign).
+        @return (numpy.array) States of the network at the last time point.
         
         """
         
-        sigma = 0.0;
-        
-        for x in self._excitatory:
-            if (x > self._params.teta_zx):
-                sigma = 1.0;
-                break;
+        for index in range(1, len(times)):
+            t = times[index - 1];
+            
+            while (t < times[index]):
+                h = min(times[index] - t, self.__calculate_stable_step(states));
+                
+                k1 = self._legion_state(states, t, argv);
+                k2 = self._legion_state(states + 0.5 * h * k1, t + 0.5 * h, argv);
+                k3 = self._legion_state(states + 0.5 * h * k2, t + 0.5 * h, argv);
+                k4 = self._legion_state(states + h * k3, t + h, argv);
+                
+                states = states + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4);
+                t = min(t + h, times[index]);
         
-        return self._params.fi * (sigma - z);
+        return states;
     
     
-    def _legion_state_simplify(self, inputs, t, argv):
+    def __calculate_stable_step(self, states):
         """!
-        @brief Returns new values of excitatory and inhibitory parts of oscillator of oscillator.
-        @details Simplify model doesn't consider oscillator potential.
+        @brief Returns the largest integration step of Runge-Kutta method that is stable for the current states.
+        @details Stability of the explicit method requires step multiplied by the fastest rate of the system to be less
+                  than 2.78 (bound on the real axis for the classic fourth-order method). The fastest rate is estimated
+                  by diagonal of Jacobian: derivative of the excitatory part (3 - 3x^2) for the current excitatory states,
+                  inhibitory part (eps), potential (lamda + mu) and the global inhibitor (fi). Bound 2.0 is used to take
+                  into account growth of the excitatory states during the step.
         
-        @param[in] inputs (list): Initial values (current) of oscillator [excitatory, inhibitory].
-        @param[in] t (double): Current time of simulation.
-        @param[in] argv (uint): Extra arguments that are not used for integration - index of oscillator.
+        @param[in] states (numpy.array): Current states of the network.
         
-        @return (list) New values of excitatoty and inhibitory part of oscillator (not assign).
+        @return (double) Stable integration step.
         
         """
         
-        index = argv;
-        
-        x = inputs[0];  # excitatory
-        y = inputs[1];  # inhibitory
-        
-        dx = 3.0 * x - x ** 3.0 + 2.0 - y + self._stimulus[index] + self._coupling_term[index] + self._noise[index];
-        dy = self._params.eps * (self._params.gamma * (1.0 + math.tanh(x / self._params.betta)) - y);
+        excitatory = states[0 : self._num_osc];
+        excitatory_rate = numpy.max(numpy.abs(3.0 - 3.0 * excitatory * excitatory));
         
-        neighbors = self.get_neighbors(index);
-        potential = 0.0;
-        
-        for index_neighbor in neighbors:
-            potential += self._params.T * heaviside(self._excitatory[index_neighbor] - self._params.teta_x);
-        
-        return [dx, dy];    
+        fastest_rate = max(excitatory_rate, self._params.eps, self._params.fi, self._params.lamda + self._params.mu);
+        return 2.0 / fastest_rate;
     
     
     def _legion_state(self, inputs, t, argv):
         """!
-        @brief Returns new values of excitatory and inhibitory parts of oscillator and potential of oscillator.
+        @brief Returns derivatives of excitatory and inhibitory parts and potential of each oscillator and derivative of the global inhibitor.
+        @details Potential of oscillators is not considered if it is disabled by parameter 'ENABLE_POTENTIONAL'.
         
-        @param[in] inputs (list): Initial values (current) of oscillator [excitatory, inhibitory, potential].
+        @param[in] inputs (numpy.array): Current states of the network [excitatory, inhibitory, potential (optional), global inhibitor].
         @param[in] t (double): Current time of simulation.
-        @param[in] argv (uint): Extra arguments that are not used for integration - index of oscillator.
+        @param[in] argv (tuple): Extra arguments that are not changed during integration: lateral potential of each oscillator, activity of the global inhibitor
+                    and external input of each oscillator (constant part, stimulus without potential, coupling term and noise).
         
-        @return (list) New values of excitatoty and inhibitory part of oscillator and new value of potential (not assign).
+        @return (numpy.array) Derivatives of states of the network (not assign).
         
         """
         
-        index = argv;
-        
-        x = inputs[0];  # excitatory
-        y = inputs[1];  # inhibitory
-        p = inputs[2];  # potential
+        (lateral_potential, sigma, external) = argv;
         
-        potential_influence = heaviside(p + math.exp(-self._params.alpha * t) - self._params.teta);
+        n = self._num_osc;
+        derivatives = numpy.empty(len(inputs));
         
-        dx = 3.0 * x - x ** 3.0 + 2.0 - y + self._stimulus[index] * potential_influence + self._coupling_term[index] + self._noise[index];
-        dy = self._params.eps * (self._params.gamma * (1.0 + math.tanh(x / self._params.betta)) - y);
+        x = inputs[0 : n];          # excitatory
+        y = inputs[n : 2 * n];      # inhibitory
+        z = inputs[-1];             # global inhibitor
         
-        neighbors = self.get_neighbors(index);
-        potential = 0.0;
+        dx = derivatives[0 : n];
+        numpy.subtract(external, y, out = dx);
+        dx += 3.0 * x - x * x * x;
         
-        for index_neighbor in neighbors:
-            potential += self._params.T * heaviside(self._excitatory[index_neighbor] - self._params.teta_x);
+        if (self._params.ENABLE_POTENTIONAL is True):
+            p = inputs[2 * n : 3 * n];  # potential
+            
+            dx += self._stimulus * (p + math.exp(-self._params.alpha * t) > self._params.teta);
+            derivatives[2 * n : 3 * n] = self._params.lamda * (1.0 - p) * lateral_potential - self._params.mu * p;
         
-        dp = self._params.lamda * (1.0 - p) * heaviside(potential - self._params.teta_p) - self._params.mu * p;
+        derivatives[n : 2 * n] = self._params.eps * (self._params.gamma * (1.0 + numpy.tanh(x / self._params.betta)) - y);
+        derivatives[-1] = self._params.fi * (sigma - z);
         
-        return [dx, dy, dp];
\ No newline at end of file
+        return derivatives;
\ No newline at end of file
@@ -30,6 +30,8 @@ import matplotlib.animation as animation
 import random
 import numpy
 
+from scipy.sparse import csr_matrix
+
 from PIL import Image
 
 from pyclustering.nnet import *
@@ -91,19 +93,23 @@ class pcnn_parameters:
 class pcnn_dynamic:
     """!
     @brief Represents output dynamic of PCNN (pulse-coupled neural network).
+    @details Python implementation stores outputs of oscillators as a compact array (time x oscillator) of type uint8.
     
     """
 
     @property
     def output(self):
         """!
-        @brief (list) Returns oscillato outputs during simulation.
+        @brief (list) Returns oscillator outputs during simulation, where each row corresponds to simulation step.
+        
+        @see output_view
+        @see get_output()
         
         """
         if self.__ccore_pcnn_dynamic_pointer is not None:
             return wrapper.pcnn_dynamic_get_output(self.__ccore_pcnn_dynamic_pointer)
             
-        return self.__dynamic
+        return self.__dynamic.tolist()
     
     
     @property
@@ -118,18 +124,53 @@ class pcnn_dynamic:
         return list(range(len(self)))
     
     
+    @property
+    def output_view(self):
+        """!
+        @brief (dynamic_view) Returns lazy view over oscillator outputs, only window that is requested by indexing is copied,
+                for example, 'output_view[-1]' or 'output_view[10:20, [0, 5]]'.
+        
+        @see get_output()
+        
+        """
+        if self.__ccore_pcnn_dynamic_pointer is not None:
+            dynamic_pointer = self.__ccore_pcnn_dynamic_pointer
+            amount_oscillators = wrapper.pcnn_dynamic_get_oscillators(dynamic_pointer)
+            return dynamic_view(lambda iterations, indexes: wrapper.pcnn_dynamic_get_output_window(dynamic_pointer, iterations, indexes), len(self), amount_oscillators, self)
+        
+        return dynamic_view(self.__dynamic, len(self), self.__dynamic.shape[1])
+    
+    
+    @property
+    def time_view(self):
+        """!
+        @brief (dynamic_view) Returns lazy one-dimensional view over sampling times of the dynamic.
+        
+        @see get_time()
+        
+        """
+        if self.__ccore_pcnn_dynamic_pointer is not None:
+            dynamic_pointer = self.__ccore_pcnn_dynamic_pointer
+            return dynamic_view(lambda iterations: wrapper.pcnn_dynamic_get_time_window(dynamic_pointer, iterations), len(self), owner=self)
+        
+        return dynamic_view(lambda iterations: numpy.arange(iterations.start, iterations.stop, iterations.step, dtype=numpy.float64), len(self))
+    
+    
     def __init__(self, dynamic, ccore=None):
         """!
         @brief Constructor of PCNN dynamic.
         
-        @param[in] dynamic (list): Dynamic of oscillators on each step of simulation. If ccore pointer is specified than it can be ignored.
+        @param[in] dynamic (array_like): Dynamic of oscillators on each step of simulation (time x oscillator). If ccore pointer is specified than it can be ignored.
         @param[in] ccore (ctypes.pointer): Pointer to CCORE pcnn_dynamic instance in memory.
         
         """
         self.__OUTPUT_TRUE = 1    # fire value for oscillators.
         self.__OUTPUT_FALSE = 0   # rest value for oscillators.
         
-        self.__dynamic = dynamic
+        self.__dynamic = None
+        if dynamic is not None:
+            self.__dynamic = numpy.asarray(dynamic, dtype=numpy.uint8)
+        
         self.__ccore_pcnn_dynamic_pointer = ccore
     
     
@@ -153,10 +194,46 @@ class pcnn_dynamic:
         return len(self.__dynamic)
     
     
+    def get_output(self, start_iteration=None, stop_iteration=None, indexes=None):
+        """!
+        @brief Returns window of oscillator outputs as numpy array where each row corresponds to simulation step.
+        @details In case of CCORE only the window is copied from the dynamic.
+        
+        @param[in] start_iteration (int): The first iteration of the window, if 'None' then the first iteration is used.
+        @param[in] stop_iteration (int): Iteration where the window is ended (it is not included), if 'None' then the window is ended by the last iteration.
+        @param[in] indexes (list): Indexes of oscillators whose outputs should be returned, if 'None' then all oscillators are used.
+        
+        @return (numpy.ndarray) Outputs of oscillators with shape [amount_iterations x amount_oscillators].
+        
+        @see output_view
+        
+        """
+        
+        return self.output_view[start_iteration:stop_iteration, indexes]
+    
+    
+    def get_time(self, start_iteration=None, stop_iteration=None):
+        """!
+        @brief Returns window of sampling times as numpy array.
+        
+        @param[in] start_iteration (int): The first iteration of the window, if 'None' then the first iteration is used.
+        @param[in] stop_iteration (int): Iteration where the window is ended (it is not included), if 'None' then the window is ended by the last iteration.
+        
+        @return (numpy.ndarray) Sampling times of the window.
+        
+        @see time_view
+        
+        """
+        
+        return self.time_view[start_iteration:stop_iteration]
+    
+    
     def allocate_sync_ensembles(self):
         """!
         @brief Allocate clusters in line with ensembles of synchronous oscillators where each
                synchronous ensemble corresponds to only one cluster.
+        @details Each oscillator is placed to the ensemble of the last step when it was fired (initial state is not considered),
+                  ensembles are ordered from the last step to the first.
         
         @return (list) Grours (lists) of indexes of synchronous oscillators. 
                 For example, [ [index_osc1, index_osc3], [index_osc2], [index_osc4, index_osc5] ].
@@ -166,23 +243,15 @@ class pcnn_dynamic:
         if self.__ccore_pcnn_dynamic_pointer is not None:
             return wrapper.pcnn_dynamic_allocate_sync_ensembles(self.__ccore_pcnn_dynamic_pointer)
         
-        sync_ensembles = []
-        traverse_oscillators = set()
+        reversed_dynamic = self.__dynamic[:0:-1] == self.__OUTPUT_TRUE
         
-        number_oscillators = len(self.__dynamic[0])
+        fired_oscillators = numpy.nonzero(reversed_dynamic.any(axis=0))[0]
+        last_fire_steps = reversed_dynamic[:, fired_oscillators].argmax(axis=0)
         
-        for t in range(len(self.__dynamic) - 1, 0, -1):
-            sync_ensemble = []
-            for i in range(number_oscillators):
-                if self.__dynamic[t][i] == self.__OUTPUT_TRUE:
-                    if i not in traverse_oscillators:
-                        sync_ensemble.append(i)
-                        traverse_oscillators.add(i)
-            
-            if sync_ensemble != []:
-                sync_ensembles.append(sync_ensemble)
+        order = numpy.argsort(last_fire_steps, kind='stable')
+        borders = numpy.nonzero(numpy.diff(last_fire_steps[order]))[0] + 1
         
-        return sync_ensembles
+        return [ensemble.tolist() for ensemble in numpy.split(fired_oscillators[order], borders) if len(ensemble) > 0]
 
 
     def allocate_spike_ensembles(self):
@@ -197,20 +266,10 @@ class pcnn_dynamic:
         if self.__ccore_pcnn_dynamic_pointer is not None:
             return wrapper.pcnn_dynamic_allocate_spike_ensembles(self.__ccore_pcnn_dynamic_pointer)
         
-        spike_ensembles = []
-        number_oscillators = len(self.__dynamic[0])
+        (steps, oscillators) = numpy.nonzero(self.__dynamic == self.__OUTPUT_TRUE)
+        borders = numpy.nonzero(numpy.diff(steps))[0] + 1
         
-        for t in range(len(self.__dynamic)):
-            spike_ensemble = []
-            
-            for index in range(number_oscillators):
-                if self.__dynamic[t][index] == self.__OUTPUT_TRUE:
-                    spike_ensemble.append(index)
-            
-            if len(spike_ensemble) > 0:
-                spike_ensembles.append(spike_ensemble)
-        
-        return spike_ensembles
+        return [ensemble.tolist() for ensemble in numpy.split(oscillators, borders) if len(ensemble) > 0]
     
     
     def allocate_time_signal(self):
@@ -224,11 +283,7 @@ class pcnn_dynamic:
         if self.__ccore_pcnn_dynamic_pointer is not None:
             return wrapper.pcnn_dynamic_allocate_time_signal(self.__ccore_pcnn_dynamic_pointer)
         
-        signal_vector_information = []
-        for t in range(0, len(self.__dynamic)):
-            signal_vector_information.append(sum(self.__dynamic[t]))
-        
-        return signal_vector_information
+        return numpy.count_nonzero(self.__dynamic, axis=1).tolist()
 
 
 class pcnn_visualizer:
@@ -267,7 +322,7 @@ class pcnn_visualizer:
         
         """
         
-        draw_dynamics(pcnn_output_dynamic.time, pcnn_output_dynamic.output, x_title = "t", y_title = "y(t)", separate = separate_representation)
+        draw_dynamics(pcnn_output_dynamic.get_time(), pcnn_output_dynamic.get_output(), x_title = "t", y_title = "y(t)", separate = separate_representation)
     
     @staticmethod
     def animate_spike_ensembles(pcnn_output_dynamic, image_size):
@@ -349,7 +404,7 @@ class pcnn_network(network):
         @param[in] num_osc (uint): Number of oscillators in the network.
         @param[in] parameters (pcnn_parameters): Parameters of the network.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network (all-to-all, grid, bidirectional list, etc.).
-        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] type_conn_represent (conn_represent): Internal representation of connection in the network: matrix, list or compressed sparse rows (CSR).
         @param[in] height (uint): Number of oscillators in column of the network, this argument is used 
                     only for network with grid structure (GRID_FOUR, GRID_EIGHT), for other types this argument is ignored.
         @param[in] width (uint): Number of oscillotors in row of the network, this argument is used only 
@@ -358,12 +413,14 @@ class pcnn_network(network):
         
         """
         
-        self._outputs = None            # list of outputs of oscillators.
+        self._outputs = None            # outputs of oscillators.
     
         self._feeding = None            # feeding compartment of each oscillator.
         self._linking = None            # linking compartment of each oscillator.
         self._threshold = None          # threshold of each oscillator.
         
+        self._conn_matrix = None        # sparse matrix of connections that is used to calculate influence of neighbors.
+        
         self._params = None
         
         self.__ccore_pcnn_pointer = None
@@ -394,11 +451,11 @@ class pcnn_network(network):
         else:
             super().__init__(num_osc, type_conn, type_conn_represent, height, width)
             
-            self._outputs = [0.0] * self._num_osc
+            self._outputs = numpy.zeros(self._num_osc, dtype=numpy.uint8)
             
-            self._feeding = [0.0] * self._num_osc
-            self._linking = [0.0] * self._num_osc
-            self._threshold = [ random.random() for i in range(self._num_osc) ]
+            self._feeding = numpy.zeros(self._num_osc)
+            self._linking = numpy.zeros(self._num_osc)
+            self._threshold = numpy.array([ random.random() for i in range(self._num_osc) ])
     
     
     def __del__(self):
@@ -441,101 +498,83 @@ class pcnn_network(network):
             ccore_instance_dynamic = wrapper.pcnn_simulate(self.__ccore_pcnn_pointer, steps, stimulus)
             return pcnn_dynamic(None, ccore_instance_dynamic)
         
-        dynamic = []
-        dynamic.append(self._outputs)
+        # initial outputs are stored even if there are no steps to simulate
+        dynamic = numpy.empty((max(steps, 1), self._num_osc), dtype=numpy.uint8)
+        dynamic[0] = self._outputs
         
         for step in range(1, steps, 1):
             self._outputs = self._calculate_states(stimulus)
             
-            dynamic.append(self._outputs)
+            dynamic[step] = self._outputs
         
         return pcnn_dynamic(dynamic)
     
     
+    def set_connection(self, i, j):
+        """!
+        @brief Couples two specified oscillators in the network.
+        
+        @param[in] i (uint): index of an oscillator that should be coupled with oscillator 'j' in the network.
+        @param[in] j (uint): index of an oscillator that should be coupled with oscillator 'i' in the network.
+        
+        """
+        
+        super().set_connection(i, j)
+        self._conn_matrix = None
+    
+    
+    def _get_connection_matrix(self):
+        """!
+        @brief Returns sparse matrix of connections between oscillators where each connection has weight 1.
+        @details Matrix is created once and is stored until connections are changed.
+        
+        @return (csr_matrix) Sparse matrix of connections.
+        
+        """
+        
+        if self._conn_matrix is None:
+            (offsets, indexes) = self._get_sparse_connections()
+            
+            self._conn_matrix = csr_matrix((numpy.ones(len(indexes)), indexes, offsets), shape=(self._num_osc, self._num_osc))
+            self._conn_matrix.sum_duplicates()
+        
+        return self._conn_matrix
+    
+    
     def _calculate_states(self, stimulus):
         """!
         @brief Calculates states of oscillators in the network for current step and stored them except outputs of oscillators.
+        @details Influence of neighbors on all oscillators is calculated at once as a product of sparse matrix of connections and vector of outputs.
         
         @param[in] stimulus (list): Stimulus for oscillators, number of stimulus should be equal to number of oscillators.
         
-        @return (list) New outputs for oscillators (do not stored it).
+        @return (numpy.array) New outputs for oscillators (do not stored it).
         
         """
         
-        feeding = [0.0] * self._num_osc
-        linking = [0.0] * self._num_osc
-        outputs = [0.0] * self._num_osc
-        threshold = [0.0] * self._num_osc
+        connections = self._get_connection_matrix()
+        neighbor_outputs = connections.dot(self._outputs.astype(float))
         
-        for index in range(0, self._num_osc, 1):
-            neighbors = self.get_neighbors(index)
-            
-            feeding_influence = 0.0
-            linking_influence = 0.0
-            
-            for index_neighbour in neighbors:
-                feeding_influence += self._outputs[index_neighbour] * self._params.M
-                linking_influence += self._outputs[index_neighbour] * self._params.W
-            
-            feeding_influence *= self._params.VF
-            linking_influence *= self._params.VL
-            
-            feeding[index] = self._params.AF * self._feeding[index] + stimulus[index] + feeding_influence
-            linking[index] = self._params.AL * self._linking[index] + linking_influence
-            
-            # calculate internal activity
-            internal_activity = feeding[index] * (1.0 + self._params.B * linking[index])
-            
-            # calculate output of the oscillator
-            if internal_activity > self._threshold[index]:
-                outputs[index] = self.__OUTPUT_TRUE
-            else:
-                outputs[index] = self.__OUTPUT_FALSE
-            
-            # In case of Fast Linking we should calculate threshold until output is changed.
-            if self._params.FAST_LINKING is not True:
-                threshold[index] = self._params.AT * self._threshold[index] + self._params.VT * outputs[index]
-
-        # In case of Fast Linking we need to wait until output is changed.
+        feeding = self._params.AF * self._feeding + numpy.asarray(stimulus, dtype=float) + self._params.VF * self._params.M * neighbor_outputs
+        linking = self._params.AL * self._linking + self._params.VL * self._params.W * neighbor_outputs
+        
+        # calculate internal activity and output of the oscillators
+        outputs = (feeding * (1.0 + self._params.B * linking) > self._threshold).astype(numpy.uint8)
+        
+        # In case of Fast Linking we need to wait until output is changed (or until outputs start to alternate between two states).
         if self._params.FAST_LINKING is True:
-            output_change = True    # Set it True for the for the first iteration.
-            previous_outputs = outputs[:]
-
-            while output_change is True:
-                current_output_change = False
-
-                for index in range(0, self._num_osc, 1):
-                    linking_influence = 0.0
-
-                    neighbors = self.get_neighbors(index)
-                    for index_neighbour in neighbors:
-                        linking_influence += previous_outputs[index_neighbour] * self._params.W
-                    
-                    linking_influence *= self._params.VL
-                    linking[index] = linking_influence
-                    
-                    internal_activity = feeding[index] * (1.0 + self._params.B * linking[index])
-                    
-                    # calculate output of the oscillator
-                    if internal_activity > self._threshold[index]:
-                        outputs[index] = self.__OUTPUT_TRUE
-                    else:
-                        outputs[index] = self.__OUTPUT_FALSE
-
-                    current_output_change |= (outputs[index] != previous_outputs[index])
-                
-                output_change = current_output_change
+            previous_outputs, preceding_outputs = None, None
+            
+            while not numpy.array_equal(outputs, previous_outputs) and not numpy.array_equal(outputs, preceding_outputs):
+                preceding_outputs, previous_outputs = previous_outputs, outputs
                 
-                if output_change is True:
-                    previous_outputs = outputs[:]
+                linking = self._params.VL * self._params.W * connections.dot(previous_outputs.astype(float))
+                outputs = (feeding * (1.0 + self._params.B * linking) > self._threshold).astype(numpy.uint8)
         
         # In case of Fast Linking threshold should be calculated after fast linking.
-        if self._params.FAST_LINKING is True:
-            for index in range(0, self._num_osc, 1):
-                threshold[index] = self._params.AT * self._threshold[index] + self._params.VT * outputs[index]
+        self._threshold = self._params.AT * self._threshold + self._params.VT * outputs
         
-        self._feeding = feeding[:]
-        self._linking = linking[:]
-        self._threshold = threshold[:]
+        self._feeding = feeding
+        self._linking = linking
         
         return outputs
@@ -27,6 +27,7 @@
 
 import math
 
+import numpy
 import random
 
 import matplotlib.pyplot as plt
@@ -35,7 +36,7 @@ import pyclustering.core.som_wrapper as wrapper
 
 from pyclustering.core.wrapper import ccore_library
 
-from pyclustering.utils import euclidean_distance_square
+from pyclustering.utils import euclidean_distance_square, euclidean_distance_square_blocks
 from pyclustering.utils.dimension import dimension_info
 
 from enum import IntEnum
@@ -83,6 +84,22 @@ class type_init(IntEnum):
     uniform_grid = 3
 
 
+class type_train(IntEnum):
+    """!
+    @brief Enumeration of training types for SOM.
+    
+    @see som
+    
+    """
+    
+    ## Weights are adapted after each presented object (classic online SOM).
+    online = 0
+    
+    ## Weights are updated once per epoch as weighted averages of objects in neighborhood of each neuron (batch SOM), learning rate is not used.
+    ## Weights converge quickly for each radius, therefore autostop condition can be reached while neighborhood is still wide.
+    batch = 1
+
+
 class som_parameters:
     """!
     @brief Represents SOM parameters.
@@ -106,6 +123,9 @@ class som_parameters:
         
         ## Condition when learining process should be stoped. It's used when autostop mode is used. 
         self.adaptation_threshold = 0.001
+        
+        ## Type of training (online or batch), batch training is supported only by Python implementation.
+        self.train_type = type_train.online
 
 
 class som:
@@ -116,6 +136,7 @@ class som:
              high-dimensional data into simple geometric relationships on a low-dimensional display.
     
     @details CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
+             Batch training (see type_train) is supported only by Python implementation, therefore CCORE is not used in this case.
     
     Example:
     @code
@@ -194,7 +215,7 @@ class som:
         """!
         @brief Return weight of each neuron.
 
-        @return (list) Weights of each neuron.
+        @return (numpy.array) Weights of each neuron (list in case of CCORE).
         
         """
         
@@ -276,7 +297,7 @@ class som:
         if self._params.init_radius is None:
             self._params.init_radius = self.__initialize_initial_radius(rows, cols)
         
-        if (ccore is True) and ccore_library.workable():
+        if (ccore is True) and ccore_library.workable() and (self._params.train_type == type_train.online):
             self.__ccore_som_pointer = wrapper.som_create(rows, cols, conn_type, self._params)
             
         else:
@@ -284,7 +305,7 @@ class som:
             self._location = self.__initialize_locations(rows, cols)
             
             # default weights
-            self._weights = [ [0.0] ] * self._size
+            self._weights = numpy.zeros((self._size, 1))
             
             # awards
             self._award = [0] * self._size
@@ -391,19 +412,42 @@ class som:
         @param[in] size (uint): Amount of neurons in the network.
         @param[in] location (list): List of coordinates of each neuron in the network.
         
-        @return (list) Distance matrix between neurons in the network.
+        @return (numpy.array) Distance matrix between neurons in the network.
         
         """
-        sqrt_distances = [ [ [] for i in range(size) ] for j in range(size) ]
-        for i in range(size):
-            for j in range(i, size, 1):
-                dist = euclidean_distance_square(location[i], location[j])
-                sqrt_distances[i][j] = dist
-                sqrt_distances[j][i] = dist
+        location = numpy.asarray(location, dtype=float).reshape(size, -1)
+        
+        sqrt_distances = numpy.zeros((size, size))
+        for dim in range(location.shape[1]):
+            sqrt_distances += numpy.square(location[:, dim, numpy.newaxis] - location[:, dim])
         
         return sqrt_distances
 
 
+    def __initialize_influences(self):
+        """!
+        @brief Calculates influence of each neuron-winner on each neuron in the network using current radius.
+        @details Neuron-winner is always adapted with influence 1, other neurons (all neurons in case of function neighbor,
+                  otherwise neighbors of the winner only) are adapted if distance to them is less than current radius.
+        
+        @return (numpy.array) Matrix where element [i][j] is influence of neuron-winner 'i' on neuron 'j'.
+        
+        """
+        
+        mask = self._sqrt_distances < self._local_radius
+        if self._conn_type != type_conn.func_neighbor:
+            connections = numpy.eye(self._size, dtype=bool)
+            for index in range(self._size):
+                connections[index, self._neighbors[index]] = True
+            
+            mask &= connections
+        
+        influences = numpy.where(mask, numpy.exp(-(self._sqrt_distances / (2.0 * self._local_radius))), 0.0)
+        numpy.fill_diagonal(influences, 1.0)
+        
+        return influences
+
+
     def _create_initial_weights(self, init_type):
         """!
         @brief Creates initial weights for neurons in line with the specified initialization.
@@ -457,6 +501,8 @@ class som:
         else:
             # Random weights of input data.
             self._weights = [[random.random() for i in range(dim_info.get_dimensions())] for _ in range(self._size)]
+        
+        self._weights = numpy.array(self._weights, dtype=float)
 
 
     def _create_connections(self, conn_type):
@@ -551,18 +597,30 @@ class som:
         
         """
         
-        index = 0
-        minimum = euclidean_distance_square(self._weights[0], x)
+        difference = self._weights - x
+        return int((difference * difference).sum(axis=1).argmin())
+
+
+    def _competition_batch(self, data):
+        """!
+        @brief Calculates neurons winners for a batch of input patterns.
+        @details Distances are calculated by blocks of input patterns to restrict amount of used memory (see euclidean_distance_square_blocks()).
         
-        for i in range(1, self._size, 1):
-            candidate = euclidean_distance_square(self._weights[i], x)
-            if candidate < minimum:
-                index = i
-                minimum = candidate
+        @param[in] data (array_like): Input patterns, for example coordinates of points.
         
-        return index
-    
-    
+        @return (numpy.array) Index of neuron winner of each input pattern.
+        
+        """
+        
+        data = numpy.asarray(data, dtype=float)
+        winners = numpy.empty(len(data), dtype=numpy.intp)
+        
+        for (begin, end, distances) in euclidean_distance_square_blocks(data, self._weights):
+            winners[begin:end] = numpy.argmin(distances, axis=1)
+        
+        return winners
+
+
     def _adaptation(self, index, x):
         """!
         @brief Change weight of neurons in line with won neuron.
@@ -572,34 +630,74 @@ class som:
         
         """
         
-        dimension = len(self._weights[0])
+        neurons = self._influence_neurons[index]
         
-        if self._conn_type == type_conn.func_neighbor:
-            for neuron_index in range(self._size):
-                distance = self._sqrt_distances[index][neuron_index]
-                
-                if distance < self._local_radius:
-                    influence = math.exp(-(distance / (2.0 * self._local_radius)))
-                    
-                    for i in range(dimension):
-                        self._weights[neuron_index][i] = self._weights[neuron_index][i] + self._learn_rate * influence * (x[i] - self._weights[neuron_index][i])
-                    
-        else:
-            for i in range(dimension):
-                self._weights[index][i] = self._weights[index][i] + self._learn_rate * (x[i] - self._weights[index][i])
-                
-            for neighbor_index in self._neighbors[index]: 
-                distance = self._sqrt_distances[index][neighbor_index]
-                if distance < self._local_radius:
-                    influence = math.exp(-(distance / (2.0 * self._local_radius)))
-                    
-                    for i in range(dimension):       
-                        self._weights[neighbor_index][i] = self._weights[neighbor_index][i] + self._learn_rate * influence * (x[i] - self._weights[neighbor_index][i])
+        weights = self._weights[neurons]
+        weights += self._influence_rates[index] * (x - weights)
+        
+        self._weights[neurons] = weights
+
+
+    def _batch_adaptation(self, data, winners):
+        """!
+        @brief Updates weights of all neurons as averages of input patterns weighted by influence of their neuron-winners.
+        @details Neurons without any input pattern in their neighborhood keep their weights.
+        
+        @param[in] data (numpy.array): Input patterns from the input data set.
+        @param[in] winners (numpy.array): Index of neuron winner of each input pattern.
+        
+        """
+        
+        counts = numpy.bincount(winners, minlength=self._size).astype(float)
+        
+        sums = numpy.zeros(self._weights.shape)
+        numpy.add.at(sums, winners, data)
+        
+        influences = self.__initialize_influences()
+        numerators = influences.T.dot(sums)
+        denominators = influences.T.dot(counts)
+        
+        updated = denominators > 0.0
+        self._weights[updated] = numerators[updated] / denominators[updated, numpy.newaxis]
+
+
+    def __prepare_adaptation(self):
+        """!
+        @brief Prepares neurons and their learning rates (multiplied by influence) that are adapted by each neuron-winner in
+                line with current radius and learning rate.
+        
+        """
+        
+        influences = self.__initialize_influences()
+        
+        self._influence_neurons = []
+        self._influence_rates = []
+        for index in range(self._size):
+            neurons = numpy.nonzero(influences[index])[0]
+            
+            self._influence_neurons.append(neurons)
+            self._influence_rates.append((self._learn_rate * influences[index, neurons])[:, numpy.newaxis])
+
+
+    def __update_statistics(self, winners):
+        """!
+        @brief Updates amount of captured objects by each neuron and their indexes.
+        
+        @param[in] winners (numpy.array): Index of neuron winner of each object.
+        
+        """
+        
+        self._award = numpy.bincount(winners, minlength=self._size).tolist()
+        
+        order = numpy.argsort(winners, kind='stable')
+        borders = numpy.cumsum(self._award)[:-1]
+        self._capture_objects = [objects.tolist() for objects in numpy.split(order, borders)]
 
 
     def train(self, data, epochs, autostop=False):
         """!
         @brief Trains self-organized feature map (SOM).
+        @details Type of training (online or batch) is defined by parameter 'train_type' (see som_parameters).
 
         @param[in] data (list): Input data - list of points where each point is represented by list of features, for example coordinates.
         @param[in] epochs (uint): Number of epochs for training.        
@@ -616,13 +714,13 @@ class som:
 
         self._sqrt_distances = self.__initialize_distances(self._size, self._location)
 
-        for i in range(self._size):
-            self._award[i] = 0
-            self._capture_objects[i].clear()
+        self._award = [0] * self._size
+        self._capture_objects = [ [] for _ in range(self._size) ]
         
         # weights
         self._create_initial_weights(self._params.init_type)
         
+        patterns = numpy.array(self._data, dtype=float).reshape(len(self._data), -1)
         previous_weights = None
         
         for epoch in range(1, epochs + 1):
@@ -630,23 +728,26 @@ class som:
             self._local_radius = (self._params.init_radius * math.exp(-(epoch / epochs))) ** 2
             self._learn_rate = self._params.init_learn_rate * math.exp(-(epoch / epochs))
             
-            # Clear statistics
-            if autostop:
-                for i in range(self._size):
-                    self._award[i] = 0
-                    self._capture_objects[i].clear()
+            if self._params.train_type == type_train.batch:
+                winners = self._competition_batch(patterns)
+                self._batch_adaptation(patterns, winners)
             
-            for i in range(len(self._data)):
-                # Step 1: Competition:
-                index = self._competition(self._data[i])
-                    
-                # Step 2: Adaptation:   
-                self._adaptation(index, self._data[i])
+            else:
+                self.__prepare_adaptation()
                 
-                # Update statistics
-                if (autostop == True) or (epoch == epochs):
-                    self._award[index] += 1
-                    self._capture_objects[index].append(i)
+                winners = numpy.empty(len(patterns), dtype=numpy.intp)
+                for i in range(len(patterns)):
+                    # Step 1: Competition:
+                    index = self._competition(patterns[i])
+                    
+                    # Step 2: Adaptation:
+                    self._adaptation(index, patterns[i])
+                    
+                    winners[i] = index
+            
+            # Update statistics
+            if (autostop == True) or (epoch == epochs):
+                self.__update_statistics(winners)
             
             # Check requirement of stopping
             if autostop:
@@ -655,7 +756,7 @@ class som:
                     if maximal_adaptation < self._params.adaptation_threshold:
                         return epoch
             
-                previous_weights = [item[:] for item in self._weights]
+                previous_weights = self._weights.copy()
         
         return epochs
 
@@ -664,18 +765,27 @@ class som:
         """!
         @brief Processes input pattern (no learining) and returns index of neuron-winner.
                Using index of neuron winner catched object can be obtained using property capture_objects.
+        @details Batch of input patterns can be processed at once, in this case list of neuron-winners is returned.
                
-        @param[in] input_pattern (list): Input pattern.
+        @param[in] input_pattern (list): Input pattern or list of input patterns.
         
-        @return (uint) Returns index of neuron-winner.
+        @return (uint) Returns index of neuron-winner (list of indexes of neuron-winners in case of list of input patterns).
                
         @see capture_objects
         
         """
 
+        is_batch = numpy.ndim(input_pattern) > 1
+
         if self.__ccore_som_pointer is not None:
-            return wrapper.som_simulate(self.__ccore_som_pointer, input_pattern)
+            if is_batch:
+                return [wrapper.som_simulate(self.__ccore_som_pointer, pattern) for pattern in input_pattern]
             
+            return wrapper.som_simulate(self.__ccore_som_pointer, input_pattern)
+        
+        if is_batch:
+            return self._competition_batch(input_pattern).tolist()
+        
         return self._competition(input_pattern)
 
 
@@ -689,20 +799,7 @@ class som:
         
         """
         
-        dimension = len(self._data[0])
-        maximal_adaptation = 0.0
-        
-        for neuron_index in range(self._size):
-            for dim in range(dimension):
-                current_adaptation = previous_weights[neuron_index][dim] - self._weights[neuron_index][dim]
-                        
-                if current_adaptation < 0:
-                    current_adaptation = -current_adaptation
-                        
-                if maximal_adaptation < current_adaptation:
-                    maximal_adaptation = current_adaptation
-                    
-        return maximal_adaptation
+        return float(numpy.max(numpy.abs(numpy.asarray(previous_weights) - self._weights)))
 
 
     def get_winner_number(self):
@@ -1010,7 +1107,7 @@ class som:
         self.__upload_common_part(state_dump)
 
         self._location = state_dump['location']
-        self._weights = state_dump['weights']
+        self._weights = numpy.array(state_dump['weights'], dtype=float)
         self._award = state_dump['award']
         self._capture_objects = state_dump['capture_objects']
 
@@ -36,8 +36,9 @@ import pyclustering.core.sync_wrapper as wrapper;
 from pyclustering.core.wrapper import ccore_library;
 
 from scipy.integrate import odeint;
+from scipy.sparse import csr_matrix;
 
-from pyclustering.nnet import network, conn_represent, conn_type, initial_type, solve_type;
+from pyclustering.nnet import network, dynamic_view, conn_represent, conn_type, initial_type, solve_type;
 from pyclustering.utils import pi, draw_dynamics, draw_dynamics_set, set_ax_param;
 
 
@@ -45,6 +46,8 @@ class order_estimator:
     """!
     @brief Provides services to calculate order parameter and local order parameter that are used
             for synchronization level estimation.
+    @details Both parameters can be calculated for phases on one iteration or for matrix of phases [iterations x oscillators],
+              in the last case parameters of all iterations are calculated at once.
 
     """
     @staticmethod
@@ -54,25 +57,25 @@ class order_estimator:
         @details This parameter is tend 1.0 when the oscillatory network close to global synchronization and it tend to 0.0 when 
                   desynchronization is observed in the network.
         
-        @param[in] oscillator_phases (list): List of oscillator phases that are used for level of global synchronization.
+        @param[in] oscillator_phases (array_like): List of oscillator phases that are used for level of global synchronization or
+                    matrix of phases where each row corresponds to iteration of simulation.
         
-        @return (double) Level of global synchronization (order parameter).
+        @return (double|numpy.ndarray) Level of global synchronization (order parameter) or levels of each iteration in case of matrix.
         
         @see calculate_order_parameter()
         
         """
         
-        exp_amount = 0.0;
-        average_phase = 0.0;
-
-        for phase in oscillator_phases:
-            exp_amount += math.expm1( abs(1j * phase) );
-            average_phase += phase;
+        phases = numpy.asarray(oscillator_phases, dtype = numpy.float64);
         
-        exp_amount /= len(oscillator_phases);
-        average_phase = math.expm1( abs(1j * (average_phase / len(oscillator_phases))) );
+        exp_amount = numpy.mean(numpy.expm1(numpy.abs(phases)), axis = -1);
+        average_phase = numpy.expm1(numpy.abs(numpy.mean(phases, axis = -1)));
         
-        return abs(average_phase) / abs(exp_amount);
+        order = numpy.abs(average_phase) / numpy.abs(exp_amount);
+        if (phases.ndim == 1):
+            return float(order);
+        
+        return order;
 
 
     @staticmethod
@@ -82,26 +85,26 @@ class order_estimator:
         @details This parameter is tend 1.0 when the oscillatory network close to local synchronization and it tend to 0.0 when 
                   desynchronization is observed in the network.
         
-        @param[in] oscillator_phases (list): List of oscillator phases that are used for level of local (partial) synchronization.
+        @param[in] oscillator_phases (array_like): List of oscillator phases that are used for level of local (partial) synchronization
+                    or matrix of phases where each row corresponds to iteration of simulation.
         @param[in] oscillatory_network (sync): Instance of oscillatory network whose connections are required for calculation.
         
-        @return (double) Level of local synchronization (local order parameter).
+        @return (double|numpy.ndarray) Level of local synchronization (local order parameter) or levels of each iteration in case of matrix.
         
         """
         
-        exp_amount = 0.0;
-        num_neigh = 0.0;
+        phases = numpy.asarray(oscillator_phases, dtype = numpy.float64);
+        
+        (offsets, neighbors) = oscillatory_network._get_sparse_connections();
+        owners = numpy.repeat(numpy.arange(len(oscillatory_network)), numpy.diff(offsets));
         
-        for i in range(0, len(oscillatory_network), 1):
-            for j in range(0, len(oscillatory_network), 1):
-                if (oscillatory_network.has_connection(i, j) == True):
-                    exp_amount += math.exp(-abs(oscillator_phases[j] - oscillator_phases[i]));
-                    num_neigh += 1.0;
+        exp_amount = numpy.sum(numpy.exp(-numpy.abs(phases[..., neighbors] - phases[..., owners])), axis = -1);
+        order = exp_amount / max(len(neighbors), 1);
         
-        if (num_neigh == 0):
-            num_neigh = 1.0;
+        if (phases.ndim == 1):
+            return float(order);
         
-        return exp_amount / num_neigh;
+        return order;
 
 
 
@@ -135,6 +138,42 @@ class sync_dynamic:
         return self._time;
     
     
+    @property
+    def output_view(self):
+        """!
+        @brief (dynamic_view) Returns lazy view over output dynamic of the Sync network, only window that is requested by indexing
+                is copied, for example, 'output_view[-1]' or 'output_view[10:20, [0, 5]]'.
+        
+        @see get_output()
+        
+        """
+        if (self._ccore_sync_dynamic_pointer is not None):
+            pointer_dynamic = self._ccore_sync_dynamic_pointer;
+            amount_oscillators = wrapper.sync_dynamic_get_oscillators(pointer_dynamic);
+            return dynamic_view(lambda iterations, indexes: wrapper.sync_dynamic_get_output_window(pointer_dynamic, iterations, indexes), len(self), amount_oscillators, self);
+        
+        amount_oscillators = 0;
+        if ( (self._dynamic is not None) and (len(self._dynamic) > 0) ):
+            amount_oscillators = len(self._dynamic[0]);
+        
+        return dynamic_view(self._dynamic, len(self), amount_oscillators);
+    
+    
+    @property
+    def time_view(self):
+        """!
+        @brief (dynamic_view) Returns lazy one-dimensional view over sampling times of the dynamic.
+        
+        @see get_time()
+        
+        """
+        if (self._ccore_sync_dynamic_pointer is not None):
+            pointer_dynamic = self._ccore_sync_dynamic_pointer;
+            return dynamic_view(lambda iterations: wrapper.sync_dynamic_get_time_window(pointer_dynamic, iterations), len(self), owner = self);
+        
+        return dynamic_view(self._time, len(self));
+    
+    
     def __init__(self, phase, time, ccore = None):
         """!
         @brief Constructor of Sync dynamic.
@@ -186,9 +225,45 @@ class sync_dynamic:
             raise NameError('Out of range ' + index + ': only indexes 0 and 1 are supported.');
 
 
+    def get_output(self, start_iteration = None, stop_iteration = None, indexes = None):
+        """!
+        @brief Returns window of output dynamic (phase coordinates of oscillators) as numpy array where each row corresponds to iteration.
+        @details In case of CCORE only the window is copied from the dynamic.
+        
+        @param[in] start_iteration (int): The first iteration of the window, if 'None' then the first iteration is used.
+        @param[in] stop_iteration (int): Iteration where the window is ended (it is not included), if 'None' then the window is ended by the last iteration.
+        @param[in] indexes (list): Indexes of oscillators whose phases should be returned, if 'None' then all oscillators are used.
+        
+        @return (numpy.ndarray) Phases of oscillators with shape [amount_iterations x amount_oscillators].
+        
+        @see output_view
+        
+        """
+        
+        return self.output_view[start_iteration:stop_iteration, indexes];
+
+
+    def get_time(self, start_iteration = None, stop_iteration = None):
+        """!
+        @brief Returns window of sampling times as numpy array.
+        
+        @param[in] start_iteration (int): The first iteration of the window, if 'None' then the first iteration is used.
+        @param[in] stop_iteration (int): Iteration where the window is ended (it is not included), if 'None' then the window is ended by the last iteration.
+        
+        @return (numpy.ndarray) Sampling times of the window.
+        
+        @see time_view
+        
+        """
+        
+        return self.time_view[start_iteration:stop_iteration];
+
+
     def allocate_sync_ensembles(self, tolerance = 0.01, indexes = None, iteration = None):
         """!
         @brief Allocate clusters in line with ensembles of synchronous oscillators where each synchronous ensemble corresponds to only one cluster.
+        @details Python implementation sorts phases on the circle and splits them where distance between neighbor phases is not less than
+                  tolerance, thus complexity is O(N log N). Oscillators in each ensemble are sorted and ensembles are ordered by their first oscillator.
                
         @param[in] tolerance (double): Maximum error for allocation of synchronous ensemble oscillators.
         @param[in] indexes (list): List of real object indexes and it should be equal to amount of oscillators (in case of 'None' - indexes are in range [0; amount_oscillators]).
@@ -212,40 +287,28 @@ class sync_dynamic:
         if ( (self._dynamic is None) or (len(self._dynamic) == 0) ):
             return [];
         
-        number_oscillators = len(self._dynamic[0]);
-        last_state = None;
-        
         if (iteration is None):
-            last_state = self._dynamic[len(self._dynamic) - 1];
-        else:
-            last_state = self._dynamic[iteration];
-        
-        clusters = [];
-        if (number_oscillators > 0):
-            clusters.append([0]);
-        
-        for i in range(1, number_oscillators, 1):
-            cluster_allocated = False;
-            for cluster in clusters:
-                for neuron_index in cluster:
-                    last_state_shifted = abs(last_state[i] - 2 * pi);
-                    
-                    if ( ( (last_state[i] < (last_state[neuron_index] + tolerance)) and (last_state[i] > (last_state[neuron_index] - tolerance)) ) or
-                         ( (last_state_shifted < (last_state[neuron_index] + tolerance)) and (last_state_shifted > (last_state[neuron_index] - tolerance)) ) ):
-                        cluster_allocated = True;
-                        
-                        real_index = i;
-                        if (indexes is not None):
-                            real_index = indexes[i];
-                        
-                        cluster.append(real_index);
-                        break;
-                
-                if (cluster_allocated == True):
-                    break;
-            
-            if (cluster_allocated == False):
-                clusters.append([i]);
+            iteration = len(self._dynamic) - 1;
+        
+        phases = numpy.mod(numpy.asarray(self._dynamic[iteration], dtype = numpy.float64), 2.0 * pi);
+        if (len(phases) == 0):
+            return [];
+        
+        # Neighbor phases on the circle that are closer than tolerance belong to the same ensemble.
+        order = numpy.argsort(phases, kind = 'stable');
+        sorted_phases = phases[order];
+        
+        borders = numpy.nonzero(numpy.diff(sorted_phases) >= tolerance)[0] + 1;
+        ensembles = numpy.split(order, borders);
+        
+        if ( (len(ensembles) > 1) and (sorted_phases[0] + 2.0 * pi - sorted_phases[-1] < tolerance) ):
+            ensembles[0] = numpy.concatenate((ensembles.pop(), ensembles[0]));
+        
+        clusters = [ numpy.sort(ensemble).tolist() for ensemble in ensembles ];
+        clusters.sort(key = lambda cluster: cluster[0]);
+        
+        if (indexes is not None):
+            clusters = [ [ indexes[index] for index in cluster ] for cluster in clusters ];
         
         return clusters;
     
@@ -266,14 +329,13 @@ class sync_dynamic:
         
         """
         
-        output_dynamic = self.output;
-        
-        if ( (output_dynamic is None) or (len(output_dynamic) == 0) ):
+        if (len(self) == 0):
             return [];
         
-        current_dynamic = output_dynamic[len(output_dynamic) - 1];
-        if (iteration is not None):
-            current_dynamic = output_dynamic[iteration];
+        if (iteration is None):
+            iteration = len(self) - 1;
+        
+        current_dynamic = self.output_view[iteration].tolist();
         
         width_matrix = grid_width;
         height_matrix = grid_height;
@@ -311,22 +373,15 @@ class sync_dynamic:
         if ( (self._dynamic is None) or (len(self._dynamic) == 0) ):
             return [];
         
-        dynamic = self._dynamic;
-        current_dynamic = dynamic[len(dynamic) - 1];
+        if (iteration is None):
+            iteration = len(self._dynamic) - 1;
         
-        if (iteration is not None):
-            current_dynamic = dynamic[iteration];
+        phases = numpy.asarray(self._dynamic[iteration], dtype = numpy.float64);
+        (sines, cosines) = (numpy.sin(phases), numpy.cos(phases));
         
-        number_oscillators = len(dynamic[0]);
-        affinity_matrix = [ [ 0.0 for i in range(number_oscillators) ] for j in range(number_oscillators) ];
+        # |sin(phase1 - phase2)| = |sin(phase1) * cos(phase2) - cos(phase1) * sin(phase2)|
+        affinity_matrix = numpy.abs(numpy.outer(sines, cosines) - numpy.outer(cosines, sines)).tolist();
         
-        for i in range(number_oscillators):
-            for j in range(number_oscillators):
-                phase1 = current_dynamic[i];
-                phase2 = current_dynamic[j];
-                
-                affinity_matrix[i][j] = abs(math.sin(phase1 - phase2));
-                
         return affinity_matrix;
 
 
@@ -366,11 +421,8 @@ class sync_dynamic:
         if (self._ccore_sync_dynamic_pointer is not None):
             return wrapper.sync_dynamic_calculate_order(self._ccore_sync_dynamic_pointer, start_iteration, stop_iteration);
         
-        sequence_order = [];
-        for index in range(start_iteration, stop_iteration):
-            sequence_order.append(order_estimator.calculate_sync_order(self.output[index]));
-        
-        return sequence_order;
+        phases = self.get_output(start_iteration, stop_iteration);
+        return order_estimator.calculate_sync_order(phases).tolist();
 
 
     def calculate_local_order_parameter(self, oscillatory_network, start_iteration = None, stop_iteration = None):
@@ -398,11 +450,8 @@ class sync_dynamic:
             network_pointer = oscillatory_network._ccore_network_pointer;
             return wrapper.sync_dynamic_calculate_local_order(self._ccore_sync_dynamic_pointer, network_pointer, start_iteration, stop_iteration);
         
-        sequence_local_order = [];
-        for index in range(start_iteration, stop_iteration):
-            sequence_local_order.append(order_estimator.calculate_local_sync_order(self.output[index], oscillatory_network));
-        
-        return sequence_local_order;
+        phases = self.get_output(start_iteration, stop_iteration);
+        return order_estimator.calculate_local_sync_order(phases, oscillatory_network).tolist();
 
 
     def __get_start_stop_iterations(self, start_iteration, stop_iteration):
@@ -442,7 +491,7 @@ class sync_visualizer:
         
         """
         
-        draw_dynamics(sync_output_dynamic.time, sync_output_dynamic.output, x_title = "t", y_title = "phase", y_lim = [0, 2 * 3.14]);
+        draw_dynamics(sync_output_dynamic.get_time(), sync_output_dynamic.get_output(), x_title = "t", y_title = "phase", y_lim = [0, 2 * 3.14]);
     
     
     @staticmethod
@@ -516,7 +565,7 @@ class sync_visualizer:
         
         order_parameter = sync_output_dynamic.calculate_order_parameter(start_iteration, stop_iteration);
         axis = plt.subplot(111);
-        plt.plot(sync_output_dynamic.time[start_iteration:stop_iteration], order_parameter, 'b-', linewidth = 2.0);
+        plt.plot(sync_output_dynamic.get_time(start_iteration, stop_iteration), order_parameter, 'b-', linewidth = 2.0);
         set_ax_param(axis, "t", "R (order parameter)", None, [0.0, 1.05]);
         
         plt.show();
@@ -537,7 +586,7 @@ class sync_visualizer:
         
         order_parameter = sync_output_dynamic.calculate_local_order_parameter(oscillatory_network, start_iteration, stop_iteration);
         axis = plt.subplot(111);
-        plt.plot(sync_output_dynamic.time[start_iteration:stop_iteration], order_parameter, 'b-', linewidth = 2.0);
+        plt.plot(sync_output_dynamic.get_time(start_iteration, stop_iteration), order_parameter, 'b-', linewidth = 2.0);
         set_ax_param(axis, "t", "R (local order parameter)", None, [0.0, 1.05]);
         
         plt.show();
@@ -556,14 +605,14 @@ class sync_visualizer:
         
         figure = plt.figure();
         
-        dynamic = sync_output_dynamic.output[0];
+        dynamic = sync_output_dynamic.output_view[0];
         artist, = plt.polar(dynamic, [1.0] * len(dynamic), 'o', color = 'blue');
         
         def init_frame():
             return [ artist ];
         
         def frame_generation(index_dynamic):
-            dynamic = sync_output_dynamic.output[index_dynamic];
+            dynamic = sync_output_dynamic.output_view[index_dynamic];
             artist.set_data(dynamic, [1.0] * len(dynamic));
             
             return [ artist ];
@@ -680,7 +729,7 @@ class sync_visualizer:
         
         """
         
-        dynamic = sync_output_dynamic.output[0];
+        dynamic = sync_output_dynamic.output_view[0];
         correlation_matrix = sync_output_dynamic.allocate_correlation_matrix(0);
         
         figure = plt.figure(1);
@@ -697,7 +746,7 @@ class sync_visualizer:
             return [ artist1, artist2 ];
 
         def frame_generation(index_dynamic):
-            dynamic = sync_output_dynamic.output[index_dynamic];
+            dynamic = sync_output_dynamic.output_view[index_dynamic];
             artist1.set_data(dynamic, [1.0] * len(dynamic));
             
             correlation_matrix = sync_output_dynamic.allocate_correlation_matrix(index_dynamic);
@@ -718,7 +767,10 @@ class sync_network(network):
     """!
     @brief Model of oscillatory network that is based on the Kuramoto model of synchronization.
     
-    @details CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
+    @details Python implementation integrates phases of all oscillators at once as one system of differential equations,
+              coupling term is calculated by product of (sparse) matrix of connections and vectors of sines and cosines of phases.
+              
+              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
     
     """
 
@@ -730,7 +782,7 @@ class sync_network(network):
         @param[in] weight (double): Coupling strength of the links between oscillators.
         @param[in] frequency (double): Multiplier of internal frequency of the oscillators.
         @param[in] type_conn (conn_type): Type of connection between oscillators in the network (all-to-all, grid, bidirectional list, etc.).
-        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix or list.
+        @param[in] representation (conn_represent): Internal representation of connection in the network: matrix, list or compressed sparse rows (CSR).
         @param[in] initial_phases (initial_type): Type of initialization of initial phases of oscillators (random, uniformly distributed, etc.).
         @param[in] ccore (bool): If True simulation is performed by CCORE library (C++ implementation of pyclustering).
         
@@ -760,6 +812,8 @@ class sync_network(network):
                     self._phases.append( pi / num_osc * index);
                 
                 self._freq.append(random.random() * frequency);
+            
+            self._conn_matrix = None;
 
 
     def __del__(self):
@@ -819,28 +873,91 @@ class sync_network(network):
         if (self._ccore_network_pointer is not None):
             return wrapper.sync_local_order(self._ccore_network_pointer);
         
-        return order_estimator.calculate_local_sync_order(self._phases, self);
+        connections = self._get_connection_matrix();
+        if (connections.nnz == 0):
+            return 0.0;
+        
+        phases = numpy.array(self._phases);
+        owners = numpy.repeat(numpy.arange(self._num_osc), numpy.diff(connections.indptr));
+        
+        return numpy.sum(numpy.exp(-numpy.abs(phases[connections.indices] - phases[owners]))) / connections.nnz;
 
 
-    def _phase_kuramoto(self, teta, t, argv):
+    def _phase_kuramoto(self, phases, t):
         """!
-        @brief Returns result of phase calculation for specified oscillator in the network.
+        @brief Returns derivative of phases of all oscillators in the network.
         
-        @param[in] teta (double): Phase of the oscillator that is differentiated.
+        @param[in] phases (numpy.array): Phases of oscillators that are differentiated.
         @param[in] t (double): Current time of simulation.
-        @param[in] argv (tuple): Index of the oscillator in the list.
         
-        @return (double) New phase for specified oscillator (don't assign here).
+        @return (numpy.array) Derivative of phase of each oscillator.
         
         """
         
-        index = argv;
-        phase = 0;
-        for k in range(0, self._num_osc):
-            if (self.has_connection(index, k) == True):
-                phase += math.sin(self._phases[k] - teta);
+        if (self.structure == conn_type.ALL_TO_ALL):
+            coupling = self._calculate_coupling(phases);
+        else:
+            coupling = self._calculate_coupling(phases, self._get_connection_matrix());
+        
+        return numpy.asarray(self._freq) + coupling * self._weight / self._num_osc;
+
+
+    @staticmethod
+    def _calculate_coupling(phases, weights = None, harmonic = 1):
+        """!
+        @brief Calculates weighted sum of sin(harmonic * (phase[j] - phase[i])) over oscillators 'j' for each oscillator 'i'.
+        @details Sine of difference is decomposed into sin(a[j])cos(a[i]) - cos(a[j])sin(a[i]), therefore the sum is
+                  calculated by product of weights and vectors of sines and cosines instead of all pairwise differences.
+        
+        @param[in] phases (numpy.array): Phases of oscillators.
+        @param[in] weights (numpy.array|csr_matrix): Weights of connections between oscillators, if it is None then
+                    all oscillators are connected with each other with weight 1.
+        @param[in] harmonic (uint): Multiplier of difference between phases.
+        
+        @return (numpy.array) Coupling term of each oscillator.
+        
+        """
+        
+        sin_phases = numpy.sin(harmonic * phases);
+        cos_phases = numpy.cos(harmonic * phases);
+        
+        if (weights is None):
+            return cos_phases * numpy.sum(sin_phases) - sin_phases * numpy.sum(cos_phases);
+        
+        return cos_phases * weights.dot(sin_phases) - sin_phases * weights.dot(cos_phases);
+
+
+    def _get_connection_matrix(self):
+        """!
+        @brief Returns sparse matrix of connections between oscillators where each connection has weight 1.
+        @details Matrix is created once and is stored until connections are changed.
+        
+        @return (csr_matrix) Matrix of connections.
+        
+        """
+        
+        if (self._conn_matrix is None):
+            (offsets, indexes) = self._get_sparse_connections();
             
-        return ( self._freq[index] + (phase * self._weight / self._num_osc) );
+            self._conn_matrix = csr_matrix((numpy.ones(len(indexes)), indexes, offsets), shape = (self._num_osc, self._num_osc));
+            self._conn_matrix.sum_duplicates();
+        
+        return self._conn_matrix;
+
+
+    def set_connection(self, i, j):
+        """!
+        @brief Couples two specified oscillators in the network with dynamic connections.
+        
+        @param[in] i (uint): index of an oscillator that should be coupled with oscillator 'j' in the network.
+        @param[in] j (uint): index of an oscillator that should be coupled with oscillator 'i' in the network.
+        
+        @note This method can be used only in case of DYNAMIC connections, otherwise it throws expection.
+        
+        """
+        
+        super().set_connection(i, j);
+        self._conn_matrix = None;
 
 
     def simulate(self, steps, time, solution = solve_type.FAST, collect_dynamic = True):
@@ -981,6 +1098,7 @@ class sync_network(network):
     def _calculate_phases(self, solution, t, step, int_step):
         """!
         @brief Calculates new phases for oscillators in the network in line with current step.
+        @details Phases of all oscillators are integrated at once as one system of differential equations.
         
         @param[in] solution (solve_type): Type solver of the differential equation.
         @param[in] t (double): Time of simulation.
@@ -991,21 +1109,19 @@ class sync_network(network):
         
         """
         
-        next_phases = [0.0] * self._num_osc;    # new oscillator _phases
+        phases = numpy.array(self._phases, dtype = numpy.double);
         
-        for index in range (0, self._num_osc, 1):
-            if (solution == solve_type.FAST):
-                result = self._phases[index] + self._phase_kuramoto(self._phases[index], 0, index);
-                next_phases[index] = self._phase_normalization(result);
-                
-            elif ( (solution == solve_type.RK4) or (solution == solve_type.RKF45) ):
-                result = odeint(self._phase_kuramoto, self._phases[index], numpy.arange(t - step, t, int_step), (index , ));
-                next_phases[index] = self._phase_normalization(result[len(result) - 1][0]);
+        if (solution == solve_type.FAST):
+            next_phases = phases + self._phase_kuramoto(phases, 0);
             
-            else:
-                raise NameError("Solver '" + str(solution) + "' is not supported");
+        elif ( (solution == solve_type.RK4) or (solution == solve_type.RKF45) ):
+            result = odeint(self._phase_kuramoto, phases, numpy.arange(t - step, t, int_step));
+            next_phases = result[len(result) - 1];
+        
+        else:
+            raise NameError("Solver '" + str(solution) + "' is not supported");
         
-        return next_phases;
+        return numpy.mod(next_phases, 2.0 * pi).tolist();
 
 
     def _phase_normalization(self, teta):
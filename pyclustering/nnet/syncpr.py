@@ -143,7 +143,7 @@ class syncpr_visualizer(sync_visualizer):
             ax1 = figure.add_subplot(121, projection='polar');
             ax2 = figure.add_subplot(122);
             
-            dynamic = syncpr_output_dynamic.output[index_dynamic];
+            dynamic = syncpr_output_dynamic.output_view[index_dynamic];
             
             artist1, = ax1.plot(dynamic, [1.0] * len(dynamic), marker = 'o', color = 'blue', ls = '');
             artist2 = syncpr_visualizer.__show_pattern(ax2, syncpr_output_dynamic, image_height, image_width, index_dynamic);
@@ -176,7 +176,7 @@ class syncpr_visualizer(sync_visualizer):
         
         """
         
-        current_dynamic = syncpr_output_dynamic.output[iteration];
+        current_dynamic = syncpr_output_dynamic.output_view[iteration];
         stage_picture = [(255, 255, 255)] * (image_height * image_width);
         for index_phase in range(len(current_dynamic)):
             phase = current_dynamic[index_phase];
@@ -246,6 +246,7 @@ class syncpr(sync_network):
             self._increase_strength1 = increase_strength1;
             self._increase_strength2 = increase_strength2;
             self._coupling = [ [0.0 for i in range(num_osc)] for j in range(num_osc) ];
+            self.__coupling_matrix = None;
 
             super().__init__(num_osc, 1, 0, conn_type.ALL_TO_ALL, conn_represent.MATRIX, initial_type.RANDOM_GAUSSIAN, ccore)
     
@@ -303,6 +304,8 @@ class syncpr(sync_network):
                 
                 self._coupling[i][j] /= length;
                 self._coupling[j][i] = self._coupling[i][j];
+        
+        self.__coupling_matrix = None;
     
     
     def simulate(self, steps, time, pattern, solution = solve_type.RK4, collect_dynamic = True):
@@ -478,35 +481,26 @@ class syncpr(sync_network):
         return abs(memory_order);
         
     
-    def _phase_kuramoto(self, teta, t, argv):
+    def _phase_kuramoto(self, phases, t):
         """!
-        @brief Returns result of phase calculation for specified oscillator in the network.
+        @brief Returns derivative of phases of all oscillators in the network.
         
-        @param[in] teta (double): Phase of the oscillator that is differentiated.
+        @param[in] phases (numpy.array): Phases of oscillators that are differentiated.
         @param[in] t (double): Current time of simulation.
-        @param[in] argv (tuple): Index of the oscillator in the list.
         
-        @return (double) New phase for specified oscillator (don't assign it here).
+        @return (numpy.array) Derivative of phase of each oscillator (don't assign it here).
         
         """
         
-        index = argv;
+        if (self.__coupling_matrix is None):
+            self.__coupling_matrix = numpy.array(self._coupling);
         
-        phase = 0.0;
-        term = 0.0;
+        phase = self._calculate_coupling(phases, self.__coupling_matrix);
         
-        for k in range(0, self._num_osc):
-            if (k != index):
-                phase_delta = self._phases[k] - teta;
-                
-                phase += self._coupling[index][k] * math.sin(phase_delta);
-                
-                term1 = self._increase_strength1 * math.sin(2.0 * phase_delta);
-                term2 = self._increase_strength2 * math.sin(3.0 * phase_delta);
-                
-                term += (term1 - term2);
-                
-        return ( phase + term / len(self) );
+        term1 = self._increase_strength1 * self._calculate_coupling(phases, None, 2);
+        term2 = self._increase_strength2 * self._calculate_coupling(phases, None, 3);
+        
+        return ( phase + (term1 - term2) / len(self) );
     
     
     def __validate_pattern(self, pattern):
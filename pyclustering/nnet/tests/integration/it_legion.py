@@ -75,6 +75,10 @@ class LegionIntergrationTest(unittest.TestCase):
         LegionTestTemplates.templateOutputDynamicInformation([1, 0, 1], legion_parameters(), conn_type.LIST_BIDIR, 100, 100, True);
 
 
+    def testOutputDynamicWindowByCore(self):
+        LegionTestTemplates.templateOutputDynamicWindow([1, 0, 1], legion_parameters(), conn_type.LIST_BIDIR, 100, 100, True);
+
+
     @remove_library
     def testProcessingWhenLibraryCoreCorrupted(self):
         LegionTestTemplates.templateOscillationsWithStructures(conn_type.LIST_BIDIR, True);
@@ -86,6 +86,10 @@ class PcnnIntegrationTest(unittest.TestCase):
         PcnnTestTemplates.templateAllocationInRectangleStructure(30, 6, 5, 20, conn_type.GRID_EIGHT, None, [0] * 30, True);
 
 
+    def testOutputDynamicWindowByCore(self):
+        PcnnTestTemplates.templateOutputDynamicWindow(5, 20, conn_type.ALL_TO_ALL, [1, 3, 5, 7, 9], True);
+
+
     def testVisualizerNoFailureByCore(self):
         stimulus = [ 5, 5, 5, 5, 10, 10, 10, 10, 15, 15, 15, 15, 20, 20, 20, 20 ];
         PcnnTestTemplates.visualize(16, 20, conn_type.ALL_TO_ALL, conn_represent.MATRIX, stimulus, 4, 4, True);
@@ -93,6 +93,10 @@ class SyncIntegrationTest(unittest.TestCase):
         SyncTestTemplates.templateOutputDynamicCalculateLocalOrderParameter(True);
 
 
+    def testOutputDynamicWindowByCore(self):
+        SyncTestTemplates.templateOutputDynamicWindow(6, True);
+
+
     def testVisualizerNoFailuresByCore(self):
         SyncTestTemplates.templateVisualizerNoFailures(5, 10, True);
 
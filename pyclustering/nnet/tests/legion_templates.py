@@ -24,8 +24,10 @@
 """
 
 
+import numpy;
+
 from pyclustering.nnet.legion import legion_network;
-from pyclustering.nnet import conn_type;
+from pyclustering.nnet import conn_type, conn_represent, solve_type;
 
 from pyclustering.utils import extract_number_oscillations;
 
@@ -41,12 +43,15 @@ class LegionTestTemplates:
 
 
     @staticmethod
-    def templateSyncEnsembleAllocation(stimulus, params, type_conn, sim_steps, sim_time, expected_clusters, ccore_flag):
+    def templateSyncEnsembleAllocation(stimulus, params, type_conn, sim_steps, sim_time, expected_clusters, ccore_flag, **kwargs):
+        solution = kwargs.get('solution', solve_type.RK4);
+        repr_type = kwargs.get('repr_type', conn_represent.MATRIX);
+        
         result_testing = False;
          
         for _ in range(0, 5, 1):
-            net = legion_network(len(stimulus), params, type_conn, ccore = ccore_flag);
-            dynamic = net.simulate(sim_steps, sim_time, stimulus);
+            net = legion_network(len(stimulus), params, type_conn, repr_type, ccore = ccore_flag);
+            dynamic = net.simulate(sim_steps, sim_time, stimulus, solution);
              
             ensembles = dynamic.allocate_sync_ensembles(0.1);
             if (ensembles != expected_clusters):
@@ -65,4 +70,17 @@ class LegionTestTemplates:
          
         assert len(dynamic.output) > 0;
         assert len(dynamic.inhibitor) > 0;
-        assert len(dynamic.time) > 0;
\ No newline at end of file
+        assert len(dynamic.time) > 0;
+
+
+    @staticmethod
+    def templateOutputDynamicWindow(stimulus, params, type_conn, sim_steps, sim_time, ccore_flag):
+        dynamic = legion_network(len(stimulus), params, type_conn, ccore = ccore_flag).simulate(sim_steps, sim_time, stimulus);
+        
+        output = numpy.array(dynamic.output, dtype = numpy.float64);
+        inhibitor = numpy.array(dynamic.inhibitor, dtype = numpy.float64);
+        time = numpy.array(dynamic.time, dtype = numpy.float64);
+        
+        assert numpy.array_equal(output[10:20:3, [0, 2]], dynamic.output_view[10:20:3, [0, 2]]);
+        assert numpy.array_equal(inhibitor[-5:], dynamic.inhibitor_view[-5:]);
+        assert numpy.array_equal(time[-5:], dynamic.time_view[-5:]);
\ No newline at end of file
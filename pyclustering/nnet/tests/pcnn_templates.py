@@ -24,6 +24,9 @@
 """
 
 
+import numpy;
+import random;
+
 from pyclustering.nnet.pcnn import pcnn_network, pcnn_parameters, pcnn_visualizer;
 from pyclustering.nnet import conn_represent;
 
@@ -50,6 +53,25 @@ class PcnnTestTemplates:
         return PcnnTestTemplates.templateDynamicLength(num_osc, steps, type_conn, repr_type, stimulus, ccore, params=params);
 
 
+    @staticmethod
+    def templateRepresentationIndependence(num_osc, steps, type_conn, stimulus, fast_linking, seed):
+        params = pcnn_parameters();
+        params.FAST_LINKING = fast_linking;
+
+        outputs = [];
+        for repr_type in [ conn_represent.MATRIX, conn_represent.LIST, conn_represent.CSR ]:
+            random.seed(seed);
+
+            net = pcnn_network(num_osc, params, type_conn, repr_type, None, None, False);
+            dynamic = net.simulate(steps, stimulus);
+
+            assert steps == len(dynamic);
+            outputs.append(dynamic.output);
+
+        assert outputs[0] == outputs[1];
+        assert outputs[0] == outputs[2];
+
+
     @staticmethod
     def templateGridRectangleDynamicLength(num_osc, steps, type_conn, repr_type, height, width, stimulus, ccore):
         net = pcnn_network(num_osc, None, type_conn, repr_type, height, width, ccore);
@@ -125,4 +147,15 @@ class PcnnTestTemplates:
 
         pcnn_visualizer.show_time_signal(dynamic);
         pcnn_visualizer.show_output_dynamic(dynamic);
-        pcnn_visualizer.animate_spike_ensembles(dynamic, (height, width));
\ No newline at end of file
+        pcnn_visualizer.animate_spike_ensembles(dynamic, (height, width));
+
+
+    @staticmethod
+    def templateOutputDynamicWindow(num_osc, steps, type_conn, stimulus, ccore):
+        dynamic = pcnn_network(num_osc, None, type_conn, conn_represent.MATRIX, None, None, ccore).simulate(steps, stimulus);
+        
+        output = numpy.array(dynamic.output, dtype = numpy.float64);
+        time = numpy.array(dynamic.time, dtype = numpy.float64);
+        
+        assert numpy.array_equal(output[2:9:2, [1, 3]], dynamic.output_view[2:9:2, [1, 3]]);
+        assert numpy.array_equal(time[4:], dynamic.time_view[4:]);
\ No newline at end of file
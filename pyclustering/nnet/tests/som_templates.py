@@ -28,7 +28,7 @@ import pickle
 import matplotlib
 matplotlib.use('Agg')
 
-from pyclustering.nnet.som import som, type_conn, som_parameters
+from pyclustering.nnet.som import som, type_conn, som_parameters, type_train
 
 from pyclustering.utils import read_sample
 
@@ -115,4 +115,22 @@ class SomTestTemplates:
             if i < 5:
                 assert expected_winners[0] == index_winner
             else:
-                assert expected_winners[1] == index_winner
\ No newline at end of file
+                assert expected_winners[1] == index_winner
+
+
+    @staticmethod
+    def templateTestSimulateBatch(connections, train_type, ccore_flag):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        parameters = som_parameters()
+        parameters.train_type = train_type
+
+        network = som(2, 2, connections, parameters, ccore = ccore_flag)
+        network.train(sample, 100)
+
+        winners = network.simulate(sample)
+        assert len(sample) == len(winners)
+
+        for i in range(len(sample)):
+            assert network.simulate(sample[i]) == winners[i]
+            assert i in network.capture_objects[winners[i]]
\ No newline at end of file
@@ -25,6 +25,8 @@
 
 
 # Generate images without having a window appear.
+import numpy;
+
 import matplotlib;
 matplotlib.use('Agg');
 
@@ -110,6 +112,9 @@ class SyncTestTemplates:
         assert len(output_dynamic.calculate_order_parameter(5)) == 1;
         assert len(output_dynamic.calculate_order_parameter(5, 10)) == 5;
         assert output_dynamic.calculate_order_parameter(20)[0] > 0.9;
+        
+        order_parameter = [ output_dynamic.calculate_order_parameter(iteration)[0] for iteration in range(5, 10) ];
+        assert numpy.allclose(order_parameter, output_dynamic.calculate_order_parameter(5, 10));
 
 
     @staticmethod
@@ -140,3 +145,12 @@ class SyncTestTemplates:
         sync_visualizer.show_local_order_parameter(output_dynamic, net);
 
 
+    @staticmethod
+    def templateOutputDynamicWindow(size, ccore_flag):
+        output_dynamic = sync_network(size, ccore = ccore_flag).simulate_static(20, 10, solution = solve_type.FAST, collect_dynamic = True);
+        
+        output = numpy.array(output_dynamic.output, dtype = numpy.float64);
+        time = numpy.array(output_dynamic.time, dtype = numpy.float64);
+        
+        assert numpy.array_equal(output[5:15:3, [0, size - 1]], output_dynamic.output_view[5:15:3, [0, -1]]);
+        assert numpy.array_equal(time[3:8], output_dynamic.time_view[3:8]);
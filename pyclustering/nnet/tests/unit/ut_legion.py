@@ -25,11 +25,12 @@
 
 
 import unittest;
+import numpy;
 
 from pyclustering.nnet.tests.legion_templates import LegionTestTemplates;
 
 from pyclustering.nnet.legion import legion_network, legion_parameters;
-from pyclustering.nnet import conn_type, conn_represent;
+from pyclustering.nnet import conn_type, conn_represent, solve_type;
 
 from pyclustering.utils import extract_number_oscillations;
 
@@ -119,10 +120,39 @@ class LegionUnitTest(unittest.TestCase):
         LegionTestTemplates.templateSyncEnsembleAllocation([1, 0, 1], None, conn_type.LIST_BIDIR, 1500, 1500, [[0, 2], [1]], False);
 
 
+    def testSyncEnsembleAllocationThreeStimulatedOscillatorsAdaptiveSolver(self):
+        LegionTestTemplates.templateSyncEnsembleAllocation([1, 1, 1], None, conn_type.LIST_BIDIR, 1500, 1500, [[0, 1, 2]], False, solution = solve_type.RKF45);
+
+
+    def testSyncEnsembleAllocationThreeMixStimulatedOscillatorsAdaptiveSolver(self):
+        LegionTestTemplates.templateSyncEnsembleAllocation([1, 0, 1], None, conn_type.LIST_BIDIR, 1500, 1500, [[0, 2], [1]], False, solution = solve_type.RKF45);
+
+
+    def testSyncEnsembleAllocationThreeMixStimulatedOscillatorsSparseRepresentation(self):
+        LegionTestTemplates.templateSyncEnsembleAllocation([1, 0, 1], None, conn_type.LIST_BIDIR, 1500, 1500, [[0, 2], [1]], False, repr_type = conn_represent.CSR);
+
+
+    def testUnsupportedSolver(self):
+        net = legion_network(3, type_conn = conn_type.LIST_BIDIR, ccore = False);
+        self.assertRaises(NameError, net.simulate, 100, 100, [1, 0, 1], solve_type.FAST);
+
+
+    def testCoarseSimulationStepIsStable(self):
+        for (steps, time) in [ (100, 500), (100, 1000), (20, 1000) ]:
+            net = legion_network(3, type_conn = conn_type.LIST_BIDIR, ccore = False);
+            dynamic = net.simulate(steps, time, [1, 0, 1], solve_type.RK4);
+            
+            assert numpy.all(numpy.isfinite(dynamic.output));
+            assert numpy.all(numpy.isfinite(dynamic.inhibitor));
+
 
     def testOutputDynamicInformation(self):
         LegionTestTemplates.templateOutputDynamicInformation([1, 0, 1], legion_parameters(), conn_type.LIST_BIDIR, 100, 100, False);
 
 
+    def testOutputDynamicWindow(self):
+        LegionTestTemplates.templateOutputDynamicWindow([1, 0, 1], legion_parameters(), conn_type.LIST_BIDIR, 100, 100, False);
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
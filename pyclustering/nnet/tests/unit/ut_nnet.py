@@ -26,9 +26,12 @@
 
 import unittest;
 
+import gc;
 import math;
+import numpy;
+import weakref;
 
-from pyclustering.nnet import network, conn_type, conn_represent;
+from pyclustering.nnet import network, dynamic_view, conn_type, conn_represent;
 
 
 class NnetUnitTest(unittest.TestCase):
@@ -350,5 +353,118 @@ class NnetUnitTest(unittest.TestCase):
         self.templateAssertRaises(10, type_conn = conn_type.GRID_EIGHT, height = 0, width = 0);
 
 
+
+    # Compressed sparse row representation suite
+    def templateSparseRepresentation(self, size, type_conn, height = None, width = None):
+        matrix_network = network(size, type_conn, conn_represent.MATRIX, height, width);
+        sparse_network = network(size, type_conn, conn_represent.CSR, height, width);
+        
+        for i in range(size):
+            assert sorted(matrix_network.get_neighbors(i)) == list(sparse_network.get_neighbors(i));
+            for j in range(size):
+                assert matrix_network.has_connection(i, j) == sparse_network.has_connection(i, j);
+
+    def testSparseRepresentationAllToAll(self):
+        self.templateSparseRepresentation(1, conn_type.ALL_TO_ALL);
+        self.templateSparseRepresentation(10, conn_type.ALL_TO_ALL);
+
+    def testSparseRepresentationNone(self):
+        self.templateSparseRepresentation(10, conn_type.NONE);
+
+    def testSparseRepresentationBidirList(self):
+        self.templateSparseRepresentation(1, conn_type.LIST_BIDIR);
+        self.templateSparseRepresentation(10, conn_type.LIST_BIDIR);
+
+    def testSparseRepresentationGridFour(self):
+        self.templateSparseRepresentation(25, conn_type.GRID_FOUR);
+        self.templateSparseRepresentation(40, conn_type.GRID_FOUR, 4, 10);
+        self.templateSparseRepresentation(40, conn_type.GRID_FOUR, 10, 4);
+        self.templateSparseRepresentation(10, conn_type.GRID_FOUR, 1, 10);
+
+    def testSparseRepresentationGridEight(self):
+        self.templateSparseRepresentation(25, conn_type.GRID_EIGHT);
+        self.templateSparseRepresentation(40, conn_type.GRID_EIGHT, 4, 10);
+        self.templateSparseRepresentation(40, conn_type.GRID_EIGHT, 10, 4);
+        self.templateSparseRepresentation(10, conn_type.GRID_EIGHT, 10, 1);
+
+    def testSparseRepresentationDynamic(self):
+        net = network(10, type_conn = conn_type.DYNAMIC, conn_repr = conn_represent.CSR);
+        net.set_connection(0, 5);
+        net.set_connection(3, 0);
+        net.set_connection(0, 5);
+        
+        assert [3, 5] == list(net.get_neighbors(0));
+        assert [0] == list(net.get_neighbors(5));
+        assert net.has_connection(5, 0) == True;
+        assert net.has_connection(5, 3) == False;
+        
+        net.set_connection(5, 3);
+        assert net.has_connection(5, 3) == True;
+        assert [0, 3] == list(net.get_neighbors(5));
+
+
+    def testDynamicViewOverList(self):
+        dynamic = [ [ float(i * 10 + j) for j in range(4) ] for i in range(6) ];
+        expected = numpy.array(dynamic);
+        view = dynamic_view(dynamic, len(dynamic), 4);
+        
+        assert view.shape == (6, 4);
+        assert len(view) == 6;
+        assert numpy.array_equal(expected[-1], view[-1]);
+        assert numpy.array_equal(expected[1:5:2, [3, 0]], view[1:5:2, [-1, 0]]);
+        assert numpy.array_equal(expected[::-1, 2], view[::-1, 2]);
+        assert numpy.array_equal(expected, numpy.asarray(view));
+        assert numpy.array_equal(expected, numpy.array(list(view)));
+        assert view[4:2].shape == (0, 4);
+
+
+    def testDynamicViewOverReader(self):
+        requests = [];
+        def reader(iterations):
+            requests.append(iterations);
+            return numpy.arange(iterations.start, iterations.stop, iterations.step, dtype = numpy.float64);
+        
+        view = dynamic_view(reader, 100);
+        
+        assert view.shape == (100,);
+        assert numpy.array_equal(numpy.arange(90, 100), view[-10:]);
+        assert numpy.array_equal(numpy.arange(99, 0, -7), view[99:0:-7]);
+        assert all(iterations.step > 0 for iterations in requests);
+        assert [ len(chunk) for chunk in view.chunks(40) ] == [40, 40, 20];
+
+
+    def testDynamicViewIncorrectIndexes(self):
+        view = dynamic_view([ [0.0, 1.0], [2.0, 3.0] ], 2, 2);
+        
+        self.assertRaises(IndexError, view.__getitem__, 2);
+        self.assertRaises(IndexError, view.__getitem__, (0, 2));
+        self.assertRaises(IndexError, view.__getitem__, (0, [0, -3]));
+        self.assertRaises(IndexError, view.__getitem__, (0, 0, 0));
+        self.assertRaises(IndexError, view.__getitem__, 0.5);
+        self.assertRaises(ValueError, lambda: list(view.chunks(0)));
+
+
+    def testDynamicViewKeepsOwner(self):
+        class dynamic_owner:
+            def __init__(self):
+                self.values = numpy.arange(12, dtype = numpy.float64).reshape(6, 2);
+        
+        owner = dynamic_owner();
+        values = owner.values;
+        view = dynamic_view(lambda iterations, indexes: values[iterations][:, indexes if indexes is not None else slice(None)], 6, 2, owner);
+        reference = weakref.ref(owner);
+        
+        del owner;
+        gc.collect();
+        
+        assert reference() is not None;
+        assert numpy.array_equal(values[1:5:2, [1]], view[1:5:2, [1]]);
+        
+        del view;
+        gc.collect();
+        
+        assert reference() is None;
+
+
 if __name__ == "__main__":
-    unittest.main();
\ No newline at end of file
+    unittest.main();
\ No newline at end of file
@@ -25,10 +25,12 @@
 
 
 import unittest
+import random
 
 from pyclustering.nnet.tests.pcnn_templates import PcnnTestTemplates
 
 from pyclustering.nnet import conn_type, conn_represent
+from pyclustering.nnet.pcnn import pcnn_network
 
 
 class PcnnUnitTest(unittest.TestCase):
@@ -62,6 +64,13 @@ class PcnnUnitTest(unittest.TestCase):
     def testDynamicLengthAllToAllConnectionFastLinking(self):
         PcnnTestTemplates.templateDynamicLengthFastLinking(10, 20, conn_type.ALL_TO_ALL, conn_represent.MATRIX, [0] * 10, False)
 
+    def testDynamicZeroSteps(self):
+        dynamic = pcnn_network(4, ccore=False).simulate(0, [1, 0, 1, 0])
+        
+        assert 1 == len(dynamic)
+        assert [[0, 0, 0, 0]] == dynamic.output
+        assert [[0, 0, 0, 0]] == dynamic.get_output().tolist()
+
     def testDynamicLengthListRepresentation(self):
         PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.NONE, conn_represent.LIST, [0] * 25, False)
         PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.GRID_EIGHT, conn_represent.LIST, [0] * 25, False)
@@ -70,6 +79,23 @@ class PcnnUnitTest(unittest.TestCase):
         PcnnTestTemplates.templateDynamicLength(25, 30, conn_type.ALL_TO_ALL, conn_represent.LIST, [0] * 25, False)
     
     
+    def testRepresentationIndependence(self):
+        stimulus = [ 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0 ]
+        for type_conn in [ conn_type.NONE, conn_type.ALL_TO_ALL, conn_type.GRID_FOUR, conn_type.GRID_EIGHT, conn_type.LIST_BIDIR ]:
+            PcnnTestTemplates.templateRepresentationIndependence(16, 30, type_conn, stimulus, False, 1)
+
+    def testRepresentationIndependenceFastLinking(self):
+        stimulus = [ 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0 ]
+        for type_conn in [ conn_type.NONE, conn_type.ALL_TO_ALL, conn_type.GRID_FOUR, conn_type.GRID_EIGHT, conn_type.LIST_BIDIR ]:
+            PcnnTestTemplates.templateRepresentationIndependence(16, 30, type_conn, stimulus, True, 1)
+
+    def testFastLinkingAlternatingOutputs(self):
+        # outputs of the network alternate between two states during fast linking on the 12th step.
+        random.seed(7)
+        stimulus = [ random.random() for _ in range(16) ]
+        PcnnTestTemplates.templateDynamicLengthFastLinking(16, 20, conn_type.GRID_EIGHT, conn_represent.MATRIX, stimulus, False)
+    
+    
     def testDynamicLengthGridRectangle25FourConnection(self):
         PcnnTestTemplates.templateGridRectangleDynamicLength(25, 20, conn_type.GRID_FOUR, conn_represent.MATRIX, 1, 25, [0] * 25, False)
         PcnnTestTemplates.templateGridRectangleDynamicLength(25, 20, conn_type.GRID_FOUR, conn_represent.MATRIX, 25, 1, [0] * 25, False)
@@ -106,6 +132,9 @@ class PcnnUnitTest(unittest.TestCase):
     def testAllocationInRectangleEightStructure(self):
         PcnnTestTemplates.templateAllocationInRectangleStructure(30, 6, 5, 20, conn_type.GRID_EIGHT, conn_represent.MATRIX, [0] * 30, False)
 
+    def testOutputDynamicWindow(self):
+        PcnnTestTemplates.templateOutputDynamicWindow(5, 20, conn_type.ALL_TO_ALL, [1, 3, 5, 7, 9], False)
+
     def testVisualizerNoFailure(self):
         stimulus = [ 5, 5, 5, 5, 10, 10, 10, 10, 15, 15, 15, 15, 20, 20, 20, 20 ]
         PcnnTestTemplates.visualize(16, 20, conn_type.ALL_TO_ALL, conn_represent.MATRIX, stimulus, 4, 4, False)
@@ -31,7 +31,7 @@ import matplotlib
 matplotlib.use('Agg')
 
 from pyclustering.nnet.tests.som_templates import SomTestTemplates
-from pyclustering.nnet.som import som, type_conn, type_init, som_parameters
+from pyclustering.nnet.som import som, type_conn, type_init, type_train, som_parameters
 
 from pyclustering.utils import read_sample
 
@@ -130,6 +130,31 @@ class SomUnitTest(unittest.TestCase):
         SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE5, 1, 4, 100, [15, 15, 15, 15], True, False)
 
 
+    def testBatchTrainThreeNeuronsThreeClusters(self):
+        parameters = som_parameters()
+        parameters.train_type = type_train.batch
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 1, 3, 100, [5, 8, 10], False, False, parameters)
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, 1, 100, [5, 8, 10], False, False, parameters)
+
+
+    def testBatchTrainAutostopFourNeuronsFourClusters(self):
+        parameters = som_parameters()
+        parameters.train_type = type_train.batch
+        SomTestTemplates.templateTestAwardNeurons(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 4, 100, [10, 10, 10, 30], True, False, parameters)
+
+
+    def testBatchTrainSevenNeuronsHeptaClusters(self):
+        parameters = som_parameters()
+        parameters.train_type = type_train.batch
+        SomTestTemplates.templateTestAwardNeurons(FCPS_SAMPLES.SAMPLE_HEPTA, 1, 7, 100, [30, 30, 30, 30, 30, 30, 32], False, False, parameters)
+
+
+    def testBatchTrainFourNeuronsTetraClusters(self):
+        parameters = som_parameters()
+        parameters.train_type = type_train.batch
+        SomTestTemplates.templateTestAwardNeurons(FCPS_SAMPLES.SAMPLE_TETRA, 1, 4, 100, [100, 100, 100, 100], False, False, parameters)
+
+
     def testOneDimensionSampleSimple7Cluster(self):
         parameters = som_parameters()
         parameters.init_type = type_init.random_surface
@@ -188,6 +213,15 @@ class SomUnitTest(unittest.TestCase):
     def testSimulateCheckWinnerHoneycombStoreLoad(self):
         SomTestTemplates.templateTestSimulate(type_conn.honeycomb, False, store_load=True)
 
+    def testSimulateBatchOnlineTrain(self):
+        SomTestTemplates.templateTestSimulateBatch(type_conn.grid_eight, type_train.online, False)
+
+    def testSimulateBatchBatchTrain(self):
+        SomTestTemplates.templateTestSimulateBatch(type_conn.grid_four, type_train.batch, False)
+
+    def testSimulateBatchFuncNeighborBatchTrain(self):
+        SomTestTemplates.templateTestSimulateBatch(type_conn.func_neighbor, type_train.batch, False)
+
 
 if __name__ == "__main__":
     unittest.main()
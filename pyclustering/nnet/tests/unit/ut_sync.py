@@ -24,6 +24,7 @@
 """
 
 import unittest;
+import math;
 
 # Generate images without having a window appear.
 import matplotlib;
@@ -31,8 +32,8 @@ matplotlib.use('Agg');
 
 from pyclustering.nnet.tests.sync_templates import SyncTestTemplates;
 
-from pyclustering.nnet import solve_type, conn_type;
-from pyclustering.nnet.sync import sync_network, sync_dynamic, sync_visualizer;
+from pyclustering.nnet import solve_type, conn_type, conn_represent, initial_type;
+from pyclustering.nnet.sync import sync_network, sync_dynamic, sync_visualizer, order_estimator;
 from pyclustering.utils import pi;
 
 
@@ -187,6 +188,46 @@ class SyncUnitTest(unittest.TestCase):
         matrix = output_dynamic.allocate_correlation_matrix();
         assert matrix == [];
 
+    def testEnsemblesAllocationAroundZero(self):
+        output_dynamic = sync_dynamic([ [0.05, 3.0, 6.25, 3.02, 0.01, 2 * pi - 0.02] ], [0], None);
+        ensembles = output_dynamic.allocate_sync_ensembles(0.1);
+        assert ensembles == [ [0, 2, 4, 5], [1, 3] ];
+
+    def testEnsemblesAllocationWithIndexes(self):
+        output_dynamic = sync_dynamic([ [1.0, 4.0, 1.05, 4.02] ], [0], None);
+        ensembles = output_dynamic.allocate_sync_ensembles(0.1, [10, 20, 30, 40]);
+        assert ensembles == [ [10, 30], [20, 40] ];
+
+    def testEnsemblesAllocationTolerance(self):
+        output_dynamic = sync_dynamic([ [0.0, 0.5, 1.0, 1.5] ], [0], None);
+        assert output_dynamic.allocate_sync_ensembles(0.6) == [ [0, 1, 2, 3] ];
+        assert output_dynamic.allocate_sync_ensembles(0.4) == [ [0], [1], [2], [3] ];
+
+    def testCorrelationMatrixFormula(self):
+        phases = [0.1, 1.2, 2.5, 4.0];
+        output_dynamic = sync_dynamic([ phases ], [0], None);
+        matrix = output_dynamic.allocate_correlation_matrix();
+
+        for i in range(len(phases)):
+            for j in range(len(phases)):
+                expected = abs(math.sin(phases[i]) * math.cos(phases[j]) - math.cos(phases[i]) * math.sin(phases[j]));
+                assert abs(matrix[i][j] - expected) < 0.0000001;
+
+    def testOrderEstimatorMatrixInput(self):
+        net = sync_network(10, ccore = False);
+        output_dynamic = net.simulate_static(20, 10, solution = solve_type.FAST, collect_dynamic = True);
+
+        phases = output_dynamic.get_output();
+        global_order = order_estimator.calculate_sync_order(phases);
+        local_order = order_estimator.calculate_local_sync_order(phases, net);
+
+        assert len(global_order) == len(output_dynamic);
+        assert len(local_order) == len(output_dynamic);
+
+        for index in range(len(output_dynamic)):
+            assert abs(global_order[index] - order_estimator.calculate_sync_order(output_dynamic.output[index])) < 0.0000001;
+            assert abs(local_order[index] - order_estimator.calculate_local_sync_order(output_dynamic.output[index], net)) < 0.0000001;
+
 
     def testOutputDynamicCalculateOrderParameter(self):
         SyncTestTemplates.templateOutputDynamicCalculateOrderParameter(False);
@@ -196,6 +237,10 @@ class SyncUnitTest(unittest.TestCase):
         SyncTestTemplates.templateOutputDynamicCalculateLocalOrderParameter(False);
 
 
+    def testOutputDynamicWindow(self):
+        SyncTestTemplates.templateOutputDynamicWindow(6, False);
+
+
     def testVisualizerOrderParameterNoFailures(self):
         net = sync_network(10, ccore = False);
         output_dynamic = net.simulate_static(20, 10, solution = solve_type.FAST, collect_dynamic = True);
@@ -219,5 +264,29 @@ class SyncUnitTest(unittest.TestCase):
         SyncTestTemplates.templateVisualizerNoFailures(5, 10, False);
 
 
+    def templateRepresentationIndependence(self, type_conn, solution):
+        matrix_network = sync_network(16, 1, type_conn = type_conn, representation = conn_represent.MATRIX, initial_phases = initial_type.EQUIPARTITION, ccore = False);
+        matrix_dynamic = matrix_network.simulate_static(10, 10, solution, True);
+        
+        for representation in [conn_represent.LIST, conn_represent.CSR]:
+            other_network = sync_network(16, 1, type_conn = type_conn, representation = representation, initial_phases = initial_type.EQUIPARTITION, ccore = False);
+            other_dynamic = other_network.simulate_static(10, 10, solution, True);
+            
+            for index_step in range(len(matrix_dynamic)):
+                for index_oscillator in range(16):
+                    assert abs(matrix_dynamic.output[index_step][index_oscillator] - other_dynamic.output[index_step][index_oscillator]) < 0.0000001;
+            
+            assert abs(matrix_network.sync_local_order() - other_network.sync_local_order()) < 0.0000001;
+
+    def testRepresentationIndependenceGridFour(self):
+        self.templateRepresentationIndependence(conn_type.GRID_FOUR, solve_type.FAST);
+
+    def testRepresentationIndependenceListBidirRK4(self):
+        self.templateRepresentationIndependence(conn_type.LIST_BIDIR, solve_type.RK4);
+
+    def testRepresentationIndependenceAllToAllRK4(self):
+        self.templateRepresentationIndependence(conn_type.ALL_TO_ALL, solve_type.RK4);
+
+
 if __name__ == "__main__":
     unittest.main();
@@ -342,6 +342,73 @@ def euclidean_distance_square(a, b):
     return distance;
 
 
+def euclidean_distance_square_bound(radius):
+    """!
+    @brief Returns the largest square Euclidean distance whose Euclidean distance is not greater than the radius.
+    @details Euclidean distance is calculated as a rounded root of square distance (see euclidean_distance()), therefore
+              comparison of square distance with square of the radius may differ from comparison of distance with the
+              radius for points on the border. Square distance is not greater than the returned bound if and only if
+              the distance is not greater than the radius.
+    
+    @param[in] radius (double): Radius (non-negative).
+    
+    @return (double) Bound of square distance.
+    
+    """
+    
+    bound = float(radius) * float(radius);
+    if (bound == float('inf')):
+        return bound;
+    
+    while ((bound > 0.0) and (bound**(0.5) > radius)):
+        bound = float(numpy.nextafter(bound, 0.0));
+    
+    while (float(numpy.nextafter(bound, float('inf')))**(0.5) <= radius):
+        bound = float(numpy.nextafter(bound, float('inf')));
+    
+    return bound;
+
+
+def split_blocks(amount, row_elements, maximum_elements = 2 ** 22):
+    """!
+    @brief Splits rows to blocks, so that intermediate array that is created for each block has bounded amount of elements.
+    @details Vectorized calculations between two sets (for example, distances between points) create intermediate arrays
+              whose size is proportional to product of sizes of the sets, therefore rows of the first set are processed
+              by blocks.
+    
+    @param[in] amount (uint): Amount of rows that should be processed.
+    @param[in] row_elements (uint): Amount of elements of intermediate array that are created for one row.
+    @param[in] maximum_elements (uint): Maximum amount of elements of intermediate array for one block.
+    
+    @return (generator) Pairs (begin, end) of rows of each block.
+    
+    """
+    
+    block_size = max(1, maximum_elements // max(1, row_elements));
+    for begin in range(0, amount, block_size):
+        yield (begin, min(begin + block_size, amount));
+
+
+def euclidean_distance_square_blocks(points1, points2, maximum_elements = 2 ** 22):
+    """!
+    @brief Calculates square Euclidean distances between each point of the first set and each point of the second set by blocks of the first set.
+    @details Matrix of distances is not created for the whole first set, rows of the matrix are returned by blocks
+              (see split_blocks()).
+    
+    @param[in] points1 (numpy.array): The first set of points.
+    @param[in] points2 (numpy.array): The second set of points.
+    @param[in] maximum_elements (uint): Maximum amount of elements of intermediate array for one block.
+    
+    @return (generator) Triples (begin, end, distances) where 'distances' are square distances between points of the
+             first set from 'begin' to 'end' (rows) and points of the second set (columns).
+    
+    """
+    
+    for (begin, end) in split_blocks(len(points1), len(points2) * max(1, points2.shape[1]), maximum_elements):
+        block = points1[begin:end];
+        yield (begin, end, numpy.sum(numpy.square(block[:, numpy.newaxis, :] - points2[numpy.newaxis, :, :]), axis = 2));
+
+
 def manhattan_distance(a, b):
     """!
     @brief Calculate Manhattan distance between vector a and b.
@@ -638,9 +705,9 @@ def timedcall(executable_function, *args):
     
     """
     
-    time_start = time.clock();
+    time_start = time.perf_counter();
     result = executable_function(*args);
-    time_end = time.clock();
+    time_end = time.perf_counter();
     
     return (time_end - time_start, result);
 
@@ -888,7 +955,7 @@ def draw_dynamics(t, dyn, x_title = None, y_title = None, x_lim = None, y_lim =
     @details It draws if matplotlib is not specified (None), othewise it should be performed manually.
     
     @param[in] t (list): Values of time (used by x axis).
-    @param[in] dyn (list): Values of output of oscillators (used by y axis).
+    @param[in] dyn (list|numpy.ndarray): Values of output of oscillators (used by y axis).
     @param[in] x_title (string): Title for Y.
     @param[in] y_title (string): Title for X.
     @param[in] x_lim (double): X limit.
@@ -910,8 +977,11 @@ def draw_dynamics(t, dyn, x_title = None, y_title = None, x_lim = None, y_lim =
     elif (len(t) > 0):
         stage_xlim = [0, t[len(t) - 1]];
     
+    # Check if we have more than one dynamic (list of states or two-dimensional numpy array)
+    multiple_dynamics = isinstance(dyn[0], (list, numpy.ndarray));
+    
     if ( (isinstance(separate, bool) is True) and (separate is True) ):
-        if (isinstance(dyn[0], list) is True):
+        if (multiple_dynamics is True):
             number_lines = len(dyn[0]);
         else:
             number_lines = 1;
@@ -927,11 +997,13 @@ def draw_dynamics(t, dyn, x_title = None, y_title = None, x_lim = None, y_lim =
         dysplay_result = True;
         (fig, axes) = plt.subplots(number_lines, 1);
     
-    # Check if we have more than one dynamic
-    if (isinstance(dyn[0], list) is True):
+    if (multiple_dynamics is True):
         num_items = len(dyn[0]);
         for index in range(0, num_items, 1):
-            y = [item[index] for item in dyn];
+            if (isinstance(dyn, numpy.ndarray) is True):
+                y = dyn[:, index];
+            else:
+                y = [item[index] for item in dyn];
             
             if (number_lines > 1):
                 index_stage = -1;
@@ -22,6 +22,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import unittest;
+import numpy;
 
 # Generate images without having a window appear.
 import matplotlib;
@@ -212,5 +213,21 @@ class Test(unittest.TestCase):
         matrix = utils.calculate_distance_matrix(data);
         assert matrix == [ [0.0, 2.0, 4.0], [2.0, 0.0, 2.0], [4.0, 2.0, 0.0] ];
 
+    def testSplitBlocks(self):
+        assert list(utils.split_blocks(10, 3, 9)) == [ (0, 3), (3, 6), (6, 9), (9, 10) ];
+        assert list(utils.split_blocks(3, 100, 9)) == [ (0, 1), (1, 2), (2, 3) ];
+        assert list(utils.split_blocks(0, 3)) == [ ];
+
+    def testEuclideanDistanceSquareBlocks(self):
+        points1 = numpy.random.RandomState(1).rand(50, 3);
+        points2 = numpy.random.RandomState(2).rand(20, 3);
+        expected = numpy.array([ [ utils.euclidean_distance_square(a, b) for b in points2 ] for a in points1 ]);
+        
+        distances = numpy.empty((len(points1), len(points2)));
+        for (begin, end, block) in utils.euclidean_distance_square_blocks(points1, points2, 600):
+            distances[begin:end] = block;
+        
+        assert numpy.allclose(expected, distances);
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file